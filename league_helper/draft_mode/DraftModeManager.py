@@ -1075,6 +1075,23 @@ class DraftModeManager:
             self.logger.debug("Roster is full (no current draft round) - no recommendations")
             return []
 
+        available_players = self._get_draftable_players(current_round)
+
+        self.logger.debug(f"Found {len(available_players)} draftable players for recommendations")
+
+        return self._rank_recommendations(available_players, current_round, picks_until_next_turn)
+
+    def _get_draftable_players(self, current_round: int) -> List[FantasyPlayer]:
+        """
+        Return the candidate pool for get_recommendations, applying its two fallbacks.
+
+        Args:
+            current_round (int): The 1-based round being recommended for (log context only)
+
+        Returns:
+            List[FantasyPlayer]: Roster-legal free agents -- positive-value ones when any
+                exist, else any projection, else regardless of the last-pass score floor
+        """
         available_players = self.player_manager.get_player_list(drafted_vals=[0], can_draft=True)
 
         if not available_players:
@@ -1113,8 +1130,25 @@ class DraftModeManager:
                     f"falling back to {len(available_players)} negative-scoring roster-legal candidates"
                 )
 
-        self.logger.debug(f"Found {len(available_players)} draftable players for recommendations")
+        return available_players
+
+    def _rank_recommendations(
+        self,
+        available_players: List[FantasyPlayer],
+        current_round: int,
+        picks_until_next_turn: Optional[int]
+    ) -> List[ScoredPlayer]:
+        """
+        Fully score every candidate and return the top Constants.RECOMMENDATION_COUNT.
 
+        Args:
+            available_players (List[FantasyPlayer]): Candidate pool from _get_draftable_players
+            current_round (int): The 1-based round being recommended for
+            picks_until_next_turn (Optional[int]): Survival-estimate input (None skips Step 15)
+
+        Returns:
+            List[ScoredPlayer]: Highest-scoring candidates, best first
+        """
         scored_players : List[ScoredPlayer] = []
 
         for p in available_players:
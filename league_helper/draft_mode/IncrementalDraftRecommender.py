@@ -0,0 +1,195 @@
+"""
+Incremental Draft Recommender
+
+A DraftModeManager whose get_recommendations() produces the same ranking as the full
+15-step rescore, without re-running every step for every available player on every pick.
+
+Draft scoring (the flag set DraftModeManager._rank_recommendations uses) splits into:
+
+- Roster-INDEPENDENT terms, fixed for a player until its point data, the config or the
+  NFL week changes: Step 1 normalized points, Step 2 ADP multiplier, Step 3 player
+  rating multiplier, Step 10 injury penalty and Step 14 NFL team penalty weight. These
+  are cached per player id, per recommender (one recommender = one config).
+- Roster/round-DEPENDENT terms, recomputed on each call but shared across players:
+  Step 8 draft-order bonus (per position for the round) and Step 9 bye-week penalty
+  (per (bye week, position) against the current roster). Step 15 survival estimate is
+  applied per player when picks_until_next_turn is given.
+
+The terms are recombined in the SAME order as PlayerScoringCalculator.score_player
+(((base + bonus) - bye) - injury) * team weight, so every candidate's score is
+bit-identical to the full path. Only the top Constants.RECOMMENDATION_COUNT candidates
+(selected with a heap) are then run through the full score_player, which yields the
+returned ScoredPlayers -- reasons and projected_points included -- exactly as the full
+path would.
+
+Author: Kai Mizuno
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import league_helper.constants as Constants
+from league_helper.draft_mode.DraftModeManager import DraftModeManager
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.PlayerManager import PlayerManager
+from league_helper.util.ScoredPlayer import ScoredPlayer
+from league_helper.util.TeamDataManager import TeamDataManager
+from utils.FantasyPlayer import FantasyPlayer
+
+
+class IncrementalDraftRecommender(DraftModeManager):
+    """
+    DraftModeManager that caches roster-independent partial scores between picks.
+
+    Intended to be constructed ONCE per (config, PlayerManager) and asked for
+    recommendations repeatedly as the draft proceeds -- e.g. by the win-rate
+    simulation's DraftHelperTeam -- rather than rebuilt every pick.
+
+    Attributes:
+        _partial_scores (Dict[int, Tuple[float, float, Optional[float]]]): Player id ->
+            (steps 1-3 score, injury penalty, NFL team penalty weight or None)
+        _cache_key (Optional[Tuple]): State the cache was built under; any change clears it
+    """
+
+    def __init__(self, config: ConfigManager, player_manager: PlayerManager, team_data_manager: TeamDataManager):
+        """
+        Initialize the recommender.
+
+        Args:
+            config (ConfigManager): Configuration with draft order strategy
+            player_manager (PlayerManager): Manages players and scoring
+            team_data_manager (TeamDataManager): Provides team data
+        """
+        super().__init__(config, player_manager, team_data_manager)
+        self._partial_scores: Dict[int, Tuple[float, float, Optional[float]]] = {}
+        self._cache_key: Optional[Tuple] = None
+
+    def set_managers(self, player_manager: PlayerManager, team_data_manager: TeamDataManager):
+        """Swap manager references; cached partial scores belong to the old manager, so drop them."""
+        super().set_managers(player_manager, team_data_manager)
+        self._partial_scores = {}
+        self._cache_key = None
+
+    def _sync_cache(self) -> None:
+        """Clear the partial-score cache if the data it was computed from has changed."""
+        calculator = self.player_manager.scoring_calculator
+        key = (
+            id(self.player_manager.players),
+            getattr(self.player_manager, 'player_data_version', None),
+            self.config.current_nfl_week,
+            calculator.max_projection,
+        )
+        if key != self._cache_key:
+            self._partial_scores = {}
+            self._cache_key = key
+
+    def _get_partial_score(self, p: FantasyPlayer) -> Tuple[float, float, Optional[float]]:
+        """
+        Return (and cache) a player's roster-independent scoring terms.
+
+        Args:
+            p (FantasyPlayer): Player to score
+
+        Returns:
+            Tuple[float, float, Optional[float]]: (steps 1-3 score, injury penalty,
+                NFL team penalty weight or None when the team is not penalized)
+        """
+        cached = self._partial_scores.get(p.id)
+        if cached is not None:
+            return cached
+
+        calculator = self.player_manager.scoring_calculator
+        calculator.use_draft_normalization = True
+        score, _ = calculator._get_normalized_fantasy_points(p, False)
+        score, _ = calculator._apply_adp_multiplier(p, score)
+        score, _ = calculator._apply_player_rating_multiplier(p, score)
+
+        injury_penalty = 0.0 - calculator._apply_injury_penalty(p, 0.0)[0]
+        team_weight = self.config.nfl_team_penalty_weight if p.team in self.config.nfl_team_penalty else None
+
+        cached = (score, injury_penalty, team_weight)
+        self._partial_scores[p.id] = cached
+        return cached
+
+    def _rank_recommendations(
+        self,
+        available_players: List[FantasyPlayer],
+        current_round: int,
+        picks_until_next_turn: Optional[int]
+    ) -> List[ScoredPlayer]:
+        """
+        Rank candidates from cached partial scores; fully score only the top ones.
+
+        Sets p.score on every candidate, exactly as the full path's score_player does,
+        since get_player_list's score floor reads it on the next pick.
+
+        Args:
+            available_players (List[FantasyPlayer]): Candidate pool from _get_draftable_players
+            current_round (int): The 1-based round being recommended for
+            picks_until_next_turn (Optional[int]): Survival-estimate input (None skips Step 15)
+
+        Returns:
+            List[ScoredPlayer]: Highest-scoring candidates, best first
+        """
+        self._sync_cache()
+
+        calculator = self.player_manager.scoring_calculator
+        draft_round = current_round - 1
+        team = getattr(self.player_manager, 'team', None)
+        roster = team.roster if team else []
+
+        bonus_by_position: Dict[str, float] = {}
+        bye_penalty_by_key: Dict[Tuple[Optional[int], str], float] = {}
+        scores: Dict[int, float] = {}
+
+        for p in available_players:
+            base, injury_penalty, team_weight = self._get_partial_score(p)
+
+            bonus = bonus_by_position.get(p.position)
+            if bonus is None:
+                bonus = self.config.get_draft_order_bonus(p.position, draft_round)[0]
+                bonus_by_position[p.position] = bonus
+
+            bye_key = (p.bye_week, p.position)
+            bye_penalty = bye_penalty_by_key.get(bye_key)
+            if bye_penalty is None:
+                bye_penalty = 0.0 - calculator._apply_bye_week_penalty(p, 0.0, roster)[0]
+                bye_penalty_by_key[bye_key] = bye_penalty
+
+            score = base + bonus
+            score = score - bye_penalty
+            score = score - injury_penalty
+            if team_weight is not None:
+                score = score * team_weight
+            if picks_until_next_turn is not None:
+                score, _ = calculator._apply_survival_estimate(p, picks_until_next_turn, score)
+
+            p.score = score
+            scores[id(p)] = score
+
+        top_players = heapq.nlargest(
+            Constants.RECOMMENDATION_COUNT, available_players, key=lambda p: scores[id(p)]
+        )
+
+        ranked_players = [
+            self.player_manager.score_player(
+                p,
+                draft_round=draft_round,
+                adp=True,
+                player_rating=True,
+                team_quality=False,
+                performance=False,
+                matchup=False,
+                schedule=False,
+                bye=True,
+                injury=True,
+                use_draft_normalization=True,
+                nfl_team_penalty=True,
+                picks_until_next_turn=picks_until_next_turn
+            )
+            for p in top_players
+        ]
+
+        self.logger.debug(f"Recommended next picks: {[p.player.name for p in ranked_players]}")
+
+        return ranked_players
@@ -17,12 +17,20 @@ Author: Kai Mizuno
 """
 
 import json
+import logging
 import statistics
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
 
 import league_helper.constants as Constants
 from historical_data_compiler.constants import ALL_NFL_TEAMS
+from league_helper.util.multiplier_lookup import (
+    BucketedMultiplierLookup,
+    LinearMultiplierLookup,
+)
 from utils.LoggingManager import get_logger
 from utils.FantasyPlayer import FantasyPlayer
 
@@ -234,8 +242,16 @@ class ConfigManager:
         >>> draft_bonus = config.get_draft_order_bonus("RB", 0)  # RB in first round (0-indexed) → returns bonus
     """
 
+    # Read-only empty default so an instance built without __init__ (ConfigManager.__new__
+    # plus hand-set ladders, as some tests do) scores on the interpretive path; __init__
+    # replaces it with the real per-instance cache.
+    _compiled_multipliers: Mapping[int, Tuple[Dict[str, Any], Dict[bool, Any]]] = (
+        MappingProxyType({})
+    )
+    # In-memory config source (see __init__'s config_data); None reads config_path.
+    _config_data: Optional[Dict[str, Any]] = None
 
-    def __init__(self, data_folder: Path) -> None:
+    def __init__(self, data_folder: Path, config_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Initialize the config manager and load configuration.
 
@@ -243,8 +259,17 @@ class ConfigManager:
         1. New structure: data/configs/league_config.json + week{N}-{M}.json files
         2. Legacy structure: data/league_config.json (for tests and backward compatibility)
 
+        or, with config_data, no folder at all: the dict is loaded exactly as if it had
+        been written to a legacy league_config.json (the simulation builds every league's
+        configs this way rather than round-tripping them through a temp directory).
+
         Args:
             data_folder (Path): Path to the data directory containing config files
+            config_data (Optional[Dict[str, Any]]): In-memory league config with the
+                league_config.json layout (config_name/description/parameters). When
+                provided, data_folder is not read and no week config is merged. The dict
+                is copied through a JSON round-trip, so the manager never aliases it and
+                sees exactly the values a written-then-read file would carry.
 
         Raises:
             FileNotFoundError: If league_config.json is not found
@@ -274,9 +299,23 @@ class ConfigManager:
         self._linear_anchors_cache: Dict[
             int, Tuple[Dict[str, Any], Tuple[Any, ...], Tuple[Tuple[float, float, str], ...]]
         ] = {}
+        # Per-block compiled multiplier lookups (league_helper/util/multiplier_lookup.py),
+        # built once at config load by _compile_multiplier and read by _get_multiplier.
+        # Keyed and strongly referenced exactly like _linear_anchors_cache above. Each
+        # entry is (block, {rising: lookup}). Validation on read is identity only, so a
+        # caller that edits a loaded ladder in place must call
+        # invalidate_compiled_multipliers() to stop being served the load-time lookup.
+        self._compiled_multipliers: Dict[
+            int, Tuple[Dict[str, Any], Dict[bool, Any]]
+        ] = {}
 
+        self._config_data = config_data
         configs_folder = data_folder / 'configs'
-        if configs_folder.exists() and (configs_folder / 'league_config.json').exists():
+        if config_data is not None:
+            self.config_path = None
+            self.configs_folder = None
+            self.logger.debug("Using in-memory config data")
+        elif configs_folder.exists() and (configs_folder / 'league_config.json').exists():
             self.config_path = configs_folder / 'league_config.json'
             self.configs_folder = configs_folder
             self.logger.debug(f"Using new config structure: {configs_folder}")
@@ -699,7 +738,8 @@ class ConfigManager:
         else:
             return self.draft_order_bonuses[self.keys.BONUS_SECONDARY], self.keys.BONUS_SECONDARY
 
-    def get_bye_week_penalty(self, same_pos_players: List[FantasyPlayer], diff_pos_players: List[FantasyPlayer]) -> float:
+    def get_bye_week_penalty(self, same_pos_players: List[FantasyPlayer], diff_pos_players: List[FantasyPlayer],
+                             median_of: Optional[Callable[[FantasyPlayer], float]] = None) -> float:
         """
         Calculate bye week penalty based on median weekly scores of conflicting players.
 
@@ -722,6 +762,9 @@ class ConfigManager:
         Args:
             same_pos_players: List of players on roster with same position and same bye week
             diff_pos_players: List of players on roster with different position and same bye week
+            median_of: Optional per-player median source, e.g. PlayerScoringCalculator's
+                cache; must return what calculate_player_median would. Defaults to
+                calculate_player_median.
 
         Returns:
             float: Total bye week penalty (linearly scaled sum)
@@ -732,51 +775,81 @@ class ConfigManager:
             diff_pos_players = [WR with median 18.0] → total 18.0
             penalty = 27.0 * 0.403 + 18.0 * 0.176 = 10.88 + 3.17 = 14.05 points
         """
-        def calculate_player_median(player: FantasyPlayer) -> float:
-            """
-            Calculate median weekly points for a player from weeks 1-17.
+        median_of = median_of or self.calculate_player_median
+        same_pos_median_total = sum(median_of(p) for p in same_pos_players)
+        diff_pos_median_total = sum(median_of(p) for p in diff_pos_players)
+        return self.get_bye_week_penalty_from_totals(same_pos_median_total, diff_pos_median_total)
 
-            Filters out None and zero values, returns 0.0 if no valid data.
-            """
-            try:
-                valid_weeks = [
-                    points for week in range(1, 18)
-                    if (points := player.get_single_weekly_projection(week, self)) is not None
-                    and points > 0
-                ]
-
-                if not valid_weeks:
-                    self.logger.debug(f"No valid weekly data for {player.name}, using 0.0 median")
-                    return 0.0
-
-                median = statistics.median(valid_weeks)
-                self.logger.debug(f"Median for {player.name}: {median:.2f} from {len(valid_weeks)} valid weeks")
-                return median
+    def get_bye_week_penalty_from_totals(self, same_pos_median_total: float, diff_pos_median_total: float) -> float:
+        """
+        Apply the bye week weights to already-summed conflict medians (step 4 of
+        get_bye_week_penalty).
 
-            except statistics.StatisticsError as e:
-                self.logger.error(f"Failed to calculate median for {player.name}: {e}")
-                return 0.0
-            except Exception as e:
-                self.logger.error(f"Unexpected error calculating median for {player.name}: {e}")
-                return 0.0
+        For callers that keep running per-roster median totals rather than lists of
+        conflicting players. Given the same totals, the result equals
+        get_bye_week_penalty's.
 
-        same_pos_median_total = sum(calculate_player_median(p) for p in same_pos_players)
-        diff_pos_median_total = sum(calculate_player_median(p) for p in diff_pos_players)
+        Args:
+            same_pos_median_total: Sum of same-position conflicting players' medians
+            diff_pos_median_total: Sum of different-position conflicting players' medians
 
+        Returns:
+            float: Total bye week penalty (linearly scaled sum)
+        """
         same_penalty = same_pos_median_total * self.same_pos_bye_weight
         diff_penalty = diff_pos_median_total * self.diff_pos_bye_weight
 
         total_penalty = same_penalty + diff_penalty
 
-        self.logger.debug(
-            f"Bye penalty calculation: "
-            f"same_pos_median={same_pos_median_total:.2f}*{self.same_pos_bye_weight}={same_penalty:.2f}, "
-            f"diff_pos_median={diff_pos_median_total:.2f}*{self.diff_pos_bye_weight}={diff_penalty:.2f}, "
-            f"total={total_penalty:.2f}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Bye penalty calculation: "
+                f"same_pos_median={same_pos_median_total:.2f}*{self.same_pos_bye_weight}={same_penalty:.2f}, "
+                f"diff_pos_median={diff_pos_median_total:.2f}*{self.diff_pos_bye_weight}={diff_penalty:.2f}, "
+                f"total={total_penalty:.2f}"
+            )
 
         return total_penalty
 
+    def calculate_player_median(self, player: FantasyPlayer) -> float:
+        """
+        Calculate median weekly points for a player from weeks 1-17.
+
+        Filters out None and zero values, returns 0.0 if no valid data. Weeks before
+        current_nfl_week read actual points, later weeks projected points, so the
+        result depends on both point arrays and on current_nfl_week.
+
+        Args:
+            player: Player whose bye-week conflict weight is being measured
+
+        Returns:
+            float: Median of the player's positive weekly points, or 0.0
+        """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        try:
+            valid_weeks = [
+                points for week in range(1, 18)
+                if (points := player.get_single_weekly_projection(week, self)) is not None
+                and points > 0
+            ]
+
+            if not valid_weeks:
+                if debug:
+                    self.logger.debug(f"No valid weekly data for {player.name}, using 0.0 median")
+                return 0.0
+
+            median = statistics.median(valid_weeks)
+            if debug:
+                self.logger.debug(f"Median for {player.name}: {median:.2f} from {len(valid_weeks)} valid weeks")
+            return median
+
+        except statistics.StatisticsError as e:
+            self.logger.error(f"Failed to calculate median for {player.name}: {e}")
+            return 0.0
+        except Exception as e:
+            self.logger.error(f"Unexpected error calculating median for {player.name}: {e}")
+            return 0.0
+
     def get_injury_penalty(self, risk_level : str) -> float:
         """
         Get injury penalty for a given risk level.
@@ -977,18 +1050,21 @@ class ConfigManager:
                 factor's declared input domain -- five for BUCKETED (the default), the
                 four configured anchors for LINEAR (see _validate_tier_reachability)
         """
-        self.logger.debug(f"Loading configuration from: {self.config_path}")
+        if self._config_data is not None:
+            data = json.loads(json.dumps(self._config_data))
+        else:
+            self.logger.debug(f"Loading configuration from: {self.config_path}")
 
-        if not self.config_path.exists():
-            self.logger.error(f"Configuration file not found: {self.config_path}")
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+            if not self.config_path.exists():
+                self.logger.error(f"Configuration file not found: {self.config_path}")
+                raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in configuration file: {e}")
-            raise
+            try:
+                with open(self.config_path, 'r') as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                self.logger.error(f"Invalid JSON in configuration file: {e}")
+                raise
 
         self._validate_config_structure(data)
 
@@ -1466,6 +1542,10 @@ class ConfigManager:
             # than per call in _get_multiplier. Must run AFTER the line above: a
             # calculated ladder has no THRESHOLDS to sort until it is materialized.
             self._cache_linear_anchors(scoring_dict)
+            self._compile_multiplier(scoring_dict, MULTIPLIER_INPUT_DOMAINS.get(scoring_key))
+        # Survival stays unregistered (see get_survival_multiplier); compiling it is only
+        # an optimization, and a malformed block is skipped here and still raises lazily.
+        self._compile_multiplier(self.survival_scoring, None)
 
         self._validate_tier_reachability()
 
@@ -1602,6 +1682,108 @@ class ConfigManager:
             return cached[2]
         return self._build_linear_anchors(scoring_dict)
 
+    def _compile_multiplier(
+        self,
+        scoring_dict: Dict[str, Any],
+        domain: Optional[Tuple[Optional[float], Optional[float]]]
+    ) -> None:
+        """Compile a ladder into immutable lookups for both threshold directions, once.
+
+        The whole _get_multiplier pipeline for a valued input -- mode dispatch, threshold
+        reads, the LINEAR anchor sort, and the `** WEIGHT` step for every tier -- is a
+        pure function of the block, so it is folded here into a BucketedMultiplierLookup
+        per direction (the accessor's rising_thresholds is fixed, but _get_multiplier
+        takes it per call) or one direction-agnostic LinearMultiplierLookup. Only the
+        LINEAR interior interpolation and its exponent remain per call.
+
+        A factor whose declared MULTIPLIER_INPUT_DOMAINS entry is a bounded integer range
+        (the 1-32 NFL ranks) also gets a table of every integer in it, hit only by an
+        exact int input. ADP and the other real-valued inputs keep the ladder walk:
+        their domains are unbounded or their inputs fractional, so no finite table
+        covers them.
+
+        Like _cache_linear_anchors this is an optimization, never a validator: a
+        malformed block is skipped and left on the interpretive path, where it raises
+        exactly as it did before, at first use.
+
+        Args:
+            scoring_dict (Dict[str, Any]): A scoring factor's ladder block.
+            domain: The factor's declared input domain, or None.
+        """
+        try:
+            keys = self.keys
+            weight = scoring_dict[keys.WEIGHT]
+            multipliers = scoring_dict[keys.MULTIPLIERS]
+            missing_label = self._resolve_missing_value_tier(scoring_dict)
+            missing_multiplier = 1.0 if missing_label == keys.NEUTRAL else multipliers[missing_label]
+            common = dict(
+                weight=weight,
+                neutral=(1.0 ** weight, keys.NEUTRAL),
+                missing=(missing_multiplier ** weight, missing_label),
+            )
+
+            if self._resolve_scaling(scoring_dict) == keys.SCALING_LINEAR:
+                anchors = self._build_linear_anchors(scoring_dict)
+                linear = LinearMultiplierLookup(
+                    thresholds=tuple(anchor[0] for anchor in anchors),
+                    anchor_results=tuple((anchor[1] ** weight, anchor[2]) for anchor in anchors),
+                    segments=tuple(
+                        (lower[0], lower[1], upper[1] - lower[1], upper[0] - lower[0],
+                         lower[2] if lower[1] >= upper[1] else upper[2])
+                        for lower, upper in zip(anchors, anchors[1:])
+                    ),
+                    **common,
+                )
+                lookups = {True: linear, False: linear}
+            else:
+                thresholds = scoring_dict[keys.THRESHOLDS]
+                tiers = {}
+                for name, tier in (("excellent", keys.EXCELLENT), ("good", keys.GOOD),
+                                   ("very_poor", keys.VERY_POOR), ("poor", keys.POOR)):
+                    tiers[name] = thresholds[tier]
+                    tiers[f"{name}_result"] = (multipliers[tier] ** weight, tier)
+                lookups = {
+                    rising: BucketedMultiplierLookup(rising=rising, **tiers, **common)
+                    for rising in (True, False)
+                }
+
+            if (domain is not None and domain[0] is not None and domain[1] is not None
+                    and domain[1] - domain[0] <= 64
+                    and float(domain[0]).is_integer() and float(domain[1]).is_integer()):
+                lookups = {
+                    rising: lookup.with_int_table(int(domain[0]), int(domain[1]))
+                    for rising, lookup in lookups.items()
+                }
+
+            self._compiled_multipliers[id(scoring_dict)] = (scoring_dict, lookups)
+        except (KeyError, TypeError, ValueError, IndexError) as exc:
+            # DEBUG for the same reason as _cache_linear_anchors: the diagnosis belongs to
+            # the validators (or, for survival, to the lazy KeyError at first use).
+            self.logger.debug(
+                f"_compile_multiplier: leaving a ladder uncompiled "
+                f"({type(exc).__name__}: {exc}); it scores on the interpretive path"
+            )
+
+    def invalidate_compiled_multipliers(self, scoring_dict: Optional[Dict[str, Any]] = None) -> None:
+        """Drop compiled multiplier lookups so edited ladders are scored from their contents.
+
+        _get_multiplier trusts a compiled lookup for as long as its block is registered,
+        without re-reading the block, so an in-place edit after load (a threshold, a
+        multiplier, WEIGHT, SCALING, MISSING_VALUE_TIER) must be followed by this call.
+        Dropped blocks score on the interpretive path from then on; nothing recompiles.
+
+        Args:
+            scoring_dict (Optional[Dict[str, Any]]): The edited ladder block, or None to
+                drop every compiled lookup.
+        """
+        if scoring_dict is None:
+            self._compiled_multipliers = {}
+        else:
+            self._compiled_multipliers = {
+                key: entry for key, entry in self._compiled_multipliers.items()
+                if entry[0] is not scoring_dict
+            }
+
     def _multiplier_factors(self) -> List[Tuple[str, Dict[str, Any],
                                                 Callable[[float], Tuple[float, str]]]]:
         """Return the eight REGISTERED `_get_multiplier` consumers as (key, ladder,
@@ -1922,7 +2104,27 @@ class ConfigManager:
             Both modes then share the unchanged `multiplier ** WEIGHT` step below, so
             LINEAR interpolates the BASE multiplier and the exponent is applied after
             (TD1).
+
+            A block compiled at config load (_compile_multiplier) and not since dropped
+            by invalidate_compiled_multipliers is evaluated through its immutable lookup
+            instead, which returns the same pair bit for bit; the code below is the
+            reference it was compiled from and the path for every other block.
         """
+        # Validated on read by the block's identity alone -- an O(1) check, where comparing
+        # contents would cost about as much as the interpretive path itself. Post-load
+        # edits are the editor's to announce (invalidate_compiled_multipliers). A miss
+        # never compiles: only the load-time pass populates.
+        entry = self._compiled_multipliers.get(id(scoring_dict))
+        if entry is not None and entry[0] is scoring_dict:
+            compiled = entry[1][bool(rising_thresholds)]
+            if val == None:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Multiplier calculation received None value, scoring it as {compiled.missing[1]}"
+                    )
+                return compiled.missing
+            return compiled.evaluate(val)
+
         if val == None:
             # Per-factor, defaulting to NEUTRAL so every factor that does not configure
             # MISSING_VALUE_TIER behaves exactly as before. The chosen tier's BASE
@@ -1934,9 +2136,12 @@ class ConfigManager:
                 multiplier = 1.0
             else:
                 multiplier = scoring_dict[self.keys.MULTIPLIERS][label]
-            self.logger.debug(
-                f"Multiplier calculation received None value, scoring it as {label}"
-            )
+            # Guarded: this arm runs per player for every absent input, and the
+            # simulations run at INFO, where the formatted string would be discarded.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Multiplier calculation received None value, scoring it as {label}"
+                )
 
         elif self._resolve_scaling(scoring_dict) == self.keys.SCALING_LINEAR:
             # Sorted anchor table, built once at config load (TD2 rationale lives on
@@ -2021,6 +2226,119 @@ class ConfigManager:
         multiplier = multiplier ** scoring_dict[self.keys.WEIGHT]
         return multiplier, label
 
+    def get_multipliers_batch(
+        self,
+        scoring_dict: Dict[str, Any],
+        values: Any,
+        rising_thresholds: bool = True,
+        missing: Optional[Any] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized _get_multiplier: evaluate one ladder for a whole array of inputs.
+
+        Element i of the result is bit-identical to
+        _get_multiplier(scoring_dict, values[i], rising_thresholds) -- with values[i]
+        replaced by None wherever missing[i] is True -- multiplier AND label. The same
+        branch order is reproduced with array masks rather than re-derived:
+
+            - missing (None) inputs take the MISSING_VALUE_TIER base multiplier;
+            - BUCKETED is an np.select over the scalar elif chain, in its order, so an
+              input satisfying two arms (e.g. val >= GOOD and val <= POOR on an
+              overlapping ladder) resolves to the same arm;
+            - LINEAR locates each input's segment with np.searchsorted over the sorted
+              anchors, then applies exact-anchor (first match wins), clamp and the
+              scalar interpolation expression verbatim. np.interp is deliberately NOT
+              used: it evaluates the segment as slope * (x - x0) + y0, which differs
+              from the scalar path in the last bit.
+            - NaN inputs satisfy no comparison in either mode and stay (1.0, NEUTRAL).
+
+        The `** WEIGHT` step is applied with Python's float power to each DISTINCT base
+        multiplier (at most five for a BUCKETED ladder), never np.power, whose SIMD
+        kernels are not guaranteed to round like the scalar path's libm pow().
+
+        Args:
+            scoring_dict: Dictionary with THRESHOLDS, MULTIPLIERS and WEIGHT
+            values: Array-like of numeric inputs (NaN where the input is absent)
+            rising_thresholds: True if higher values are better (BUCKETED only)
+            missing: Optional boolean array-like; True marks an input the scalar path
+                would receive as None
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (float64 weighted multipliers, object array
+                of tier labels), both shaped like values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        missing = (np.zeros(values.shape, dtype=bool) if missing is None
+                   else np.asarray(missing, dtype=bool))
+        thresholds = scoring_dict[self.keys.THRESHOLDS]
+        multipliers = scoring_dict[self.keys.MULTIPLIERS]
+
+        base = np.ones(values.shape, dtype=np.float64)
+        labels = np.full(values.shape, self.keys.NEUTRAL, dtype=object)
+        valued = ~missing
+
+        if self._resolve_scaling(scoring_dict) == self.keys.SCALING_LINEAR:
+            anchors = self._linear_anchors(scoring_dict)
+            anchor_thresholds = np.array([anchor[0] for anchor in anchors], dtype=np.float64)
+            anchor_multipliers = np.array([anchor[1] for anchor in anchors], dtype=np.float64)
+            anchor_labels = np.array([anchor[2] for anchor in anchors], dtype=object)
+
+            # Interior segments. searchsorted(side='left') puts a non-anchor input in
+            # (t[upper - 1], t[upper]); the strict bounds below are the scalar loop's.
+            upper = np.clip(np.searchsorted(anchor_thresholds, values, side='left'), 1, len(anchors) - 1)
+            lower = upper - 1
+            lower_threshold, upper_threshold = anchor_thresholds[lower], anchor_thresholds[upper]
+            lower_multiplier, upper_multiplier = anchor_multipliers[lower], anchor_multipliers[upper]
+            interior = valued & (lower_threshold < values) & (values < upper_threshold)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                interpolated = (lower_multiplier
+                                + (upper_multiplier - lower_multiplier)
+                                * (values - lower_threshold) / (upper_threshold - lower_threshold))
+            base = np.where(interior, interpolated, base)
+            labels = np.where(
+                interior,
+                np.where(lower_multiplier >= upper_multiplier, anchor_labels[lower], anchor_labels[upper]),
+                labels,
+            )
+
+            below = valued & (values < anchor_thresholds[0])
+            above = valued & (values > anchor_thresholds[-1])
+            base[below], labels[below] = anchors[0][1], anchors[0][2]
+            base[above], labels[above] = anchors[-1][1], anchors[-1][2]
+
+            # Exact anchors last, in reverse, so the FIRST matching anchor wins (TD3 clause 1).
+            for anchor_threshold, anchor_multiplier, anchor_label in reversed(anchors):
+                exact = valued & (values == anchor_threshold)
+                base[exact], labels[exact] = anchor_multiplier, anchor_label
+        else:
+            if rising_thresholds:
+                arms = [
+                    (values >= thresholds[self.keys.EXCELLENT], self.keys.EXCELLENT),
+                    (values >= thresholds[self.keys.GOOD], self.keys.GOOD),
+                    (values <= thresholds[self.keys.VERY_POOR], self.keys.VERY_POOR),
+                    (values <= thresholds[self.keys.POOR], self.keys.POOR),
+                ]
+            else:
+                arms = [
+                    (values <= thresholds[self.keys.EXCELLENT], self.keys.EXCELLENT),
+                    (values <= thresholds[self.keys.GOOD], self.keys.GOOD),
+                    (values >= thresholds[self.keys.VERY_POOR], self.keys.VERY_POOR),
+                    (values >= thresholds[self.keys.POOR], self.keys.POOR),
+                ]
+            conditions = [valued & condition for condition, _ in arms]
+            base = np.select(conditions, [multipliers[label] for _, label in arms], default=1.0).astype(np.float64)
+            labels = np.select(conditions, [label for _, label in arms], default=self.keys.NEUTRAL).astype(object)
+
+        if missing.any():
+            missing_label = self._resolve_missing_value_tier(scoring_dict)
+            base[missing] = 1.0 if missing_label == self.keys.NEUTRAL else multipliers[missing_label]
+            labels[missing] = missing_label
+
+        weight = scoring_dict[self.keys.WEIGHT]
+        distinct, inverse = np.unique(base, return_inverse=True)
+        weighted = np.array([multiplier ** weight for multiplier in distinct.tolist()], dtype=np.float64)
+        return weighted[inverse].reshape(values.shape), labels
+
 
     def __repr__(self) -> str:
         """String representation of the config manager."""
@@ -141,6 +141,23 @@ class FantasyTeam:
 
         return True
 
+    def draftable_positions(self) -> List[str]:
+        """
+        Return the positions can_draft could currently accept a player at.
+
+        The position-level half of can_draft (roster space, natural slot or FLEX space),
+        so a caller can skip whole positions before running the per-player checks.
+
+        Returns:
+            List[str]: Positions (keys of config.max_positions) with room, in config order
+        """
+        if len(self.roster) >= self.config.max_players:
+            return []
+        return [
+            pos for pos, limit in self.config.max_positions.items()
+            if len(self.slot_assignments[pos]) < limit or self.flex_eligible(pos)
+        ]
+
     def draft_player(self, player : FantasyPlayer) -> bool:
         """
         Draft a player onto the team.
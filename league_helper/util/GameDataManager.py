@@ -38,7 +38,12 @@ class GameDataManager:
         ...     print(f"KC vs {game.away_team}, temp: {game.temperature}")
     """
 
-    def __init__(self, data_folder: Path, current_week: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        data_folder: Path,
+        current_week: Optional[int] = None,
+        games: Optional[Dict[int, Dict[str, UpcomingGame]]] = None
+    ) -> None:
         """
         Initialize GameDataManager and load game data.
 
@@ -47,6 +52,10 @@ class GameDataManager:
             current_week (Optional[int]): If provided, only games for this week
                 are indexed by team. If None, all games are loaded but get_game()
                 requires a week parameter.
+            games (Optional[Dict[int, Dict[str, UpcomingGame]]]): Already-parsed games,
+                shaped like all_games (e.g. a simulation SeasonBundle's). When provided,
+                game_data.csv is not read and the mapping is shared, not copied -- it is
+                only ever read here (set_current_week copies the week it indexes).
 
         Note:
             If game_data.csv doesn't exist, manager initializes with empty data
@@ -60,6 +69,12 @@ class GameDataManager:
 
         self.all_games: Dict[int, Dict[str, UpcomingGame]] = {}
 
+        if games is not None:
+            self.all_games = games
+            if current_week and current_week in games:
+                self.games_by_team = games[current_week].copy()
+            return
+
         self._load_game_data()
 
     def _load_game_data(self) -> None:
@@ -36,15 +36,17 @@ The 15-step scoring algorithm:
 Author: Kai Mizuno
 """
 
+import heapq
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional, Any
 import statistics
 
-from league_helper.util.TeamDataManager import TeamDataManager
+from league_helper.util.TeamDataManager import TeamDataManager, WeekRankTables
 from league_helper.util.SeasonScheduleManager import SeasonScheduleManager
 from league_helper.util.FantasyTeam import FantasyTeam
 from league_helper.util.GameDataManager import GameDataManager
+from league_helper.util.upcoming_game_model import UpcomingGame
 import league_helper.constants as Constants
 from league_helper.util.ConfigManager import ConfigManager
 from league_helper.util.ScoredPlayer import ScoredPlayer
@@ -68,11 +70,14 @@ class PlayerManager:
         team_data_manager (TeamDataManager): Manager for team rankings and matchups
         season_schedule_manager (SeasonScheduleManager): Manager for season schedule data
         team (FantasyTeam): Current fantasy team roster
-        players (List[FantasyPlayer]): All available players
+        players (List[FantasyPlayer]): All available players. Looked up by id / position
+            through get_player_by_id / get_available_players, whose index is rebuilt
+            lazily whenever this list is replaced or changes length
         max_projection (float): Max projection used as the score-normalization denominator — the
             max rest-of-season projection in the JSON load path (matches the scoring numerator's
             current_week..17 window; see T47), recomputed per week from fantasy_points by
             set_player_data in the win-rate sim
+        player_data_version (int): Incremented on every load_players_from_json / set_player_data
 
     Example:
         >>> player_manager = PlayerManager(data_folder, config, team_data_manager, season_schedule_manager)
@@ -83,12 +88,18 @@ class PlayerManager:
         ...     player_manager.update_players_file()
     """
 
+    # In-memory player source (see __init__'s player_records); None reads player_data/.
+    _player_records: Optional[Mapping[str, List[Dict[str, Any]]]] = None
+
     def __init__(
         self,
         data_folder: Path,
         config: ConfigManager,
         team_data_manager: TeamDataManager,
-        season_schedule_manager: SeasonScheduleManager
+        season_schedule_manager: SeasonScheduleManager,
+        fast_scoring: bool = False,
+        player_records: Optional[Mapping[str, List[Dict[str, Any]]]] = None,
+        game_data: Optional[Dict[int, Dict[str, UpcomingGame]]] = None
     ) -> None:
         """
         Initialize the Player Manager.
@@ -98,6 +109,17 @@ class PlayerManager:
             config (ConfigManager): Configuration manager with scoring parameters
             team_data_manager (TeamDataManager): Manager for team rankings and matchups
             season_schedule_manager (SeasonScheduleManager): Manager for season schedule data
+            fast_scoring (bool): Score without building reason or debug strings (see
+                PlayerScoringCalculator.fast_scoring). Set by the simulation engines;
+                the interactive league helper keeps the default False.
+            player_records (Optional[Mapping[str, List[Dict[str, Any]]]]): In-memory
+                player records keyed by position file stem ('qb_data', ...), each list
+                shaped like that file's array. When provided, load_players_from_json
+                builds players from them instead of reading player_data/ (the simulation
+                builds every league from one shared SeasonBundle this way). The records
+                are only read; every FantasyPlayer gets its own point arrays.
+            game_data (Optional[Dict[int, Dict[str, UpcomingGame]]]): Already-parsed
+                games for this manager's GameDataManager (see GameDataManager's games).
 
         Side Effects:
             - Loads all players from player_data/*.json
@@ -112,7 +134,8 @@ class PlayerManager:
         self.team_data_manager = team_data_manager
         self.season_schedule_manager = season_schedule_manager
 
-        self.game_data_manager = GameDataManager(data_folder, config.current_nfl_week)
+        self._player_records = player_records
+        self.game_data_manager = GameDataManager(data_folder, config.current_nfl_week, games=game_data)
 
         self.scoring_calculator = PlayerScoringCalculator(
             config,
@@ -121,7 +144,8 @@ class PlayerManager:
             team_data_manager,
             season_schedule_manager,
             config.current_nfl_week,
-            self.game_data_manager
+            self.game_data_manager,
+            fast_scoring=fast_scoring
         )
 
         self.team: FantasyTeam
@@ -130,6 +154,17 @@ class PlayerManager:
         self.max_weekly_projections: Dict[int, float] = {}
         self._last_mtimes: Dict[str, float] = {}
 
+        # id -> player and position -> players indexes over self.players (see _ensure_player_index)
+        self._players_by_id: Dict[int, FantasyPlayer] = {}
+        self._players_by_position: Dict[str, List[FantasyPlayer]] = {}
+        self._indexed_players: Optional[List[FantasyPlayer]] = None
+        self._indexed_count = 0
+
+        # Incremented whenever player point data is (re)loaded or swapped, so caches derived
+        # from it (e.g. IncrementalDraftRecommender's per-player partial scores) can tell
+        # they are stale without diffing the players.
+        self.player_data_version = 0
+
         self.load_players_from_json()
         self.load_team()
         self.logger.debug(f"Player Manager initialized with {len(self.players)} players, {len(self.team.roster)} on roster")
@@ -146,7 +181,8 @@ class PlayerManager:
             True always (raises on unrecoverable errors; corrupted position files are skipped)
 
         Raises:
-            FileNotFoundError: If player_data directory doesn't exist
+            FileNotFoundError: If player_data directory doesn't exist (and the manager was
+                not given in-memory player_records)
 
         Side Effects:
             - Sets self.players to combined list from all position files
@@ -161,15 +197,16 @@ class PlayerManager:
 
         """
         player_data_dir = self.data_folder / 'player_data'
-        if not player_data_dir.exists():
-            raise FileNotFoundError(
-                f"Player data directory not found: {player_data_dir}\n"
-                "Run run_player_fetcher.py to generate JSON files."
-            )
+        if self._player_records is None:
+            if not player_data_dir.exists():
+                raise FileNotFoundError(
+                    f"Player data directory not found: {player_data_dir}\n"
+                    "Run run_player_fetcher.py to generate JSON files."
+                )
 
-        for tmp_file in player_data_dir.glob("*.tmp"):
-            tmp_file.unlink()
-            self.logger.warning(f"Removed stale temp file: {tmp_file.name}")
+            for tmp_file in player_data_dir.glob("*.tmp"):
+                tmp_file.unlink()
+                self.logger.warning(f"Removed stale temp file: {tmp_file.name}")
 
         all_players = []
         failed_positions = []
@@ -179,18 +216,24 @@ class PlayerManager:
         ]
 
         for position_file in position_files:
+            position_key = position_file.removesuffix('.json')
             filepath = player_data_dir / position_file
 
-            if not filepath.exists():
+            if self._player_records is not None:
+                if position_key not in self._player_records:
+                    self.logger.warning(f"Position file not found: {position_file}")
+                    continue
+            elif not filepath.exists():
                 self.logger.warning(f"Position file not found: {position_file}")
                 continue
 
             try:
-                with open(filepath, 'r') as f:
-                    json_data = json.load(f)
-
-                position_key = position_file.removesuffix('.json')
-                players_array = json_data.get(position_key, [])
+                if self._player_records is not None:
+                    players_array = self._player_records[position_key]
+                else:
+                    with open(filepath, 'r') as f:
+                        json_data = json.load(f)
+                    players_array = json_data.get(position_key, [])
 
                 for player_data in players_array:
                     try:
@@ -213,6 +256,7 @@ class PlayerManager:
             self.logger.warning(summary_msg)
 
         self.players = all_players
+        self._bump_player_data_version()
         self.logger.debug(f"All position files loaded: {len(self.players)} total players across all positions")
 
         self.refresh_team_context()
@@ -253,10 +297,14 @@ class PlayerManager:
         - matchup_score: get_rank_difference(team, position) — an OPPONENT-defense rank
           (1-32) or None on genuine no-info (bye / team data unavailable).
 
-        All three are week-dependent, so they are read live from TeamDataManager at call
-        time — never cached, never precomputed into the JSON files. Called at load
-        (load_players_from_json) and per-week in the win-rate season loop so the
-        team-quality and matchup factors reflect the correct week.
+        All three are week-dependent, so they are read from TeamDataManager's CURRENT
+        week at call time — never precomputed into the JSON files. When the
+        TeamDataManager holds cached week rank tables they come from get_team_context,
+        which memoizes the three values per (team, position) in that week's tables: each
+        player is one lookup, and a week change swaps to the new week's tables, so nothing
+        stale is ever served. Otherwise they are read through the individual getters.
+        Called at load (load_players_from_json) and per-week in the win-rate season loop
+        so the team-quality and matchup factors reflect the correct week.
 
         A team absent from a rank dict yields None on that field (the getters are
         Optional[int] .get() lookups) and raises nothing; the populate tolerates that
@@ -266,6 +314,14 @@ class PlayerManager:
             None. Mutates FantasyPlayer.team_offensive_rank, team_defensive_rank and
             matchup_score on each player in self.players in place.
         """
+        team_data_manager = self.team_data_manager
+        if isinstance(getattr(team_data_manager, '_week_tables', None), WeekRankTables):
+            get_team_context = team_data_manager.get_team_context
+            for player in self.players:
+                (player.team_offensive_rank, player.team_defensive_rank,
+                 player.matchup_score) = get_team_context(player.team, player.position)
+            return
+
         for player in self.players:
             player.team_offensive_rank = self.team_data_manager.get_team_offensive_rank(
                 player.team
@@ -532,6 +588,88 @@ class PlayerManager:
             print(f"Warning: Could not reload player data: {e}")
 
 
+    def _ensure_player_index(self) -> None:
+        """
+        (Re)build the id and position indexes if self.players changed shape since last built.
+
+        self.players is replaced wholesale on every load (load_players_from_json) and is
+        assigned directly by callers and tests, so the index is validated by list identity
+        and length on each lookup instead of being hooked into every writer. Per-player
+        mutations (drafted_by, the set_player_data point swaps) don't move a player's id or
+        position and so never invalidate it.
+        """
+        if getattr(self, '_indexed_players', None) is self.players and self._indexed_count == len(self.players):
+            return
+
+        by_id: Dict[int, FantasyPlayer] = {}
+        # Bucket entries carry the player's list index so buckets can be merged back into
+        # self.players order (the draft ranking breaks score ties by that order).
+        by_position: Dict[str, List[Tuple[int, FantasyPlayer]]] = {}
+        for index, player in enumerate(self.players):
+            by_id.setdefault(player.id, player)
+            by_position.setdefault(player.position, []).append((index, player))
+
+        self._players_by_id = by_id
+        self._players_by_position = by_position
+        self._indexed_players = self.players
+        self._indexed_count = len(self.players)
+
+    def get_player_by_id(self, player_id: int) -> Optional[FantasyPlayer]:
+        """
+        Return this manager's player object with the given id, or None.
+
+        O(1) replacement for scanning self.players; the win-rate draft broadcasts every pick
+        to every team's two managers, and weekly lineups resolve starters by id.
+
+        Args:
+            player_id (int): Player id
+
+        Returns:
+            Optional[FantasyPlayer]: The first player in self.players with that id, or None
+        """
+        self._ensure_player_index()
+        return self._players_by_id.get(player_id)
+
+    def get_available_players(self, positions: Optional[Iterable[str]] = None) -> List[FantasyPlayer]:
+        """
+        Return the free agents (is_free_agent()) overall or at the given positions.
+
+        Availability is read from each player's drafted_by at call time rather than kept in
+        a separately maintained set: drafted_by is written directly by FantasyTeam, the
+        modify-player and trade modes and the simulation teams, so only the position buckets
+        are indexed and the free-agent filter runs over those buckets. The draft candidate
+        pool (get_player_list with can_draft) reads only the positions the roster can still
+        take, which late in a draft is a small fraction of the player list.
+
+        Args:
+            positions (Optional[Iterable[str]]): Restrict to these positions. None = all
+                positions.
+
+        Returns:
+            List[FantasyPlayer]: Available players in self.players order
+        """
+        if positions is None:
+            return [p for p in self.players if p.is_free_agent()]
+        self._ensure_player_index()
+        buckets = [self._players_by_position.get(pos, []) for pos in dict.fromkeys(positions)]
+        return [p for _, p in heapq.merge(*buckets, key=lambda entry: entry[0]) if p.is_free_agent()]
+
+    def mark_player_drafted(self, player_id: int, drafted_by: str) -> Optional[FantasyPlayer]:
+        """
+        Set drafted_by on the player with the given id (no roster change).
+
+        Args:
+            player_id (int): Player id
+            drafted_by (str): Owning team name (e.g. "OPPONENT")
+
+        Returns:
+            Optional[FantasyPlayer]: The updated player, or None if the id is unknown
+        """
+        player = self.get_player_by_id(player_id)
+        if player is not None:
+            player.drafted_by = drafted_by
+        return player
+
     def get_roster_len(self) -> int:
         return len(self.team.roster)
     
@@ -600,8 +738,15 @@ class PlayerManager:
             if pos not in min_scores:
                 min_scores[pos] = 0.0
 
+        if can_draft and drafted_vals == [0]:
+            # Draft candidate pool: only free agents at positions the roster can still take
+            # (can_draft below still runs the per-player checks).
+            candidates = self.get_available_players(self.team.draftable_positions())
+        else:
+            candidates = self.players
+
         player_list = [
-            p for p in self.players
+            p for p in candidates
             if matches_drafted_status(p, drafted_vals) and p.score >= min_scores[p.position] and is_unlocked(p.locked)
         ]
 
@@ -917,6 +1062,7 @@ class PlayerManager:
             - Recomputes fantasy_points, max_projection, scoring_calculator.max_projection,
               and per-player weighted_projection
             - Clears max_weekly_projections and scoring_calculator.max_weekly_projection
+            - Increments player_data_version
         """
         if not player_data:
             return
@@ -953,9 +1099,14 @@ class PlayerManager:
 
         self.max_weekly_projections = {}
         self.scoring_calculator.max_weekly_projection = 0.0
+        self._bump_player_data_version()
 
         self.logger.debug(f"Player data updated, max_projection={self.max_projection:.2f}")
 
+    def _bump_player_data_version(self) -> None:
+        """Mark player point data as changed (see player_data_version)."""
+        self.player_data_version = getattr(self, 'player_data_version', 0) + 1
+
     def get_players_by_team(self) -> Dict[str, List[FantasyPlayer]]:
         """
         Organize players by their fantasy team.
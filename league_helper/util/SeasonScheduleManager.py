@@ -22,12 +22,15 @@ class SeasonScheduleManager:
     for querying opponents, future matchups, and remaining schedules.
     """
 
-    def __init__(self, data_folder: Path):
+    def __init__(self, data_folder: Path, schedule: Optional[Dict[tuple, Optional[str]]] = None):
         """
         Initialize the Season Schedule Manager.
 
         Args:
             data_folder: Path to data directory containing season_schedule.csv
+            schedule: Optional already-loaded (team, week) -> opponent mapping, shaped like
+                schedule_cache (e.g. another manager's cache, or a simulation SeasonBundle's).
+                When provided it is copied in and season_schedule.csv is not read.
 
         Note:
             If season_schedule.csv is not found, manager initializes with empty cache.
@@ -38,6 +41,10 @@ class SeasonScheduleManager:
         self.schedule_file = data_folder / 'season_schedule.csv'
         self.schedule_cache: Dict[tuple, Optional[str]] = {}
 
+        if schedule is not None:
+            self.schedule_cache = dict(schedule)
+            return
+
         try:
             self._load_schedule()
             self.logger.debug(f"Loaded {len(self.schedule_cache)} schedule entries")
@@ -12,11 +12,17 @@ Key responsibilities:
 - Calculating position-specific defense rankings
 - Providing matchup analysis for player scoring adjustments
 
+Rankings for a (week, rolling-window) pair never change for a given season, so each
+week's rank tables are computed once and cached (optionally in a cache shared by every
+manager built from the same season data, e.g. all simulated leagues of a season);
+set_current_week then swaps the current tables instead of recalculating.
+
 Author: Kai Mizuno
 """
 
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import csv
 import json
 
@@ -28,6 +34,39 @@ if TYPE_CHECKING:
     from league_helper.util.ConfigManager import ConfigManager
 
 
+TeamContext = Tuple[Optional[int], Optional[int], Optional[int]]
+"""A player's (team_offensive_rank, team_defensive_rank, matchup_score) for one week."""
+
+
+@dataclass(frozen=True)
+class WeekRankTables:
+    """
+    One week's complete rankings, built once and never modified afterwards.
+
+    Attributes:
+        week (int): The NFL week the rankings are for
+        offensive_ranks (Dict[str, int]): Offensive rankings
+        defensive_ranks (Dict[str, int]): Defensive rankings
+        position_ranks (Dict[str, Dict[str, int]]): Position-specific defense rankings
+        dst_fantasy_ranks (Dict[str, int]): D/ST fantasy rankings
+        team_data_cache (Dict[str, TeamData]): TeamData objects built from the rankings
+        team_context (Dict[Tuple[str, str], TeamContext]): (team, position) -> the
+            player team context for this week, filled on first lookup by get_team_context
+    """
+
+    week: int
+    offensive_ranks: Dict[str, int]
+    defensive_ranks: Dict[str, int]
+    position_ranks: Dict[str, Dict[str, int]]
+    dst_fantasy_ranks: Dict[str, int]
+    team_data_cache: Dict[str, TeamData]
+    team_context: Dict[Tuple[str, str], TeamContext] = field(default_factory=dict)
+
+
+RankTableCache = Dict[Tuple[int, int, int], WeekRankTables]
+"""Week rank tables keyed by (week, TEAM_QUALITY_MIN_WEEKS, MATCHUP_MIN_WEEKS)."""
+
+
 class TeamDataManager:
     """
     Loads and manages team ranking data calculated from per-team historical files.
@@ -47,9 +86,16 @@ class TeamDataManager:
         current_nfl_week (int): Current NFL week number
     """
 
+    # The current week's cached tables (None until rankings are first calculated).
+    # Class-level so instances built without __init__ read as "no cached tables".
+    _week_tables: Optional[WeekRankTables] = None
+
     def __init__(self, data_folder: Path, config_manager: 'ConfigManager',
                  season_schedule_manager: Optional['SeasonScheduleManager'] = None,
-                 current_nfl_week: int = 1):
+                 current_nfl_week: int = 1,
+                 team_weekly_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 dst_player_data: Optional[Dict[str, List[Optional[float]]]] = None,
+                 rank_table_cache: Optional[RankTableCache] = None):
         """
         Initialize TeamDataManager and load team data.
 
@@ -58,6 +104,15 @@ class TeamDataManager:
             config_manager (ConfigManager): Configuration manager for MIN_WEEKS access
             season_schedule_manager (Optional[SeasonScheduleManager]): Season schedule manager
             current_nfl_week (int): Current NFL week number (default: 1)
+            team_weekly_data (Optional[Dict]): Already-loaded load_team_weekly_data output
+                (e.g. a simulation SeasonBundle's). When provided, team_data/ is not read.
+            dst_player_data (Optional[Dict]): Already-extracted D/ST weekly points (see
+                dst_player_data_from_records). When provided, dst_data.json is not read.
+            Both are only ever read, so they are shared rather than copied.
+            rank_table_cache (Optional[RankTableCache]): Week rank tables to read and fill.
+                Share one cache only between managers built from the same team data, D/ST
+                data and schedule (a simulation SeasonBundle owns one per season). Default
+                None gives this manager a private cache.
 
         Side Effects:
             - Loads team_data/*.csv files into memory
@@ -83,8 +138,16 @@ class TeamDataManager:
         self.season_schedule_manager = season_schedule_manager
         self.current_nfl_week = current_nfl_week
 
-        self._load_team_data()
-        self._load_dst_player_data()
+        self._rank_tables: RankTableCache = rank_table_cache if rank_table_cache is not None else {}
+
+        if team_weekly_data is not None:
+            self.team_weekly_data = team_weekly_data
+        else:
+            self._load_team_data()
+        if dst_player_data is not None:
+            self.dst_player_data = dst_player_data
+        else:
+            self._load_dst_player_data()
         self._calculate_rankings()
 
     def _load_team_data(self) -> None:
@@ -119,13 +182,7 @@ class TeamDataManager:
             with open(dst_json_path, 'r') as f:
                 data = json.load(f)
 
-            dst_players = data.get('dst_data', [])
-
-            for dst_player in dst_players:
-                team = dst_player.get('team', '').upper()
-                actual_points = dst_player.get('actual_points', [0.0] * 17)
-
-                self.dst_player_data[team] = actual_points
+            self.dst_player_data = self.dst_player_data_from_records(data.get('dst_data', []))
 
             self.logger.debug(f"Loaded D/ST data for {len(self.dst_player_data)} teams from {dst_json_path}")
 
@@ -139,28 +196,75 @@ class TeamDataManager:
             self.logger.error(f"Error reading D/ST data file {dst_json_path}: {e}")
             self.dst_player_data = {}
 
+    @staticmethod
+    def dst_player_data_from_records(dst_players: List[Dict[str, Any]]) -> Dict[str, List[Optional[float]]]:
+        """
+        Extract {team: weekly actual_points} from dst_data.json player records.
+
+        Args:
+            dst_players (List[Dict[str, Any]]): The records under dst_data.json's 'dst_data' key
+
+        Returns:
+            Dict[str, List[Optional[float]]]: Weekly D/ST fantasy points by upper-cased team
+        """
+        dst_player_data = {}
+        for dst_player in dst_players:
+            team = dst_player.get('team', '').upper()
+            dst_player_data[team] = dst_player.get('actual_points', [0.0] * 17)
+        return dst_player_data
+
     def _calculate_rankings(self) -> None:
         """
-        Calculate all rankings based on current week and MIN_WEEKS settings.
+        Make the current week's rank tables current, computing them on first use.
 
         Uses different rolling windows for different ranking types:
         - Offensive/defensive ranks: TEAM_QUALITY_MIN_WEEKS window
         - Position-specific defense ranks: MATCHUP_MIN_WEEKS window
+
+        Tables are cached per (week, TEAM_QUALITY_MIN_WEEKS, MATCHUP_MIN_WEEKS), so only
+        the first manager to reach a week computes it; after that this is a lookup and
+        an attribute swap.
         """
         if not self.team_weekly_data:
             self.logger.debug("No team data available for ranking calculation")
             return
 
-        team_quality_min_weeks = self.config_manager.get_team_quality_min_weeks()
-        matchup_min_weeks = self.config_manager.get_matchup_min_weeks()
+        key = (
+            self.current_nfl_week,
+            self.config_manager.get_team_quality_min_weeks(),
+            self.config_manager.get_matchup_min_weeks(),
+        )
+        tables = self._rank_tables.get(key)
+        if tables is None:
+            tables = self._compute_rank_tables(*key)
+            self._rank_tables[key] = tables
+
+        self._week_tables = tables
+        self.offensive_ranks = tables.offensive_ranks
+        self.defensive_ranks = tables.defensive_ranks
+        self.position_ranks = tables.position_ranks
+        self.dst_fantasy_ranks = tables.dst_fantasy_ranks
+        self.team_data_cache = tables.team_data_cache
+
+    def _compute_rank_tables(self, week: int, team_quality_min_weeks: int,
+                             matchup_min_weeks: int) -> WeekRankTables:
+        """
+        Calculate all rankings for one week from the raw team and D/ST data.
+
+        Args:
+            week: NFL week the rankings are for (data through week - 1 is used)
+            team_quality_min_weeks: TEAM_QUALITY_MIN_WEEKS rolling window
+            matchup_min_weeks: MATCHUP_MIN_WEEKS rolling window
 
+        Returns:
+            WeekRankTables: Freshly built tables for the week
+        """
         min_required = min(team_quality_min_weeks, matchup_min_weeks)
-        if self.current_nfl_week <= min_required:
-            self.logger.debug(f"Week {self.current_nfl_week} < MIN_WEEKS {min_required}, using neutral rankings")
-            self._set_neutral_rankings()
-            return
+        if week <= min_required:
+            self.logger.debug(f"Week {week} < MIN_WEEKS {min_required}, using neutral rankings")
+            return self._neutral_rank_tables(week)
 
-        end_week = self.current_nfl_week - 1
+        end_week = week - 1
         positions = ['QB', 'RB', 'WR', 'TE', 'K']
 
         tq_start_week = max(1, end_week - team_quality_min_weeks + 1)
@@ -229,27 +333,39 @@ class TeamDataManager:
 
             dst_totals[team] = (dst_total, games)
 
-        self._rank_offensive(offensive_totals)
-        self._rank_defensive(defensive_totals)
-        self._rank_dst_fantasy(dst_totals)
-        self._rank_positions(position_totals, positions)
+        offensive_ranks = self._rank_offensive(offensive_totals)
+        defensive_ranks = self._rank_defensive(defensive_totals)
+        dst_fantasy_ranks = self._rank_dst_fantasy(dst_totals)
+        position_ranks = self._rank_positions(position_totals, positions)
 
-        self._build_team_data_cache()
+        self.logger.debug(f"Calculated rankings for {len(offensive_ranks)} teams")
 
-        self.logger.debug(f"Calculated rankings for {len(self.offensive_ranks)} teams")
+        return WeekRankTables(
+            week=week,
+            offensive_ranks=offensive_ranks,
+            defensive_ranks=defensive_ranks,
+            position_ranks=position_ranks,
+            dst_fantasy_ranks=dst_fantasy_ranks,
+            team_data_cache=self._build_team_data_cache(offensive_ranks, defensive_ranks, position_ranks),
+        )
 
-    def _set_neutral_rankings(self) -> None:
-        """Set all rankings to neutral (16) for early season."""
-        for team in NFL_TEAMS:
-            self.offensive_ranks[team] = 16
-            self.defensive_ranks[team] = 16
-            self.dst_fantasy_ranks[team] = 16
-            self.position_ranks[team] = {
-                'QB': 16, 'RB': 16, 'WR': 16, 'TE': 16, 'K': 16
-            }
-        self._build_team_data_cache()
+    def _neutral_rank_tables(self, week: int) -> WeekRankTables:
+        """Build all-neutral (16) rankings for early season."""
+        offensive_ranks = {team: 16 for team in NFL_TEAMS}
+        defensive_ranks = {team: 16 for team in NFL_TEAMS}
+        position_ranks = {
+            team: {'QB': 16, 'RB': 16, 'WR': 16, 'TE': 16, 'K': 16} for team in NFL_TEAMS
+        }
+        return WeekRankTables(
+            week=week,
+            offensive_ranks=offensive_ranks,
+            defensive_ranks=defensive_ranks,
+            position_ranks=position_ranks,
+            dst_fantasy_ranks={team: 16 for team in NFL_TEAMS},
+            team_data_cache=self._build_team_data_cache(offensive_ranks, defensive_ranks, position_ranks),
+        )
 
-    def _rank_offensive(self, totals: Dict[str, tuple]) -> None:
+    def _rank_offensive(self, totals: Dict[str, tuple]) -> Dict[str, int]:
         """Rank teams by offensive production (higher points = better = rank 1)."""
         averages = []
         for team, (total, games) in totals.items():
@@ -258,10 +374,9 @@ class TeamDataManager:
 
         averages.sort(key=lambda x: x[1], reverse=True)
 
-        for rank, (team, _) in enumerate(averages, 1):
-            self.offensive_ranks[team] = rank
+        return {team: rank for rank, (team, _) in enumerate(averages, 1)}
 
-    def _rank_defensive(self, totals: Dict[str, tuple]) -> None:
+    def _rank_defensive(self, totals: Dict[str, tuple]) -> Dict[str, int]:
         """Rank teams by defensive production (fewer points allowed = better = rank 1)."""
         averages = []
         for team, (total, games) in totals.items():
@@ -270,10 +385,9 @@ class TeamDataManager:
 
         averages.sort(key=lambda x: x[1])
 
-        for rank, (team, _) in enumerate(averages, 1):
-            self.defensive_ranks[team] = rank
+        return {team: rank for rank, (team, _) in enumerate(averages, 1)}
 
-    def _rank_dst_fantasy(self, totals: Dict[str, tuple]) -> None:
+    def _rank_dst_fantasy(self, totals: Dict[str, tuple]) -> Dict[str, int]:
         """
         Rank teams by D/ST fantasy points scored (higher points = better = rank 1).
 
@@ -284,8 +398,8 @@ class TeamDataManager:
         Args:
             totals: Dict mapping team abbreviation to (total_points, games_played)
 
-        Side Effects:
-            - Populates self.dst_fantasy_ranks with rankings (1-32)
+        Returns:
+            Dict[str, int]: D/ST fantasy rankings (1-32) by team
         """
         averages = []
         for team, (total, games) in totals.items():
@@ -294,11 +408,11 @@ class TeamDataManager:
 
         averages.sort(key=lambda x: x[1], reverse=True)
 
-        for rank, (team, _) in enumerate(averages, 1):
-            self.dst_fantasy_ranks[team] = rank
+        return {team: rank for rank, (team, _) in enumerate(averages, 1)}
 
-    def _rank_positions(self, totals: Dict[str, Dict], positions: List[str]) -> None:
+    def _rank_positions(self, totals: Dict[str, Dict], positions: List[str]) -> Dict[str, Dict[str, int]]:
         """Rank teams by position-specific defense (fewer points = better = rank 1)."""
+        position_ranks: Dict[str, Dict[str, int]] = {}
         for pos in positions:
             averages = []
             for team, pos_data in totals.items():
@@ -309,30 +423,34 @@ class TeamDataManager:
             averages.sort(key=lambda x: x[1])
 
             for rank, (team, _) in enumerate(averages, 1):
-                if team not in self.position_ranks:
-                    self.position_ranks[team] = {}
-                self.position_ranks[team][pos] = rank
-
-    def _build_team_data_cache(self) -> None:
-        """Build team_data_cache from calculated rankings for compatibility."""
-        for team in self.offensive_ranks.keys():
-            pos_ranks = self.position_ranks.get(team, {})
-            self.team_data_cache[team] = TeamData(
+                position_ranks.setdefault(team, {})[pos] = rank
+        return position_ranks
+
+    @staticmethod
+    def _build_team_data_cache(offensive_ranks: Dict[str, int], defensive_ranks: Dict[str, int],
+                               position_ranks: Dict[str, Dict[str, int]]) -> Dict[str, TeamData]:
+        """Build the TeamData objects for a set of rankings, for compatibility."""
+        team_data_cache = {}
+        for team in offensive_ranks.keys():
+            pos_ranks = position_ranks.get(team, {})
+            team_data_cache[team] = TeamData(
                 team=team,
-                offensive_rank=self.offensive_ranks.get(team),
-                defensive_rank=self.defensive_ranks.get(team),
+                offensive_rank=offensive_ranks.get(team),
+                defensive_rank=defensive_ranks.get(team),
                 def_vs_qb_rank=pos_ranks.get('QB'),
                 def_vs_rb_rank=pos_ranks.get('RB'),
                 def_vs_wr_rank=pos_ranks.get('WR'),
                 def_vs_te_rank=pos_ranks.get('TE'),
                 def_vs_k_rank=pos_ranks.get('K')
             )
+        return team_data_cache
 
     def set_current_week(self, week_num: int) -> None:
         """
-        Update current week and recalculate rankings.
+        Update current week and switch to that week's rankings.
 
-        Used by simulation to update rankings each week.
+        Used by simulation to update rankings each week. A week already in the rank
+        table cache is a lookup; only a week never seen before is calculated.
 
         Args:
             week_num: New NFL week number
@@ -340,6 +458,54 @@ class TeamDataManager:
         self.current_nfl_week = week_num
         self._calculate_rankings()
 
+    def get_team_context(self, team: str, position: str) -> TeamContext:
+        """
+        Get a player's three team-context fields for the current week.
+
+        Returns exactly what PlayerManager.refresh_team_context would read from the
+        individual getters: the team's offensive rank, its D/ST fantasy rank (defense
+        positions) or defensive rank (everything else), and get_rank_difference. The
+        result is memoized per (team, position) in the current week's rank tables, so
+        every player of a team/position after the first -- across all PlayerManagers
+        sharing the tables -- is a single dict lookup.
+
+        The memo is only used while the rank dicts and week are the cached tables'
+        own; anything that replaced them falls through to the live getters.
+
+        Args:
+            team: Team abbreviation (e.g., 'PHI', 'KC')
+            position: Player position (QB, RB, WR, TE, K, DST, DEF, D/ST)
+
+        Returns:
+            TeamContext: (team_offensive_rank, team_defensive_rank, matchup_score)
+        """
+        tables = self._week_tables
+        memo = None
+        if (tables is not None and tables.week == self.current_nfl_week
+                and tables.offensive_ranks is self.offensive_ranks
+                and tables.defensive_ranks is self.defensive_ranks
+                and tables.position_ranks is self.position_ranks
+                and tables.dst_fantasy_ranks is self.dst_fantasy_ranks):
+            memo = tables.team_context
+            context = memo.get((team, position))
+            if context is not None:
+                return context
+
+        from league_helper.constants import DEFENSE_POSITIONS
+
+        if position in DEFENSE_POSITIONS:
+            defensive_rank = self.get_team_dst_fantasy_rank(team)
+        else:
+            defensive_rank = self.get_team_defensive_rank(team)
+        context = (
+            self.get_team_offensive_rank(team),
+            defensive_rank,
+            self.get_rank_difference(team, position),
+        )
+        if memo is not None:
+            memo[(team, position)] = context
+        return context
+
     def get_team_offensive_rank(self, team: str) -> Optional[int]:
         """
         Get team offensive ranking.
@@ -455,6 +621,10 @@ class TeamDataManager:
         self.defensive_ranks = {}
         self.position_ranks = {}
         self.team_data_cache = {}
+        self._week_tables = None
+        # Rankings are recalculated from the reloaded data, never served from tables
+        # built from the old data (a shared cache is left to its other managers).
+        self._rank_tables = {}
         self._load_team_data()
         self._calculate_rankings()
 
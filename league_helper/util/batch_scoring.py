@@ -0,0 +1,159 @@
+"""
+Batch Scoring Data Model
+
+Columnar inputs and outputs for PlayerScoringCalculator.score_players_batch.
+
+PlayerColumns snapshots the roster-independent, config-independent scoring inputs of
+a player pool into NumPy columns ONCE, so a caller that scores the same pool many
+times (every pick of a draft, every week of a season, every config of a sweep) pays
+the per-player attribute walk once and the vectorized multiplier chain thereafter.
+Absent (None) inputs are stored as NaN alongside an explicit `*_missing` mask,
+because the scalar path treats None (MISSING_VALUE_TIER) and NaN (NEUTRAL)
+differently and the batch path must not conflate them.
+
+BatchScores is the result: one score per player in column order, the same
+projected_points score_player reports, and -- only when requested -- the same
+reason strings.
+
+Author: Kai Mizuno
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.FantasyPlayer import FantasyPlayer
+
+
+WEEK_COUNT = 17
+
+
+def _optional_column(values: Sequence[Optional[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (float64 column with NaN for None, boolean None mask)."""
+    missing = np.array([value is None for value in values], dtype=bool)
+    column = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    return column, missing
+
+
+def _weekly_matrix(rows: Sequence[Optional[Sequence[Optional[float]]]]) -> np.ndarray:
+    """Stack 17-week point lists into an (n, 17) float64 matrix; None weeks read as 0.0."""
+    matrix = np.zeros((len(rows), WEEK_COUNT), dtype=np.float64)
+    for row_index, row in enumerate(rows):
+        for week_index, points in enumerate(list(row or [])[:WEEK_COUNT]):
+            if points is not None:
+                matrix[row_index, week_index] = points
+    return matrix
+
+
+@dataclass(frozen=True)
+class PlayerColumns:
+    """
+    Columnar snapshot of a player pool's scoring inputs.
+
+    Row i describes players[i]. The snapshot is taken at construction: rebuild it after
+    player data is reloaded (PlayerManager.player_data_version changes), since the
+    point matrices and rank columns are copies, not views.
+
+    Attributes:
+        players (Tuple[FantasyPlayer, ...]): The players, in row order
+        positions (np.ndarray): Position strings (object)
+        teams (np.ndarray): NFL team abbreviations (object)
+        injury_statuses (np.ndarray): Injury status strings (object)
+        projected_points (np.ndarray): (n, 17) float64 weekly projections, None -> 0.0
+        actual_points (np.ndarray): (n, 17) float64 weekly actuals, None -> 0.0
+        adp / adp_missing: ADP column (NaN where None) and its None mask
+        player_rating / player_rating_missing: Player rating column and None mask
+        team_offensive_rank / team_offensive_rank_missing: Offensive rank and None mask
+        team_defensive_rank / team_defensive_rank_missing: Defensive rank and None mask
+        matchup_score / matchup_score_missing: Matchup score and None mask
+    """
+
+    players: Tuple[FantasyPlayer, ...]
+    positions: np.ndarray
+    teams: np.ndarray
+    injury_statuses: np.ndarray
+    projected_points: np.ndarray
+    actual_points: np.ndarray
+    adp: np.ndarray
+    adp_missing: np.ndarray
+    player_rating: np.ndarray
+    player_rating_missing: np.ndarray
+    team_offensive_rank: np.ndarray
+    team_offensive_rank_missing: np.ndarray
+    team_defensive_rank: np.ndarray
+    team_defensive_rank_missing: np.ndarray
+    matchup_score: np.ndarray
+    matchup_score_missing: np.ndarray
+
+    @classmethod
+    def from_players(cls, players: Sequence[FantasyPlayer]) -> 'PlayerColumns':
+        """
+        Snapshot a player pool into columns.
+
+        Args:
+            players (Sequence[FantasyPlayer]): Players to score, in the desired row order
+
+        Returns:
+            PlayerColumns: The columnar snapshot
+        """
+        players = tuple(players)
+        adp, adp_missing = _optional_column([p.adp for p in players])
+        rating, rating_missing = _optional_column([p.player_rating for p in players])
+        offense, offense_missing = _optional_column([p.team_offensive_rank for p in players])
+        defense, defense_missing = _optional_column([p.team_defensive_rank for p in players])
+        matchup, matchup_missing = _optional_column([p.matchup_score for p in players])
+        return cls(
+            players=players,
+            positions=np.array([p.position for p in players], dtype=object),
+            teams=np.array([p.team for p in players], dtype=object),
+            injury_statuses=np.array([p.injury_status for p in players], dtype=object),
+            projected_points=_weekly_matrix([p.projected_points for p in players]),
+            actual_points=_weekly_matrix([p.actual_points for p in players]),
+            adp=adp,
+            adp_missing=adp_missing,
+            player_rating=rating,
+            player_rating_missing=rating_missing,
+            team_offensive_rank=offense,
+            team_offensive_rank_missing=offense_missing,
+            team_defensive_rank=defense,
+            team_defensive_rank_missing=defense_missing,
+            matchup_score=matchup,
+            matchup_score_missing=matchup_missing,
+        )
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def hybrid_points(self, current_week: int) -> np.ndarray:
+        """
+        Return FantasyPlayer.get_weekly_projections() for every row at once.
+
+        Actual points for weeks before current_week, projected points from it onward.
+
+        Args:
+            current_week (int): The config's current NFL week
+
+        Returns:
+            np.ndarray: (n, 17) float64 hybrid weekly points
+        """
+        past = np.arange(1, WEEK_COUNT + 1) < current_week
+        return np.where(past, self.actual_points, self.projected_points)
+
+
+@dataclass
+class BatchScores:
+    """
+    Result of PlayerScoringCalculator.score_players_batch.
+
+    Attributes:
+        scores (np.ndarray): float64 final scores, row-aligned with the input players;
+            element i equals score_player(players[i], ...).score bit for bit
+        projected_points (np.ndarray): float64, equal to score_player's projected_points
+        reasons (Optional[List[List[str]]]): Per-player reason lists identical to
+            score_player's, or None when include_reasons was False
+    """
+
+    scores: np.ndarray
+    projected_points: np.ndarray
+    reasons: Optional[List[List[str]]] = None
@@ -0,0 +1,169 @@
+"""
+Compiled Multiplier Lookups
+
+Immutable, precompiled forms of a scoring factor's multiplier ladder, built once at
+config load by ConfigManager._compile_multiplier and evaluated by _get_multiplier
+on the scoring hot path (per player, per factor, every recommendation pass and both
+simulation engines).
+
+A compiled lookup holds everything _get_multiplier would otherwise re-read from the
+ladder's nested dicts on every call -- the thresholds bound to plain attributes, the
+tier multipliers already raised to the factor's WEIGHT, the tier labels -- and
+exposes a single evaluate(val) returning the same (weighted multiplier, label) pair,
+bit for bit. A factor whose input domain is a small integer range (an NFL rank,
+1-32) additionally carries a fully precomputed table for every integer in it.
+
+The lookups carry no knowledge of ConfigKeys or of the scoring dict layout; the
+ConfigManager owns that, and owns deciding when a compiled lookup is still valid
+for its source ladder.
+
+Author: Kai Mizuno
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+
+Result = Tuple[float, str]
+
+
+@dataclass(frozen=True)
+class _MultiplierLookup:
+    """
+    Shared base of the compiled lookups.
+
+    Attributes:
+        weight (float): The factor's WEIGHT exponent
+        neutral (Result): (1.0 ** WEIGHT, NEUTRAL) -- what an input no arm or segment
+            claims (NaN) scores as
+        missing (Result): What a None input scores as (the MISSING_VALUE_TIER result)
+        int_table_start (int): Smallest integer covered by int_table
+        int_table (Optional[Tuple[Result, ...]]): Precomputed results for every integer
+            in [int_table_start, int_table_start + len(int_table)), or None
+    """
+
+    weight: float
+    neutral: Result
+    missing: Result
+    int_table_start: int = 0
+    int_table: Optional[Tuple[Result, ...]] = None
+
+    def evaluate(self, val) -> Result:
+        """
+        Return the (weighted multiplier, label) pair for a valued (non-None) input.
+
+        An exact int inside the integer table is a single tuple index. bool is excluded
+        by the exact type check, as is any other int subclass.
+
+        Args:
+            val: The factor's input value
+
+        Returns:
+            Result: The same pair ConfigManager._get_multiplier returns for val
+        """
+        table = self.int_table
+        if table is not None and type(val) is int:
+            index = val - self.int_table_start
+            if 0 <= index < len(table):
+                return table[index]
+        return self._evaluate_ladder(val)
+
+    def _evaluate_ladder(self, val) -> Result:
+        raise NotImplementedError
+
+    def with_int_table(self, start: int, stop: int) -> '_MultiplierLookup':
+        """
+        Return a copy carrying a precomputed table for every integer in [start, stop].
+
+        The table is filled by this lookup's own ladder walk, so a table hit and a
+        walk cannot disagree.
+        """
+        table = tuple(self._evaluate_ladder(val) for val in range(start, stop + 1))
+        return replace(self, int_table_start=start, int_table=table)
+
+
+@dataclass(frozen=True)
+class BucketedMultiplierLookup(_MultiplierLookup):
+    """
+    Compiled BUCKETED ladder for one threshold direction.
+
+    The four arms are tested in _get_multiplier's elif order -- the two "better" arms
+    first, then the two "worse" ones -- so an input satisfying two arms of an
+    overlapping ladder resolves to the same arm it always did.
+
+    Attributes:
+        rising (bool): True if higher values are better (>= on the better arms)
+        excellent / good / very_poor / poor (float): The four tier thresholds
+        excellent_result / good_result / very_poor_result / poor_result (Result):
+            The tier's (multiplier ** WEIGHT, label)
+    """
+
+    rising: bool = True
+    excellent: float = 0.0
+    good: float = 0.0
+    very_poor: float = 0.0
+    poor: float = 0.0
+    excellent_result: Result = (1.0, "")
+    good_result: Result = (1.0, "")
+    very_poor_result: Result = (1.0, "")
+    poor_result: Result = (1.0, "")
+
+    def _evaluate_ladder(self, val) -> Result:
+        if self.rising:
+            if val >= self.excellent:
+                return self.excellent_result
+            if val >= self.good:
+                return self.good_result
+            if val <= self.very_poor:
+                return self.very_poor_result
+            if val <= self.poor:
+                return self.poor_result
+            return self.neutral
+        if val <= self.excellent:
+            return self.excellent_result
+        if val <= self.good:
+            return self.good_result
+        if val >= self.very_poor:
+            return self.very_poor_result
+        if val >= self.poor:
+            return self.poor_result
+        return self.neutral
+
+
+@dataclass(frozen=True)
+class LinearMultiplierLookup(_MultiplierLookup):
+    """
+    Compiled LINEAR ladder (direction-agnostic, see ConfigManager._build_linear_anchors).
+
+    Attributes:
+        thresholds (Tuple[float, ...]): Anchor thresholds, sorted ascending
+        anchor_results (Tuple[Result, ...]): Each anchor's (multiplier ** WEIGHT, label),
+            aligned with thresholds; also the clamp results at either end
+        segments (Tuple[Tuple[float, float, float, float, str], ...]): For the segment
+            ending at anchor i (i >= 1), entry i - 1 holds (lower threshold, lower
+            multiplier, upper - lower multiplier, width, better-side label) with the
+            BASE multipliers, since interpolation happens before the `** WEIGHT` step
+    """
+
+    thresholds: Tuple[float, ...] = ()
+    anchor_results: Tuple[Result, ...] = ()
+    segments: Tuple[Tuple[float, float, float, float, str], ...] = ()
+
+    def _evaluate_ladder(self, val) -> Result:
+        thresholds = self.thresholds
+        # bisect_left returns the FIRST anchor >= val, so an at-anchor input lands on
+        # the first anchor in sorted order it equals -- TD3 clause 1, checked first.
+        upper = bisect_left(thresholds, val)
+        if upper < len(thresholds) and val == thresholds[upper]:
+            return self.anchor_results[upper]
+        # TD3 clause 2: clamp, never extrapolate. A NaN compares False everywhere, is
+        # placed at 0 by bisect_left, fails the clamp test and keeps the neutral result,
+        # as it does in the interpretive segment loop.
+        if upper == 0:
+            return self.anchor_results[0] if val < thresholds[0] else self.neutral
+        if upper == len(thresholds):
+            return self.anchor_results[-1]
+        # TD3 clause 3: strictly inside segment upper - 1.
+        lower_threshold, lower_multiplier, delta, width, label = self.segments[upper - 1]
+        multiplier = lower_multiplier + delta * (val - lower_threshold) / width
+        return multiplier ** self.weight, label
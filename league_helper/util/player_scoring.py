@@ -26,13 +26,19 @@ The 15-step scoring algorithm:
 Author: Kai Mizuno
 """
 
+import copy
+import logging
 import statistics
-from typing import Tuple, Optional, List, Dict, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from league_helper.util.PlayerManager import PlayerManager
 
 import league_helper.constants as Constants
+from league_helper.util.batch_scoring import BatchScores, PlayerColumns
 from league_helper.util.ConfigManager import ConfigManager
 from league_helper.util.ScoredPlayer import ScoredPlayer
 from league_helper.util.TeamDataManager import TeamDataManager
@@ -43,6 +49,47 @@ from utils.FantasyPlayer import FantasyPlayer
 from utils.LoggingManager import get_logger
 
 
+@dataclass
+class _ByeRosterAggregate:
+    """
+    Bye-week conflict totals for one roster, built once and shared by every candidate
+    scored against it (Step 9).
+
+    Attributes:
+        key (Tuple): (median cache version, (id, bye week, position) per rostered player)
+            the aggregate was built for
+        roster_ids (frozenset): player.id of every rostered player
+        by_bye_week (Dict[int, List[Tuple[str, float]]]): (position, median) of each rostered
+            player whose bye is still ahead, grouped by bye week, in roster order
+        totals (Dict[Tuple[int, str], Tuple[float, int, float, int]]): Memoized
+            (same_total, same_count, diff_total, diff_count) per (bye week, position)
+    """
+
+    key: Tuple[Any, ...]
+    roster_ids: frozenset
+    by_bye_week: Dict[int, List[Tuple[str, float]]]
+    totals: Dict[Tuple[int, str], Tuple[float, int, float, int]] = field(default_factory=dict)
+
+    def conflict_totals(self, bye_week: int, position: str) -> Tuple[float, int, float, int]:
+        """
+        Return (same_total, same_count, diff_total, diff_count) for a candidate that is
+        not on the roster.
+
+        The totals are summed with sum() in roster order, exactly as
+        ConfigManager.get_bye_week_penalty sums its two lists, so the penalty built from
+        them is bit-identical.
+        """
+        key = (bye_week, position)
+        totals = self.totals.get(key)
+        if totals is None:
+            entries = self.by_bye_week.get(bye_week, [])
+            same = [median for entry_position, median in entries if entry_position == position]
+            diff = [median for entry_position, median in entries if entry_position != position]
+            totals = (sum(same), len(same), sum(diff), len(diff))
+            self.totals[key] = totals
+        return totals
+
+
 class PlayerScoringCalculator:
     """
     Calculator for player scoring using the 15-step algorithm.
@@ -59,9 +106,19 @@ class PlayerScoringCalculator:
         season_schedule_manager (SeasonScheduleManager): Manager for season schedule data
         current_nfl_week (int): Current NFL week number
         use_draft_normalization (bool): Draft mode flag for normalization scale selection
+        fast_scoring (bool): Simulation mode -- score_player returns no reasons and no
+            reason or debug strings are formatted; scores are unchanged
         logger: Logger instance
     """
 
+    # Class-level default so calculators assembled without __init__ (test doubles built
+    # with __new__) score in the interactive mode.
+    fast_scoring: bool = False
+    # Likewise for the bye-week caches: a None version never matches, so the first
+    # _bye_week_median call creates the instance's own cache.
+    _bye_median_version: Optional[Tuple[Any, ...]] = None
+    _bye_roster_aggregate: Optional[_ByeRosterAggregate] = None
+
     def __init__(
         self,
         config: ConfigManager,
@@ -70,7 +127,8 @@ class PlayerScoringCalculator:
         team_data_manager: TeamDataManager,
         season_schedule_manager: SeasonScheduleManager,
         current_nfl_week: int,
-        game_data_manager: Optional[GameDataManager] = None
+        game_data_manager: Optional[GameDataManager] = None,
+        fast_scoring: bool = False
     ) -> None:
         """
         Initialize PlayerScoringCalculator.
@@ -84,6 +142,8 @@ class PlayerScoringCalculator:
             current_nfl_week (int): Current NFL week number
             game_data_manager (Optional[GameDataManager]): Manager for game conditions
                 (temperature, wind, location). If None, game condition scoring is disabled.
+            fast_scoring (bool): Skip reason-string and debug-string construction. For the
+                simulation engines, which never display either. Default False.
         """
         self.config = config
         self.player_manager = player_manager
@@ -94,7 +154,23 @@ class PlayerScoringCalculator:
         self.current_nfl_week = current_nfl_week
         self.game_data_manager = game_data_manager
         self.use_draft_normalization: bool = False
+        self.fast_scoring = fast_scoring
         self.logger = get_logger()
+        # Step 9 caches: per-player bye-week medians for the current player data
+        # version and week (_bye_week_median), and the conflict totals of the last
+        # roster scored against (_get_bye_roster_aggregate).
+        self._bye_median_cache: Dict[Any, Tuple[Any, Any, float]] = {}
+        self._bye_median_version = None
+        self._bye_roster_aggregate = None
+
+    def _debug_enabled(self) -> bool:
+        """
+        Return True when debug messages should be formatted.
+
+        Never in fast_scoring mode. Otherwise only when the logger would emit them, so
+        the f-strings of the per-player hot path are not built just to be discarded.
+        """
+        return not self.fast_scoring and self.logger.isEnabledFor(logging.DEBUG)
 
     def get_weekly_projection(self, player: FantasyPlayer, week=0) -> Tuple[float, float]:
         """
@@ -126,15 +202,17 @@ class PlayerScoringCalculator:
         if weekly_points is not None and float(weekly_points) > 0:
             weekly_points = float(weekly_points)
             weighted_projection = self.weight_projection(weekly_points, use_weekly_max=True)
-            self.logger.debug(
-                f"Week {week} projection for {player.name}: {weekly_points:.2f} pts "
-                f"(weighted: {weighted_projection:.2f})"
-            )
+            if self._debug_enabled():
+                self.logger.debug(
+                    f"Week {week} projection for {player.name}: {weekly_points:.2f} pts "
+                    f"(weighted: {weighted_projection:.2f})"
+                )
             return weekly_points, weighted_projection
 
-        self.logger.debug(
-            f"No valid projection data for {player.name} in week {week}"
-        )
+        if self._debug_enabled():
+            self.logger.debug(
+                f"No valid projection data for {player.name} in week {week}"
+            )
         return 0.0, 0.0
 
     def weight_projection(self, pts: float, use_weekly_max: bool = False) -> float:
@@ -161,10 +239,11 @@ class PlayerScoringCalculator:
         scale = self.config.draft_normalization_max_scale if self.use_draft_normalization else self.config.normalization_max_scale
         normalized_score = (pts / chosen_max) * scale
 
-        self.logger.debug(
-            f"Normalization: {pts:.2f} pts / {chosen_max:.2f} ({'weekly' if use_weekly_max else 'ROS'} max) "
-            f"* {scale} = {normalized_score:.2f}"
-        )
+        if self._debug_enabled():
+            self.logger.debug(
+                f"Normalization: {pts:.2f} pts / {chosen_max:.2f} ({'weekly' if use_weekly_max else 'ROS'} max) "
+                f"* {scale} = {normalized_score:.2f}"
+            )
 
         return normalized_score
 
@@ -197,7 +276,8 @@ class PlayerScoringCalculator:
                            Returns None if insufficient data or DST position
         """
         if player.position == 'DST':
-            self.logger.debug(f"Skipping performance calculation for DST player: {player.name}")
+            if self._debug_enabled():
+                self.logger.debug(f"Skipping performance calculation for DST player: {player.name}")
             return None
 
         min_weeks = self.config.performance_scoring[self.config.keys.MIN_WEEKS]
@@ -221,34 +301,38 @@ class PlayerScoringCalculator:
                         deviation = (actual_points - projected_points) / projected_points
                         deviations.append(deviation)
 
-                        self.logger.debug(
-                            f"Week {week} performance for {player.name}: "
-                            f"actual={actual_points:.2f}, projected={projected_points:.2f}, "
-                            f"deviation={deviation:.3f} ({deviation*100:.1f}%)"
-                        )
+                        if self._debug_enabled():
+                            self.logger.debug(
+                                f"Week {week} performance for {player.name}: "
+                                f"actual={actual_points:.2f}, projected={projected_points:.2f}, "
+                                f"deviation={deviation:.3f} ({deviation*100:.1f}%)"
+                            )
                     elif projected_points == 0.0:
-                        self.logger.debug(
-                            f"Skipping week {week} for {player.name}: projected=0.0"
-                        )
+                        if self._debug_enabled():
+                            self.logger.debug(
+                                f"Skipping week {week} for {player.name}: projected=0.0"
+                            )
 
             week -= 1
 
         weeks_count = len(deviations)
 
         if weeks_count < min_weeks:
-            self.logger.debug(
-                f"Insufficient performance data for {player.name}: "
-                f"{weeks_count} valid weeks found < {min_weeks} required "
-                f"(looked back to week {earliest_week})"
-            )
+            if self._debug_enabled():
+                self.logger.debug(
+                    f"Insufficient performance data for {player.name}: "
+                    f"{weeks_count} valid weeks found < {min_weeks} required "
+                    f"(looked back to week {earliest_week})"
+                )
             return None
 
         avg_deviation = statistics.mean(deviations)
 
-        self.logger.debug(
-            f"Performance deviation for {player.name}: {avg_deviation:.3f} "
-            f"({avg_deviation*100:.1f}%) across {weeks_count} weeks"
-        )
+        if self._debug_enabled():
+            self.logger.debug(
+                f"Performance deviation for {player.name}: {avg_deviation:.3f} "
+                f"({avg_deviation*100:.1f}%) across {weeks_count} weeks"
+            )
 
         return avg_deviation
 
@@ -275,7 +359,8 @@ class PlayerScoringCalculator:
         )
 
         if not future_opponents:
-            self.logger.debug(f"{player.name}: No future games (end of season)")
+            if self._debug_enabled():
+                self.logger.debug(f"{player.name}: No future games (end of season)")
             return None
 
         is_defense = player.position in Constants.DEFENSE_POSITIONS
@@ -292,18 +377,20 @@ class PlayerScoringCalculator:
                 defense_ranks.append(rank)
 
         if len(defense_ranks) < 2:
-            self.logger.debug(
-                f"{player.name}: Insufficient future games ({len(defense_ranks)}) "
-                f"for schedule calculation (minimum 2 required)"
-            )
+            if self._debug_enabled():
+                self.logger.debug(
+                    f"{player.name}: Insufficient future games ({len(defense_ranks)}) "
+                    f"for schedule calculation (minimum 2 required)"
+                )
             return None
 
         avg_rank = sum(defense_ranks) / len(defense_ranks)
 
-        self.logger.debug(
-            f"{player.name} schedule: {len(defense_ranks)} future games, "
-            f"avg opponent rank: {avg_rank:.1f}"
-        )
+        if self._debug_enabled():
+            self.logger.debug(
+                f"{player.name} schedule: {len(defense_ranks)} future games, "
+                f"avg opponent rank: {avg_rank:.1f}"
+            )
 
         return avg_rank
 
@@ -364,87 +451,105 @@ class PlayerScoringCalculator:
         self.use_draft_normalization = use_draft_normalization
 
         reasons = []
+        build_reasons = not self.fast_scoring
+        debug = self._debug_enabled()
         def add_to_reasons(r: str) -> None:
-            if r is not None and r != "":
+            if build_reasons and r is not None and r != "":
                 reasons.append(r)
 
         player_score, reason = self._get_normalized_fantasy_points(p, use_weekly_projection)
         add_to_reasons(reason)
-        self.logger.debug(f"Step 1 - Normalized score for {p.name}: {player_score:.2f}")
+        if debug:
+            self.logger.debug(f"Step 1 - Normalized score for {p.name}: {player_score:.2f}")
 
         if adp:
             player_score, reason = self._apply_adp_multiplier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 2 - ADP Enhanced score for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 2 - ADP Enhanced score for {p.name}: {player_score:.2f}")
 
         if player_rating:
             player_score, reason = self._apply_player_rating_multiplier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 3 - Player Rating Enhanced score for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 3 - Player Rating Enhanced score for {p.name}: {player_score:.2f}")
 
         if team_quality:
             player_score, reason = self._apply_team_quality_multiplier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 4 - Team Quality Enhanced score for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 4 - Team Quality Enhanced score for {p.name}: {player_score:.2f}")
 
         if performance:
             player_score, reason = self._apply_performance_multiplier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 5 - After performance for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 5 - After performance for {p.name}: {player_score:.2f}")
 
         if matchup:
             player_score, reason = self._apply_matchup_multiplier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 6 - After matchup multiplier for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 6 - After matchup multiplier for {p.name}: {player_score:.2f}")
 
         if schedule:
             player_score, reason = self._apply_schedule_multiplier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 7 - After schedule multiplier for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 7 - After schedule multiplier for {p.name}: {player_score:.2f}")
 
         if draft_round >= 0:
             player_score, reason = self._apply_draft_order_bonus(p, draft_round, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 8 - After DRAFT_ORDER bonus for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 8 - After DRAFT_ORDER bonus for {p.name}: {player_score:.2f}")
 
         if bye:
             player_score, reason = self._apply_bye_week_penalty(p, player_score, roster if roster is not None else team_roster)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 9 - After bye penalty for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 9 - After bye penalty for {p.name}: {player_score:.2f}")
 
         if injury:
             player_score, reason = self._apply_injury_penalty(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 10 - After injury penalty for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 10 - After injury penalty for {p.name}: {player_score:.2f}")
 
         if temperature:
             player_score, reason = self._apply_temperature_scoring(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 11 - After temperature scoring for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 11 - After temperature scoring for {p.name}: {player_score:.2f}")
 
         if wind:
             player_score, reason = self._apply_wind_scoring(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 12 - After wind scoring for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 12 - After wind scoring for {p.name}: {player_score:.2f}")
 
         if location:
             player_score, reason = self._apply_location_modifier(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 13 - After location scoring for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 13 - After location scoring for {p.name}: {player_score:.2f}")
 
         if nfl_team_penalty:
             player_score, reason = self._apply_nfl_team_penalty(p, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 14 - After NFL team penalty for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 14 - After NFL team penalty for {p.name}: {player_score:.2f}")
 
         if picks_until_next_turn is not None:
             player_score, reason = self._apply_survival_estimate(p, picks_until_next_turn, player_score)
             add_to_reasons(reason)
-            self.logger.debug(f"Step 15 - After survival estimate for {p.name}: {player_score:.2f}")
+            if debug:
+                self.logger.debug(f"Step 15 - After survival estimate for {p.name}: {player_score:.2f}")
 
-        self.logger.debug(
-            f"Scoring for {p.name}: final_score={player_score:.1f}"
-        )
+        if debug:
+            self.logger.debug(
+                f"Scoring for {p.name}: final_score={player_score:.1f}"
+            )
 
         p.score = player_score
 
@@ -458,6 +563,251 @@ class PlayerScoringCalculator:
 
         return ScoredPlayer(p, player_score, reasons, projected_points=calculated_projection)
 
+    def score_players_batch(self, players: Union[Sequence[FantasyPlayer], PlayerColumns], team_roster: List[FantasyPlayer], use_weekly_projection=False, adp=False, player_rating=True, team_quality=True, performance=True, matchup=False, schedule=True, draft_round=-1, bye=True, injury=True, roster: Optional[List[FantasyPlayer]] = None, temperature=False, wind=False, location=False, use_draft_normalization: bool = False, nfl_team_penalty=False, picks_until_next_turn: Optional[int] = None, include_reasons: bool = False) -> BatchScores:
+        """
+        Score a whole player pool at once (vectorized 15-step calculation).
+
+        Takes the same flags as score_player and returns, for every player, the score
+        score_player would -- bit for bit -- plus its projected_points and (optionally)
+        its reasons. Like score_player, it sets p.score on every player.
+
+        How each step is evaluated:
+        - Per-player numeric inputs (Steps 1-6, 10, 14, 15) are read from PlayerColumns
+          and run through ConfigManager.get_multipliers_batch, which reproduces
+          _get_multiplier's BUCKETED / LINEAR branches and `** WEIGHT` elementwise.
+        - Inputs that are per-player but not columnar (Step 5's performance deviation)
+          are gathered per player, then evaluated as a column.
+        - Inputs that depend only on a shared key are computed ONCE per key through the
+          scalar step and broadcast: Step 7 per (team, position), Step 8 per position,
+          Step 9 per (bye week, position) against the roster, Steps 11-13 per NFL team.
+
+        Each step combines with the running score using the scalar step's own
+        arithmetic, in the scalar step order, so no reassociation can creep in.
+
+        Args:
+            players: The pool to score, as FantasyPlayers or a prebuilt PlayerColumns
+                (reuse one PlayerColumns to score the same pool repeatedly)
+            team_roster, use_weekly_projection, ..., picks_until_next_turn: As score_player
+            include_reasons: Build score_player's reason strings as well. Default False:
+                the simulations never display them and formatting dominates at scale.
+
+        Returns:
+            BatchScores: scores / projected_points arrays in input order, and reasons
+                when include_reasons is True
+        """
+        columns = players if isinstance(players, PlayerColumns) else PlayerColumns.from_players(players)
+        players = columns.players
+        count = len(columns)
+        self.use_draft_normalization = use_draft_normalization
+        config = self.config
+        reasons: Optional[List[List[str]]] = [[] for _ in range(count)] if include_reasons else None
+
+        def add_to_reasons(index: int, reason: str) -> None:
+            if reason is not None and reason != "":
+                reasons[index].append(reason)
+
+        # Step 1 - normalized projection
+        hybrid = columns.hybrid_points(config.current_nfl_week)
+        scale = config.draft_normalization_max_scale if use_draft_normalization else config.normalization_max_scale
+        if use_weekly_projection:
+            week = config.current_nfl_week
+            if not (1 <= week <= 17):
+                raise ValueError(f"week_num must be between 1 and 17, got {week}")
+            orig_pts = hybrid[:, week - 1]
+            if self.max_weekly_projection == 0:
+                weighted_pts = np.zeros(count)
+            else:
+                weighted_pts = np.where(orig_pts > 0, (orig_pts / self.max_weekly_projection) * scale, 0.0)
+            orig_pts = np.where(orig_pts > 0, orig_pts, 0.0)
+        else:
+            # Left-to-right running sum from 0.0, exactly as get_rest_of_season_projection
+            # accumulates it (np.sum would pairwise-sum and round differently).
+            remaining = hybrid[:, config.current_nfl_week - 1:]
+            orig_pts = np.add.accumulate(
+                np.concatenate([np.zeros((count, 1)), remaining], axis=1), axis=1
+            )[:, -1]
+            if self.max_projection > 0:
+                weighted_pts = (orig_pts / self.max_projection) * scale
+            else:
+                weighted_pts = np.zeros(count)
+        score = weighted_pts.copy()
+        if include_reasons:
+            for i, (orig, weighted) in enumerate(zip(orig_pts.tolist(), weighted_pts.tolist())):
+                add_to_reasons(i, f"Projected: {orig:.2f} pts, Weighted: {weighted:.2f} pts")
+
+        def add_multiplier_reasons(title: str, multipliers: np.ndarray, labels: np.ndarray,
+                                   applies: Optional[np.ndarray] = None) -> None:
+            if not include_reasons:
+                return
+            for i, (multiplier, label) in enumerate(zip(multipliers.tolist(), labels.tolist())):
+                if applies is None or applies[i]:
+                    add_to_reasons(i, f"{title}: {label} ({multiplier:.4f}x)")
+
+        # Step 2 - ADP
+        if adp:
+            multipliers, labels = config.get_multipliers_batch(
+                config.adp_scoring, columns.adp, rising_thresholds=False, missing=columns.adp_missing)
+            score = score * multipliers
+            add_multiplier_reasons("ADP", multipliers, labels)
+
+        # Step 3 - player rating
+        if player_rating:
+            multipliers, labels = config.get_multipliers_batch(
+                config.player_rating_scoring, columns.player_rating, missing=columns.player_rating_missing)
+            score = score * multipliers
+            add_multiplier_reasons("Player Rating", multipliers, labels)
+
+        # Step 4 - team quality (defensive rank for a defense, offensive rank otherwise)
+        if team_quality:
+            is_defense = np.array([position in Constants.DEFENSE_POSITIONS for position in columns.positions], dtype=bool)
+            multipliers, labels = config.get_multipliers_batch(
+                config.team_quality_scoring,
+                np.where(is_defense, columns.team_defensive_rank, columns.team_offensive_rank),
+                rising_thresholds=False,
+                missing=np.where(is_defense, columns.team_defensive_rank_missing, columns.team_offensive_rank_missing))
+            score = score * multipliers
+            add_multiplier_reasons("Team Quality", multipliers, labels)
+
+        # Step 5 - performance deviation (skipped where there is too little data)
+        if performance:
+            deviations = [self.calculate_performance_deviation(p) for p in players]
+            applies = np.array([deviation is not None for deviation in deviations], dtype=bool)
+            deviation_column = np.array([0.0 if d is None else d for d in deviations], dtype=np.float64)
+            multipliers, labels = config.get_multipliers_batch(config.performance_scoring, deviation_column)
+            score = np.where(applies, score * multipliers, score)
+            if include_reasons:
+                for i in np.flatnonzero(applies).tolist():
+                    add_to_reasons(i, f"Performance: {labels[i]} ({deviations[i]*100:+.1f}%, {multipliers[i]:.4f}x)")
+
+        # Step 6 - matchup additive bonus (skipped where matchup_score == 0)
+        if matchup:
+            applies = ~((columns.matchup_score == 0) & ~columns.matchup_score_missing)
+            multipliers, labels = config.get_multipliers_batch(
+                config.matchup_scoring, columns.matchup_score, missing=columns.matchup_score_missing)
+            impact_scale = config.matchup_scoring['IMPACT_SCALE']
+            bonuses = (impact_scale * multipliers) - impact_scale
+            score = np.where(applies, score + bonuses, score)
+            if include_reasons:
+                for i in np.flatnonzero(applies).tolist():
+                    add_to_reasons(i, f"Matchup: {labels[i]} ({bonuses[i]:+.1f} pts)")
+
+        # Step 7 - schedule additive bonus, once per (team, position)
+        if schedule:
+            score = self._apply_keyed_step(
+                players, score, reasons, lambda p: (p.team, p.position),
+                lambda p: self._apply_schedule_multiplier(p, 0.0))
+
+        # Step 8 - draft order bonus, once per position
+        if draft_round >= 0:
+            score = self._apply_keyed_step(
+                players, score, reasons, lambda p: p.position,
+                lambda p: self._apply_draft_order_bonus(p, draft_round, 0.0))
+
+        # Step 9 - bye week penalty, once per (bye week, position); a player already on
+        # the roster is excluded from its own overlap count, so it is keyed on its own
+        if bye:
+            bye_roster = roster if roster is not None else team_roster
+            roster_ids = {roster_player.id for roster_player in bye_roster}
+            score = self._apply_keyed_step(
+                players, score, reasons,
+                lambda p: (p.bye_week, p.position, p.id if p.id in roster_ids else None),
+                lambda p: self._apply_bye_week_penalty(p, 0.0, bye_roster))
+
+        # Step 10 - injury penalty, once per injury status
+        if injury:
+            penalty_by_status: Dict[str, float] = {}
+            for p in players:
+                if p.injury_status not in penalty_by_status:
+                    penalty_by_status[p.injury_status] = config.get_injury_penalty(p.get_risk_level())
+            penalties = np.array([penalty_by_status[status] for status in columns.injury_statuses],
+                                 dtype=np.float64)
+            score = score - penalties
+            if include_reasons:
+                for i, status in enumerate(columns.injury_statuses.tolist()):
+                    if status != "ACTIVE":
+                        add_to_reasons(i, f"Injury: {status} ({-penalty_by_status[status]:.1f} pts)")
+
+        # Steps 11-13 - game conditions, once per NFL team
+        if temperature:
+            score = self._apply_keyed_step(
+                players, score, reasons, lambda p: p.team,
+                lambda p: self._apply_temperature_scoring(p, 0.0))
+        if wind:
+            score = self._apply_keyed_step(
+                players, score, reasons,
+                lambda p: (p.team, p.position in Constants.WIND_AFFECTED_POSITIONS),
+                lambda p: self._apply_wind_scoring(p, 0.0))
+        if location:
+            score = self._apply_keyed_step(
+                players, score, reasons, lambda p: p.team,
+                lambda p: self._apply_location_modifier(p, 0.0))
+
+        # Step 14 - NFL team penalty
+        if nfl_team_penalty:
+            penalized = np.array([team in config.nfl_team_penalty for team in columns.teams], dtype=bool)
+            score = np.where(penalized, score * config.nfl_team_penalty_weight, score)
+            if include_reasons:
+                for i in np.flatnonzero(penalized).tolist():
+                    add_to_reasons(i, f"NFL Team Penalty: {columns.teams[i]} ({config.nfl_team_penalty_weight:.2f}x)")
+
+        # Step 15 - survival estimate (identity multipliers are skipped, as in the scalar step)
+        if picks_until_next_turn is not None:
+            multipliers, labels = config.get_multipliers_batch(
+                config.survival_scoring, columns.adp - picks_until_next_turn,
+                rising_thresholds=False, missing=columns.adp_missing)
+            applies = multipliers != 1.0
+            score = np.where(applies, score * multipliers, score)
+            add_multiplier_reasons("Survival", multipliers, labels, applies)
+
+        for p, player_score in zip(players, score.tolist()):
+            p.score = player_score
+
+        chosen_max = self.max_weekly_projection if use_weekly_projection else self.max_projection
+        if scale > 0 and chosen_max > 0:
+            projected_points = (score / scale) * chosen_max
+        else:
+            projected_points = np.zeros(count)
+
+        return BatchScores(score, projected_points, reasons)
+
+    def _apply_keyed_step(
+        self,
+        players: Sequence[FantasyPlayer],
+        score: np.ndarray,
+        reasons: Optional[List[List[str]]],
+        key_of: Callable[[FantasyPlayer], Hashable],
+        scalar_step: Callable[[FantasyPlayer], Tuple[float, str]]
+    ) -> np.ndarray:
+        """
+        Apply an additive scoring step whose delta depends only on a shared key.
+
+        scalar_step(p) is the scalar _apply_* method evaluated at a 0.0 running score,
+        so it returns (0.0 + delta, reason) for an additive step; it is called once per
+        distinct key and its delta/reason are broadcast to every player sharing it.
+
+        Args:
+            players: Players in row order
+            score: Running scores before this step
+            reasons: Per-player reason lists to extend, or None to skip reasons
+            key_of: Maps a player to the key its delta depends on
+            scalar_step: The scalar step, bound to its non-score arguments
+
+        Returns:
+            np.ndarray: score + delta, elementwise
+        """
+        results: Dict[Hashable, Tuple[float, str]] = {}
+        deltas = np.empty(len(players), dtype=np.float64)
+        for i, p in enumerate(players):
+            key = key_of(p)
+            result = results.get(key)
+            if result is None:
+                result = scalar_step(p)
+                results[key] = result
+            deltas[i] = result[0]
+            if reasons is not None and result[1] is not None and result[1] != "":
+                reasons[i].append(result[1])
+        return score + deltas
+
     def _get_normalized_fantasy_points(self, p: FantasyPlayer, use_weekly_projection: bool) -> Tuple[float, str]:
         """Get normalized fantasy points (Step 1)."""
         if use_weekly_projection:
@@ -469,18 +819,24 @@ class PlayerScoringCalculator:
             else:
                 weighted_pts = 0.0
 
+        if self.fast_scoring:
+            return weighted_pts, ""
         reason = f"Projected: {orig_pts:.2f} pts, Weighted: {weighted_pts:.2f} pts"
         return weighted_pts, reason
 
     def _apply_adp_multiplier(self, p: FantasyPlayer, player_score: float) -> Tuple[float, str]:
         """Calculate ADP-based market wisdom adjustment multiplier (Step 2)."""
         multiplier, rating = self.config.get_adp_multiplier(p.adp)
+        if self.fast_scoring:
+            return player_score * multiplier, ""
         reason = f"ADP: {rating} ({multiplier:.4f}x)"
         return player_score * multiplier, reason
 
     def _apply_player_rating_multiplier(self, p: FantasyPlayer, player_score: float) -> Tuple[float, str]:
         """Apply player rating multiplier (Step 3)."""
         multiplier, rating = self.config.get_player_rating_multiplier(p.player_rating)
+        if self.fast_scoring:
+            return player_score * multiplier, ""
         reason = f"Player Rating: {rating} ({multiplier:.4f}x)"
         return player_score * multiplier, reason
 
@@ -491,6 +847,8 @@ class PlayerScoringCalculator:
             quality_val = p.team_defensive_rank
 
         multiplier, rating = self.config.get_team_quality_multiplier(quality_val)
+        if self.fast_scoring:
+            return player_score * multiplier, ""
         reason = f"Team Quality: {rating} ({multiplier:.4f}x)"
         return player_score * multiplier, reason
 
@@ -525,6 +883,8 @@ class PlayerScoringCalculator:
 
         multiplier, rating = self.config.get_performance_multiplier(deviation)
 
+        if self.fast_scoring:
+            return player_score * multiplier, ""
         reason = f"Performance: {rating} ({deviation*100:+.1f}%, {multiplier:.4f}x)"
         return player_score * multiplier, reason
 
@@ -537,6 +897,8 @@ class PlayerScoringCalculator:
         impact_scale = self.config.matchup_scoring['IMPACT_SCALE']
         bonus = (impact_scale * multiplier) - impact_scale
 
+        if self.fast_scoring:
+            return player_score + bonus, ""
         reason = f"Matchup: {rating} ({bonus:+.1f} pts)"
         return player_score + bonus, reason
 
@@ -565,12 +927,15 @@ class PlayerScoringCalculator:
         bonus = (impact_scale * multiplier) - impact_scale
 
         new_score = player_score + bonus
+        if self.fast_scoring:
+            return new_score, ""
         reason = f"Schedule: {rating} (avg opp rank: {schedule_value:.1f}, {bonus:+.1f} pts)"
 
-        self.logger.debug(
-            f"{player.name}: Schedule bonus {bonus:+.1f} pts "
-            f"({schedule_value:.1f} avg rank) -> {player_score:.2f} to {new_score:.2f}"
-        )
+        if self._debug_enabled():
+            self.logger.debug(
+                f"{player.name}: Schedule bonus {bonus:+.1f} pts "
+                f"({schedule_value:.1f} avg rank) -> {player_score:.2f} to {new_score:.2f}"
+            )
 
         return new_score, reason
 
@@ -579,7 +944,7 @@ class PlayerScoringCalculator:
         bonus, bonus_type = self.config.get_draft_order_bonus(p.position, draft_round)
 
         reason = ""
-        if bonus_type != "":
+        if bonus_type != "" and not self.fast_scoring:
             reason = f"Draft Order Bonus: {bonus_type} ({bonus:+.1f} pts)"
 
         return player_score + bonus, reason
@@ -600,41 +965,138 @@ class PlayerScoringCalculator:
         Returns:
             Tuple[float, str]: (adjusted_score, reason_string)
         """
-        same_pos_players = []
-        diff_pos_players = []
-
         if p.bye_week is None:
             return player_score, "No bye week information available"
 
         if p.bye_week < self.config.current_nfl_week:
             return player_score, "The player's bye week has already passed."
 
-        for roster_player in roster:
-            if roster_player.id == p.id:
-                continue
-            if roster_player.bye_week is None or roster_player.bye_week < self.config.current_nfl_week:
-                continue
-
-            if roster_player.bye_week == p.bye_week:
-                if roster_player.position == p.position:
-                    same_pos_players.append(roster_player)
-                else:
-                    diff_pos_players.append(roster_player)
-
-        penalty = self.config.get_bye_week_penalty(same_pos_players, diff_pos_players)
-
-        if len(same_pos_players) == 0 and len(diff_pos_players) == 0:
+        aggregate = self._get_bye_roster_aggregate(roster)
+        if p.id not in aggregate.roster_ids:
+            same_total, same_count, diff_total, diff_count = aggregate.conflict_totals(p.bye_week, p.position)
+            penalty = self.config.get_bye_week_penalty_from_totals(same_total, diff_total)
+        else:
+            # A rostered player is scored against the rest of the roster, so it has to be
+            # excluded from its own conflicts; rare enough to walk the roster for.
+            same_pos_players = []
+            diff_pos_players = []
+            for roster_player in roster:
+                if roster_player.id == p.id:
+                    continue
+                if roster_player.bye_week is None or roster_player.bye_week < self.config.current_nfl_week:
+                    continue
+
+                if roster_player.bye_week == p.bye_week:
+                    if roster_player.position == p.position:
+                        same_pos_players.append(roster_player)
+                    else:
+                        diff_pos_players.append(roster_player)
+
+            penalty = self.config.get_bye_week_penalty(same_pos_players, diff_pos_players,
+                                                       median_of=self._bye_week_median)
+            same_count, diff_count = len(same_pos_players), len(diff_pos_players)
+
+        if self.fast_scoring or (same_count == 0 and diff_count == 0):
             reason = ""
         else:
-            reason = f"Bye Overlaps: {len(same_pos_players)} same-position, {len(diff_pos_players)} different-position ({-penalty:.1f} pts)"
+            reason = f"Bye Overlaps: {same_count} same-position, {diff_count} different-position ({-penalty:.1f} pts)"
 
         return player_score - penalty, reason
 
+    def _sync_bye_cache_version(self) -> Tuple[Any, Any]:
+        """
+        Return the current (player_data_version, current_nfl_week), first dropping the
+        bye-week median cache and roster aggregate if either has changed since they
+        were filled.
+        """
+        version = (getattr(getattr(self, 'player_manager', None), 'player_data_version', None),
+                   self.config.current_nfl_week)
+        if version != self._bye_median_version:
+            self._bye_median_cache = {}
+            self._bye_median_version = version
+            self._bye_roster_aggregate = None
+        return version
+
+    def _bye_week_median(self, player: FantasyPlayer) -> float:
+        """
+        Return ConfigManager.calculate_player_median(player), cached per player.
+
+        The cache is keyed by player id and belongs to one (player_data_version,
+        current_nfl_week) pair: it is dropped when PlayerManager swaps point data
+        (load_players_from_json / set_player_data) or the week changes, since the
+        median reads actual points before the current week and projections after.
+        Each entry also keeps a copy of the two point arrays it was computed from and
+        is recomputed if they no longer match, so two player objects sharing an id, or
+        arrays edited in place, are never served another player's median.
+
+        Args:
+            player (FantasyPlayer): A rostered player in a bye-week conflict
+
+        Returns:
+            float: The player's median weekly points (0.0 when it has none)
+        """
+        self._sync_bye_cache_version()
+
+        cached = self._bye_median_cache.get(player.id)
+        if (cached is not None and cached[0] == player.projected_points
+                and cached[1] == player.actual_points):
+            return cached[2]
+
+        median = self.config.calculate_player_median(player)
+        self._bye_median_cache[player.id] = (
+            copy.copy(player.projected_points), copy.copy(player.actual_points), median,
+        )
+        return median
+
+    def _get_bye_roster_aggregate(self, roster: List[FantasyPlayer]) -> _ByeRosterAggregate:
+        """
+        Return the bye-week conflict aggregate for roster, rebuilding it only when the
+        roster (membership, order, bye weeks or positions) or the median cache version
+        has changed.
+
+        A draft scores every available candidate against one roster per pick, so the
+        aggregate turns Step 9 from a roster walk plus a median per conflicting player
+        into a dict lookup per candidate. The roster is keyed by each player's
+        (id, bye_week, position) -- a short tuple for a 15-player roster, and exact
+        however the list was edited. Rostered players' point arrays are read when the
+        aggregate is built; in-place edits to them are picked up on the next data
+        version, week, or roster change.
+
+        Args:
+            roster (List[FantasyPlayer]): The roster candidates are scored against
+
+        Returns:
+            _ByeRosterAggregate: The roster's conflict aggregate
+        """
+        version = self._sync_bye_cache_version()
+
+        key = (version, tuple((r.id, r.bye_week, r.position) for r in roster))
+        aggregate = self._bye_roster_aggregate
+        if aggregate is not None and aggregate.key == key:
+            return aggregate
+
+        current_week = self.config.current_nfl_week
+        by_bye_week: Dict[int, List[Tuple[str, float]]] = {}
+        for roster_player in roster:
+            if roster_player.bye_week is None or roster_player.bye_week < current_week:
+                continue
+            by_bye_week.setdefault(roster_player.bye_week, []).append(
+                (roster_player.position, self._bye_week_median(roster_player))
+            )
+
+        aggregate = _ByeRosterAggregate(
+            key=key,
+            roster_ids=frozenset(r.id for r in roster),
+            by_bye_week=by_bye_week,
+        )
+        self._bye_roster_aggregate = aggregate
+        return aggregate
+
     def _apply_injury_penalty(self, p: FantasyPlayer, player_score: float) -> Tuple[float, str]:
         """Apply injury penalty (Step 10)."""
         penalty = self.config.get_injury_penalty(p.get_risk_level())
 
-        reason = "" if p.injury_status == "ACTIVE" else f"Injury: {p.injury_status} ({-penalty:.1f} pts)"
+        reason = "" if self.fast_scoring or p.injury_status == "ACTIVE" else f"Injury: {p.injury_status} ({-penalty:.1f} pts)"
 
         return player_score - penalty, reason
 
@@ -642,6 +1104,8 @@ class PlayerScoringCalculator:
         """Apply NFL team penalty multiplier (Step 14)."""
         if p.team in self.config.nfl_team_penalty:
             weight = self.config.nfl_team_penalty_weight
+            if self.fast_scoring:
+                return player_score * weight, ""
             reason = f"NFL Team Penalty: {p.team} ({weight:.2f}x)"
             return player_score * weight, reason
 
@@ -685,6 +1149,8 @@ class PlayerScoringCalculator:
         bonus = (impact_scale * multiplier) - impact_scale
 
         ideal_temp = self.config.temperature_scoring.get('IDEAL_TEMPERATURE', 60)
+        if self.fast_scoring:
+            return player_score + bonus, ""
         if bonus >= 0:
             reason = f"Temp: {game.temperature}°F ({tier}, +{bonus:.1f} pts)"
         else:
@@ -729,6 +1195,8 @@ class PlayerScoringCalculator:
         impact_scale = self.config.wind_scoring.get('IMPACT_SCALE', 60.0)
         bonus = (impact_scale * multiplier) - impact_scale
 
+        if self.fast_scoring:
+            return player_score + bonus, ""
         if bonus >= 0:
             reason = f"Wind: {game.wind_gust}mph ({tier}, +{bonus:.1f} pts)"
         else:
@@ -773,6 +1241,8 @@ class PlayerScoringCalculator:
 
         if modifier == 0:
             return player_score, ""
+        elif self.fast_scoring:
+            return player_score + modifier, ""
         elif modifier > 0:
             reason = f"Location: {location_type} (+{modifier:.1f} pts)"
         else:
@@ -832,6 +1302,8 @@ class PlayerScoringCalculator:
         multiplier, rating = self.config.get_survival_multiplier(margin)
         if multiplier == 1.0:
             return player_score, ""
+        if self.fast_scoring:
+            return player_score * multiplier, ""
         reason = f"Survival: {rating} ({multiplier:.4f}x)"
         return player_score * multiplier, reason
 
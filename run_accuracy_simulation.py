@@ -37,6 +37,7 @@ from typing import Dict, Optional
 
 from simulation.accuracy.AccuracySimulationManager import AccuracySimulationManager
 from simulation.accuracy.AccuracyResultsManager import propagate_to_configs
+from simulation.accuracy.racing import RACING_DEFAULT_CONFIDENCE, RACING_DEFAULT_FRACTION
 from simulation.accuracy.horizon_labels import (
     HORIZON_COUNT,
     candidate_values_label,
@@ -368,6 +369,58 @@ def main() -> None:
              'as before.'
     )
 
+    parser.add_argument(
+        '--no-eval-memo',
+        dest='use_eval_memo',
+        action='store_false',
+        help='Evaluate every config even if the output folder\'s evaluation memo '
+             'already holds its result (by default re-tested incumbents and resumed '
+             'runs reuse memoized evaluations)'
+    )
+
+    parser.add_argument(
+        '--no-season-shards',
+        dest='shard_seasons',
+        action='store_false',
+        help='Evaluate each config as one task covering every season and horizon '
+             '(by default work is split into config × season × horizon tasks so '
+             'passes with few candidates still keep every worker busy)'
+    )
+
+    parser.add_argument(
+        '--racing',
+        action='store_true',
+        default=False,
+        help='Screen each parameter\'s candidates on a subsample of season-weeks first '
+             'and fully evaluate only those not clearly worse than the horizon '
+             'incumbents. Off by default.'
+    )
+
+    parser.add_argument(
+        '--racing-fraction',
+        type=float,
+        default=RACING_DEFAULT_FRACTION,
+        help=f'Share of each season\'s horizon weeks used for --racing screening '
+             f'(default: {RACING_DEFAULT_FRACTION})'
+    )
+
+    parser.add_argument(
+        '--racing-confidence',
+        type=float,
+        default=RACING_DEFAULT_CONFIDENCE,
+        help=f'One-sided confidence required for --racing to discard a candidate as '
+             f'worse than the incumbent (default: {RACING_DEFAULT_CONFIDENCE})'
+    )
+
+    parser.add_argument(
+        '--horizon-restricted',
+        action='store_true',
+        default=False,
+        help='Score each horizon-specific candidate only on its own week range, so it '
+             'can only be adopted for that horizon (shared-parameter candidates still '
+             'cover all four). Off by default.'
+    )
+
     args = parser.parse_args()
 
     setup_logger(LOG_NAME, args.log_level.upper(), args.enable_log_file, None, LOGGING_FORMAT)
@@ -472,7 +525,13 @@ def main() -> None:
             max_workers=args.max_workers,
             use_processes=args.use_processes,
             seed=args.seed,
-            exclude_low_coverage_weeks=args.exclude_low_coverage_weeks
+            exclude_low_coverage_weeks=args.exclude_low_coverage_weeks,
+            use_eval_memo=args.use_eval_memo,
+            shard_seasons=args.shard_seasons,
+            racing=args.racing,
+            racing_fraction=args.racing_fraction,
+            racing_confidence=args.racing_confidence,
+            horizon_restricted=args.horizon_restricted
         )
     except Exception as e:
         logger.error(f"Failed to initialize AccuracySimulationManager: {e}")
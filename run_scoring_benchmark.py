@@ -0,0 +1,129 @@
+"""
+Scoring Benchmark Runner
+
+Measures the per-player cost of PlayerScoringCalculator scoring on one season's real
+simulation data, in three modes:
+
+- interactive: score_player with reasons built (the league helper's mode)
+- fast:        score_player with fast_scoring=True (the simulation engines' mode)
+- batch:       score_players_batch over a prebuilt PlayerColumns, no reasons
+
+for the draft flag set (DraftModeManager's recommendation flags) and the weekly
+lineup flag set (starter selection's flags). Every mode is checked to produce the
+same scores before its timing is reported.
+
+Usage:
+    python run_scoring_benchmark.py
+    python run_scoring_benchmark.py --season simulation/sim_data/2024 --repeats 10
+
+Author: Kai Mizuno
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.batch_scoring import PlayerColumns
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+from utils.LoggingManager import setup_logger
+
+LOG_NAME = "scoring_benchmark"
+
+FLAG_SETS: Dict[str, dict] = {
+    "draft": dict(
+        adp=True, player_rating=True, team_quality=False, performance=False, matchup=False,
+        schedule=False, draft_round=3, bye=True, injury=True, use_draft_normalization=True,
+        nfl_team_penalty=True,
+    ),
+    "weekly": dict(
+        use_weekly_projection=True, adp=False, player_rating=True, team_quality=True,
+        performance=True, matchup=True, schedule=False, bye=False, injury=False,
+        temperature=True, wind=True, location=True,
+    ),
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser for the scoring benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Per-call scoring cost: interactive vs fast_scoring vs batch. "
+                    "Must be run from the project root directory."
+    )
+    parser.add_argument(
+        "--season", type=str, default="simulation/sim_data/2025", metavar="PATH",
+        help="Season folder to load players from (default: simulation/sim_data/2025)"
+    )
+    parser.add_argument(
+        "--week", type=int, default=6, metavar="N",
+        help="NFL week to score at (default: 6)"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, metavar="N",
+        help="Timed passes over the full player pool per mode (default: 5)"
+    )
+    return parser
+
+
+def _time_per_player(run: Callable[[], List[float]], player_count: int, repeats: int) -> float:
+    """Return the best-of-repeats cost of run(), in microseconds per player."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best / player_count * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a per-mode, per-flag-set cost table."""
+    args = _build_parser().parse_args()
+    setup_logger(LOG_NAME, "WARNING", False, None, "standard")
+
+    base_config = ConfigManager(Path("data"))
+    config_dict = {
+        "config_name": base_config.config_name,
+        "description": base_config.description,
+        "parameters": dict(base_config.parameters),
+    }
+    league = SimulatedLeague(config_dict, Path(args.season), seed=1)
+    try:
+        for team in league.teams:
+            team.config.current_nfl_week = args.week
+        league._load_week_data(args.week)
+
+        player_manager = league.teams[0].projected_pm
+        calculator = player_manager.scoring_calculator
+        calculator.max_weekly_projection = player_manager.calculate_max_weekly_projection(args.week)
+        players = player_manager.players
+        roster = players[:7]
+        columns = PlayerColumns.from_players(players)
+
+        print(f"{len(players)} players, week {args.week}, best of {args.repeats} passes (us/player)")
+        print(f"{'flags':<8} {'interactive':>12} {'fast':>10} {'batch':>10} {'fast x':>8} {'batch x':>8}")
+        for name, flags in FLAG_SETS.items():
+            def scalar() -> List[float]:
+                return [calculator.score_player(p, roster, **flags).score for p in players]
+
+            def batch() -> List[float]:
+                return calculator.score_players_batch(columns, roster, **flags).scores.tolist()
+
+            calculator.fast_scoring = False
+            interactive_scores = scalar()
+            interactive = _time_per_player(scalar, len(players), args.repeats)
+
+            calculator.fast_scoring = True
+            if scalar() != interactive_scores or batch() != interactive_scores:
+                raise RuntimeError(f"{name}: scoring modes disagree; timings would be meaningless")
+            fast = _time_per_player(scalar, len(players), args.repeats)
+            batched = _time_per_player(batch, len(players), args.repeats)
+
+            print(f"{name:<8} {interactive:>12.1f} {fast:>10.1f} {batched:>10.1f} "
+                  f"{interactive / fast:>7.1f}x {interactive / batched:>7.1f}x")
+    finally:
+        league.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -55,9 +55,20 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--workers", type=int, default=8, metavar="N",
-        help="Max parallel worker threads for ParallelLeagueRunner (default: 8)"
+        help="Max parallel workers for ParallelLeagueRunner: processes by default, threads with --threads (default: 8)"
+    )
+    """League simulation is CPU-bound pure Python once week data is preloaded, so the win rate sim runs leagues in a persistent ProcessPoolExecutor (one GIL per worker; start-up and season loading paid once per run). --threads falls back to ThreadPoolExecutor, which has lower overhead for a handful of leagues. Use --workers to tune parallelism."""
+    parser.add_argument(
+        "--threads", action="store_true",
+        help="Run leagues in worker threads instead of worker processes. Threads share one GIL, "
+             "so this is only faster for very small runs."
+    )
+    parser.add_argument(
+        "--draft-log-cache", action="store_true",
+        help="Replay seeded self-play drafts that were already played (the sweep re-runs the same "
+             "seeds for every candidate), and resume drafts that share the reference config from "
+             "the measured team's first different pick. Needs a seed; no effect with --naive-opponents."
     )
-    """Win rate sim uses ThreadPoolExecutor (I/O-bound — disk reads dominate); accuracy sim uses ProcessPoolExecutor (CPU-bound — score computation dominates). Use --workers to tune thread parallelism. ProcessPoolExecutor (use_processes=True on ParallelLeagueRunner) is available but adds process-creation overhead."""
     parser.add_argument(
         "--endless", action="store_true",
         help="Run continuously until KeyboardInterrupt"
@@ -96,6 +107,19 @@ def _build_parser() -> argparse.ArgumentParser:
         "--num-values", type=int, default=5, metavar="N",
         help="Candidate grid density per draft-side parameter for the sweep (default: 5). Sweep mode only."
     )
+    parser.add_argument(
+        "--batch-candidates", action="store_true",
+        help="Evaluate all of a parameter's candidates as one batch of leagues against the same "
+             "incumbent, adopting the strongest that clears the gate, so worker processes stay busy "
+             "between candidates. Sweep mode only."
+    )
+    parser.add_argument(
+        "--sequential-block", type=int, default=None, metavar="N",
+        help="Play each candidate evaluation in blocks of N simulations per season and stop it as "
+             "soon as its confidence bounds settle the adoption gate, so clearly weaker or stronger "
+             "candidates cost a fraction of the full --sims budget at the same adoption rates. "
+             "Default: full fixed-size evaluations. Sweep mode only."
+    )
     parser.add_argument(
         "--promote", action="store_true",
         help="Preview promoting the best-ranked sweep combination into data/configs/league_config.json "
@@ -282,6 +306,8 @@ def main() -> None:
         strategy_filter=args.strategy,
         naive_opponents=args.naive_opponents,
         seed=args.seed,
+        use_processes=not args.threads,
+        draft_log_cache=args.draft_log_cache,
     )
 
     pass_num = 0
@@ -301,6 +327,8 @@ def main() -> None:
     except FileNotFoundError as e:
         logger.error(str(e))
         sys.exit(1)
+    finally:
+        orchestrator.close()
 
     _print_summary(meta_data_manager)
 
@@ -351,7 +379,8 @@ def _run_sweep_mode(args: argparse.Namespace, data_folder: Path, logger) -> None
     base_seed = _resolve_sweep_seed(args, logger)
     evaluator = CombinationEvaluator(
         data_folder=data_folder, num_simulations=args.sims, max_workers=args.workers,
-        config_path=Path(args.config), naive_opponents=args.naive_opponents, seed=base_seed
+        config_path=Path(args.config), naive_opponents=args.naive_opponents, seed=base_seed,
+        use_processes=not args.threads, draft_log_cache=args.draft_log_cache
     )
 
     # T61/D1: games-per-evaluation reachability pre-flight, run BEFORE any evaluation and at
@@ -493,7 +522,8 @@ def _run_sweep_mode(args: argparse.Namespace, data_folder: Path, logger) -> None
     # terminal disposition against its OWN min_games rather than trusting the driver's floor.
     tournament = SweepTournament(
         evaluator, store, num_values=args.num_values,
-        games_per_evaluation=games_per_evaluation,
+        games_per_evaluation=games_per_evaluation, batch_candidates=args.batch_candidates,
+        sequential_block=args.sequential_block,
     )
 
     # T16/KDD-4: detect once whether stdout is a TTY. TTY -> a redrawing ProgressTracker bar;
@@ -628,6 +658,8 @@ def _run_sweep_mode(args: argparse.Namespace, data_folder: Path, logger) -> None
         print(format_summary(ranked))
         write_sweep_report(ranked, data_folder)
         sys.exit(0)
+    finally:
+        evaluator.close()
 
 
 def _run_promote_mode(data_folder: Path, logger, confirm: bool, seed: int,
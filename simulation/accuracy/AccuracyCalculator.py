@@ -15,7 +15,8 @@ Player Filtering Rules (from specs):
 Author: Kai Mizuno
 """
 
-from typing import List, Dict, Tuple, Optional, Any
+from collections import Counter
+from typing import List, Dict, Tuple, Optional, Any, Sequence
 
 import numpy as np
 from scipy.stats import spearmanr
@@ -24,6 +25,93 @@ from utils.LoggingManager import get_logger
 from simulation.accuracy.accuracy_types import RankingMetrics
 
 
+# Positions the ranking metrics are computed for; a row's position code indexes this
+# tuple (-1 for any other position, which only counts toward MAE).
+RANKING_POSITIONS: Tuple[str, ...] = ('QB', 'RB', 'WR', 'TE', 'K', 'DST')
+
+# One scored player-week. 'player' identifies the player within its week (the top-N
+# overlap compares players by it); 'position' is an index into RANKING_POSITIONS.
+PLAYER_WEEK_DTYPE = np.dtype([
+    ('week', np.int16),
+    ('position', np.int8),
+    ('player', np.int32),
+    ('projected', np.float64),
+    ('actual', np.float64),
+])
+
+# Minimum actual points for a player-week to enter the ranking metrics.
+RANKING_MIN_ACTUAL = 3.0
+TOP_N_SIZES: Tuple[int, ...] = (5, 10, 20)
+
+
+def player_week_rows(player_data_by_week: Dict[int, List[Dict[str, Any]]]) -> np.ndarray:
+    """
+    Convert per-week lists of player dicts into PLAYER_WEEK_DTYPE rows.
+
+    Rows keep each week's list order (ties in the ranking metrics resolve by it);
+    players are identified by 'name' within their week, as the top-N overlap did.
+
+    Args:
+        player_data_by_week: Dict of week -> list of dicts with 'name', 'position',
+            'projected' and 'actual' keys (missing values default to '' / 0)
+
+    Returns:
+        np.ndarray: One row per player dict
+    """
+    records = []
+    for week_num, player_list in player_data_by_week.items():
+        names: Dict[Any, int] = {}
+        for player in player_list:
+            position = player.get('position')
+            records.append((
+                week_num,
+                RANKING_POSITIONS.index(position) if position in RANKING_POSITIONS else -1,
+                names.setdefault(player.get('name', ''), len(names)),
+                player.get('projected', 0),
+                player.get('actual', 0),
+            ))
+    return np.array(records, dtype=PLAYER_WEEK_DTYPE)
+
+
+def _count_strict_inversions(values: Sequence[float]) -> int:
+    """
+    Count the pairs i < j with values[i] > values[j] in O(n log n).
+
+    Bottom-up merge sort that adds, whenever an element of the right run is merged
+    ahead of the left run, the number of left-run elements still pending. Equal
+    values merge left-first, so ties are never counted.
+
+    Args:
+        values: Sequence of mutually comparable numbers (no NaN)
+
+    Returns:
+        int: Number of strict inversions
+    """
+    values = list(values)
+    buffer = values[:]
+    n = len(values)
+    inversions = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if values[j] < values[i]:
+                    buffer[k] = values[j]
+                    inversions += mid - i
+                    j += 1
+                else:
+                    buffer[k] = values[i]
+                    i += 1
+                k += 1
+            buffer[k:hi] = values[i:mid] + values[j:hi]
+        values, buffer = buffer, values
+        width *= 2
+    return inversions
+
+
 class AccuracyResult:
     """
     Results from an accuracy calculation.
@@ -374,7 +462,9 @@ class AccuracyCalculator:
         Calculate pairwise decision accuracy for a position.
 
         For every pair of players at the same position, checks if the prediction
-        correctly identifies which player will score more fantasy points.
+        correctly identifies which player will score more fantasy points. The pairs
+        are counted by sorting and inversion counting (O(n log n)) rather than by
+        visiting each pair; the result is identical.
 
         Args:
             player_data: List of dicts with 'projected', 'actual', 'position' keys
@@ -398,23 +488,7 @@ class AccuracyCalculator:
             self.logger.debug(f"Not enough {position} players for pairwise accuracy")
             return np.nan
 
-        correct = 0
-        total = 0
-
-        for i in range(len(players)):
-            for j in range(i + 1, len(players)):
-                proj_i, actual_i = players[i]
-                proj_j, actual_j = players[j]
-
-                if actual_i == actual_j:
-                    continue
-
-                predicted_order = proj_i > proj_j
-                actual_order = actual_i > actual_j
-
-                if predicted_order == actual_order:
-                    correct += 1
-                total += 1
+        correct, total = self._count_pairwise(players)
 
         if total == 0:
             self.logger.warning(f"No valid comparisons for {position} (all ties)")
@@ -426,6 +500,68 @@ class AccuracyCalculator:
         )
         return accuracy
 
+    @classmethod
+    def _count_pairwise(cls, players: List[Tuple[float, float]]) -> Tuple[int, int]:
+        """
+        Count (correct, total) pairwise comparisons for (projected, actual) tuples.
+
+        A NaN projection compares False against everything, which no sort order can
+        reproduce, so such slates are counted pair by pair; every other slate is
+        counted in O(n log n).
+        """
+        if any(proj != proj for proj, _ in players):
+            return cls._count_pairwise_quadratic(players)
+        return cls._count_pairwise_sorted(players)
+
+    @staticmethod
+    def _count_pairwise_sorted(players: List[Tuple[float, float]]) -> Tuple[int, int]:
+        """
+        Count (correct, total) pairwise comparisons in O(n log n).
+
+        A pair i < j (input order) with different actuals is correct when
+        (proj_i > proj_j) == (actual_i > actual_j). Stable-sorting by projection puts
+        every pair in ascending projected order, with projected ties kept in input
+        order; for both kinds of pair the comparison is then correct exactly when the
+        earlier player's actual is strictly lower. So correct = total - (strict
+        inversions of the actuals in that order), counted by merge sort.
+
+        Args:
+            players: (projected, actual) tuples in input order, no NaN projections
+
+        Returns:
+            Tuple[int, int]: (correct comparisons, comparisons with different actuals)
+        """
+        n = len(players)
+        actual_ties = sum(c * (c - 1) // 2 for c in Counter(a for _, a in players).values())
+        total = n * (n - 1) // 2 - actual_ties
+
+        ordered_actuals = [actual for _, actual in sorted(players, key=lambda p: p[0])]
+        return total - _count_strict_inversions(ordered_actuals), total
+
+    @staticmethod
+    def _count_pairwise_quadratic(players: List[Tuple[float, float]]) -> Tuple[int, int]:
+        """
+        Count (correct, total) pairwise comparisons pair by pair (O(n^2)).
+
+        Only used for slates with a NaN projection; see _count_pairwise_sorted.
+
+        Args:
+            players: (projected, actual) tuples in input order
+
+        Returns:
+            Tuple[int, int]: (correct comparisons, comparisons with different actuals)
+        """
+        correct = 0
+        total = 0
+        for i, (proj_i, actual_i) in enumerate(players):
+            for proj_j, actual_j in players[i + 1:]:
+                if actual_i == actual_j:
+                    continue
+                if (proj_i > proj_j) == (actual_i > actual_j):
+                    correct += 1
+                total += 1
+        return correct, total
+
     def calculate_top_n_accuracy(
         self,
         player_data: List[Dict[str, Any]],
@@ -551,6 +687,9 @@ class AccuracyCalculator:
         - Pairwise/Top-N: Simple average across weeks
         - Spearman: Fisher z-transformation for proper averaging
 
+        Converts the dicts to PLAYER_WEEK_DTYPE rows and delegates to
+        calculate_ranking_metrics_columnar.
+
         Args:
             player_data_by_week: Dict of week -> list of player dicts with keys:
                 - 'name': Player name
@@ -561,77 +700,239 @@ class AccuracyCalculator:
         Returns:
             Tuple of (overall_metrics, by_position_metrics)
         """
-        positions = ['QB', 'RB', 'WR', 'TE', 'K', 'DST']
-
-        position_data = {pos: {
-            'pairwise_sum': 0.0,
-            'pairwise_count': 0,
-            'top_5_sum': 0.0,
-            'top_5_count': 0,
-            'top_10_sum': 0.0,
-            'top_10_count': 0,
-            'top_20_sum': 0.0,
-            'top_20_count': 0,
-            'spearman_z_values': []
-        } for pos in positions}
-
-        for week_num, player_list in player_data_by_week.items():
-            for pos in positions:
-                pairwise = self.calculate_pairwise_accuracy(
-                    player_list, pos
-                )
-                if not np.isnan(pairwise):
-                    position_data[pos]['pairwise_sum'] += pairwise
-                    position_data[pos]['pairwise_count'] += 1
+        return self.calculate_ranking_metrics_columnar(player_week_rows(player_data_by_week))
 
-                for n in [5, 10, 20]:
-                    top_n = self.calculate_top_n_accuracy(
-                        player_list, n, pos
-                    )
-                    if not np.isnan(top_n):
-                        position_data[pos][f'top_{n}_sum'] += top_n
-                        position_data[pos][f'top_{n}_count'] += 1
+    def calculate_ranking_metrics_columnar(
+        self,
+        rows: np.ndarray
+    ) -> Tuple[Optional[RankingMetrics], Dict[str, RankingMetrics]]:
+        """
+        Calculate ranking metrics for a season's PLAYER_WEEK_DTYPE rows.
 
-                corr = self.calculate_spearman_correlation(
-                    player_list, pos
-                )
-                if not np.isnan(corr):
-                    z = np.arctanh(np.clip(corr, -1 + 1e-6, 1 - 1e-6))
-                    position_data[pos]['spearman_z_values'].append(z)
+        Computes, for every (position, week) group at once, the same values the
+        per-position methods compute for one group: top-N overlap and Spearman
+        correlation vectorized over all groups (stable sorts per group, average
+        ranks for ties), pairwise accuracy by the O(n log n) count per group. Groups
+        are then aggregated exactly as calculate_ranking_metrics_for_season
+        describes.
 
-        by_position = {}
-        for pos in positions:
-            data = position_data[pos]
-
-            has_any_metric = (
-                data['pairwise_count'] > 0
-                or data['top_5_count'] > 0
-                or data['top_10_count'] > 0
-                or data['top_20_count'] > 0
-                or bool(data['spearman_z_values'])
+        Args:
+            rows: PLAYER_WEEK_DTYPE rows; within a week, row order breaks ties
+
+        Returns:
+            Tuple of (overall_metrics, by_position_metrics)
+
+        Note:
+            - Filters to ranked positions with actual >= 3 points
+            - A group whose metric is undefined (too few players, zero variance, all
+              ties) is left out of that metric's average
+            - Groups with a NaN projection are scored by the per-position methods,
+              whose comparison semantics a sort cannot reproduce
+        """
+        rows = rows[(rows['position'] >= 0) & (rows['actual'] >= RANKING_MIN_ACTUAL)]
+        values = {pos: {'pairwise': [], 'top_5': [], 'top_10': [], 'top_20': [], 'spearman_z': []}
+                  for pos in RANKING_POSITIONS}
+
+        if len(rows) > 0:
+            # Group by (position, week); lexsort is stable, so each group keeps row order.
+            rows = rows[np.lexsort((rows['week'], rows['position']))]
+            group_key = rows['position'].astype(np.int64) * 65536 + rows['week']
+            starts = np.flatnonzero(np.r_[True, group_key[1:] != group_key[:-1]])
+            sizes = np.diff(np.r_[starts, len(rows)])
+            group = np.repeat(np.arange(len(starts)), sizes)
+
+            pairwise = self._group_pairwise_accuracy(rows, starts, sizes)
+            top_n = self._group_top_n_accuracy(rows, group, starts, sizes)
+            spearman = self._group_spearman_correlation(rows, group, sizes)
+
+            for g in np.unique(group[np.isnan(rows['projected'])]).tolist():
+                group_rows = rows[starts[g]:starts[g] + sizes[g]]
+                position = RANKING_POSITIONS[group_rows['position'][0]]
+                player_list = [
+                    {'position': position, 'name': int(row['player']),
+                     'projected': float(row['projected']), 'actual': float(row['actual'])}
+                    for row in group_rows
+                ]
+                for n in TOP_N_SIZES:
+                    top_n[n][g] = self.calculate_top_n_accuracy(player_list, n, position)
+                spearman[g] = self.calculate_spearman_correlation(player_list, position)
+
+            z_values = np.arctanh(np.clip(spearman, -1 + 1e-6, 1 - 1e-6))
+            for g, start in enumerate(starts.tolist()):
+                data = values[RANKING_POSITIONS[rows['position'][start]]]
+                if not np.isnan(pairwise[g]):
+                    data['pairwise'].append(pairwise[g])
+                for n in TOP_N_SIZES:
+                    if not np.isnan(top_n[n][g]):
+                        data[f'top_{n}'].append(float(top_n[n][g]))
+                if not np.isnan(spearman[g]):
+                    data['spearman_z'].append(z_values[g])
+
+            self.logger.debug(
+                f"Ranking metrics: {len(rows)} qualifying player-weeks in {len(starts)} position-weeks"
             )
-            if not has_any_metric:
+
+        return self._assemble_ranking_metrics(values)
+
+    def calculate_season_accuracy(
+        self,
+        rows: np.ndarray,
+        week_range: Tuple[int, int],
+        weeks_evaluated: int
+    ) -> AccuracyResult:
+        """
+        Calculate MAE and ranking metrics for one season's PLAYER_WEEK_DTYPE rows.
+
+        The columnar counterpart of calculate_weekly_mae followed by
+        calculate_ranking_metrics_for_season, for rows that already pair every
+        player's projection with their actual for each evaluated week.
+
+        Args:
+            rows: PLAYER_WEEK_DTYPE rows for every evaluated week of the range
+            week_range: Tuple of (start_week, end_week) inclusive
+            weeks_evaluated: Number of weeks of week_range that had data
+
+        Returns:
+            AccuracyResult: MAE, ranking metrics and week coverage for the season
+        """
+        start_week, end_week = week_range
+        self.logger.debug(
+            f"calculate_season_accuracy: Processing {len(rows)} player-weeks (before filtering) "
+            f"for weeks {start_week}-{end_week}"
+        )
+
+        played = rows[rows['actual'] > 0]
+        if len(played) == 0:
+            self.logger.warning("No valid players for MAE calculation")
+            result = AccuracyResult(mae=0.0, player_count=0, total_error=0.0)
+        else:
+            total_error = float(np.abs(played['actual'] - played['projected']).sum())
+            result = AccuracyResult(
+                mae=total_error / len(played), player_count=len(played), total_error=total_error
+            )
+
+        result.overall_metrics, result.by_position = self.calculate_ranking_metrics_columnar(rows)
+        result.weeks_requested = end_week - start_week + 1
+        result.weeks_evaluated = weeks_evaluated
+        return result
+
+    @classmethod
+    def _group_pairwise_accuracy(cls, rows: np.ndarray, starts: np.ndarray,
+                                 sizes: np.ndarray) -> List[float]:
+        """Pairwise accuracy per group (np.nan when undefined), see calculate_pairwise_accuracy."""
+        projected = rows['projected'].tolist()
+        actual = rows['actual'].tolist()
+        accuracies = []
+        for start, size in zip(starts.tolist(), sizes.tolist()):
+            correct, total = cls._count_pairwise(
+                list(zip(projected[start:start + size], actual[start:start + size]))
+            ) if size >= 2 else (0, 0)
+            accuracies.append(correct / total if total > 0 else np.nan)
+        return accuracies
+
+    @staticmethod
+    def _group_top_n_accuracy(rows: np.ndarray, group: np.ndarray, starts: np.ndarray,
+                              sizes: np.ndarray) -> Dict[int, np.ndarray]:
+        """
+        Top-N overlap per group for every TOP_N_SIZES entry (np.nan below N players).
+
+        Ranks each group by a stable descending sort (ties keep row order, as
+        sorted(..., reverse=True) does) and intersects the predicted and actual top N
+        as sets of player ids, like calculate_top_n_accuracy.
+        """
+        count = len(rows)
+        rank_projected = np.empty(count, dtype=np.int64)
+        rank_actual = np.empty(count, dtype=np.int64)
+        for ranks, column in ((rank_projected, 'projected'), (rank_actual, 'actual')):
+            order = np.lexsort((-rows[column], group))
+            ranks[order] = np.arange(count) - starts[group[order]]
+
+        player_span = int(rows['player'].max()) + 1
+        player_key = group.astype(np.int64) * player_span + rows['player']
+        top_n = {}
+        for n in TOP_N_SIZES:
+            shared = np.intersect1d(
+                np.unique(player_key[rank_projected < n]), np.unique(player_key[rank_actual < n]),
+                assume_unique=True,
+            )
+            overlap = np.bincount(shared // player_span, minlength=len(starts))
+            top_n[n] = np.where(sizes >= n, overlap / n, np.nan)
+        return top_n
+
+    @staticmethod
+    def _group_spearman_correlation(rows: np.ndarray, group: np.ndarray,
+                                    sizes: np.ndarray) -> np.ndarray:
+        """
+        Spearman correlation per group (np.nan below 2 players or with zero variance).
+
+        Pearson correlation of within-group average ranks, as scipy's spearmanr
+        computes it.
+        """
+        def average_ranks(column: str) -> np.ndarray:
+            order = np.lexsort((rows[column], group))
+            ordered, ordered_group = rows[column][order], group[order]
+            new_run = np.r_[True, (ordered[1:] != ordered[:-1]) | (ordered_group[1:] != ordered_group[:-1])]
+            run_starts = np.flatnonzero(new_run)
+            run_ends = np.r_[run_starts[1:], len(ordered)]
+            group_starts = np.r_[0, np.cumsum(sizes)[:-1]]
+            run_ranks = (run_starts + run_ends - 1) / 2 - group_starts[ordered_group[run_starts]] + 1
+            ranks = np.empty(len(ordered))
+            ranks[order] = run_ranks[np.cumsum(new_run) - 1]
+            return ranks
+
+        mean_rank = ((sizes + 1) / 2)[group]
+        x = average_ranks('projected') - mean_rank
+        y = average_ranks('actual') - mean_rank
+        groups = len(sizes)
+        sxy = np.bincount(group, x * y, minlength=groups)
+        sxx = np.bincount(group, x * x, minlength=groups)
+        syy = np.bincount(group, y * y, minlength=groups)
+
+        defined = (sizes >= 2) & (sxx > 0) & (syy > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = sxy / np.sqrt(sxx * syy)
+        return np.where(defined, np.clip(correlation, -1.0, 1.0), np.nan)
+
+    def _assemble_ranking_metrics(
+        self,
+        values: Dict[str, Dict[str, List[float]]]
+    ) -> Tuple[Optional[RankingMetrics], Dict[str, RankingMetrics]]:
+        """
+        Aggregate per-week metric values into per-position and overall RankingMetrics.
+
+        Args:
+            values: Position -> metric ('pairwise', 'top_5', 'top_10', 'top_20',
+                'spearman_z') -> valid per-week values in week order
+
+        Returns:
+            Tuple of (overall_metrics, by_position_metrics)
+        """
+        by_position = {}
+        for pos in RANKING_POSITIONS:
+            data = values[pos]
+
+            if not any(data.values()):
                 self.logger.debug(f"No valid data for {pos}, skipping ranking metrics")
                 continue
 
-            if data['spearman_z_values']:
-                z_mean = np.mean(data['spearman_z_values'])
+            if data['spearman_z']:
+                z_mean = np.mean(data['spearman_z'])
                 spearman = float(np.tanh(z_mean))
             else:
                 spearman = None
 
             by_position[pos] = RankingMetrics(
-                pairwise_accuracy=(data['pairwise_sum'] / data['pairwise_count']) if data['pairwise_count'] > 0 else None,
-                top_5_accuracy=(data['top_5_sum'] / data['top_5_count']) if data['top_5_count'] > 0 else None,
-                top_10_accuracy=(data['top_10_sum'] / data['top_10_count']) if data['top_10_count'] > 0 else None,
-                top_20_accuracy=(data['top_20_sum'] / data['top_20_count']) if data['top_20_count'] > 0 else None,
+                pairwise_accuracy=(sum(data['pairwise']) / len(data['pairwise'])) if data['pairwise'] else None,
+                top_5_accuracy=(sum(data['top_5']) / len(data['top_5'])) if data['top_5'] else None,
+                top_10_accuracy=(sum(data['top_10']) / len(data['top_10'])) if data['top_10'] else None,
+                top_20_accuracy=(sum(data['top_20']) / len(data['top_20'])) if data['top_20'] else None,
                 spearman_correlation=spearman
             )
 
         if by_position:
             all_z_values = []
-            for data in position_data.values():
-                all_z_values.extend(data['spearman_z_values'])
+            for data in values.values():
+                all_z_values.extend(data['spearman_z'])
 
             overall_spearman = None
             if all_z_values:
@@ -44,8 +44,16 @@ from simulation.accuracy.AccuracyResultsManager import (
     format_metric_pct,
     format_metric_corr,
 )
+from simulation.accuracy.evaluation_memo import MEMO_FILENAME, EvaluationMemo
+from simulation.accuracy.racing import (
+    RACING_DEFAULT_CONFIDENCE,
+    RACING_DEFAULT_FRACTION,
+    is_clearly_worse,
+    screening_exclusions,
+)
 from simulation.accuracy.horizon_labels import (
     HORIZON_COUNT,
+    HORIZON_WEEK_KEYS,
     candidate_values_label,
     configs_per_param_label,
 )
@@ -84,6 +92,15 @@ class AccuracySimulationManager:
 
     ORPHANED_DIR_MAX_AGE_HOURS = 24
 
+    # Created lazily by _run_ascent_pass and closed when run_both finishes.
+    parallel_runner = None
+    use_eval_memo = True
+    shard_seasons = True
+    # Racing is off unless __init__ builds a screening subsample.
+    racing_exclusions = None
+    racing_confidence = RACING_DEFAULT_CONFIDENCE
+    horizon_restricted = False
+
     def __init__(
         self,
         baseline_config_path: Path,
@@ -95,7 +112,13 @@ class AccuracySimulationManager:
         max_workers: int = 8,
         use_processes: bool = True,
         seed: int = DEFAULT_ACCURACY_SEED,
-        exclude_low_coverage_weeks: bool = False
+        exclude_low_coverage_weeks: bool = False,
+        use_eval_memo: bool = True,
+        shard_seasons: bool = True,
+        racing: bool = False,
+        racing_fraction: float = RACING_DEFAULT_FRACTION,
+        racing_confidence: float = RACING_DEFAULT_CONFIDENCE,
+        horizon_restricted: bool = False
     ) -> None:
         """
         Initialize AccuracySimulationManager.
@@ -115,6 +138,26 @@ class AccuracySimulationManager:
                 corpus every season-week the shared coverage owner reports below the
                 per-week floor (D8.4). Default False — nothing is computed, nothing is
                 logged, and the evaluation corpus is exactly today's.
+            use_eval_memo (bool): When True (default), config evaluations are memoized
+                on disk under output_dir (see evaluation_memo), so re-tested
+                incumbents and resumed runs reuse earlier results. False evaluates
+                every config.
+            shard_seasons (bool): When True (default), the parallel runner schedules
+                one task per config, season and horizon on per-season-horizon workers
+                (see ParallelAccuracyRunner), so passes with few candidates still use
+                every worker. False submits one task per config.
+            racing (bool): When True, each parameter's candidates are first screened on
+                a subsample of season-weeks and only those not clearly worse than the
+                horizon incumbents get the full evaluation (see racing). Default False.
+            racing_fraction (float): Share of each season's horizon weeks in the
+                screening subsample, in (0, 1].
+            racing_confidence (float): One-sided confidence, in (0.5, 1), required
+                to discard a candidate as worse than the incumbent.
+            horizon_restricted (bool): When True, a candidate generated for one horizon
+                of a horizon-specific parameter is scored and recorded only on that
+                horizon's week range; shared-parameter candidates still cover all four.
+                Default False (every candidate is scored on, and can be adopted for,
+                every horizon).
         """
         self.logger = get_logger()
         self.logger.info("Initializing AccuracySimulationManager")
@@ -128,6 +171,9 @@ class AccuracySimulationManager:
 
         self.max_workers = max_workers
         self.use_processes = use_processes
+        self.use_eval_memo = use_eval_memo
+        self.shard_seasons = shard_seasons
+        self.horizon_restricted = horizon_restricted
         self.parallel_runner = None
         self.progress_tracker = None
 
@@ -159,6 +205,20 @@ class AccuracySimulationManager:
             if exclude_low_coverage_weeks else {}
         )
 
+        if racing:
+            if not 0 < racing_fraction <= 1:
+                raise ValueError(f"racing_fraction must be in (0, 1], got {racing_fraction}")
+            if not 0.5 < racing_confidence < 1:
+                raise ValueError(f"racing_confidence must be in (0.5, 1), got {racing_confidence}")
+            self.racing_confidence = racing_confidence
+            self.racing_exclusions = screening_exclusions(
+                self.available_seasons, self.excluded_season_weeks, racing_fraction, seed
+            )
+            self.logger.info(
+                f"Racing enabled: candidates screened on {racing_fraction:.0%} of each season's "
+                f"horizon weeks, discarded at {racing_confidence:.0%} confidence"
+            )
+
         candidate_values = num_test_values + 1
         configs_per_param = candidate_values * HORIZON_COUNT
         self.logger.info(
@@ -546,6 +606,8 @@ class AccuracySimulationManager:
             return optimal_path
 
         finally:
+            if self.parallel_runner is not None:
+                self.parallel_runner.close()
             self._restore_signal_handlers()
 
 
@@ -588,28 +650,33 @@ class AccuracySimulationManager:
             # of them would inflate the ProgressTracker total and the log line, so a
             # partially-frozen pass could never reach 100% -- reporting a bar that cannot
             # complete as if work were missing.
-            active_horizons = [h for h in test_values_dict if h not in frozen_horizons]
+            active_horizons = [
+                h for h in test_values_dict
+                if h not in frozen_horizons and not self._scores_only_frozen(h, frozen_horizons)
+            ]
             total_configs = sum(len(test_values_dict[h]) for h in active_horizons)
-            total_evaluations = total_configs * len(WEEK_RANGES)
+            total_evaluations = sum(
+                len(test_values_dict[h]) * len(self._evaluated_horizons(h) or WEEK_RANGES)
+                for h in active_horizons
+            )
 
             if total_configs == 0:
                 # Every horizon frozen: nothing to evaluate for this parameter.
                 continue
 
             self.logger.info(f"Optimizing parameter {param_idx + 1}/{len(self.parameter_order)}: {param_name}")
-            self.logger.info(f"  Evaluating {total_configs} configs × 4 horizons = {total_evaluations} total evaluations")
-
-            self.progress_tracker = ProgressTracker(
-                total=total_configs,
-                description="Configs (each tests 4 horizons)"
-            )
+            if total_evaluations == total_configs * len(WEEK_RANGES):
+                self.logger.info(f"  Evaluating {total_configs} configs × 4 horizons = {total_evaluations} total evaluations")
+            else:
+                self.logger.info(f"  Evaluating {total_configs} configs = {total_evaluations} horizon-restricted evaluations")
 
             configs_to_evaluate = []
             config_metadata = []
 
             for horizon, test_values in test_values_dict.items():
-                if horizon in frozen_horizons:
+                if horizon not in active_horizons:
                     continue   # T69/D1: converged -- generate no further candidates
+                evaluated_horizons = self._evaluated_horizons(horizon)
                 for test_idx, test_value in enumerate(test_values):
                     config_dict = self.config_generator.get_config_for_horizon(horizon, param_name, test_idx)
 
@@ -621,29 +688,44 @@ class AccuracySimulationManager:
                     }
 
                     configs_to_evaluate.append(config_dict)
-                    config_metadata.append((horizon, test_idx))
+                    config_metadata.append((horizon, test_idx, evaluated_horizons))
 
             if self.parallel_runner is None:
                 from simulation.accuracy.ParallelAccuracyRunner import ParallelAccuracyRunner
+                memo = (
+                    EvaluationMemo(self.output_dir / MEMO_FILENAME, self.available_seasons,
+                                   self.excluded_season_weeks)
+                    if self.use_eval_memo else None
+                )
                 self.parallel_runner = ParallelAccuracyRunner(
                     self.data_folder,
                     self.available_seasons,
                     max_workers=self.max_workers,
                     use_processes=self.use_processes,
-                    excluded_season_weeks=self.excluded_season_weeks
+                    excluded_season_weeks=self.excluded_season_weeks,
+                    memo=memo,
+                    shard_seasons=self.shard_seasons
                 )
 
-            def progress_update(completed):
-                self.progress_tracker.update()
+            generated_configs = len(configs_to_evaluate)
+            if self.racing_exclusions is not None:
+                configs_to_evaluate, config_metadata = self._race_candidates(
+                    configs_to_evaluate, config_metadata, frozen_horizons
+                )
 
-            evaluation_results = self.parallel_runner.evaluate_configs_parallel(
-                configs_to_evaluate,
-                progress_callback=progress_update
+            self.progress_tracker = ProgressTracker(
+                total=len(configs_to_evaluate),
+                description=self._progress_description(config_metadata, generated_configs)
             )
 
-            self.progress_tracker.finish()
+            def progress_update(completed):
+                self.progress_tracker.update()
 
-            for (config_dict, results_dict), (horizon, test_idx) in zip(evaluation_results, config_metadata):
+            def record_result(index, config_dict, results_dict):
+                # Results arrive in submission order as soon as each config (and every
+                # earlier one) is evaluated, so best-config tracking advances with the
+                # pass and ties resolve exactly as in a sequential evaluation.
+                horizon, test_idx, _ = config_metadata[index]
                 for result_horizon, result in results_dict.items():
                     if result_horizon in frozen_horizons:
                         continue   # T69/D1: frozen -- its best is final for this run
@@ -661,6 +743,15 @@ class AccuracySimulationManager:
                         adopted_this_pass.add(result_horizon)
                         self.logger.info(f"    New best for {result_horizon}: MAE={result.mae:.4f} (test_{test_idx})")
 
+            self.parallel_runner.evaluate_configs_parallel(
+                configs_to_evaluate,
+                progress_callback=progress_update,
+                result_callback=record_result,
+                horizons=[metadata[2] for metadata in config_metadata]
+            )
+
+            self.progress_tracker.finish()
+
             self.results_manager.save_intermediate_results(
                 param_idx,
                 param_name,
@@ -687,6 +778,99 @@ class AccuracySimulationManager:
 
         return adopted_this_pass
 
+    def _evaluated_horizons(self, horizon: str) -> Optional[Tuple[str, ...]]:
+        """WEEK_RANGES keys a candidate generated for `horizon` is scored on; None means all four.
+
+        Only horizon-restricted mode narrows this, and only for a horizon-specific
+        parameter's candidates ('1-5', ...): those are scored on their own week range.
+        Shared-parameter candidates ('shared') always cover every horizon.
+        """
+        if self.horizon_restricted and horizon in HORIZON_WEEK_KEYS:
+            return (HORIZON_WEEK_KEYS[horizon],)
+        return None
+
+    @staticmethod
+    def _progress_description(config_metadata: List[tuple], generated_configs: int) -> str:
+        """ProgressTracker label for one parameter's evaluation batch.
+
+        Counts the horizons each config is actually scored on (its evaluated_horizons
+        metadata; None means all of WEEK_RANGES), and notes how many generated candidates
+        the racing screen left, so horizon-restricted and raced runs are not labelled as
+        four-horizon evaluations of every candidate.
+
+        Args:
+            config_metadata (List[tuple]): (horizon, test_idx, evaluated_horizons) per
+                config being evaluated.
+            generated_configs (int): Candidates generated before the racing screen.
+
+        Returns:
+            str: e.g. "Configs (each tests 4 horizons)" or
+                "Configs (1-4 horizons each; 12 of 20 survived racing)".
+        """
+        counts = sorted({len(metadata[2] or WEEK_RANGES) for metadata in config_metadata})
+        if len(counts) == 1:
+            horizons = f"each tests {counts[0]} horizon{'s' if counts[0] != 1 else ''}"
+        elif counts:
+            horizons = f"{counts[0]}-{counts[-1]} horizons each"
+        else:
+            horizons = "none to test"
+        if len(config_metadata) < generated_configs:
+            horizons += f"; {len(config_metadata)} of {generated_configs} survived racing"
+        return f"Configs ({horizons})"
+
+    def _scores_only_frozen(self, horizon: str, frozen_horizons: set) -> bool:
+        """True when every horizon `horizon`'s candidates would be scored on is frozen."""
+        evaluated = self._evaluated_horizons(horizon)
+        return evaluated is not None and set(evaluated) <= frozen_horizons
+
+    def _race_candidates(self, configs: List[dict], config_metadata: List[tuple],
+                         frozen_horizons: set) -> Tuple[List[dict], List[tuple]]:
+        """Screen a parameter's candidates on the racing subsample and keep the survivors.
+
+        The horizon incumbents (results_manager.best_configs) are screened in the same
+        batch, so every comparison is on identical season-weeks. A candidate is dropped
+        only when it is clearly worse (racing.is_clearly_worse) than the incumbent of
+        every unfrozen horizon it was scored on, i.e. every horizon it could still be
+        adopted for. Dropped candidates are never recorded. Until every unfrozen horizon
+        has an incumbent, all candidates are kept.
+
+        Args:
+            configs (List[dict]): The parameter's candidate configs.
+            config_metadata (List[tuple]): (horizon, test_idx, evaluated_horizons) per
+                config, see _evaluated_horizons.
+            frozen_horizons (set): Horizons no longer recorded.
+
+        Returns:
+            Tuple[List[dict], List[tuple]]: Surviving configs and their metadata.
+        """
+        active = [week_key for week_key in WEEK_RANGES if week_key not in frozen_horizons]
+        incumbents = [self.results_manager.best_configs.get(week_key) for week_key in active]
+        if any(perf is None for perf in incumbents):
+            self.logger.info("  Racing skipped: not every horizon has an incumbent yet")
+            return configs, config_metadata
+
+        screened = self.parallel_runner.evaluate_configs_parallel(
+            [perf.config_dict for perf in incumbents] + configs,
+            excluded_season_weeks=self.racing_exclusions,
+            horizons=[None] * len(incumbents) + [metadata[2] for metadata in config_metadata]
+        )
+        incumbent_results = {
+            week_key: screened[i][1][week_key] for i, week_key in enumerate(active)
+        }
+
+        survivors = [
+            index for index, (_, results) in enumerate(screened[len(active):])
+            if not all(
+                is_clearly_worse(results[week_key], incumbent_results[week_key], self.racing_confidence)
+                for week_key in active if week_key in results
+            )
+        ]
+        self.logger.info(
+            f"  Racing: {len(survivors)}/{len(configs)} candidates survive screening "
+            f"({len(configs) - len(survivors)} clearly worse than every incumbent)"
+        )
+        return [configs[i] for i in survivors], [config_metadata[i] for i in survivors]
+
     def _warn_low_accuracy_promoted(self) -> None:
         """Warn once per horizon when the promoted config scores below the accuracy bar.
 
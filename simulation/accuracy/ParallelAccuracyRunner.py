@@ -5,31 +5,261 @@ This module provides parallel evaluation of configs across multiple horizons
 to speed up tournament optimization. Each config is evaluated across all 4
 weekly horizons (week 1-5, 6-9, 10-13, 14-17) to calculate MAE.
 
+Everything a config's evaluation reads from a season folder is config-independent, so
+each worker parses it once and keeps it for its lifetime: the season's schedule, team
+data and game conditions, every week folder's player records, and every week's actual
+results. Evaluating a config then only builds its ConfigManager and managers from that
+in-memory data and rescores the players -- no temp directories, no file copies.
+
+Rescoring is factor-decomposed (see factor_scores): each projected week keeps every
+player's per-factor values keyed by the config sections they depend on, so a
+coordinate-ascent candidate, which differs from its horizon baseline in one parameter,
+recomputes only the factor that parameter feeds and recombines the cached rest.
+
+Scored weeks are handed to the calculator as one structured array per season
+(PLAYER_WEEK_DTYPE rows: week, position, player, projected, actual) instead of lists
+of per-player dicts; each week's config-independent columns are built once.
+
 Author: Kai Mizuno
 """
 
 import json
-import shutil
-import tempfile
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple
 
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import numpy as np
 
-from simulation.accuracy.AccuracyCalculator import AccuracyCalculator, AccuracyResult
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from simulation.accuracy.AccuracyCalculator import (
+    PLAYER_WEEK_DTYPE, RANKING_POSITIONS, AccuracyCalculator, AccuracyResult,
+)
+from simulation.accuracy.evaluation_memo import EvaluationMemo, results_from_payload, results_to_payload
+from simulation.accuracy.factor_scores import (
+    ACCURACY_FACTORS, RANK_WINDOW_FACTORS, STATIC_FEATURE_FACTORS, compose_projections, factor_keys,
+    factor_values, feature_table,
+)
 from simulation.accuracy.horizon_labels import HORIZON_COUNT, WEEK_RANGES
 from utils.LoggingManager import get_logger
 from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.GameDataManager import GameDataManager
 from league_helper.util.PlayerManager import PlayerManager
-from league_helper.util.TeamDataManager import TeamDataManager
+from league_helper.util.player_scoring import PlayerScoringCalculator
+from league_helper.util.TeamDataManager import RankTableCache, TeamDataManager
 from league_helper.util.SeasonScheduleManager import SeasonScheduleManager
+from league_helper.util.upcoming_game_model import UpcomingGame
+from utils.FantasyPlayer import FantasyPlayer
+from utils.TeamData import load_team_weekly_data
+
+
+POSITION_FILES: Tuple[str, ...] = (
+    'qb_data.json', 'rb_data.json', 'wr_data.json',
+    'te_data.json', 'k_data.json', 'dst_data.json',
+)
+
+
+@dataclass(frozen=True)
+class _SeasonData:
+    """
+    One season's config-independent inputs, shared by every week folder of the season.
+
+    Attributes:
+        schedule (Dict[Tuple[str, int], Optional[str]]): SeasonScheduleManager's
+            (team, week) -> opponent cache; empty when season_schedule.csv is missing.
+        team_weekly_data (Dict[str, List[Dict[str, Any]]]): load_team_weekly_data
+            output; empty when the team_data folder is missing or unreadable.
+        games (Dict[int, Dict[str, UpcomingGame]]): GameDataManager.all_games.
+    """
+
+    schedule: Dict[Tuple[str, int], Optional[str]]
+    team_weekly_data: Dict[str, List[Dict[str, Any]]]
+    games: Dict[int, Dict[str, UpcomingGame]]
+
+
+@dataclass(frozen=True)
+class _WeekFolderData:
+    """
+    One week folder's parsed player data.
+
+    Attributes:
+        player_records (Dict[str, List[Dict[str, Any]]]): Player records keyed by position
+            file stem ('qb_data', ...). A missing or unreadable position file is absent.
+        dst_player_data (Dict[str, List[Optional[float]]]): D/ST weekly actual points by
+            team, extracted from this folder's dst_data.json.
+        rank_tables (RankTableCache): TeamDataManager week rank tables for managers built
+            from this folder; they depend on its D/ST data, so the cache is per folder.
+    """
+
+    player_records: Dict[str, List[Dict[str, Any]]]
+    dst_player_data: Dict[str, List[Optional[float]]]
+    rank_tables: RankTableCache = field(default_factory=dict, compare=False, repr=False)
+
+
+# Per-worker caches, filled lazily and kept for the worker's lifetime (every config,
+# horizon and season the worker evaluates). Keyed by folder path: sim_data is read-only
+# while an evaluation runs. In thread mode they live in the calling process.
+_WORKER_SEASONS: Dict[Path, _SeasonData] = {}
+_WORKER_WEEK_FOLDERS: Dict[Path, _WeekFolderData] = {}
+_WORKER_WEEK_ACTUALS: Dict[Tuple[Path, int], List[Tuple[str, str, str, float]]] = {}
+
+# Distinct keys kept per factor and projected week. A coordinate-ascent batch holds at
+# most one baseline per horizon for every factor it does not sweep; the swept factor's
+# candidate values are each used once and simply cycle through the remaining slots.
+FACTOR_CACHE_SIZE = 8
+
+
+class _WeekFactors:
+    """
+    Per-player factor values of one projected week, for every config scored against it.
+
+    Owns a template PlayerManager built from the first config that reaches the week;
+    its players, schedule and game data are config-independent. A later config only
+    gets a ConfigManager (and, for the rank-window factors, a TeamDataManager) to
+    compute the factors whose key it has not seen; every other factor is read from
+    the cache. All access holds the entry's lock because computing a factor rewrites
+    the template players' team context (thread mode shares the entry).
+
+    Attributes:
+        season_path (Path): The season folder.
+        projected_path (Path): The week_N folder the players come from.
+        week_num (int): The scored week.
+        template (PlayerManager): Players and config-independent managers.
+        player_ids (List[str]): Player ids in row order.
+        max_weekly_projection (float): The week's maximum weekly projection.
+        feature_tables (Dict[str, FeatureTable]): The template players grouped by game
+            features, for the STATIC_FEATURE_FACTORS; built once per week.
+        factors (Dict[str, OrderedDict]): Factor -> LRU of key -> per-player values.
+        normalization_scales (Dict[str, float]): Weight key -> normalization_max_scale.
+        actual_rows (Optional[Tuple[np.ndarray, np.ndarray]]): The week's matched
+            PLAYER_WEEK_DTYPE rows without projections, and each row's player index
+            into player_ids; built by the first rows() call.
+    """
+
+    def __init__(self, config_dict: dict, projected_path: Path, season_path: Path, week_num: int):
+        self.season_path = season_path
+        self.projected_path = projected_path
+        self.week_num = week_num
+        self.template = _create_player_manager(config_dict, projected_path, season_path, week_num)
+        self.player_ids = [player.id for player in self.template.players]
+        self.max_weekly_projection = self.template.calculate_max_weekly_projection(week_num)
+        self.feature_tables = {
+            factor: feature_table(self.template.players, factor) for factor in STATIC_FEATURE_FACTORS
+        }
+        self.factors: Dict[str, OrderedDict] = {factor: OrderedDict() for factor in ACCURACY_FACTORS}
+        self.normalization_scales: Dict[str, float] = {}
+        self.actual_rows: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    def projections(self, config_dict: dict, keys: Dict[str, str]) -> Dict[str, float]:
+        """
+        Return every player's projected points under config_dict.
+
+        Args:
+            config_dict: Configuration dictionary
+            keys: factor_keys(config_dict['parameters'])
+
+        Returns:
+            Player id -> projected points, equal to score_player's projected_points.
+        """
+        return dict(zip(self.player_ids, self._projected(config_dict, keys).tolist()))
+
+    def rows(self, config_dict: dict, keys: Dict[str, str], actual_path: Path) -> np.ndarray:
+        """
+        Return the week's PLAYER_WEEK_DTYPE rows scored under config_dict.
+
+        One row per player with a positive actual (see _week_actuals) who is also
+        projected this week, in the actuals' load order. Players are identified by
+        name within the week, as the dict-based ranking metrics did.
+
+        Args:
+            config_dict: Configuration dictionary
+            keys: factor_keys(config_dict['parameters'])
+            actual_path: The week_N+1 folder holding this week's actuals
+
+        Returns:
+            np.ndarray: The week's rows with 'projected' filled in for config_dict.
+        """
+        if self.actual_rows is None:
+            index = {player_id: i for i, player_id in enumerate(self.player_ids)}
+            names: Dict[str, int] = {}
+            records, player_index = [], []
+            for player_id, name, position, actual in _week_actuals(actual_path, self.week_num):
+                if player_id in index:
+                    records.append((
+                        self.week_num,
+                        RANKING_POSITIONS.index(position) if position in RANKING_POSITIONS else -1,
+                        names.setdefault(name, len(names)),
+                        0.0,
+                        actual,
+                    ))
+                    player_index.append(index[player_id])
+            self.actual_rows = (np.array(records, dtype=PLAYER_WEEK_DTYPE),
+                                np.array(player_index, dtype=np.intp))
+
+        base, player_index = self.actual_rows
+        rows = base.copy()
+        rows['projected'] = self._projected(config_dict, keys)[player_index]
+        return rows
+
+    def _projected(self, config_dict: dict, keys: Dict[str, str]) -> np.ndarray:
+        """Projected points per player in player_ids order (see projections)."""
+        with self._lock:
+            missing = [factor for factor in ACCURACY_FACTORS if keys[factor] not in self.factors[factor]]
+            if missing:
+                self._compute(config_dict, keys, missing)
+
+            values = {}
+            for factor in ACCURACY_FACTORS:
+                cache = self.factors[factor]
+                cache.move_to_end(keys[factor])
+                values[factor] = cache[keys[factor]]
+            return compose_projections(
+                values, self.normalization_scales[keys['weight']], self.max_weekly_projection
+            )
+
+    def _compute(self, config_dict: dict, keys: Dict[str, str], missing: List[str]) -> None:
+        """Compute and cache the missing factors for config_dict (caller holds the lock)."""
+        template = self.template
+        config_mgr = ConfigManager(self.season_path, config_data=_config_at_week(config_dict, self.week_num))
+
+        team_data_mgr = template.team_data_manager
+        if RANK_WINDOW_FACTORS.intersection(missing):
+            team_data_mgr = _team_data_manager(config_mgr, self.projected_path, self.season_path)
+            template.team_data_manager = team_data_mgr
+            template.refresh_team_context()
+
+        calculator = PlayerScoringCalculator(
+            config_mgr, template, template.max_projection, team_data_mgr,
+            template.season_schedule_manager, self.week_num, template.game_data_manager,
+            fast_scoring=True,
+        )
+        calculator.max_weekly_projection = self.max_weekly_projection
+
+        for factor in missing:
+            cache = self.factors[factor]
+            cache[keys[factor]] = factor_values(
+                calculator, template.players, factor, table=self.feature_tables.get(factor)
+            )
+            if len(cache) > FACTOR_CACHE_SIZE:
+                evicted, _ = cache.popitem(last=False)
+                if factor == 'weight':
+                    del self.normalization_scales[evicted]
+        if 'weight' in missing:
+            self.normalization_scales[keys['weight']] = config_mgr.normalization_max_scale
+
+
+_WORKER_WEEK_FACTORS: Dict[Tuple[Path, int], _WeekFactors] = {}
 
 
 def _evaluate_config_tournament_process(
     config_dict: Dict[str, Any],
     data_folder: Path,
     available_seasons: List[Path],
-    excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None
+    excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None,
+    horizons: Optional[Tuple[str, ...]] = None
 ) -> Tuple[Dict[str, Any], Dict[str, AccuracyResult]]:
     """
     Module-level function to evaluate single config across all 4 weekly horizons.
@@ -43,11 +273,14 @@ def _evaluate_config_tournament_process(
         excluded_season_weeks: Optional season-directory-name -> frozenset of
             week numbers the harness must not evaluate (D8.4). None or an empty
             mapping evaluates every season-week, exactly as before.
+        horizons: Optional subset of WEEK_RANGES keys to evaluate (horizon-restricted
+            mode). None evaluates all four.
 
     Returns:
         Tuple of (config_dict, results_dict) where results_dict maps horizon to AccuracyResult.
         Uses underscore keys to match AccuracyResultsManager expectations:
         {'week_1_5': result_1_5, 'week_6_9': result_6_9, 'week_10_13': result_10_13, 'week_14_17': result_14_17}
+        With horizons given, only those keys are present.
     """
     calculator = AccuracyCalculator()
 
@@ -59,22 +292,94 @@ def _evaluate_config_tournament_process(
     config_horizon = metadata.get('horizon', 'unknown')
 
     for week_key, week_range in WEEK_RANGES.items():
+        if horizons is not None and week_key not in horizons:
+            continue
         results[week_key] = _evaluate_config_weekly_worker(
             calculator, config_dict, data_folder, available_seasons, week_range, week_key,
             param_name, param_value, config_horizon, excluded_season_weeks
         )
 
-    logger = calculator.logger
-    config_label = f"{param_name}={param_value} [{config_horizon}]"
-    logger.info(f"━━━ Config Complete: {config_label} ━━━")
-    logger.info(f"  week_1_5:   MAE={results['week_1_5'].mae:.4f} (players={results['week_1_5'].player_count}, weeks={results['week_1_5'].weeks_evaluated}/{results['week_1_5'].weeks_requested})")
-    logger.info(f"  week_6_9:   MAE={results['week_6_9'].mae:.4f} (players={results['week_6_9'].player_count}, weeks={results['week_6_9'].weeks_evaluated}/{results['week_6_9'].weeks_requested})")
-    logger.info(f"  week_10_13: MAE={results['week_10_13'].mae:.4f} (players={results['week_10_13'].player_count}, weeks={results['week_10_13'].weeks_evaluated}/{results['week_10_13'].weeks_requested})")
-    logger.info(f"  week_14_17: MAE={results['week_14_17'].mae:.4f} (players={results['week_14_17'].player_count}, weeks={results['week_14_17'].weeks_evaluated}/{results['week_14_17'].weeks_requested})")
-
+    _log_config_complete(calculator.logger, config_dict, results)
     return (config_dict, results)
 
 
+def _config_label(config_dict: Dict[str, Any]) -> str:
+    """'param=value [horizon]' label of a config, from its _eval_metadata."""
+    metadata = config_dict.get('_eval_metadata', {})
+    return (
+        f"{metadata.get('param_name', 'unknown')}={metadata.get('param_value', 'unknown')} "
+        f"[{metadata.get('horizon', 'unknown')}]"
+    )
+
+
+def _log_config_complete(logger, config_dict: Dict[str, Any], results: Dict[str, AccuracyResult]) -> None:
+    """Log a finished config's per-horizon MAE summary."""
+    logger.info(f"━━━ Config Complete: {_config_label(config_dict)} ━━━")
+    for week_key, result in results.items():
+        label = f"{week_key}:"
+        logger.info(f"  {label:<11} MAE={result.mae:.4f} (players={result.player_count}, weeks={result.weeks_evaluated}/{result.weeks_requested})")
+
+
+def _evaluate_config_task(
+    index: int,
+    config_dict: Dict[str, Any],
+    data_folder: Path,
+    available_seasons: List[Path],
+    excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None,
+    horizons: Optional[Tuple[str, ...]] = None
+) -> Tuple[int, Dict[str, AccuracyResult]]:
+    """
+    Index-tagged task submitted by ParallelAccuracyRunner.
+
+    Returns the config's position in its batch instead of echoing the config back, so
+    only the results cross the process boundary on the way out.
+
+    Args:
+        index: Position of the config in the evaluate_configs_parallel batch
+        config_dict, data_folder, available_seasons, excluded_season_weeks, horizons:
+            As for _evaluate_config_tournament_process
+
+    Returns:
+        Tuple of (index, results_dict)
+    """
+    _, results = _evaluate_config_tournament_process(
+        config_dict, data_folder, available_seasons, excluded_season_weeks, horizons
+    )
+    return index, results
+
+
+def _evaluate_shard_task(
+    index: int,
+    config_dict: Dict[str, Any],
+    season_pos: int,
+    season_path: Path,
+    week_key: str,
+    excluded_weeks: FrozenSet[int]
+) -> Tuple[int, int, str, AccuracyResult]:
+    """
+    One (config, season, horizon) shard, submitted by a runner with shard_seasons.
+
+    Scores the config on one season's weeks of one horizon and returns the season's
+    unaggregated result; the parent aggregates a config's seasons once every shard
+    is in (see _ShardAssembler).
+
+    Args:
+        index: Position of the config in the evaluate_configs_parallel batch
+        config_dict: Configuration to evaluate
+        season_pos: Position of season_path in the runner's available_seasons
+        season_path: The season folder
+        week_key: The WEEK_RANGES key of the horizon
+        excluded_weeks: Week numbers of this season left out of the corpus (D8.4)
+
+    Returns:
+        Tuple of (index, season_pos, week_key, season_result)
+    """
+    result = _evaluate_season_horizon(
+        AccuracyCalculator(), config_dict, season_path, WEEK_RANGES[week_key], excluded_weeks
+    )
+    return index, season_pos, week_key, result
+
+
 def _evaluate_config_weekly_worker(
     calculator: AccuracyCalculator,
     config_dict: dict,
@@ -91,11 +396,14 @@ def _evaluate_config_weekly_worker(
 
     For each season, walks every week in week_range: loads that week's projected and
     actual data paths (skipping weeks whose data is missing), scores each player on the
-    projected side, reads each player's recorded actual for that week and keeps it only
-    when it is positive, and pairs the two into per-player records for the players
-    present on both sides.
-    Each season's collected weeks become an AccuracyResult via the calculator's
-    weekly-MAE and ranking-metric passes, and the per-season results are aggregated
+    projected side (recombining the week's cached factor values, see _WeekFactors),
+    reads each player's recorded actual for that week and keeps it only when it is
+    positive, and pairs the two into PLAYER_WEEK_DTYPE rows for the players present on
+    both sides. The actuals do not depend on the config, so they come from
+    the worker's cache (_week_actuals) rather than a second PlayerManager, and only
+    the projected column is filled per config.
+    Each season's rows become an AccuracyResult via the calculator's columnar MAE and
+    ranking-metric pass, and the per-season results are aggregated
     into the single AccuracyResult returned, labelled from param_name, param_value,
     and config_horizon.
 
@@ -105,90 +413,68 @@ def _evaluate_config_weekly_worker(
     coverage owner rejected (D8.4); the decision was made and announced once in the
     parent process, so this worker skips silently and emits no per-skip line.
     """
-    start_week, end_week = week_range
     season_results = []
     excluded_by_season = excluded_season_weeks or {}
 
     for season_path in available_seasons:
-        week_projections = {}
-        week_actuals = {}
-        player_data_by_week = {}
-        excluded_weeks = excluded_by_season.get(season_path.name, frozenset())
+        result = _evaluate_season_horizon(
+            calculator, config_dict, season_path, week_range,
+            excluded_by_season.get(season_path.name, frozenset())
+        )
+        season_results.append((season_path.name, result))
 
-        for week_num in range(start_week, end_week + 1):
-            if week_num in excluded_weeks:
-                continue
+    config_label = f"{param_name}={param_value} [{config_horizon}]"
+    return calculator.aggregate_season_results(season_results, horizon, config_label)
 
-            projected_path, actual_path = _load_season_data(season_path, week_num)
-            if not projected_path or not actual_path:
-                continue
 
-            projected_mgr = _create_player_manager(config_dict, projected_path, season_path, week_num)
-            actual_mgr = _create_player_manager(config_dict, actual_path, season_path, week_num)
+def _evaluate_season_horizon(
+    calculator: AccuracyCalculator,
+    config_dict: dict,
+    season_path: Path,
+    week_range: Tuple[int, int],
+    excluded_weeks: FrozenSet[int]
+) -> AccuracyResult:
+    """
+    Evaluate one config over one season's weeks of a horizon, before aggregation.
 
-            try:
-                projections = {}
-                actuals = {}
-                player_data = []
-
-                max_weekly = projected_mgr.calculate_max_weekly_projection(week_num)
-                projected_mgr.scoring_calculator.max_weekly_projection = max_weekly
-
-                for player in projected_mgr.players:
-                    scored = projected_mgr.score_player(
-                        player,
-                        use_weekly_projection=True,
-                        adp=False,
-                        player_rating=False,
-                        team_quality=True,
-                        performance=True,
-                        matchup=True,
-                        schedule=False,
-                        bye=False,
-                        injury=False,
-                        temperature=True,
-                        wind=True,
-                        location=True
-                    )
-                    if scored:
-                        projections[player.id] = scored.projected_points
-
-                for player in actual_mgr.players:
-                    if 1 <= week_num <= 17 and len(player.actual_points) >= week_num:
-                        actual = player.actual_points[week_num - 1]
-                        if actual is not None and actual > 0:
-                            actuals[player.id] = actual
-
-                            if player.id in projections:
-                                player_data.append({
-                                    'name': player.name,
-                                    'position': player.position,
-                                    'projected': projections[player.id],
-                                    'actual': actual
-                                })
-
-                week_projections[week_num] = projections
-                week_actuals[week_num] = actuals
-                player_data_by_week[week_num] = player_data
-
-            finally:
-                _cleanup_player_manager(projected_mgr)
-                _cleanup_player_manager(actual_mgr)
-
-        result = calculator.calculate_weekly_mae(
-            week_projections, week_actuals, week_range
-        )
+    Args:
+        calculator: The worker's AccuracyCalculator
+        config_dict: Configuration to evaluate
+        season_path: The season folder
+        week_range: Tuple of (start_week, end_week) inclusive
+        excluded_weeks: Week numbers of this season to skip (D8.4)
 
-        overall_metrics, by_position = calculator.calculate_ranking_metrics_for_season(
-            player_data_by_week
-        )
-        result.overall_metrics = overall_metrics
-        result.by_position = by_position
+    Returns:
+        AccuracyResult: The season's MAE, ranking metrics and week coverage
+    """
+    start_week, end_week = week_range
+    season_rows = []
+    keys = None
 
-        season_results.append((season_path.name, result))
+    for week_num in range(start_week, end_week + 1):
+        if week_num in excluded_weeks:
+            continue
 
-    config_label = f"{param_name}={param_value} [{config_horizon}]"
-    return calculator.aggregate_season_results(season_results, horizon, config_label)
+        projected_path, actual_path = _load_season_data(season_path, week_num)
+        if not projected_path or not actual_path:
+            continue
+
+        if keys is None:
+            # Validate the config before scoring: a fully cached config would
+            # otherwise never reach a ConfigManager.
+            ConfigManager(season_path, config_data=config_dict)
+            keys = factor_keys(config_dict['parameters'])
+
+        factors = _WORKER_WEEK_FACTORS.get((projected_path, week_num))
+        if factors is None:
+            factors = _WORKER_WEEK_FACTORS.setdefault(
+                (projected_path, week_num),
+                _WeekFactors(config_dict, projected_path, season_path, week_num),
+            )
+        season_rows.append(factors.rows(config_dict, keys, actual_path))
+
+    rows = np.concatenate(season_rows) if season_rows else np.empty(0, dtype=PLAYER_WEEK_DTYPE)
+    return calculator.calculate_season_accuracy(rows, week_range, len(season_rows))
 
 
 def _load_season_data(season_path: Path, week_num: int) -> Tuple[Path, Path]:
@@ -231,9 +517,113 @@ def _load_season_data(season_path: Path, week_num: int) -> Tuple[Path, Path]:
     return projected_folder, actual_folder
 
 
+def _season_data(season_path: Path) -> _SeasonData:
+    """
+    Return the worker's parsed season-level data, reading it on first use.
+
+    Reads what the managers would read from the season folder, with the same
+    dispositions: a missing schedule, game data file or team_data folder is warned
+    about and left empty.
+
+    Args:
+        season_path: Path to season folder containing season_schedule.csv, game_data.csv, team_data/
+    """
+    season = _WORKER_SEASONS.get(season_path)
+    if season is None:
+        logger = get_logger()
+        team_data_folder = season_path / "team_data"
+        team_weekly_data: Dict[str, List[Dict[str, Any]]] = {}
+        if not team_data_folder.exists():
+            logger.warning(f"team_data folder not found: {team_data_folder}")
+        else:
+            try:
+                team_weekly_data = load_team_weekly_data(str(team_data_folder))
+            except Exception as e:
+                logger.warning(f"Error loading team data from {team_data_folder}: {e}. Team rankings will not be available.")
+
+        season = _SeasonData(
+            schedule=SeasonScheduleManager(season_path).schedule_cache,
+            team_weekly_data=team_weekly_data,
+            games=GameDataManager(season_path).all_games,
+        )
+        _WORKER_SEASONS[season_path] = season
+    return season
+
+
+def _week_folder_data(week_data_path: Path) -> _WeekFolderData:
+    """
+    Return the worker's parsed player data for a week folder, reading it on first use.
+
+    A missing position file is warned about and left out, as is one that cannot be
+    read or parsed (PlayerManager then loads no players for that position).
+
+    Args:
+        week_data_path: Path to week folder containing position JSON files
+    """
+    week_folder = _WORKER_WEEK_FOLDERS.get(week_data_path)
+    if week_folder is None:
+        logger = get_logger()
+        player_records: Dict[str, List[Dict[str, Any]]] = {}
+        for filename in POSITION_FILES:
+            source_file = week_data_path / filename
+            if not source_file.exists():
+                logger.warning(f"Missing position file: {filename} in {week_data_path}")
+                continue
+            position_key = filename.removesuffix('.json')
+            try:
+                player_records[position_key] = json.loads(source_file.read_text()).get(position_key, [])
+            except (json.JSONDecodeError, OSError) as e:
+                logger.error(f"Failed to read or parse {source_file}, skipping position: {e}")
+
+        week_folder = _WeekFolderData(
+            player_records=player_records,
+            dst_player_data=TeamDataManager.dst_player_data_from_records(
+                player_records.get('dst_data', [])
+            ),
+        )
+        _WORKER_WEEK_FOLDERS[week_data_path] = week_folder
+    return week_folder
+
+
+def _week_actuals(actual_path: Path, week_num: int) -> List[Tuple[str, str, str, float]]:
+    """
+    Return every player's positive actual result for a week, computed on first use.
+
+    Args:
+        actual_path: The week_N+1 folder holding week N's actual_points (see _load_season_data)
+        week_num: NFL week number whose actuals are read (1-17)
+
+    Returns:
+        (player id, name, position, actual points) for each player in the folder whose
+        recorded actual for week_num is positive, in load order.
+    """
+    key = (actual_path, week_num)
+    actuals = _WORKER_WEEK_ACTUALS.get(key)
+    if actuals is None:
+        logger = get_logger()
+        actuals = []
+        for position_file in POSITION_FILES:
+            for record in _week_folder_data(actual_path).player_records.get(position_file.removesuffix('.json'), []):
+                try:
+                    player = FantasyPlayer.from_json(record)
+                except ValueError as e:
+                    logger.warning(f"Skipping invalid player: {e}")
+                    continue
+                if 1 <= week_num <= 17 and len(player.actual_points) >= week_num:
+                    actual = player.actual_points[week_num - 1]
+                    if actual is not None and actual > 0:
+                        actuals.append((player.id, player.name, player.position, actual))
+        _WORKER_WEEK_ACTUALS[key] = actuals
+    return actuals
+
+
 def _create_player_manager(config_dict: dict, week_data_path: Path, season_path: Path, week_num: int) -> PlayerManager:
     """
-    Create PlayerManager with temporary config file.
+    Create a PlayerManager for one config at one week from the worker's cached data.
+
+    Only the ConfigManager (and the managers that hold it) are built per call; the
+    player records, schedule, team data and game conditions come from _week_folder_data
+    and _season_data, and the week's team rankings from the week folder's rank tables.
 
     Args:
         config_dict: Configuration dictionary
@@ -241,56 +631,128 @@ def _create_player_manager(config_dict: dict, week_data_path: Path, season_path:
         season_path: Path to season folder containing season_schedule.csv, team_data/
         week_num: NFL week number being simulated (1-17)
     """
-    logger = get_logger()
+    config_mgr = ConfigManager(season_path, config_data=_config_at_week(config_dict, week_num))
+    team_data_mgr = _team_data_manager(config_mgr, week_data_path, season_path)
+    return PlayerManager(
+        season_path, config_mgr, team_data_mgr, team_data_mgr.season_schedule_manager,
+        fast_scoring=True, player_records=_week_folder_data(week_data_path).player_records,
+        game_data=_season_data(season_path).games,
+    )
 
-    temp_dir = Path(tempfile.mkdtemp(prefix="accuracy_sim_"))
 
-    player_data_dir = temp_dir / "player_data"
-    player_data_dir.mkdir(exist_ok=True)
+def _config_at_week(config_dict: dict, week_num: int) -> dict:
+    """Return config_dict with parameters.CURRENT_NFL_WEEK set to week_num (shallow copy)."""
+    config_data = dict(config_dict)
+    config_data['parameters'] = dict(config_dict['parameters'], CURRENT_NFL_WEEK=week_num)
+    return config_data
 
-    position_files = ['qb_data.json', 'rb_data.json', 'wr_data.json',
-                      'te_data.json', 'k_data.json', 'dst_data.json']
-    for filename in position_files:
-        source_file = week_data_path / filename
-        if source_file.exists():
-            shutil.copy(source_file, player_data_dir / filename)
-        else:
-            logger.warning(f"Missing position file: {filename} in {week_data_path}")
 
-    season_schedule = season_path / "season_schedule.csv"
-    if season_schedule.exists():
-        shutil.copy(season_schedule, temp_dir / "season_schedule.csv")
+def _team_data_manager(config_mgr: ConfigManager, week_data_path: Path, season_path: Path) -> TeamDataManager:
+    """Build a TeamDataManager (and its SeasonScheduleManager) for config_mgr from the worker's cached data."""
+    season = _season_data(season_path)
+    week_folder = _week_folder_data(week_data_path)
+    return TeamDataManager(
+        season_path, config_mgr, SeasonScheduleManager(season_path, schedule=season.schedule),
+        config_mgr.current_nfl_week,
+        team_weekly_data=season.team_weekly_data,
+        dst_player_data=week_folder.dst_player_data,
+        rank_table_cache=week_folder.rank_tables,
+    )
+
+
+# Tasks kept submitted per worker: enough to keep every worker busy while a finished
+# result is handed over, without pickling a whole pass's configs up front.
+IN_FLIGHT_PER_WORKER = 2
+
 
-    game_data = season_path / "game_data.csv"
-    if game_data.exists():
-        shutil.copy(game_data, temp_dir / "game_data.csv")
+class _ShardAssembler:
+    """
+    Collects a batch's (config, season, horizon) shard results in the parent.
 
-    team_data_source = season_path / "team_data"
-    if team_data_source.exists():
-        shutil.copytree(team_data_source, temp_dir / "team_data")
+    A config's results are aggregated once all of its shards are in, per horizon in
+    WEEK_RANGES order and across seasons in available_seasons order, exactly as
+    _evaluate_config_weekly_worker aggregates them inside a worker.
+    """
 
-    import copy
-    config_dict_copy = copy.deepcopy(config_dict)
-    config_dict_copy['parameters']['CURRENT_NFL_WEEK'] = week_num
+    def __init__(self, available_seasons: List[Path]):
+        self.available_seasons = available_seasons
+        self.calculator = AccuracyCalculator()
+        self._pending: Dict[int, Tuple[Dict[str, Any], Dict[str, List[Optional[AccuracyResult]]], List[int]]] = {}
+
+    def start(self, index: int, config_dict: Dict[str, Any], horizons: Optional[Tuple[str, ...]]) -> List[str]:
+        """Register a config and return the horizons (WEEK_RANGES keys) it is sharded into."""
+        week_keys = [key for key in WEEK_RANGES if horizons is None or key in horizons]
+        seasons = {key: [None] * len(self.available_seasons) for key in week_keys}
+        self._pending[index] = (config_dict, seasons, [len(week_keys) * len(self.available_seasons)])
+        return week_keys
+
+    def add(self, index: int, season_pos: int, week_key: str,
+            result: AccuracyResult) -> Optional[Dict[str, AccuracyResult]]:
+        """
+        Record one shard's season result.
 
-    config_path = temp_dir / "league_config.json"
-    with open(config_path, 'w') as f:
-        json.dump(config_dict_copy, f, indent=2)
+        Returns:
+            The config's aggregated per-horizon results once this was its last shard,
+            otherwise None.
+        """
+        config_dict, seasons, remaining = self._pending[index]
+        seasons[week_key][season_pos] = result
+        remaining[0] -= 1
+        if remaining[0]:
+            return None
+
+        del self._pending[index]
+        label = _config_label(config_dict)
+        results = {
+            week_key: self.calculator.aggregate_season_results(
+                [(path.name, season_result) for path, season_result in zip(self.available_seasons, season_results)],
+                week_key, label
+            )
+            for week_key, season_results in seasons.items()
+        }
+        _log_config_complete(self.calculator.logger, config_dict, results)
+        return results
+
+
+class _LaneQueues:
+    """
+    Parent-side queues of a batch's shards, one per lane, with work stealing.
+
+    A shard is queued on its season-horizon's home lane, and each lane is fed from its
+    own queue first, at most IN_FLIGHT_PER_WORKER shards at a time, so a season-horizon's
+    cached data is normally reused by one worker. A lane with nothing of its own left
+    and nothing running takes the head of the longest other queue instead, so no worker
+    sits idle while shards are waiting -- including lanes with no home season-horizon
+    at all (few seasons, a large max_workers, or horizon-restricted batches).
+    """
 
-    config_mgr = ConfigManager(temp_dir)
-    schedule_mgr = SeasonScheduleManager(temp_dir)
-    team_data_mgr = TeamDataManager(temp_dir, config_mgr, schedule_mgr, config_mgr.current_nfl_week)
-    player_mgr = PlayerManager(temp_dir, config_mgr, team_data_mgr, schedule_mgr)
+    def __init__(self, lane_count: int):
+        self._queues: List[deque] = [deque() for _ in range(lane_count)]
+        self._running = [0] * lane_count
 
-    player_mgr._temp_dir = temp_dir
+    def __len__(self) -> int:
+        """Shards queued and not yet handed to a lane."""
+        return sum(len(queue) for queue in self._queues)
 
-    return player_mgr
+    def push(self, lane: int, shard: Tuple[int, int, str]) -> None:
+        """Queue shard (index, season_pos, week_key) on its home lane."""
+        self._queues[lane].append(shard)
 
+    def take(self, lane: int) -> Optional[Tuple[int, int, str]]:
+        """Return the next shard lane should run, or None if it is full or nothing fits."""
+        if self._running[lane] >= IN_FLIGHT_PER_WORKER:
+            return None
+        queue = self._queues[lane]
+        if not queue and self._running[lane] == 0:
+            queue = max(self._queues, key=len)
+        if not queue:
+            return None
+        self._running[lane] += 1
+        return queue.popleft()
 
-def _cleanup_player_manager(player_mgr: PlayerManager) -> None:
-    """Clean up temporary files from player manager."""
-    if hasattr(player_mgr, '_temp_dir') and player_mgr._temp_dir.exists():
-        shutil.rmtree(player_mgr._temp_dir)
+    def finish(self, lane: int) -> None:
+        """Record that one of lane's shards has completed."""
+        self._running[lane] -= 1
 
 
 class ParallelAccuracyRunner:
@@ -300,6 +762,19 @@ class ParallelAccuracyRunner:
     Evaluates multiple configs in parallel across all 4 weekly horizons to speed
     up tournament optimization. Each config gets 4 MAE calculations (one per
     horizon).
+
+    The executor is started lazily and kept across evaluate_configs_parallel calls so
+    worker caches persist for the whole tournament; call close() (or use the runner
+    as a context manager) to stop it.
+
+    With shard_seasons, the unit of work is a (config, season, horizon) shard instead
+    of a whole config, so a batch with fewer configs than workers still keeps every
+    worker busy and a slow config no longer runs on one worker alone. There is one
+    single-worker executor (a lane) per worker, and each season-horizon has a home
+    lane that runs its shards whenever it can, so its weeks' cached data and factor
+    values are normally built in one worker; an idle lane steals queued shards from
+    the others (_LaneQueues). The parent aggregates each config's seasons
+    (_ShardAssembler) to the same results a per-config task returns.
     """
 
     def __init__(
@@ -308,7 +783,9 @@ class ParallelAccuracyRunner:
         available_seasons: List[Path],
         max_workers: int = 8,
         use_processes: bool = True,
-        excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None
+        excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None,
+        memo: Optional[EvaluationMemo] = None,
+        shard_seasons: bool = False
     ):
         """
         Initialize parallel runner.
@@ -321,59 +798,270 @@ class ParallelAccuracyRunner:
             excluded_season_weeks: Optional season-directory-name -> frozenset of
                 week numbers to drop from the evaluation corpus (D8.4). None or an
                 empty mapping evaluates every season-week, exactly as before.
+            memo: Optional EvaluationMemo consulted before dispatching a config and
+                updated with every evaluation. None evaluates every config.
+            shard_seasons: Submit (config, season, horizon) shards to per-worker lanes,
+                preferring each season-horizon's home lane, instead of one task per
+                config (default: False)
         """
         self.data_folder = data_folder
         self.available_seasons = available_seasons
         self.max_workers = max_workers
         self.use_processes = use_processes
         self.excluded_season_weeks = excluded_season_weeks or {}
+        self.memo = memo
+        self.shard_seasons = shard_seasons
         self.logger = get_logger()
+        self._executor = None
+        self._lanes: List[Any] = []
+        self._lane_of: Dict[Tuple[int, str], int] = {}
+
+    def _get_executor(self):
+        """
+        Return the runner's executor, starting it on first use.
+
+        The executor persists across evaluate_configs_parallel calls so the worker-resident
+        caches (season data, week folders, per-factor values) outlive a single parameter's
+        batch: the next parameter's candidates share every factor but one with the
+        candidates just scored, and are served from the same workers' caches.
+        """
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    def _start_lanes(self) -> None:
+        """
+        Start the max_workers single-worker lanes and give each season-horizon a home lane.
+
+        The lanes are started on first use and kept like the shared executor.
+        Season-horizons are spread over them longest horizon first, each to the lane
+        with the fewest weeks so far, so every lane's home share of the corpus is about
+        equal. With fewer season-horizons than workers some lanes have no home share
+        and run only shards they steal (see _LaneQueues).
+        """
+        if self._lanes:
+            return
+        pairs = [(pos, key) for pos in range(len(self.available_seasons)) for key in WEEK_RANGES]
+        pairs.sort(key=lambda pair: WEEK_RANGES[pair[1]][0] - WEEK_RANGES[pair[1]][1])
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        self._lanes = [executor_class(max_workers=1) for _ in range(self.max_workers)]
+        loads = [0] * len(self._lanes)
+        for pair in pairs:
+            lane = loads.index(min(loads))
+            self._lane_of[pair] = lane
+            start_week, end_week = WEEK_RANGES[pair[1]]
+            loads[lane] += end_week - start_week + 1
+
+    def _drop_executors(self, wait: bool) -> None:
+        """Shut down the shared executor and every lane, cancelling queued tasks."""
+        executors = ([self._executor] if self._executor is not None else []) + self._lanes
+        self._executor, self._lanes, self._lane_of = None, [], {}
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def close(self) -> None:
+        """
+        Stop the persistent executor (and the shard lanes). Idempotent.
+
+        The runner stays usable: a later evaluate_configs_parallel call starts a fresh
+        executor (with empty worker caches).
+        """
+        self._drop_executors(wait=True)
+
+    def __enter__(self) -> 'ParallelAccuracyRunner':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def evaluate_configs_parallel(
         self,
         configs: List[Dict[str, Any]],
-        progress_callback = None
+        progress_callback = None,
+        result_callback: Optional[Callable[[int, Dict[str, Any], Dict[str, AccuracyResult]], Optional[bool]]] = None,
+        excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None,
+        horizons: Optional[List[Optional[Tuple[str, ...]]]] = None
     ) -> List[Tuple[Dict[str, Any], Dict[str, AccuracyResult]]]:
         """
         Evaluate multiple configs in parallel across all 4 weekly horizons.
 
+        With a memo, configs already stored are answered from it without dispatching,
+        and configs sharing a memo key (identical parameters) are evaluated once.
+
+        Configs are submitted as index-tagged tasks, at most IN_FLIGHT_PER_WORKER per
+        worker at a time and in input order, and each result is released as soon as it
+        and every earlier config are done. Results therefore reach the caller in input
+        order (so ties resolve exactly as a sequential evaluation would) without waiting
+        for the whole batch. With shard_seasons, a config's shards are submitted
+        together and the window counts shards; the config is done once its last
+        shard is.
+
         Args:
             configs: List of config dicts to evaluate
             progress_callback: Optional callback(completed_count) to track progress
+            result_callback: Optional callback(index, config_dict, results_dict) handed
+                each result in input order as it is released. Results it receives are
+                not retained. Returning True stops the evaluation: queued tasks are
+                cancelled and no further configs are submitted.
+            excluded_season_weeks: Optional corpus override: evaluate with these
+                season-week exclusions instead of the runner's (e.g. a racing
+                screening subsample). The memo only holds full-corpus evaluations, so
+                it is neither consulted nor updated.
+            horizons: Optional per-config horizon subsets, parallel to configs
+                (horizon-restricted mode). An entry of None evaluates all four
+                horizons; a tuple of WEEK_RANGES keys evaluates only those, and that
+                config's results_dict holds only those keys.
 
         Returns:
-            List of (config_dict, results_dict) tuples in same order as input
+            List of (config_dict, results_dict) tuples in same order as input; empty when
+            a result_callback consumes them
         """
         if len(configs) == 0:
             return []
 
-        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
         executor_name = "ProcessPoolExecutor" if self.use_processes else "ThreadPoolExecutor"
 
-        self.logger.info(f"Starting parallel evaluation: {len(configs)} configs × {HORIZON_COUNT} horizons = {len(configs) * HORIZON_COUNT} total evaluations")
-        self.logger.info(f"Using {executor_name} with {self.max_workers} workers")
+        if horizons is None:
+            horizons = [None] * len(configs)
+        total_evaluations = sum(HORIZON_COUNT if h is None else len(h) for h in horizons)
 
-        results = []
-        completed = 0
+        if total_evaluations == len(configs) * HORIZON_COUNT:
+            self.logger.info(f"Starting parallel evaluation: {len(configs)} configs × {HORIZON_COUNT} horizons = {len(configs) * HORIZON_COUNT} total evaluations")
+        else:
+            self.logger.info(f"Starting parallel evaluation: {len(configs)} configs, {total_evaluations} horizon-restricted evaluations")
+        if self.shard_seasons:
+            self.logger.info(f"Using {executor_name} lanes: {self.max_workers} workers, one task per config × season × horizon")
+        else:
+            self.logger.info(f"Using {executor_name} with {self.max_workers} workers")
 
-        with executor_class(max_workers=self.max_workers) as executor:
-            future_to_config = {
-                executor.submit(
-                    _evaluate_config_tournament_process,
-                    config,
-                    self.data_folder,
-                    self.available_seasons,
-                    self.excluded_season_weeks
-                ): config
-                for config in configs
-            }
+        memo = self.memo if excluded_season_weeks is None else None
+        if excluded_season_weeks is None:
+            excluded_season_weeks = self.excluded_season_weeks
 
-            try:
-                for future in as_completed(future_to_config):
-                    config = future_to_config[future]
+        # Without a memo every config is its own task.
+        keys = (
+            [memo.key(config, config_horizons) for config, config_horizons in zip(configs, horizons)]
+            if memo is not None else range(len(configs))
+        )
+        indices_by_key: Dict[Any, List[int]] = {}
+        for index, key in enumerate(keys):
+            indices_by_key.setdefault(key, []).append(index)
+
+        collected: List[Tuple[Dict[str, Any], Dict[str, AccuracyResult]]] = []
+        ready: Dict[int, Dict[str, AccuracyResult]] = {}
+        next_index = 0
+        stopped = False
+        completed = 0
+
+        def release() -> bool:
+            """Hand over the contiguous run of finished configs; True once the caller stops."""
+            nonlocal next_index
+            while next_index in ready:
+                config_results = ready.pop(next_index)
+                if result_callback is None:
+                    collected.append((configs[next_index], config_results))
+                elif result_callback(next_index, configs[next_index], config_results):
+                    self.logger.info(f"Evaluation stopped by caller after {next_index + 1}/{len(configs)} configs")
+                    return True
+                next_index += 1
+            return False
+
+        if memo is not None:
+            stored = memo.get_many(indices_by_key)
+            for key, payload in stored.items():
+                for index in indices_by_key.pop(key):
+                    ready[index] = results_from_payload(payload)
+                    completed += 1
+                    if progress_callback is not None:
+                        progress_callback(completed)
+            self.logger.info(
+                f"Evaluation memo: {completed}/{len(configs)} configs already evaluated, "
+                f"{len(indices_by_key)} distinct configs to evaluate"
+            )
+            stopped = release()
+
+        # Distinct configs in order of first appearance, so the released prefix grows early.
+        to_submit = iter(indices_by_key.values())
+        in_flight = set()
+        max_in_flight = self.max_workers * IN_FLIGHT_PER_WORKER
+        assembler = _ShardAssembler(self.available_seasons) if self.shard_seasons and self.available_seasons else None
+        queues = None
+        lane_of_future: Dict[Any, int] = {}
+        if assembler is not None:
+            self._start_lanes()
+            queues = _LaneQueues(len(self._lanes))
+
+        def dispatch() -> None:
+            """Hand queued shards to every lane with room (home shards first, then stolen ones)."""
+            for lane, lane_executor in enumerate(self._lanes):
+                shard = queues.take(lane)
+                while shard is not None:
+                    index, season_pos, week_key = shard
+                    season_path = self.available_seasons[season_pos]
+                    future = lane_executor.submit(
+                        _evaluate_shard_task,
+                        index,
+                        configs[index],
+                        season_pos,
+                        season_path,
+                        week_key,
+                        excluded_season_weeks.get(season_path.name, frozenset())
+                    )
+                    lane_of_future[future] = lane
+                    in_flight.add(future)
+                    shard = queues.take(lane)
+
+        try:
+            while not stopped:
+                for indices in to_submit:
+                    index = indices[0]
+                    if assembler is None:
+                        in_flight.add(self._get_executor().submit(
+                            _evaluate_config_task,
+                            index,
+                            configs[index],
+                            self.data_folder,
+                            self.available_seasons,
+                            excluded_season_weeks,
+                            horizons[index]
+                        ))
+                    else:
+                        for week_key in assembler.start(index, configs[index], horizons[index]):
+                            for season_pos in range(len(self.available_seasons)):
+                                queues.push(self._lane_of[(season_pos, week_key)], (index, season_pos, week_key))
+                    if len(in_flight) + (len(queues) if queues is not None else 0) >= max_in_flight:
+                        break
+                if queues is not None:
+                    dispatch()
+                if not in_flight:
+                    break
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if queues is not None:
+                        queues.finish(lane_of_future.pop(future))
                     try:
-                        result = future.result()
-                        results.append(result)
+                        outcome = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Config evaluation failed: {e}", exc_info=True)
+                        raise
+                    if assembler is None:
+                        index, config_results = outcome
+                    else:
+                        index, config_results = outcome[0], assembler.add(*outcome)
+                        if config_results is None:
+                            continue
+
+                    key = keys[index]
+                    payload = None
+                    if memo is not None:
+                        payload = results_to_payload(config_results)
+                        memo.put(key, payload)
+
+                    for position, duplicate in enumerate(indices_by_key[key]):
+                        # Duplicates get their own copies of the results.
+                        ready[duplicate] = config_results if position == 0 else results_from_payload(payload)
                         completed += 1
 
                         if completed % 10 == 0 or completed == len(configs):
@@ -386,22 +1074,22 @@ class ParallelAccuracyRunner:
                         if progress_callback is not None:
                             progress_callback(completed)
 
-                    except Exception as e:
-                        self.logger.error(f"Config evaluation failed: {e}", exc_info=True)
-                        raise
-
-            except KeyboardInterrupt:
-                self.logger.warning("\nKeyboardInterrupt received - cancelling all workers...")
-                for future in future_to_config:
-                    future.cancel()
-                executor.shutdown(wait=False, cancel_futures=True)
-                self.logger.info("All workers cancelled")
-                raise
-
-        import json
-        config_to_result = {json.dumps(cfg, sort_keys=True): res for cfg, res in results}
-        ordered_results = [(cfg, config_to_result[json.dumps(cfg, sort_keys=True)]) for cfg in configs]
-
-        return ordered_results
-
-
+                stopped = release()
+
+            for future in in_flight:
+                future.cancel()
+
+        except KeyboardInterrupt:
+            self.logger.warning("\nKeyboardInterrupt received - cancelling all workers...")
+            for future in in_flight:
+                future.cancel()
+            self._drop_executors(wait=False)
+            self.logger.info("All workers cancelled")
+            raise
+        except BaseException:
+            # Drop the executor on any other failure too (a broken process pool cannot be
+            # reused); the next call starts a fresh one.
+            self.close()
+            raise
+
+        return collected
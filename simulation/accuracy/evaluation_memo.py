@@ -0,0 +1,238 @@
+"""
+Persistent Config-Evaluation Memo
+
+Coordinate ascent evaluates the same config more than once: every pass re-tests each
+horizon's incumbent value (ConfigGenerator always includes it among the candidates),
+horizons whose baselines agree submit identical configs in one batch, and a resumed
+run re-evaluates whatever was scored before the interruption. An evaluation is a pure
+function of the config's parameters, the season data and the evaluation code, so its
+per-horizon AccuracyResults can be stored once and reused.
+
+EvaluationMemo keeps them in a SQLite file under the accuracy output folder, keyed by
+a sha256 over:
+- the config's canonical 'parameters' block (config_name, description and the
+  _eval_metadata bookkeeping do not affect the evaluation and are left out)
+- a context fingerprint of everything else an evaluation reads: the evaluated
+  seasons' files (relative path, size and mtime), the excluded season-weeks, and the
+  source of the evaluation code (league_helper, simulation/accuracy, utils)
+
+Any change to the data, the exclusions or the code therefore starts from an empty
+memo rather than serving a stale result. Only the parent process reads and writes
+the memo; workers never see it.
+
+Author: Kai Mizuno
+"""
+
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from simulation.accuracy.AccuracyCalculator import AccuracyResult
+from simulation.accuracy.accuracy_types import RankingMetrics
+from utils.LoggingManager import get_logger
+
+
+MEMO_FILENAME = "accuracy_eval_memo.sqlite"
+
+# Bumped when the stored payload's shape changes; part of every key.
+MEMO_SCHEMA_VERSION = 1
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Packages whose source an evaluation executes (scoring, managers, player model).
+_CODE_PACKAGES = ("league_helper", "simulation/accuracy", "utils")
+
+
+def _code_fingerprint() -> str:
+    """sha256 over the relative path and bytes of every evaluation-code source file."""
+    digest = hashlib.sha256()
+    for package in _CODE_PACKAGES:
+        for source in sorted((_PROJECT_ROOT / package).rglob("*.py")):
+            digest.update(source.relative_to(_PROJECT_ROOT).as_posix().encode("utf-8"))
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _data_fingerprint(available_seasons: Iterable[Path]) -> str:
+    """sha256 over each season's files: relative path, size and modification time."""
+    digest = hashlib.sha256()
+    for season_path in available_seasons:
+        digest.update(season_path.name.encode("utf-8"))
+        for data_file in sorted(p for p in season_path.rglob("*") if p.is_file()):
+            stat = data_file.stat()
+            digest.update(
+                f"{data_file.relative_to(season_path).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}"
+                .encode("utf-8")
+            )
+    return digest.hexdigest()
+
+
+def _result_to_payload(result: AccuracyResult) -> Dict[str, Any]:
+    """Serialize an aggregated AccuracyResult (individual errors are not kept)."""
+    return {
+        "mae": result.mae,
+        "player_count": result.player_count,
+        "total_error": result.total_error,
+        "weeks_evaluated": result.weeks_evaluated,
+        "weeks_requested": result.weeks_requested,
+        "per_season_pairwise": result.per_season_pairwise,
+        "overall_metrics": asdict(result.overall_metrics) if result.overall_metrics else None,
+        "by_position": {pos: asdict(metrics) for pos, metrics in result.by_position.items()},
+    }
+
+
+def _result_from_payload(payload: Dict[str, Any]) -> AccuracyResult:
+    """Rebuild an AccuracyResult from _result_to_payload output."""
+    overall = payload["overall_metrics"]
+    return AccuracyResult(
+        mae=payload["mae"],
+        player_count=payload["player_count"],
+        total_error=payload["total_error"],
+        overall_metrics=RankingMetrics(**overall) if overall is not None else None,
+        by_position={pos: RankingMetrics(**metrics) for pos, metrics in payload["by_position"].items()},
+        weeks_evaluated=payload["weeks_evaluated"],
+        weeks_requested=payload["weeks_requested"],
+        per_season_pairwise=payload["per_season_pairwise"],
+    )
+
+
+def results_to_payload(results: Dict[str, AccuracyResult]) -> str:
+    """
+    Serialize one config's per-horizon results to the memo's JSON payload.
+
+    Args:
+        results (Dict[str, AccuracyResult]): Horizon key -> aggregated result.
+
+    Returns:
+        str: JSON text; floats round-trip exactly.
+    """
+    return json.dumps({horizon: _result_to_payload(result) for horizon, result in results.items()})
+
+
+def results_from_payload(payload: str) -> Dict[str, AccuracyResult]:
+    """
+    Rebuild one config's per-horizon results from results_to_payload output.
+
+    Every call returns new AccuracyResult objects, so callers may mutate them freely.
+
+    Args:
+        payload (str): JSON text from results_to_payload.
+
+    Returns:
+        Dict[str, AccuracyResult]: Horizon key -> aggregated result.
+    """
+    return {horizon: _result_from_payload(data) for horizon, data in json.loads(payload).items()}
+
+
+class EvaluationMemo:
+    """
+    On-disk memo of config evaluations (config fingerprint -> per-horizon results).
+
+    Attributes:
+        path (Path): The SQLite file.
+        context_fingerprint (str): sha256 of the data, exclusions and code the
+            evaluations ran against; part of every key.
+        hits (int): Lookups served from the memo since construction.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        available_seasons: List[Path],
+        excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]] = None
+    ) -> None:
+        """
+        Open (creating if needed) the memo and fingerprint its evaluation context.
+
+        Args:
+            path (Path): SQLite file, normally output_dir / MEMO_FILENAME.
+            available_seasons (List[Path]): Season folders the evaluations read.
+            excluded_season_weeks (Optional[Dict[str, FrozenSet[int]]]): Season name ->
+                week numbers left out of the evaluation corpus.
+        """
+        self.logger = get_logger()
+        self.path = path
+        self.hits = 0
+
+        exclusions = {
+            season: sorted(weeks) for season, weeks in (excluded_season_weeks or {}).items() if weeks
+        }
+        context = json.dumps({
+            "schema": MEMO_SCHEMA_VERSION,
+            "data": _data_fingerprint(available_seasons),
+            "excluded_season_weeks": exclusions,
+            "code": _code_fingerprint(),
+        }, sort_keys=True, separators=(",", ":"))
+        self.context_fingerprint = hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS evaluations (key TEXT PRIMARY KEY, results TEXT NOT NULL)")
+            count = conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+        self.logger.debug(f"Evaluation memo at {path}: {count} stored evaluations")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection (committed and closed on exit); none is held between calls."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def key(self, config_dict: Dict[str, Any], horizons: Optional[Tuple[str, ...]] = None) -> str:
+        """
+        Return the memo key of a config: its canonical parameters plus the context.
+
+        Args:
+            config_dict (Dict[str, Any]): Config with a 'parameters' block.
+            horizons (Optional[Tuple[str, ...]]): The horizons a horizon-restricted
+                evaluation covers; None (every horizon) leaves the key unchanged.
+
+        Returns:
+            str: sha256 hex digest.
+        """
+        identity: Dict[str, Any] = {"context": self.context_fingerprint, "parameters": config_dict["parameters"]}
+        if horizons is not None:
+            identity["horizons"] = sorted(horizons)
+        canonical = json.dumps(identity, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up stored payloads (see results_from_payload).
+
+        Args:
+            keys (Iterable[str]): Memo keys.
+
+        Returns:
+            Dict[str, str]: Key -> stored payload, for the keys present.
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        with self._connect() as conn:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT key, results FROM evaluations WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+        self.hits += len(found)
+        return found
+
+    def put(self, key: str, payload: str) -> None:
+        """
+        Store one config's payload (see results_to_payload), replacing any previous one.
+
+        Args:
+            key (str): Memo key from key().
+            payload (str): Serialized per-horizon results.
+        """
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO evaluations (key, results) VALUES (?, ?)", (key, payload))
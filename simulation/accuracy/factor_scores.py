@@ -0,0 +1,217 @@
+"""
+Factor-Decomposed Accuracy Scoring
+
+The accuracy harness scores every player-week with score_player(use_weekly_projection=True)
+and only the team quality, performance, matchup, temperature, wind and location steps
+enabled. With those flags the 15-step chain reduces to
+
+    score = ((weight * team_quality) * performance) + matchup + temperature + wind + location
+    projected = (score / NORMALIZATION_MAX_SCALE) * max_weekly_projection
+
+where weight is the normalized weekly projection (Step 1), the two multipliers come from
+Steps 4-5 and the four bonuses from Steps 6 and 11-13. Each factor reads one config
+section (FACTOR_SECTIONS). Coordinate ascent changes one parameter per candidate, so a
+candidate shares every factor but one with its horizon baseline. A caller that keeps
+each factor's per-player values keyed by factor_keys therefore recomputes only the
+swept factor and recombines the rest with compose_projections.
+
+A factor value is the scoring step applied to a neutral running score (1.0 for a
+multiplier, 0.0 for a bonus), which returns exactly the step's multiplier or bonus.
+compose_projections re-applies them in score_player's order with the same IEEE
+operations, so its projections are bit-identical to score_player's projected_points.
+
+Five factors depend on a player only through a small feature shared by many players:
+the team's game (temperature distance, home/international flags), the game plus
+whether the position is wind affected, the team-quality rank, or the
+defense-vs-position matchup rank. feature_table maps every player to the first
+player with the same feature (FACTOR_FEATURES), and factor_values then runs the
+step once per distinct feature and indexes the result back out per player.
+
+Author: Kai Mizuno
+"""
+
+import json
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+import league_helper.constants as Constants
+from league_helper.util.player_scoring import PlayerScoringCalculator
+from utils.FantasyPlayer import FantasyPlayer
+
+
+# Factors in score_player's application order.
+ACCURACY_FACTORS: Tuple[str, ...] = (
+    'weight', 'team_quality', 'performance', 'matchup', 'temperature', 'wind', 'location',
+)
+
+# The config section each factor reads.
+FACTOR_SECTIONS: Dict[str, str] = {
+    'weight': 'NORMALIZATION_MAX_SCALE',
+    'team_quality': 'TEAM_QUALITY_SCORING',
+    'performance': 'PERFORMANCE_SCORING',
+    'matchup': 'MATCHUP_SCORING',
+    'temperature': 'TEMPERATURE_SCORING',
+    'wind': 'WIND_SCORING',
+    'location': 'LOCATION_MODIFIERS',
+}
+
+# Factors read through the players' team context, whose rank tables depend on BOTH
+# rolling windows (TeamDataManager keys them by (week, TEAM_QUALITY_MIN_WEEKS,
+# MATCHUP_MIN_WEEKS) and falls back to neutral ranks below the smaller one).
+RANK_WINDOW_FACTORS = frozenset({'team_quality', 'matchup'})
+
+_FACTOR_STEPS: Dict[str, Callable[[PlayerScoringCalculator, FantasyPlayer], float]] = {
+    'weight': lambda calc, p: calc._get_normalized_fantasy_points(p, True)[0],
+    'team_quality': lambda calc, p: calc._apply_team_quality_multiplier(p, 1.0)[0],
+    'performance': lambda calc, p: calc._apply_performance_multiplier(p, 1.0)[0],
+    'matchup': lambda calc, p: calc._apply_matchup_multiplier(p, 0.0)[0],
+    'temperature': lambda calc, p: calc._apply_temperature_scoring(p, 0.0)[0],
+    'wind': lambda calc, p: calc._apply_wind_scoring(p, 0.0)[0],
+    'location': lambda calc, p: calc._apply_location_modifier(p, 0.0)[0],
+}
+
+# The per-player feature each grouped factor's step reads; two players with equal
+# features get the same value. Weight and performance are per player.
+FACTOR_FEATURES: Dict[str, Callable[[FantasyPlayer], Hashable]] = {
+    'team_quality': lambda p: (
+        p.team_defensive_rank if p.position in Constants.DEFENSE_POSITIONS else p.team_offensive_rank
+    ),
+    'matchup': lambda p: p.matchup_score,
+    'temperature': lambda p: p.team,
+    'wind': lambda p: (p.team, p.position in Constants.WIND_AFFECTED_POSITIONS),
+    'location': lambda p: p.team,
+}
+
+# Grouped factors whose feature does not change with the config: the players' teams
+# and positions are fixed for a week, the rank features are not (see
+# RANK_WINDOW_FACTORS).
+STATIC_FEATURE_FACTORS = frozenset(FACTOR_FEATURES) - RANK_WINDOW_FACTORS
+
+
+class FeatureTable(NamedTuple):
+    """
+    Players grouped by one factor's feature.
+
+    Attributes:
+        rows (List[int]): Row of the first player with each distinct feature.
+        codes (np.ndarray): Per player, the index of its feature in rows.
+    """
+    rows: List[int]
+    codes: np.ndarray
+
+
+def feature_table(players: Sequence[FantasyPlayer], factor: str) -> FeatureTable:
+    """
+    Group players by the feature a factor's step reads (FACTOR_FEATURES).
+
+    Args:
+        players (Sequence[FantasyPlayer]): Players in row order.
+        factor (str): A FACTOR_FEATURES entry.
+
+    Returns:
+        FeatureTable: One representative row per distinct feature, and each player's code.
+    """
+    feature_of = FACTOR_FEATURES[factor]
+    codes_by_feature: Dict[Hashable, int] = {}
+    rows: List[int] = []
+    codes = np.empty(len(players), dtype=np.intp)
+    for row, p in enumerate(players):
+        feature = feature_of(p)
+        code = codes_by_feature.get(feature)
+        if code is None:
+            code = codes_by_feature[feature] = len(rows)
+            rows.append(row)
+        codes[row] = code
+    return FeatureTable(rows, codes)
+
+
+def factor_keys(parameters: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Key each factor by the config values its per-player values depend on.
+
+    A factor's key holds its own section plus every parameter that no factor owns
+    (CURRENT_NFL_WEEK, the draft settings, ...). Unowned parameters are included
+    conservatively: a change there invalidates every factor instead of risking a
+    stale value. The team quality and matchup keys also carry both MIN_WEEKS values
+    (see RANK_WINDOW_FACTORS).
+
+    Args:
+        parameters (Dict[str, Any]): A config's parameters block.
+
+    Returns:
+        Dict[str, str]: Factor name -> canonical JSON key.
+    """
+    owned = set(FACTOR_SECTIONS.values())
+    shared = {name: value for name, value in parameters.items() if name not in owned}
+    windows = [
+        (parameters.get(section) or {}).get('MIN_WEEKS')
+        for section in ('TEAM_QUALITY_SCORING', 'MATCHUP_SCORING')
+    ]
+
+    keys = {}
+    for factor, section in FACTOR_SECTIONS.items():
+        key: Dict[str, Any] = {'shared': shared, section: parameters.get(section)}
+        if factor in RANK_WINDOW_FACTORS:
+            key['MIN_WEEKS'] = windows
+        keys[factor] = json.dumps(key, sort_keys=True)
+    return keys
+
+
+def factor_values(calculator: PlayerScoringCalculator, players: Sequence[FantasyPlayer],
+                  factor: str, table: Optional[FeatureTable] = None) -> np.ndarray:
+    """
+    Evaluate one factor for every player.
+
+    The calculator must be set up the way score_player would run it: its config at the
+    scored week, max_weekly_projection set and use_draft_normalization False, and the
+    players' team context refreshed from that config's TeamDataManager.
+
+    A grouped factor (FACTOR_FEATURES) runs its step once per distinct feature; the
+    values are the same floats a per-player loop returns.
+
+    Args:
+        calculator (PlayerScoringCalculator): Calculator bound to the config being scored.
+        players (Sequence[FantasyPlayer]): Players in row order.
+        factor (str): One of ACCURACY_FACTORS.
+        table (Optional[FeatureTable]): A feature_table of these players for this factor,
+            when the caller keeps one; built here otherwise.
+
+    Returns:
+        np.ndarray: The factor's value per player (float64).
+    """
+    step = _FACTOR_STEPS[factor]
+    if factor not in FACTOR_FEATURES:
+        return np.array([step(calculator, p) for p in players], dtype=np.float64)
+
+    if table is None:
+        table = feature_table(players, factor)
+    values = np.array([step(calculator, players[row]) for row in table.rows], dtype=np.float64)
+    return values[table.codes]
+
+
+def compose_projections(factors: Dict[str, np.ndarray], normalization_scale: float,
+                        max_weekly_projection: float) -> np.ndarray:
+    """
+    Recombine per-player factor values into projected points.
+
+    Applies the factors in score_player's order, then converts the score back to
+    points exactly as score_player does (0.0 when the scale or the weekly max is 0).
+
+    Args:
+        factors (Dict[str, np.ndarray]): Every ACCURACY_FACTORS entry, in one row order.
+        normalization_scale (float): The config's normalization_max_scale.
+        max_weekly_projection (float): The week's maximum weekly projection.
+
+    Returns:
+        np.ndarray: Projected points per player.
+    """
+    score = factors['weight'] * factors['team_quality']
+    score = score * factors['performance']
+    for factor in ('matchup', 'temperature', 'wind', 'location'):
+        score = score + factors[factor]
+
+    if normalization_scale > 0 and max_weekly_projection > 0:
+        return (score / normalization_scale) * max_weekly_projection
+    return np.zeros_like(score)
+
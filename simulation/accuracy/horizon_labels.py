@@ -32,6 +32,11 @@ WEEK_RANGES: Dict[str, Tuple[int, int]] = {
 
 HORIZON_COUNT = len(WEEK_RANGES)
 
+# ConfigGenerator's horizon names ('1-5', ...) -> the WEEK_RANGES key they optimize.
+HORIZON_WEEK_KEYS: Dict[str, str] = {
+    f"{start}-{end}": week_key for week_key, (start, end) in WEEK_RANGES.items()
+}
+
 
 def candidate_values_label(candidate_values: int) -> str:
     """Build the shared 'candidate values per parameter' banner label.
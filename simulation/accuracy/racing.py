@@ -0,0 +1,122 @@
+"""
+Racing Mode for Accuracy Tournament Candidates
+
+Most random test values of a parameter are obviously worse than the horizon's incumbent,
+yet every candidate is normally evaluated on every season-week of all four horizons.
+Racing screens a parameter's candidates first on a fixed subsample of season-weeks and
+spends the full evaluation only on the candidates that survive.
+
+The subsample keeps, for every season and horizon, a seeded random share of the weeks
+with data (at least one), so every season is represented in every horizon. It is
+expressed as an excluded_season_weeks mapping, which lets the screening run the ordinary
+evaluation unchanged on a smaller corpus.
+
+A candidate is discarded only when it is clearly worse than the incumbent in every
+horizon it could be adopted for. "Clearly worse" is a paired, one-sided test on
+per-season pairwise accuracy, the metric AccuracyConfigPerformance.is_better_than adopts
+on: the Student-t upper confidence bound of the mean per-season difference
+(candidate minus incumbent) lies below zero.
+
+Author: Kai Mizuno
+"""
+
+import math
+import random
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+import numpy as np
+from scipy.stats import t as student_t
+
+from simulation.accuracy.AccuracyCalculator import AccuracyResult
+from simulation.accuracy.horizon_labels import WEEK_RANGES
+
+
+# Share of each season's horizon weeks evaluated during screening.
+RACING_DEFAULT_FRACTION = 0.25
+
+# One-sided confidence that a discarded candidate is worse than the incumbent.
+RACING_DEFAULT_CONFIDENCE = 0.95
+
+
+def _has_week_data(season_path: Path, week_num: int) -> bool:
+    """True when the week's projected folder and its actuals (next week's folder) exist."""
+    weeks = season_path / "weeks"
+    return (weeks / f"week_{week_num:02d}").exists() and (weeks / f"week_{week_num + 1:02d}").exists()
+
+
+def screening_exclusions(
+    available_seasons: List[Path],
+    excluded_season_weeks: Optional[Dict[str, FrozenSet[int]]],
+    fraction: float,
+    seed: int
+) -> Dict[str, FrozenSet[int]]:
+    """
+    Build the excluded_season_weeks mapping that leaves only the screening subsample.
+
+    For every season and horizon, ceil(fraction * n) of the horizon's n evaluable weeks
+    (data present, not already excluded) are kept, at least one; every other week is
+    excluded. The choice depends only on the seasons and the seed, so every screening
+    batch of a run uses the same subsample.
+
+    Args:
+        available_seasons (List[Path]): Season folders the run evaluates.
+        excluded_season_weeks (Optional[Dict[str, FrozenSet[int]]]): The run's own
+            exclusions (D8.4); never screened.
+        fraction (float): Share of weeks to keep, in (0, 1].
+        seed (int): Seed for the week choice.
+
+    Returns:
+        Dict[str, FrozenSet[int]]: Season name -> weeks left out of screening.
+    """
+    rng = random.Random(seed)
+    all_weeks = {week for start, end in WEEK_RANGES.values() for week in range(start, end + 1)}
+    exclusions = {}
+    for season_path in available_seasons:
+        already_excluded = (excluded_season_weeks or {}).get(season_path.name, frozenset())
+        screened = set()
+        for start, end in WEEK_RANGES.values():
+            weeks = [
+                week for week in range(start, end + 1)
+                if week not in already_excluded and _has_week_data(season_path, week)
+            ]
+            if weeks:
+                screened.update(rng.sample(weeks, max(1, math.ceil(fraction * len(weeks)))))
+        exclusions[season_path.name] = frozenset(all_weeks - screened)
+    return exclusions
+
+
+def is_clearly_worse(candidate: AccuracyResult, incumbent: AccuracyResult, confidence: float) -> bool:
+    """
+    Decide whether a screened candidate is worse than the incumbent at the given confidence.
+
+    Pairs the two results' per-season pairwise accuracy over the seasons both cover.
+    The candidate is clearly worse when the one-sided Student-t upper bound of the mean
+    difference (candidate minus incumbent) is below zero; identical per-season deficits
+    (zero spread) count as clearly worse. With fewer than two shared seasons there is
+    no spread to test against, and the candidate is kept.
+
+    Args:
+        candidate (AccuracyResult): The candidate's screening result for one horizon.
+        incumbent (AccuracyResult): The incumbent's screening result for that horizon.
+        confidence (float): One-sided confidence level, in (0.5, 1).
+
+    Returns:
+        bool: True when the candidate can be discarded for this horizon.
+    """
+    shared = sorted(set(candidate.per_season_pairwise) & set(incumbent.per_season_pairwise))
+    if len(shared) < 2:
+        return False
+
+    differences = np.array(
+        [candidate.per_season_pairwise[s] - incumbent.per_season_pairwise[s] for s in shared]
+    )
+    mean = differences.mean()
+    if mean >= 0:
+        return False
+
+    spread = differences.std(ddof=1)
+    if spread == 0:
+        return True
+    upper = mean + student_t.ppf(confidence, len(differences) - 1) * spread / math.sqrt(len(differences))
+    return bool(upper < 0)
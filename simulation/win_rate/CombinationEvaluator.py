@@ -3,13 +3,18 @@ Combination Evaluator
 
 Evaluates a single (draft strategy + draft-side parameter) combination for the
 win-rate parameter sweep. Builds its expensive resources once — the base config,
-the ParallelLeagueRunner, and the per-season SimDataLoader caches — and then scores
-any combination cheaply on each evaluate() call.
+the ParallelLeagueRunner, and the per-season SimDataLoader caches and SeasonBundles —
+and then scores any combination cheaply on each evaluate() call.
+
+Leagues run in a persistent process pool by default: league work is CPU-bound pure
+Python, so threads are serialized by the GIL. The pool lives until close(), and each
+worker receives a season's data once (see ParallelLeagueRunner's persistent_pool).
 
 This is the reusable scoring unit the budget-aware sweep tournament calls once per
-candidate combination. The strategy-only DraftStrategyOrchestrator will later be
-refactored to route through this evaluator (until then its per-season loop is
-intentionally duplicated here).
+candidate combination, or once per swept parameter (evaluate_batch) to score all of its
+candidates as one flat batch of leagues. The strategy-only DraftStrategyOrchestrator
+will later be refactored to route through this evaluator (until then its per-season
+loop is intentionally duplicated here).
 
 Author: Kai Mizuno
 """
@@ -17,13 +22,14 @@ Author: Kai Mizuno
 # Standard library
 import copy
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Local
 from utils.LoggingManager import get_logger
 from utils.error_handler import FileOperationError
 from league_helper.util.ConfigManager import ConfigManager
-from simulation.win_rate.ParallelLeagueRunner import ParallelLeagueRunner
+from simulation.win_rate.ParallelLeagueRunner import LeagueBatchItem, ParallelLeagueRunner
+from simulation.win_rate.SeasonBundle import SeasonBundle
 from simulation.win_rate.SimDataLoader import SimDataLoader
 from simulation.win_rate.config_overrides import apply_draft_overrides
 
@@ -40,6 +46,9 @@ class CombinationEvaluator:
     mutates the shared runner's data folder via set_data_folder(). The sweep
     tournament calls it sequentially; parallelism lives inside
     ParallelLeagueRunner.run_simulations_for_config().
+
+    Call close() (or use the evaluator as a context manager) when the sweep is done to
+    stop the worker processes; it also logs the run's league throughput.
     """
 
     def __init__(
@@ -50,6 +59,8 @@ class CombinationEvaluator:
         config_path: Path = Path("data/configs/league_config.json"),
         naive_opponents: bool = False,
         seed: Optional[int] = None,
+        use_processes: bool = True,
+        draft_log_cache: bool = False,
     ) -> None:
         """
         Build the evaluator's reusable resources once.
@@ -57,7 +68,7 @@ class CombinationEvaluator:
         Args:
             data_folder (Path): Simulation data root containing 20XX/ season folders.
             num_simulations (int): Simulations per season per evaluate() call.
-            max_workers (int): Worker threads for ParallelLeagueRunner.
+            max_workers (int): Workers (processes, or threads) for ParallelLeagueRunner.
             config_path (Path): Path to league_config.json; config_path.parent.parent
                 is the ConfigManager data root. Defaults to data/configs/league_config.json.
             naive_opponents (bool): Forwarded to the ParallelLeagueRunner (and thus every
@@ -65,6 +76,13 @@ class CombinationEvaluator:
             seed (Optional[int]): Base seed for deterministic evaluation (D1/T29). Forwarded to
                 ParallelLeagueRunner; per-task seeds are derived config-independently (D2). Default
                 None → OS entropy, preserving stochastic behavior (D3).
+            use_processes (bool): True (default) runs leagues in a persistent process
+                pool that serves every evaluate() call until close(); False runs them in
+                worker threads.
+            draft_log_cache (bool): Forwarded to the ParallelLeagueRunner. True replays
+                drafts already played by an earlier evaluate() call on the same seed, and
+                resumes those that share the incumbent config; needs a seed and self-play.
+                Default False drafts every league live.
 
         Raises:
             FileOperationError: If the base config cannot be loaded.
@@ -84,7 +102,9 @@ class CombinationEvaluator:
         except (FileNotFoundError, ValueError) as e:
             raise FileOperationError(f"Failed to load config from {config_path}: {e}") from e
 
-        self._runner = ParallelLeagueRunner(max_workers=max_workers, data_folder=data_folder, naive_opponents=naive_opponents, seed=seed)
+        self._runner = ParallelLeagueRunner(max_workers=max_workers, data_folder=data_folder, naive_opponents=naive_opponents, seed=seed,
+                                            use_processes=use_processes, persistent_pool=use_processes,
+                                            draft_log_cache=draft_log_cache)
 
         seasons = sorted(data_folder.glob("20*/"))
         if not seasons:
@@ -94,10 +114,18 @@ class CombinationEvaluator:
             )
 
         self._season_cache: Dict[Path, Dict[int, Dict]] = {}
+        # Per-season in-memory construction data, so no league round-trips a temp directory.
+        # A season whose bundle cannot be read keeps the temp-directory path.
+        self._season_bundles: Dict[Path, SeasonBundle] = {}
         for season_folder in seasons:
             loader = SimDataLoader(season_folder)
             if loader.is_valid:
                 self._season_cache[season_folder] = loader.week_data_cache
+                try:
+                    self._season_bundles[season_folder] = loader.load_season_bundle()
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Season {season_folder.name}: season bundle unavailable ({e}) — "
+                                   "leagues will be built through a temp directory")
 
         if not self._season_cache:
             logger.warning(
@@ -108,9 +136,25 @@ class CombinationEvaluator:
 
         logger.info(
             f"CombinationEvaluator initialized: {len(self._season_cache)} valid season(s), "
-            f"{num_simulations} sims/season, {max_workers} workers"
+            f"{num_simulations} sims/season, {max_workers} "
+            f"{'worker processes' if use_processes else 'worker threads'}"
         )
 
+    def close(self) -> None:
+        """Stop the runner's worker pool and log the league throughput and draft-log use. Idempotent."""
+        logger = get_logger()  # KDD-3: resolve at call time so --log-level governs this output
+        if self._runner.leagues_completed:
+            logger.info(f"League throughput: {self._runner.throughput_summary()}")
+            if self._runner.draft_logs is not None:
+                logger.info(f"Draft-log cache: {self._runner.draft_logs.summary()}")
+        self._runner.close()
+
+    def __enter__(self) -> 'CombinationEvaluator':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     @property
     def base_config(self) -> dict:
         """Return a deep copy of the base config (callers read only)."""
@@ -131,6 +175,18 @@ class CombinationEvaluator:
         """
         return len(self._season_cache)
 
+    @property
+    def num_simulations(self) -> int:
+        """Return the leagues simulated per season for one full evaluation.
+
+        SweepTournament's sequential mode walks this budget in blocks through
+        evaluate_batch(first_sim_id=..., num_simulations=...).
+
+        Returns:
+            int: Simulations per season per evaluation.
+        """
+        return self._num_simulations
+
     def evaluate(
         self,
         draft_order: list,
@@ -170,7 +226,8 @@ class CombinationEvaluator:
             self._runner.set_data_folder(season_folder)
             results = self._runner.run_simulations_for_config(
                 incumbent_config, self._num_simulations, preloaded_week_data=week_data_cache,
-                measured_config_dict=trial_config if incumbent_param_values is not None else None
+                measured_config_dict=trial_config if incumbent_param_values is not None else None,
+                season_bundle=self._season_bundles.get(season_folder)
             )
             # D3: read the runner's per-call drop counters immediately after the call (safe
             # because evaluate() runs the runner sequentially per season — see class docstring).
@@ -191,3 +248,73 @@ class CombinationEvaluator:
         total_games = total_wins + total_losses
         win_rate = total_wins / total_games if total_games > 0 else 0.0
         return total_wins, total_games, win_rate
+
+    def evaluate_batch(
+        self,
+        draft_order: list,
+        trials: List[Dict[str, float]],
+        incumbent_param_values: Dict[str, float],
+        first_sim_id: int = 0,
+        num_simulations: Optional[int] = None,
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Score several trial combinations against one incumbent in a single flat batch.
+
+        Every (trial, season) group of leagues goes to the runner in one
+        run_simulations_for_batch call, so with the persistent pool the workers run all of
+        the trials' leagues back to back. Each trial's leagues use the same per-task seeds as
+        evaluate(draft_order, trial, incumbent_param_values), so its result is the one
+        evaluate() would return for it.
+
+        first_sim_id and num_simulations select a block of each season's leagues: the block
+        plays sim_ids first_sim_id .. first_sim_id + num_simulations - 1, so consecutive
+        blocks covering 0 .. self.num_simulations - 1 add up to exactly one full evaluation.
+
+        Args:
+            draft_order (list): The strategy's DRAFT_ORDER array (applied verbatim).
+            trials (List[Dict[str, float]]): The measured team's 6-param sets.
+            incumbent_param_values (Dict[str, float]): The 6-param set the 9 opponents draft with.
+            first_sim_id (int): sim_id of each season's first league in this block (default 0).
+            num_simulations (Optional[int]): Leagues per season in this block; default None
+                runs the evaluator's full num_simulations.
+
+        Returns:
+            List[Tuple[int, int, float]]: (total_wins, total_games, win_rate) per trial,
+                aligned to trials.
+
+        Raises:
+            ConfigurationError: Propagated from apply_draft_overrides on a bad param set.
+        """
+        logger = get_logger()  # KDD-3: resolve at call time so --log-level governs this output
+        if num_simulations is None:
+            num_simulations = self._num_simulations
+
+        incumbent_config = apply_draft_overrides(self._base_config, draft_order, incumbent_param_values)
+        trial_configs = [apply_draft_overrides(self._base_config, draft_order, trial) for trial in trials]
+        items = [
+            LeagueBatchItem(
+                incumbent_config, num_simulations, season_folder,
+                preloaded_week_data=week_data_cache, measured_config_dict=trial_config,
+                season_bundle=self._season_bundles.get(season_folder), first_sim_id=first_sim_id
+            )
+            for trial_config in trial_configs
+            for season_folder, week_data_cache in self._season_cache.items()
+        ]
+        groups = self._runner.run_simulations_for_batch(items)
+
+        seasons = len(self._season_cache)
+        scores = []
+        for trial_idx in range(len(trials)):
+            trial_groups = groups[trial_idx * seasons:(trial_idx + 1) * seasons]
+            total_wins = sum(wins for group in trial_groups for wins, _, _ in group)
+            total_games = total_wins + sum(losses for group in trial_groups for _, losses, _ in group)
+            eval_requested = num_simulations * seasons
+            eval_dropped = eval_requested - sum(len(group) for group in trial_groups)
+            if eval_dropped > 0:
+                logger.error(
+                    f"evaluate_batch dropped {eval_dropped}/{eval_requested} leagues of trial "
+                    f"{trial_idx + 1}/{len(trials)} across {seasons} season(s) "
+                    f"(rate={eval_dropped / eval_requested:.1%}) — win_rate is computed over survivors only"
+                )
+            scores.append((total_wins, total_games, total_wins / total_games if total_games > 0 else 0.0))
+        return scores
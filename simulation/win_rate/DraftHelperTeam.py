@@ -6,7 +6,9 @@ and weekly lineup optimization. This is the team being tested/optimized
 through simulations.
 
 The DraftHelperTeam uses:
-- DraftModeManager for draft recommendations (always picks #1 recommendation, no error)
+- IncrementalDraftRecommender (a DraftModeManager that caches roster-independent
+  partial scores across picks) for draft recommendations (always picks #1
+  recommendation, no error)
 - StarterHelperModeManager for weekly lineup decisions
 - Two PlayerManager instances: one for projected data, one for actual scoring
 
@@ -19,6 +21,7 @@ from league_helper.util.PlayerManager import PlayerManager
 from league_helper.util.ConfigManager import ConfigManager
 from league_helper.util.TeamDataManager import TeamDataManager
 from league_helper.draft_mode.DraftModeManager import DraftModeManager
+from league_helper.draft_mode.IncrementalDraftRecommender import IncrementalDraftRecommender
 from league_helper.starter_helper_mode.StarterHelperModeManager import StarterHelperModeManager
 from utils.FantasyPlayer import FantasyPlayer
 from utils.LoggingManager import get_logger
@@ -43,7 +46,8 @@ class DraftHelperTeam:
         config (ConfigManager): Configuration manager with scoring parameters
         team_data_mgr (TeamDataManager): Team rankings and matchup data
         roster (List[FantasyPlayer]): Current team roster (max 15 players)
-        draft_mgr (DraftModeManager): Draft assistant manager
+        draft_mgr (DraftModeManager): Draft assistant manager (an IncrementalDraftRecommender,
+            built on the first pick and reused for the rest of the draft)
         starter_helper_mgr (StarterHelperModeManager): Weekly lineup optimizer
         logger: Logger instance for tracking operations
     """
@@ -95,25 +99,21 @@ class DraftHelperTeam:
             - Adds player to self.roster for local tracking
         """
 
-        for p in self.projected_pm.players:
-            if p.id == player.id:
-                success = self.projected_pm.draft_player(p)
-                if not success:
-                    self.logger.error(f"Failed to draft {p.name} in projected_pm (position limit reached?)")
-                    return
-                break
-
-        for p in self.actual_pm.players:
-            if p.id == player.id:
-                success = self.actual_pm.draft_player(p)
-                if not success:
-                    self.logger.error(f"Failed to draft {p.name} in actual_pm (position limit reached?)")
-                    for proj_p in self.projected_pm.players:
-                        if proj_p.id == player.id:
-                            self.projected_pm.team.remove_player(proj_p)
-                            break
-                    return
-                break
+        proj_p = self.projected_pm.get_player_by_id(player.id)
+        if proj_p is not None:
+            success = self.projected_pm.draft_player(proj_p)
+            if not success:
+                self.logger.error(f"Failed to draft {proj_p.name} in projected_pm (position limit reached?)")
+                return
+
+        actual_p = self.actual_pm.get_player_by_id(player.id)
+        if actual_p is not None:
+            success = self.actual_pm.draft_player(actual_p)
+            if not success:
+                self.logger.error(f"Failed to draft {actual_p.name} in actual_pm (position limit reached?)")
+                if proj_p is not None:
+                    self.projected_pm.team.remove_player(proj_p)
+                return
 
         self.roster.append(player)
 
@@ -128,14 +128,17 @@ class DraftHelperTeam:
             FantasyPlayer: The top recommended player to draft
 
         Note:
-            Creates a fresh DraftModeManager each time to ensure
-            recommendations reflect the current roster state.
+            The recommender is built once and reused: it reads the live roster and
+            draft state on every call and caches only the roster-independent partial
+            score per player, so recommendations still reflect the current roster
+            while each pick avoids the full 15-step rescore of every available player.
         """
-        self.draft_mgr = DraftModeManager(
-            self.config,
-            self.projected_pm,
-            self.team_data_mgr
-        )
+        if self.draft_mgr is None:
+            self.draft_mgr = IncrementalDraftRecommender(
+                self.config,
+                self.projected_pm,
+                self.team_data_mgr
+            )
 
         recommendations = self.draft_mgr.get_recommendations()
 
@@ -183,7 +186,6 @@ class DraftHelperTeam:
 
         # D2: score from actual_pm (<- week_N+1) by id, not the projected_pm lineup object
         # (which reads 0.0 for the current week after the D1 in-place swap).
-        actual_pm_by_id = {p.id: p for p in self.actual_pm.players}
 
         starters = [
             lineup.qb,
@@ -201,7 +203,7 @@ class DraftHelperTeam:
         for starter in starters:
             if starter and starter.player:
                 starters_count += 1
-                actual_player = actual_pm_by_id.get(starter.player.id)
+                actual_player = self.actual_pm.get_player_by_id(starter.player.id)
                 if actual_player is not None and 1 <= week <= 17 and len(actual_player.actual_points) >= week:
                     actual_points = actual_player.actual_points[week - 1]
                     if actual_points is not None:
@@ -222,15 +224,8 @@ class DraftHelperTeam:
         Side Effects:
             - Sets player.drafted_by = "OPPONENT" in both projected_pm and actual_pm
         """
-        for p in self.projected_pm.players:
-            if p.id == player_id:
-                p.drafted_by = "OPPONENT"
-                break
-
-        for p in self.actual_pm.players:
-            if p.id == player_id:
-                p.drafted_by = "OPPONENT"
-                break
+        self.projected_pm.mark_player_drafted(player_id, "OPPONENT")
+        self.actual_pm.mark_player_drafted(player_id, "OPPONENT")
 
     def get_roster_size(self) -> int:
         """Get current roster size."""
@@ -31,6 +31,8 @@ class DraftStrategyOrchestrator:
         strategy_filter: Optional[str] = None,
         naive_opponents: bool = False,
         seed: Optional[int] = None,
+        use_processes: bool = True,
+        draft_log_cache: bool = False,
     ) -> None:
         """
         Initialize the orchestrator.
@@ -39,7 +41,7 @@ class DraftStrategyOrchestrator:
             data_folder (Path): Root data folder (contains 20XX/ season folders and
                 draft_order_possibilities/ strategy folder).
             num_simulations (int): Number of simulations to run per season per strategy.
-            max_workers (int): Number of parallel worker threads for ParallelLeagueRunner.
+            max_workers (int): Number of parallel workers for ParallelLeagueRunner.
             meta_data_manager (WinRateMetaDataManager): Instantiated manager for
                 reading/writing win_rate_meta_data.json.
             config_path (Path): Path to league_config.json; config_path.parent.parent
@@ -54,6 +56,10 @@ class DraftStrategyOrchestrator:
                 ParallelLeagueRunner / SimulatedLeague). False (default) = self-play; True = naive.
             seed (Optional[int]): Base seed for deterministic evaluation (D1/T29). Forwarded to
                 CombinationEvaluator → ParallelLeagueRunner. Default None → OS entropy (D3).
+            use_processes (bool): Forwarded to the CombinationEvaluator. True (default) =
+                persistent process pool; False = worker threads.
+            draft_log_cache (bool): Forwarded to the CombinationEvaluator. True replays
+                seeded drafts already played; default False drafts every league live.
         """
         self._data_folder = data_folder
         self._num_simulations = num_simulations
@@ -67,6 +73,8 @@ class DraftStrategyOrchestrator:
             config_path=config_path,
             naive_opponents=naive_opponents,
             seed=seed,
+            use_processes=use_processes,
+            draft_log_cache=draft_log_cache,
         )
         self._baseline_params: Dict[str, float] = extract_draft_param_values(
             self._evaluator.base_config
@@ -78,6 +86,10 @@ class DraftStrategyOrchestrator:
                 f"statistically noisy. Consider --sims 30+ for reliable rankings."
             )
 
+    def close(self) -> None:
+        """Stop the evaluator's worker pool (see CombinationEvaluator.close). Idempotent."""
+        self._evaluator.close()
+
     def run(self) -> None:
         """
         Process one full pass through all strategy files.
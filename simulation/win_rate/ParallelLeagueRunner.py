@@ -7,8 +7,21 @@ with thread-safe progress tracking.
 
 Key Features:
 - Multi-threaded simulation execution (ThreadPoolExecutor, default)
-- Multi-process simulation execution (ProcessPoolExecutor, optional)
+- Multi-process simulation execution (ProcessPoolExecutor, optional), with the
+  season's week data published ONCE to shared memory as a PlayerTable that every
+  worker attaches to read-only
+- Optional SeasonBundle: leagues are built in memory, with no temp directory, from
+  one bundle per season (shipped once to each worker process in process mode)
+- Optional persistent process pool: workers outlive a single call and keep a warm,
+  immutable context per season (week data, SeasonBundle), so a sweep's tasks carry
+  only (config, seed) and no call pays process start-up or season loading again
 - Thread-safe result collection
+- Throughput accounting: leagues per second, overall and per core in use, across
+  every call (see throughput_summary)
+- Optional draft-log cache: seeded self-play drafts already played (or their common
+  opening picks) are replayed instead of re-drafted (see draft_log_cache)
+- Flat batches: many (config, season) league groups submitted to the persistent pool
+  at once, so workers stay busy between groups (see run_simulations_for_batch)
 - Progress tracking callbacks
 - Exception handling and error reporting
 - Configurable worker pool
@@ -16,25 +29,202 @@ Key Features:
 Author: Kai Mizuno
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Callable, Optional, Tuple, List
+from typing import Dict, Callable, Optional, Sequence, Tuple, List
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from concurrent.futures.process import BrokenProcessPool
 import hashlib
+import os
 import threading
+import time
 import gc
 
 from utils.LoggingManager import get_logger
-from simulation.win_rate.SimulatedLeague import SimulatedLeague
+from simulation.win_rate.SimulatedLeague import SimulatedLeague, WEEKS_PER_SEASON
+from simulation.win_rate.PlayerTable import PlayerTable, SharedPlayerTable, SharedPlayerTableHandle
+from simulation.win_rate.SeasonBundle import SeasonBundle
+from simulation.win_rate.SimDataLoader import SimDataLoader
+from simulation.win_rate.draft_log_cache import DraftLogCache, draft_log_key
 
 
 GC_FREQUENCY = 5
 _WORKER_PRELOADED_WEEK_DATA: Optional[Dict[int, Dict]] = None
+_WORKER_PLAYER_TABLE: Optional[PlayerTable] = None
+_WORKER_SEASON_BUNDLE: Optional[SeasonBundle] = None
 
 
-def _init_worker_process(week_data: Optional[Dict[int, Dict]]) -> None:
-    global _WORKER_PRELOADED_WEEK_DATA
+def _init_worker_process(
+    week_data: Optional[Dict[int, Dict]],
+    table_handle: Optional[SharedPlayerTableHandle] = None,
+    season_bundle: Optional[SeasonBundle] = None
+) -> None:
+    global _WORKER_PRELOADED_WEEK_DATA, _WORKER_PLAYER_TABLE, _WORKER_SEASON_BUNDLE
     _WORKER_PRELOADED_WEEK_DATA = week_data
+    # Attach once per worker; every league this worker runs reads the same shared arrays.
+    _WORKER_PLAYER_TABLE = PlayerTable.attach(table_handle) if table_handle is not None else None
+    # Unpickled once per worker; every league this worker runs is built from it in memory.
+    _WORKER_SEASON_BUNDLE = season_bundle
+
+
+def _worker_league_kwargs() -> dict:
+    """SimulatedLeague kwargs for the worker's shared player table and season bundle (empty when none)."""
+    kwargs = {}
+    if _WORKER_PLAYER_TABLE is not None:
+        kwargs['player_table'] = _WORKER_PLAYER_TABLE
+    if _WORKER_SEASON_BUNDLE is not None:
+        kwargs['season_bundle'] = _WORKER_SEASON_BUNDLE
+    return kwargs
+
+
+def _season_bundle_kwargs(season_bundle: Optional[SeasonBundle]) -> dict:
+    """SimulatedLeague kwargs for a thread-mode season bundle (empty when none)."""
+    return {'season_bundle': season_bundle} if season_bundle is not None else {}
+
+
+def _draft_log_kwargs(draft_logs: Optional[DraftLogCache]) -> dict:
+    """SimulatedLeague kwargs for a draft-log cache (empty when none)."""
+    return {'draft_log_cache': draft_logs} if draft_logs is not None else {}
+
+
+@dataclass(frozen=True)
+class _SeasonKey:
+    """
+    Identifies one season's warm context inside a persistent-pool worker.
+
+    Shipped with every persistent-pool task; small (the table handle carries only the
+    id/position columns and two shared-memory block names).
+
+    Attributes:
+        data_folder (Path): The season folder.
+        table_handle (Optional[SharedPlayerTableHandle]): The season's week data published
+            to shared memory by the runner, or None when the runner had no week data (the
+            worker then loads it from data_folder itself).
+    """
+
+    data_folder: Path
+    table_handle: Optional[SharedPlayerTableHandle] = None
+
+
+@dataclass(frozen=True)
+class _WarmSeason:
+    """
+    One season's immutable, config-independent league inputs, held by a worker process.
+
+    Attributes:
+        week_data (Optional[Dict[int, Dict]]): Parsed week data (when no table was published).
+        player_table (Optional[PlayerTable]): Shared-memory week data (when one was published).
+        season_bundle (SeasonBundle): Construction snapshot, schedule, team and game data.
+    """
+
+    week_data: Optional[Dict[int, Dict]]
+    player_table: Optional[PlayerTable]
+    season_bundle: SeasonBundle
+
+    def league_kwargs(self) -> dict:
+        """SimulatedLeague kwargs building a league from this warm context."""
+        kwargs = {'season_bundle': self.season_bundle}
+        if self.player_table is not None:
+            kwargs['player_table'] = self.player_table
+        return kwargs
+
+
+@dataclass(frozen=True)
+class LeagueBatchItem:
+    """
+    One group of leagues in a run_simulations_for_batch call: one config pair on one season.
+
+    Attributes:
+        config_dict (dict): Configuration every non-measured team drafts with.
+        num_simulations (int): Leagues to run for this group.
+        data_folder (Path): The season folder.
+        preloaded_week_data (Optional[Dict[int, Dict]]): The season's week data from SimDataLoader.
+        measured_config_dict (Optional[dict]): The measured team's trial config, or None.
+        season_bundle (Optional[SeasonBundle]): The season's SeasonBundle (see
+            run_simulations_for_config).
+        first_sim_id (int): sim_id of the group's first league; the group runs sim_ids
+            first_sim_id .. first_sim_id + num_simulations - 1 (see run_simulations_for_config).
+    """
+
+    config_dict: dict
+    num_simulations: int
+    data_folder: Path
+    preloaded_week_data: Optional[Dict[int, Dict]] = None
+    measured_config_dict: Optional[dict] = None
+    season_bundle: Optional[SeasonBundle] = None
+    first_sim_id: int = 0
+
+
+# Per-worker registry of warm seasons, filled lazily by _warm_season. Lives as long as
+# the worker process, i.e. across every run_simulations_for_config call and season
+# the persistent pool serves.
+_WORKER_WARM_SEASONS: Dict[_SeasonKey, _WarmSeason] = {}
+
+
+def _warm_season(key: _SeasonKey) -> _WarmSeason:
+    """
+    Return the worker's warm context for a season, building it on first use.
+
+    The first task a worker receives for a season attaches the season's shared player
+    table (or parses the week data from disk when none was published) and reads the
+    SeasonBundle; every later task for that season reuses both.
+
+    Args:
+        key (_SeasonKey): The season the task simulates.
+
+    Returns:
+        _WarmSeason: The season's warm context.
+    """
+    warm = _WORKER_WARM_SEASONS.get(key)
+    if warm is None:
+        if key.table_handle is not None:
+            week_data, player_table = None, PlayerTable.attach(key.table_handle)
+        else:
+            week_data, player_table = SimDataLoader(key.data_folder).week_data_cache, None
+        warm = _WarmSeason(
+            week_data=week_data,
+            player_table=player_table,
+            season_bundle=SeasonBundle.from_season_folder(key.data_folder, WEEKS_PER_SEASON + 1),
+        )
+        _WORKER_WARM_SEASONS[key] = warm
+    return warm
+
+
+def _run_warm_simulation_process(
+    args: Tuple[dict, int, _SeasonKey, bool, Optional[int], Optional[dict], bool, Optional[DraftLogCache]]
+):
+    """
+    Run a single simulation in a persistent-pool worker from its warm season context.
+
+    Module-level for ProcessPoolExecutor. Only the per-league inputs travel with the
+    task; everything config-independent comes from _warm_season. Each league still gets
+    fresh managers (every manager carries the task's config), but with the warm context
+    that construction reads nothing from disk.
+
+    Args:
+        args: Tuple of (config_dict, simulation_id, season_key, naive_opponents, seed,
+            measured_config_dict, by_week, draft_logs), where draft_logs is a task-local
+            DraftLogCache holding the one log this draft can use (None without a cache).
+
+    Returns:
+        Tuple[result, Optional[DraftLogCache]]: get_draft_helper_results() (or
+            get_draft_helper_results_by_week() when by_week is True), and draft_logs with
+            this league's draft added, for the runner to merge.
+    """
+    config_dict, simulation_id, season_key, naive_opponents, seed, measured_config_dict, by_week, draft_logs = args
+    warm = _warm_season(season_key)
+    league = None
+    try:
+        league = SimulatedLeague(config_dict, season_key.data_folder, warm.week_data, measured_config_dict=measured_config_dict, naive_opponents=naive_opponents, seed=seed, **warm.league_kwargs(), **_draft_log_kwargs(draft_logs))
+        league.run_draft()
+        league.run_season()
+        if by_week:
+            return league.get_draft_helper_results_by_week(), draft_logs
+        return league.get_draft_helper_results(), draft_logs
+    finally:
+        if league:
+            league.cleanup()
+            del league
 
 
 def _run_simulation_process(args: Tuple[dict, int, Path, bool, Optional[int], Optional[dict]]) -> Tuple[int, int, float]:
@@ -42,9 +232,10 @@ def _run_simulation_process(args: Tuple[dict, int, Path, bool, Optional[int], Op
     Run a single simulation in a separate process.
 
     This is a module-level function required for ProcessPoolExecutor,
-    which cannot pickle instance methods. preloaded_week_data is read
-    from the module-level _WORKER_PRELOADED_WEEK_DATA set once per
-    worker by _init_worker_process, avoiding per-simulation pickling.
+    which cannot pickle instance methods. Week data is read from the
+    module-level _WORKER_PLAYER_TABLE (shared memory) or
+    _WORKER_PRELOADED_WEEK_DATA, set once per worker by
+    _init_worker_process, avoiding per-simulation pickling.
 
     Args:
         args: Tuple of (config_dict, simulation_id, data_folder, naive_opponents, seed,
@@ -58,7 +249,7 @@ def _run_simulation_process(args: Tuple[dict, int, Path, bool, Optional[int], Op
     config_dict, simulation_id, data_folder, naive_opponents, seed, measured_config_dict = args
     league = None
     try:
-        league = SimulatedLeague(config_dict, data_folder, _WORKER_PRELOADED_WEEK_DATA, measured_config_dict=measured_config_dict, naive_opponents=naive_opponents, seed=seed)
+        league = SimulatedLeague(config_dict, data_folder, _WORKER_PRELOADED_WEEK_DATA, measured_config_dict=measured_config_dict, naive_opponents=naive_opponents, seed=seed, **_worker_league_kwargs())
         league.run_draft()
         league.run_season()
         wins, losses, total_points = league.get_draft_helper_results()
@@ -74,8 +265,8 @@ def _run_simulation_with_weeks_process(args: Tuple[dict, int, Path, bool, Option
     Run a single simulation with week tracking in a separate process.
 
     This is a module-level function required for ProcessPoolExecutor.
-    preloaded_week_data is read from the module-level
-    _WORKER_PRELOADED_WEEK_DATA set once per worker by
+    Week data is read from the module-level _WORKER_PLAYER_TABLE (shared
+    memory) or _WORKER_PRELOADED_WEEK_DATA, set once per worker by
     _init_worker_process, avoiding per-simulation pickling.
 
     Args:
@@ -89,7 +280,7 @@ def _run_simulation_with_weeks_process(args: Tuple[dict, int, Path, bool, Option
     config_dict, simulation_id, data_folder, naive_opponents, seed = args
     league = None
     try:
-        league = SimulatedLeague(config_dict, data_folder, _WORKER_PRELOADED_WEEK_DATA, naive_opponents=naive_opponents, seed=seed)
+        league = SimulatedLeague(config_dict, data_folder, _WORKER_PRELOADED_WEEK_DATA, naive_opponents=naive_opponents, seed=seed, **_worker_league_kwargs())
         league.run_draft()
         league.run_season()
         week_results = league.get_draft_helper_results_by_week()
@@ -138,6 +329,11 @@ class ParallelLeagueRunner:
         - Higher overhead (process creation, serialization)
         - Best for CPU-bound simulations on multi-core systems
 
+    League work (drafting, lineup optimization) is pure-Python CPU work once week data
+    is preloaded, so sweeps (CombinationEvaluator) run in process mode with a
+    persistent pool by default; thread mode remains the default here for callers that
+    run only a handful of leagues.
+
     Attributes:
         max_workers (int): Number of concurrent workers
         data_folder (Path): Base folder containing season data
@@ -145,6 +341,10 @@ class ParallelLeagueRunner:
         logger: Logger instance
         progress_callback (Optional[Callable]): Function called after each simulation
         lock (threading.Lock): Lock for thread-safe progress updates
+        leagues_completed (int): Leagues completed across every call
+        simulation_seconds (float): Wall-clock seconds spent inside run calls
+        draft_logs (Optional[DraftLogCache]): Pick logs shared by every league, when
+            draft_log_cache is enabled
     """
 
     def __init__(
@@ -154,7 +354,9 @@ class ParallelLeagueRunner:
         progress_callback: Optional[Callable[[int, int], None]] = None,
         use_processes: bool = False,
         naive_opponents: bool = False,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        persistent_pool: bool = False,
+        draft_log_cache: bool = False
     ) -> None:
         """
         Initialize ParallelLeagueRunner.
@@ -175,6 +377,18 @@ class ParallelLeagueRunner:
                 each simulation task receives a per-task seed derived from
                 (base_seed, season_folder, sim_id) via _derive_task_seed, making every league's
                 RNG deterministic and config-independent (D2). Default None → OS entropy (D3).
+            persistent_pool (bool): Process mode only. If True, the worker processes are
+                started on the first call and kept until close(), across calls and seasons.
+                Each worker builds a warm context per season on its first task for it (see
+                _warm_season) and every later league reuses it, always building in memory
+                from a SeasonBundle; the per-call season_bundle argument is then not needed.
+                Default False starts and stops a pool on every call.
+            draft_log_cache (bool): If True, keep a DraftLogCache across every call, so a
+                seeded self-play draft already played is replayed and one sharing the
+                reference config resumes from the measured team's first divergent pick.
+                Thread mode shares the cache directly; the persistent pool ships each task
+                the one log it can use and merges the task's new log back. A per-call
+                process pool does not use it. Default False drafts every league live.
         """
         self.max_workers = max_workers
         self.data_folder = data_folder or Path("simulation/sim_data")
@@ -191,6 +405,24 @@ class ParallelLeagueRunner:
         self.last_completed_count = 0
         self.last_dropped_count = 0
 
+        # Throughput accounting across every run call (see throughput_summary).
+        self.leagues_completed = 0
+        self.simulation_seconds = 0.0
+
+        self.draft_logs: Optional[DraftLogCache] = DraftLogCache() if draft_log_cache else None
+
+        # Process-mode columnar copy of the most recent preloaded_week_data. A strong ref to
+        # the source dict is kept alongside so the identity check can't match a recycled id().
+        self._player_table_source: Optional[Dict[int, Dict]] = None
+        self._player_table: Optional[PlayerTable] = None
+
+        # persistent_pool state: the long-lived executor, and every table published for it
+        # (one per season's week-data dict), kept alive until close() since workers hold
+        # them attached in their warm contexts.
+        self.persistent_pool = persistent_pool
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._persistent_tables: List[Tuple[Dict[int, Dict], SharedPlayerTable]] = []
+
         executor_type = "ProcessPoolExecutor" if use_processes else "ThreadPoolExecutor"
         self.logger.debug(f"ParallelLeagueRunner initialized with {max_workers} workers ({executor_type})")
 
@@ -207,13 +439,139 @@ class ParallelLeagueRunner:
         self.data_folder = data_folder
         self.logger.debug(f"ParallelLeagueRunner data_folder updated to: {data_folder}")
 
+    def _publish_player_table(
+        self,
+        preloaded_week_data: Optional[Dict[int, Dict]]
+    ) -> Optional[SharedPlayerTable]:
+        """
+        Publish preloaded_week_data to shared memory for this call's worker processes.
+
+        The columnar PlayerTable is built once per distinct week-data dict and reused across
+        calls (CombinationEvaluator passes the same per-season dict for every config), so
+        repeated calls only pay the shared-memory copy, not the conversion.
+
+        Args:
+            preloaded_week_data (Optional[Dict[int, Dict]]): Pre-loaded week data from SimDataLoader.
+
+        Returns:
+            Optional[SharedPlayerTable]: The published table (caller must release()), or None
+                when there is no week data to share — workers then fall back to the
+                preloaded_week_data initializer path / their own file reads.
+        """
+        if not preloaded_week_data:
+            return None
+        if self._player_table_source is not preloaded_week_data:
+            self._player_table = PlayerTable.from_week_data(preloaded_week_data)
+            self._player_table_source = preloaded_week_data
+        return self._player_table.to_shared_memory()
+
+    def _persistent_season_key(
+        self,
+        preloaded_week_data: Optional[Dict[int, Dict]],
+        data_folder: Optional[Path] = None
+    ) -> _SeasonKey:
+        """
+        Return the persistent-pool key for a season, publishing its table once.
+
+        A week-data dict is published to shared memory the first time it is seen and the
+        table kept until close(): the workers' warm contexts stay attached to it across
+        calls. Without week data the key carries no handle and each worker reads the
+        season itself, once.
+
+        Args:
+            preloaded_week_data (Optional[Dict[int, Dict]]): Pre-loaded week data from SimDataLoader.
+            data_folder (Optional[Path]): The season folder; default None uses self.data_folder.
+
+        Returns:
+            _SeasonKey: The key every task of the season carries.
+        """
+        data_folder = data_folder or self.data_folder
+        if not preloaded_week_data:
+            return _SeasonKey(data_folder)
+        for source, table in self._persistent_tables:
+            if source is preloaded_week_data:
+                return _SeasonKey(data_folder, table.handle)
+        table = PlayerTable.from_week_data(preloaded_week_data).to_shared_memory()
+        self._persistent_tables.append((preloaded_week_data, table))
+        return _SeasonKey(data_folder, table.handle)
+
+    def _persistent_executor(self) -> ProcessPoolExecutor:
+        """Return the persistent pool, starting it on first use (or after it broke)."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            self.logger.debug(f"Started persistent pool with {self.max_workers} worker processes")
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Stop the persistent pool and release the tables published for it. Idempotent.
+
+        A no-op for a runner without persistent_pool. The runner stays usable: a later
+        call starts a fresh pool.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        tables, self._persistent_tables = self._persistent_tables, []
+        for _, table in tables:
+            table.release()
+
+    def __enter__(self) -> 'ParallelLeagueRunner':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def cores_in_use(self) -> int:
+        """
+        Cores the runner's leagues can occupy at once.
+
+        Process mode uses min(max_workers, CPU count); thread mode is serialized by the
+        GIL on this pure-Python work, so it counts as one.
+        """
+        if not self.use_processes:
+            return 1
+        return max(1, min(self.max_workers, os.cpu_count() or 1))
+
+    def leagues_per_second(self) -> float:
+        """Leagues completed per wall-clock second across every call (0.0 before any)."""
+        if self.simulation_seconds <= 0:
+            return 0.0
+        return self.leagues_completed / self.simulation_seconds
+
+    def throughput_summary(self) -> str:
+        """
+        Describe the runner's throughput so far, for checking scaling with the worker count.
+
+        Returns:
+            str: e.g. "1200 leagues in 300.0s: 4.00 leagues/s, 0.50 leagues/s per core
+                (8 processes on 8 cores)"
+        """
+        executor_type = "processes" if self.use_processes else "threads"
+        rate = self.leagues_per_second()
+        return (
+            f"{self.leagues_completed} leagues in {self.simulation_seconds:.1f}s: "
+            f"{rate:.2f} leagues/s, {rate / self.cores_in_use:.2f} leagues/s per core "
+            f"({self.max_workers} {executor_type} on {self.cores_in_use} "
+            f"core{'s' if self.cores_in_use != 1 else ''})"
+        )
+
+    def _record_throughput(self, completed: int, started: float) -> float:
+        """Add one call's completed leagues and elapsed time to the totals; return the elapsed seconds."""
+        elapsed = time.perf_counter() - started
+        self.leagues_completed += completed
+        self.simulation_seconds += elapsed
+        return elapsed
+
     def run_single_simulation(
         self,
         config_dict: dict,
         simulation_id: int,
         preloaded_week_data: Optional[Dict[int, Dict]] = None,
         seed: Optional[int] = None,
-        measured_config_dict: Optional[dict] = None
+        measured_config_dict: Optional[dict] = None,
+        season_bundle: Optional[SeasonBundle] = None
     ) -> Tuple[int, int, float]:
         """
         Run a single league simulation (thread-safe).
@@ -232,6 +590,8 @@ class ParallelLeagueRunner:
                 When non-None the single measured DraftHelperTeam drafts with it while the other
                 teams draft with config_dict (the incumbent). None (default) → legacy single-config
                 self-play (measured team shares config_dict).
+            season_bundle (Optional[SeasonBundle]): The data folder's SeasonBundle. If
+                provided, the league is built in memory instead of through a temp directory.
 
         Returns:
             Tuple[int, int, float]: (wins, losses, total_points) for DraftHelperTeam
@@ -241,7 +601,7 @@ class ParallelLeagueRunner:
         """
         league = None
         try:
-            league = SimulatedLeague(config_dict, self.data_folder, preloaded_week_data, measured_config_dict=measured_config_dict, naive_opponents=self.naive_opponents, seed=seed)
+            league = SimulatedLeague(config_dict, self.data_folder, preloaded_week_data, measured_config_dict=measured_config_dict, naive_opponents=self.naive_opponents, seed=seed, **_season_bundle_kwargs(season_bundle), **_draft_log_kwargs(self.draft_logs))
 
             league.run_draft()
             league.run_season()
@@ -263,7 +623,8 @@ class ParallelLeagueRunner:
         config_dict: dict,
         simulation_id: int,
         preloaded_week_data: Optional[Dict[int, Dict]] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        season_bundle: Optional[SeasonBundle] = None
     ) -> List[Tuple[int, bool, float]]:
         """
         Run a single league simulation and return per-week results (thread-safe).
@@ -278,6 +639,8 @@ class ParallelLeagueRunner:
                 SimDataLoader. If provided, passed to SimulatedLeague to skip file reads.
             seed (Optional[int]): Per-task deterministic seed derived by the caller (D1/T29).
                 None → OS entropy, preserving stochastic behavior (D3).
+            season_bundle (Optional[SeasonBundle]): The data folder's SeasonBundle. If
+                provided, the league is built in memory instead of through a temp directory.
 
         Returns:
             List[Tuple[int, bool, float]]: Per-week results as list of
@@ -288,7 +651,7 @@ class ParallelLeagueRunner:
         """
         league = None
         try:
-            league = SimulatedLeague(config_dict, self.data_folder, preloaded_week_data, naive_opponents=self.naive_opponents, seed=seed)
+            league = SimulatedLeague(config_dict, self.data_folder, preloaded_week_data, naive_opponents=self.naive_opponents, seed=seed, **_season_bundle_kwargs(season_bundle), **_draft_log_kwargs(self.draft_logs))
 
             league.run_draft()
             league.run_season()
@@ -305,31 +668,115 @@ class ParallelLeagueRunner:
                 league.cleanup()
                 del league
 
-    def _derive_task_seeds(self, num_simulations: int) -> List[Optional[int]]:
+    def _derive_task_seeds(
+        self,
+        num_simulations: int,
+        data_folder: Optional[Path] = None,
+        first_sim_id: int = 0
+    ) -> List[Optional[int]]:
         """Derive the per-task seed list for a run (D2/T29).
 
         Config-independent key (base_seed, season, sim_index); returns None for each
         task when self.seed is None, preserving the entropy-default (D3). Shared by
-        run_simulations_for_config and run_simulations_for_config_with_weeks so the
-        derivation lives in one place.
+        run_simulations_for_config, run_simulations_for_config_with_weeks and
+        run_simulations_for_batch so the derivation lives in one place.
 
         Args:
             num_simulations (int): Number of simulation tasks in this run.
+            data_folder (Optional[Path]): The season folder; default None uses self.data_folder.
+            first_sim_id (int): sim_id of the first task (default 0).
 
         Returns:
-            List[Optional[int]]: Per-task seeds aligned to sim_id in range(num_simulations).
+            List[Optional[int]]: Per-task seeds aligned to sim_id in
+                range(first_sim_id, first_sim_id + num_simulations).
         """
+        data_folder = data_folder or self.data_folder
         return [
-            _derive_task_seed(self.seed, self.data_folder, sim_id) if self.seed is not None else None
-            for sim_id in range(num_simulations)
+            _derive_task_seed(self.seed, data_folder, sim_id) if self.seed is not None else None
+            for sim_id in range(first_sim_id, first_sim_id + num_simulations)
         ]
 
+    def _submit_persistent(
+        self,
+        config_dict: dict,
+        num_simulations: int,
+        preloaded_week_data: Optional[Dict[int, Dict]],
+        task_seeds: List[Optional[int]],
+        measured_config_dict: Optional[dict],
+        by_week: bool
+    ) -> Tuple[ProcessPoolExecutor, Dict]:
+        """
+        Submit one call's leagues to the persistent pool as (config, seed) tasks.
+
+        Args:
+            config_dict (dict): Configuration dictionary
+            num_simulations (int): Number of simulations to run
+            preloaded_week_data (Optional[Dict[int, Dict]]): Pre-loaded week data from SimDataLoader.
+            task_seeds (List[Optional[int]]): Per-task seeds from _derive_task_seeds.
+            measured_config_dict (Optional[dict]): The measured team's trial config, or None.
+            by_week (bool): True to collect get_draft_helper_results_by_week().
+
+        Returns:
+            Tuple[ProcessPoolExecutor, Dict]: The pool and the future -> sim_id map.
+        """
+        executor = self._persistent_executor()
+        season_key = self._persistent_season_key(preloaded_week_data)
+        future_to_sim_id = {
+            executor.submit(
+                _run_warm_simulation_process,
+                (config_dict, sim_id, season_key, self.naive_opponents, task_seeds[sim_id], measured_config_dict, by_week,
+                 self._task_draft_logs(config_dict, measured_config_dict, task_seeds[sim_id]))
+            ): sim_id
+            for sim_id in range(num_simulations)
+        }
+        return executor, future_to_sim_id
+
+    def _task_draft_logs(
+        self,
+        config_dict: dict,
+        measured_config_dict: Optional[dict],
+        seed: Optional[int],
+        data_folder: Optional[Path] = None
+    ) -> Optional[DraftLogCache]:
+        """
+        Build a persistent-pool task's own DraftLogCache, holding the one log its draft can use.
+
+        Args:
+            config_dict (dict): The task's reference config.
+            measured_config_dict (Optional[dict]): The task's measured config, or None.
+            seed (Optional[int]): The task's seed.
+            data_folder (Optional[Path]): The task's season folder; default None uses
+                self.data_folder.
+
+        Returns:
+            Optional[DraftLogCache]: The task cache (empty when no log applies), or None when
+                the runner has no cache or the league would not use one (unseeded or naive).
+        """
+        if self.draft_logs is None or seed is None or self.naive_opponents:
+            return None
+        # Room for the shipped log and the league's own.
+        task_logs = DraftLogCache(max_entries=2)
+        data_folder = data_folder or self.data_folder
+        found = self.draft_logs.lookup(draft_log_key(data_folder.name, seed, config_dict, measured_config_dict))
+        if found is not None:
+            task_logs.store(*found)
+        return task_logs
+
+    def _collect_persistent(self, returned: tuple):
+        """Unpack a persistent-pool task's return, merging its draft logs; return the league result."""
+        result, task_logs = returned
+        if task_logs is not None:
+            self.draft_logs.merge(task_logs)
+        return result
+
     def run_simulations_for_config(
         self,
         config_dict: dict,
         num_simulations: int,
         preloaded_week_data: Optional[Dict[int, Dict]] = None,
-        measured_config_dict: Optional[dict] = None
+        measured_config_dict: Optional[dict] = None,
+        season_bundle: Optional[SeasonBundle] = None,
+        first_sim_id: int = 0
     ) -> list[Tuple[int, int, float]]:
         """
         Run multiple simulations for a single configuration in parallel.
@@ -344,6 +791,14 @@ class ParallelLeagueRunner:
             measured_config_dict (Optional[dict]): The measured team's trial config (T54/D1), threaded
                 to SimulatedLeague through BOTH the thread-mode submit and the process-mode sim_args
                 tuple. None (default) → symmetric single-config behavior.
+            season_bundle (Optional[SeasonBundle]): The data folder's SeasonBundle
+                (SimDataLoader.load_season_bundle). If provided, every league is built in
+                memory with no temp directory; in process mode it is shipped to each worker
+                once, through the pool initializer. Not needed with persistent_pool, whose
+                workers read their own bundle once per season.
+            first_sim_id (int): sim_id of the first league (default 0). The leagues take the
+                seeds of sim_ids first_sim_id .. first_sim_id + num_simulations - 1, so a run
+                split into consecutive blocks plays exactly the leagues of one full run.
 
         Returns:
             list[Tuple[int, int, float]]: List of (wins, losses, points) tuples
@@ -366,17 +821,25 @@ class ParallelLeagueRunner:
 
         results = []
         completed_count = 0
+        started = time.perf_counter()
 
         # Per-task seed derivation (D2/T29) — see _derive_task_seeds.
-        task_seeds = self._derive_task_seeds(num_simulations)
+        task_seeds = self._derive_task_seeds(num_simulations, first_sim_id=first_sim_id)
 
         ExecutorClass = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-        """Win rate sim uses ThreadPoolExecutor (I/O-bound — disk reads dominate); accuracy sim uses ProcessPoolExecutor (CPU-bound — score computation dominates). ThreadPoolExecutor: lower overhead, sufficient for I/O-bound simulation setup; ProcessPoolExecutor: bypasses GIL for CPU-bound parallelism at the cost of pickling overhead and higher process-creation latency."""
-        if self.use_processes:
+        """With week data preloaded, league work is CPU-bound pure Python: ProcessPoolExecutor bypasses the GIL (CombinationEvaluator's default, with a persistent pool so start-up and season loading are paid once); ThreadPoolExecutor has lower overhead for a handful of leagues."""
+        shared_table = None
+        persistent = self.use_processes and self.persistent_pool
+        if persistent:
+            executor, future_to_sim_id = self._submit_persistent(
+                config_dict, num_simulations, preloaded_week_data, task_seeds, measured_config_dict, by_week=False
+            )
+        elif self.use_processes:
+            shared_table = self._publish_player_table(preloaded_week_data)
             executor = ProcessPoolExecutor(
                 max_workers=self.max_workers,
                 initializer=_init_worker_process,
-                initargs=(preloaded_week_data,)
+                initargs=(None, shared_table.handle, season_bundle) if shared_table else (preloaded_week_data, None, season_bundle)
             )
             sim_args = [
                 (config_dict, sim_id, self.data_folder, self.naive_opponents, task_seeds[sim_id], measured_config_dict)
@@ -389,7 +852,7 @@ class ParallelLeagueRunner:
         else:
             executor = ExecutorClass(max_workers=self.max_workers)
             future_to_sim_id = {
-                executor.submit(self.run_single_simulation, config_dict, sim_id, preloaded_week_data, task_seeds[sim_id], measured_config_dict): sim_id
+                executor.submit(self.run_single_simulation, config_dict, sim_id, preloaded_week_data, task_seeds[sim_id], measured_config_dict, season_bundle): sim_id
                 for sim_id in range(num_simulations)
             }
 
@@ -399,6 +862,8 @@ class ParallelLeagueRunner:
 
                 try:
                     result = future.result()
+                    if persistent:
+                        result = self._collect_persistent(result)
                     results.append(result)
 
                     with self.lock:
@@ -412,6 +877,9 @@ class ParallelLeagueRunner:
 
                 except BrokenProcessPool:
                     self.logger.error("Process pool crashed — stopping simulations")
+                    if persistent:
+                        # Discarded; the next call starts a fresh pool.
+                        self._pool = None
                     break
                 except Exception as e:
                     self.logger.error(f"Simulation {sim_id} failed: {e}")
@@ -419,10 +887,19 @@ class ParallelLeagueRunner:
             self.logger.warning("Simulation interrupted by user")
             raise
         finally:
-            executor.shutdown(wait=False, cancel_futures=True)
+            if persistent and self._pool is executor:
+                # The pool outlives this call; drop only this call's unstarted tasks.
+                for future in future_to_sim_id:
+                    future.cancel()
+            else:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if shared_table is not None:
+                # Workers that are still winding down keep their mapping after unlink().
+                shared_table.release()
 
         self.last_completed_count = len(results)
         self.last_dropped_count = num_simulations - len(results)
+        elapsed = self._record_throughput(len(results), started)
 
         if self.last_dropped_count > 0:
             drop_rate = self.last_dropped_count / num_simulations if num_simulations else 0.0
@@ -433,7 +910,8 @@ class ParallelLeagueRunner:
             self.logger.error(msg)
 
         self.logger.debug(
-            f"Completed {len(results)}/{num_simulations} simulations successfully"
+            f"Completed {len(results)}/{num_simulations} simulations successfully "
+            f"in {elapsed:.2f}s ({len(results) / elapsed if elapsed > 0 else 0.0:.2f} leagues/s)"
         )
 
         return results
@@ -442,7 +920,8 @@ class ParallelLeagueRunner:
         self,
         config_dict: dict,
         num_simulations: int,
-        preloaded_week_data: Optional[Dict[int, Dict]] = None
+        preloaded_week_data: Optional[Dict[int, Dict]] = None,
+        season_bundle: Optional[SeasonBundle] = None
     ) -> list[List[Tuple[int, bool, float]]]:
         """
         Run multiple simulations for a single configuration with per-week tracking.
@@ -455,6 +934,8 @@ class ParallelLeagueRunner:
             config_dict (dict): Configuration dictionary
             num_simulations (int): Number of simulations to run
             preloaded_week_data (Optional[Dict[int, Dict]]): Pre-loaded week data from SimDataLoader. If provided, skips per-simulation file reads.
+            season_bundle (Optional[SeasonBundle]): The data folder's SeasonBundle; see
+                run_simulations_for_config.
 
         Returns:
             list[List[Tuple[int, bool, float]]]: List of per-week results,
@@ -479,17 +960,25 @@ class ParallelLeagueRunner:
 
         results = []
         completed_count = 0
+        started = time.perf_counter()
 
         # Per-task seed derivation (D2/T29) — see _derive_task_seeds.
         task_seeds = self._derive_task_seeds(num_simulations)
 
         ExecutorClass = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-        """Win rate sim uses ThreadPoolExecutor (I/O-bound — disk reads dominate); accuracy sim uses ProcessPoolExecutor (CPU-bound — score computation dominates). ThreadPoolExecutor: lower overhead, sufficient for I/O-bound simulation setup; ProcessPoolExecutor: bypasses GIL for CPU-bound parallelism at the cost of pickling overhead and higher process-creation latency."""
-        if self.use_processes:
+        """With week data preloaded, league work is CPU-bound pure Python: ProcessPoolExecutor bypasses the GIL (CombinationEvaluator's default, with a persistent pool so start-up and season loading are paid once); ThreadPoolExecutor has lower overhead for a handful of leagues."""
+        shared_table = None
+        persistent = self.use_processes and self.persistent_pool
+        if persistent:
+            executor, future_to_sim_id = self._submit_persistent(
+                config_dict, num_simulations, preloaded_week_data, task_seeds, None, by_week=True
+            )
+        elif self.use_processes:
+            shared_table = self._publish_player_table(preloaded_week_data)
             executor = ProcessPoolExecutor(
                 max_workers=self.max_workers,
                 initializer=_init_worker_process,
-                initargs=(preloaded_week_data,)
+                initargs=(None, shared_table.handle, season_bundle) if shared_table else (preloaded_week_data, None, season_bundle)
             )
             sim_args = [
                 (config_dict, sim_id, self.data_folder, self.naive_opponents, task_seeds[sim_id])
@@ -502,7 +991,7 @@ class ParallelLeagueRunner:
         else:
             executor = ExecutorClass(max_workers=self.max_workers)
             future_to_sim_id = {
-                executor.submit(self.run_single_simulation_with_weeks, config_dict, sim_id, preloaded_week_data, task_seeds[sim_id]): sim_id
+                executor.submit(self.run_single_simulation_with_weeks, config_dict, sim_id, preloaded_week_data, task_seeds[sim_id], season_bundle): sim_id
                 for sim_id in range(num_simulations)
             }
 
@@ -512,6 +1001,8 @@ class ParallelLeagueRunner:
 
                 try:
                     result = future.result()
+                    if persistent:
+                        result = self._collect_persistent(result)
                     results.append(result)
 
                     with self.lock:
@@ -525,6 +1016,9 @@ class ParallelLeagueRunner:
 
                 except BrokenProcessPool:
                     self.logger.error("Process pool crashed — stopping simulations")
+                    if persistent:
+                        # Discarded; the next call starts a fresh pool.
+                        self._pool = None
                     break
                 except Exception as e:
                     self.logger.error(f"Simulation {sim_id} failed: {e}")
@@ -532,10 +1026,19 @@ class ParallelLeagueRunner:
             self.logger.warning("Simulation interrupted by user")
             raise
         finally:
-            executor.shutdown(wait=False, cancel_futures=True)
+            if persistent and self._pool is executor:
+                # The pool outlives this call; drop only this call's unstarted tasks.
+                for future in future_to_sim_id:
+                    future.cancel()
+            else:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if shared_table is not None:
+                # Workers that are still winding down keep their mapping after unlink().
+                shared_table.release()
 
         self.last_completed_count = len(results)
         self.last_dropped_count = num_simulations - len(results)
+        elapsed = self._record_throughput(len(results), started)
 
         if self.last_dropped_count > 0:
             drop_rate = self.last_dropped_count / num_simulations if num_simulations else 0.0
@@ -546,11 +1049,134 @@ class ParallelLeagueRunner:
             self.logger.error(msg)
 
         self.logger.debug(
-            f"Completed {len(results)}/{num_simulations} simulations successfully (with weeks)"
+            f"Completed {len(results)}/{num_simulations} simulations successfully (with weeks) "
+            f"in {elapsed:.2f}s ({len(results) / elapsed if elapsed > 0 else 0.0:.2f} leagues/s)"
+        )
+
+        return results
+
+    def run_simulations_for_batch(self, items: Sequence[LeagueBatchItem]) -> List[List[Tuple[int, int, float]]]:
+        """
+        Run several (config, season) groups of leagues as one flat batch.
+
+        With a persistent pool every league of every group is submitted at once, so the
+        workers stay busy from the first group to the last instead of idling while a
+        small group's last leagues finish. Each league keeps the seed it would get from
+        run_simulations_for_config on its group's season (_derive_task_seed), so a group's
+        results do not depend on what else is in the batch. Other modes run the groups
+        one after another through run_simulations_for_config.
+
+        The last_* counters describe the whole batch; a group's drops are
+        item.num_simulations minus the length of its result list.
+
+        Args:
+            items (Sequence[LeagueBatchItem]): The groups to run.
+
+        Returns:
+            List[List[Tuple[int, int, float]]]: Each group's (wins, losses, points) results,
+                aligned to items.
+        """
+        if not (self.use_processes and self.persistent_pool):
+            return self._run_batch_sequentially(items)
+
+        total = sum(item.num_simulations for item in items)
+        self.logger.debug(f"Running a batch of {len(items)} groups ({total} leagues) with {self.max_workers} processes")
+
+        self.last_requested_count = total
+        self.last_completed_count = 0
+        self.last_dropped_count = 0
+
+        results: List[List[Tuple[int, int, float]]] = [[] for _ in items]
+        completed_count = 0
+        started = time.perf_counter()
+
+        executor = self._persistent_executor()
+        future_to_task: Dict = {}
+        for item_idx, item in enumerate(items):
+            season_key = self._persistent_season_key(item.preloaded_week_data, item.data_folder)
+            task_seeds = self._derive_task_seeds(item.num_simulations, item.data_folder, item.first_sim_id)
+            for sim_id in range(item.num_simulations):
+                future = executor.submit(
+                    _run_warm_simulation_process,
+                    (item.config_dict, sim_id, season_key, self.naive_opponents, task_seeds[sim_id],
+                     item.measured_config_dict, False,
+                     self._task_draft_logs(item.config_dict, item.measured_config_dict, task_seeds[sim_id], item.data_folder))
+                )
+                future_to_task[future] = (item_idx, sim_id)
+
+        try:
+            for future in as_completed(future_to_task):
+                item_idx, sim_id = future_to_task[future]
+
+                try:
+                    results[item_idx].append(self._collect_persistent(future.result()))
+
+                    with self.lock:
+                        completed_count += 1
+                        if self.progress_callback:
+                            self.progress_callback(completed_count, total)
+
+                        if completed_count % GC_FREQUENCY == 0:
+                            gc.collect()
+
+                except BrokenProcessPool:
+                    self.logger.error("Process pool crashed — stopping simulations")
+                    # Discarded; the next call starts a fresh pool.
+                    self._pool = None
+                    break
+                except Exception as e:
+                    self.logger.error(f"Simulation {sim_id} of batch group {item_idx} failed: {e}")
+        except KeyboardInterrupt:
+            self.logger.warning("Simulation interrupted by user")
+            raise
+        finally:
+            if self._pool is executor:
+                for future in future_to_task:
+                    future.cancel()
+            else:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        completed = sum(len(group) for group in results)
+        self.last_completed_count = completed
+        self.last_dropped_count = total - completed
+        elapsed = self._record_throughput(completed, started)
+
+        if self.last_dropped_count > 0:
+            drop_rate = self.last_dropped_count / total if total else 0.0
+            self.logger.error(
+                f"{self.last_dropped_count}/{total} leagues dropped "
+                f"({completed}/{total} completed, rate={drop_rate:.1%})"
+            )
+
+        self.logger.debug(
+            f"Completed batch of {completed}/{total} simulations "
+            f"in {elapsed:.2f}s ({completed / elapsed if elapsed > 0 else 0.0:.2f} leagues/s)"
         )
 
         return results
 
+    def _run_batch_sequentially(self, items: Sequence[LeagueBatchItem]) -> List[List[Tuple[int, int, float]]]:
+        """run_simulations_for_batch without a persistent pool: one run_simulations_for_config per group."""
+        data_folder = self.data_folder
+        results = []
+        requested = completed = 0
+        try:
+            for item in items:
+                self.set_data_folder(item.data_folder)
+                results.append(self.run_simulations_for_config(
+                    item.config_dict, item.num_simulations, preloaded_week_data=item.preloaded_week_data,
+                    measured_config_dict=item.measured_config_dict, season_bundle=item.season_bundle,
+                    first_sim_id=item.first_sim_id
+                ))
+                requested += self.last_requested_count
+                completed += self.last_completed_count
+        finally:
+            self.set_data_folder(data_folder)
+        self.last_requested_count = requested
+        self.last_completed_count = completed
+        self.last_dropped_count = requested - completed
+        return results
+
     def run_multiple_configs(
         self,
         config_dicts: list[dict],
@@ -0,0 +1,293 @@
+"""
+Player Table
+
+Columnar, read-only store of one season's per-week player point arrays for the
+win-rate simulation. Built ONCE per season from SimDataLoader's week_data_cache and
+then shared by every team of every league that simulates that season:
+
+- Within a process, every PlayerManager of a league reads the same NumPy arrays.
+- Across ParallelLeagueRunner worker processes, the arrays live in a single
+  multiprocessing.shared_memory block that each worker attaches to, instead of every
+  worker unpickling its own dict-of-dicts copy of all 17 weeks.
+
+The table carries exactly what PlayerManager.set_player_data consumes each simulated
+week -- the week_N (projected) and week_N+1 (actual) datasets' 17-element
+projected_points / actual_points arrays -- plus the player ids and position codes.
+Per-team state (drafted_by, locked, roster membership) is NOT stored here: it is
+mutable, per team, and stays on each team's own FantasyPlayer objects.
+
+week_view() returns a read-only Mapping with the same shape as one
+week_data_cache[week]['projected' | 'actual'] dict, so set_player_data consumes
+either source unchanged and the two paths are bit-identical.
+
+Author: Kai Mizuno
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+POSITION_CODES: Tuple[str, ...] = ('QB', 'RB', 'WR', 'TE', 'K', 'DST')
+"""Position code order; positions[i] == -1 marks a position outside this tuple."""
+
+DATASETS: Tuple[str, ...] = ('projected', 'actual')
+"""week_data_cache dataset keys, in table axis order (week_N folder, week_N+1 folder)."""
+
+POINT_FIELDS: Tuple[str, ...] = ('projected_points', 'actual_points')
+"""Per-player array fields, in table axis order."""
+
+WEEK_LENGTH = 17
+
+
+@dataclass(frozen=True)
+class SharedPlayerTableHandle:
+    """Picklable description of a PlayerTable published to shared memory.
+
+    Small enough to ship through a ProcessPoolExecutor initializer: the id/position
+    columns travel by value, the two large arrays by shared-memory block name.
+
+    Attributes:
+        ids: Player ids in row order.
+        positions: Position codes in row order (index into POSITION_CODES, -1 unknown).
+        weeks: The simulated weeks present, ascending.
+        points_name: Shared-memory block name of the float64 points array.
+        present_name: Shared-memory block name of the bool presence array.
+    """
+
+    ids: Tuple[int, ...]
+    positions: Tuple[int, ...]
+    weeks: Tuple[int, ...]
+    points_name: str
+    present_name: str
+
+
+class _WeekRows(Mapping):
+    """One week/dataset slice of a PlayerTable, shaped like a week_data_cache dict.
+
+    Maps player id -> {'projected_points': [...17], 'actual_points': [...17]} for the
+    players present in that dataset. Values are fresh Python lists on every access so
+    a caller can never write through into the shared arrays.
+    """
+
+    def __init__(self, table: 'PlayerTable', week_index: int, dataset_index: int) -> None:
+        self._table = table
+        self._week_index = week_index
+        self._dataset_index = dataset_index
+        self._present = table.present[week_index, dataset_index]
+
+    def _row(self, player_id: Any) -> Optional[int]:
+        row = self._table.row_of.get(player_id)
+        if row is None or not self._present[row]:
+            return None
+        return row
+
+    def __contains__(self, player_id: object) -> bool:
+        return self._row(player_id) is not None
+
+    def __getitem__(self, player_id: Any) -> Dict[str, List[float]]:
+        row = self._row(player_id)
+        if row is None:
+            raise KeyError(player_id)
+        points = self._table.points[self._week_index, self._dataset_index]
+        return {
+            field: points[field_index, row].tolist()
+            for field_index, field in enumerate(POINT_FIELDS)
+        }
+
+    def __iter__(self) -> Iterator[int]:
+        ids = self._table.ids
+        return (int(ids[row]) for row in np.flatnonzero(self._present))
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._present))
+
+
+class PlayerTable:
+    """
+    Read-only columnar player store for one simulated season.
+
+    Attributes:
+        ids (np.ndarray): int64 player ids, one per row, ascending.
+        positions (np.ndarray): int8 position codes (index into POSITION_CODES, -1 unknown).
+        weeks (Tuple[int, ...]): Simulated weeks carried by the table, ascending.
+        points (np.ndarray): float64, shape (len(weeks), 2 datasets, 2 fields, rows, 17).
+        present (np.ndarray): bool, shape (len(weeks), 2 datasets, rows) -- whether the
+            player appears in that week's dataset (set_player_data only touches those).
+        row_of (Dict[int, int]): Player id -> row index.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        positions: np.ndarray,
+        weeks: Tuple[int, ...],
+        points: np.ndarray,
+        present: np.ndarray,
+        shm_blocks: Optional[List[shared_memory.SharedMemory]] = None,
+    ) -> None:
+        self.ids = ids
+        self.positions = positions
+        self.weeks = tuple(weeks)
+        self.points = points
+        self.present = present
+        self.row_of: Dict[int, int] = {int(pid): row for row, pid in enumerate(ids)}
+        self._week_index: Dict[int, int] = {week: idx for idx, week in enumerate(self.weeks)}
+        # Attached blocks are held for the table's lifetime: the arrays above are views
+        # into their buffers, which are invalid once the block object is closed.
+        self._shm_blocks = shm_blocks or []
+        for array in (self.ids, self.positions, self.points, self.present):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_week_data(cls, week_data_cache: Dict[int, Dict]) -> 'PlayerTable':
+        """Build a table from a SimDataLoader-shaped week_data_cache.
+
+        Args:
+            week_data_cache (Dict[int, Dict]): {week: {'projected': {id: dict},
+                'actual': {id: dict}}}, as produced by load_week_player_data.
+
+        Returns:
+            PlayerTable: The columnar equivalent of week_data_cache.
+        """
+        weeks = tuple(sorted(week_data_cache))
+
+        position_of: Dict[int, str] = {}
+        for week in weeks:
+            for dataset in DATASETS:
+                for player_id, record in week_data_cache[week][dataset].items():
+                    position_of.setdefault(int(player_id), record.get('position', ''))
+
+        ids = np.array(sorted(position_of), dtype=np.int64)
+        row_of = {int(pid): row for row, pid in enumerate(ids)}
+        positions = np.array(
+            [POSITION_CODES.index(position_of[int(pid)]) if position_of[int(pid)] in POSITION_CODES else -1
+             for pid in ids],
+            dtype=np.int8,
+        )
+
+        points = np.zeros((len(weeks), len(DATASETS), len(POINT_FIELDS), len(ids), WEEK_LENGTH), dtype=np.float64)
+        present = np.zeros((len(weeks), len(DATASETS), len(ids)), dtype=bool)
+        for week_index, week in enumerate(weeks):
+            for dataset_index, dataset in enumerate(DATASETS):
+                for player_id, record in week_data_cache[week][dataset].items():
+                    row = row_of[int(player_id)]
+                    present[week_index, dataset_index, row] = True
+                    for field_index, field in enumerate(POINT_FIELDS):
+                        values = (list(record.get(field, [])) + [0.0] * WEEK_LENGTH)[:WEEK_LENGTH]
+                        points[week_index, dataset_index, field_index, row] = values
+
+        return cls(ids, positions, weeks, points, present)
+
+    def has_week(self, week: int) -> bool:
+        """Return True when the table carries data for the given simulated week."""
+        return week in self._week_index
+
+    def week_view(self, week: int, dataset: str) -> Mapping:
+        """Return one week's dataset as a read-only week_data_cache-shaped Mapping.
+
+        Args:
+            week (int): Simulated week (1-17).
+            dataset (str): 'projected' (week_N folder) or 'actual' (week_N+1 folder).
+
+        Raises:
+            KeyError: If the week is not in the table.
+            ValueError: If dataset is not one of DATASETS.
+        """
+        return _WeekRows(self, self._week_index[week], DATASETS.index(dataset))
+
+    def to_shared_memory(self) -> 'SharedPlayerTable':
+        """Publish this table's arrays to shared memory for worker processes.
+
+        Returns:
+            SharedPlayerTable: The owner of the published blocks. The caller must call
+                release() once every worker is done with it.
+        """
+        blocks = []
+        try:
+            for array in (self.points, self.present):
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        except Exception:
+            for block in blocks:
+                block.close()
+                block.unlink()
+            raise
+
+        handle = SharedPlayerTableHandle(
+            ids=tuple(int(pid) for pid in self.ids),
+            positions=tuple(int(code) for code in self.positions),
+            weeks=self.weeks,
+            points_name=blocks[0].name,
+            present_name=blocks[1].name,
+        )
+        return SharedPlayerTable(handle, blocks)
+
+    @classmethod
+    def attach(cls, handle: SharedPlayerTableHandle) -> 'PlayerTable':
+        """Rebuild a read-only table over blocks published by to_shared_memory().
+
+        Args:
+            handle (SharedPlayerTableHandle): The publishing process's handle.
+
+        Returns:
+            PlayerTable: A table whose points/present arrays are views of shared memory.
+        """
+        rows = len(handle.ids)
+        weeks = len(handle.weeks)
+        points_block = _attach_block(handle.points_name)
+        present_block = _attach_block(handle.present_name)
+        points = np.ndarray(
+            (weeks, len(DATASETS), len(POINT_FIELDS), rows, WEEK_LENGTH),
+            dtype=np.float64, buffer=points_block.buf,
+        )
+        present = np.ndarray((weeks, len(DATASETS), rows), dtype=bool, buffer=present_block.buf)
+        return cls(
+            np.array(handle.ids, dtype=np.int64),
+            np.array(handle.positions, dtype=np.int8),
+            handle.weeks,
+            points,
+            present,
+            shm_blocks=[points_block, present_block],
+        )
+
+
+class SharedPlayerTable:
+    """Owner of a PlayerTable's published shared-memory blocks.
+
+    Attributes:
+        handle (SharedPlayerTableHandle): What workers pass to PlayerTable.attach().
+    """
+
+    def __init__(self, handle: SharedPlayerTableHandle, blocks: List[shared_memory.SharedMemory]) -> None:
+        self.handle = handle
+        self._blocks = blocks
+
+    def release(self) -> None:
+        """Close and unlink the published blocks. Idempotent."""
+        blocks, self._blocks = self._blocks, []
+        for block in blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without handing its lifetime to this process.
+
+    The publishing process owns unlink(). Python 3.13+ says so directly (track=False).
+    Before 3.13 attaching re-registers the name with the resource tracker, which worker
+    processes share with their parent (fork and spawn alike); the registry is a set, so
+    the re-registration is a no-op and the parent's unlink() still clears it exactly once.
+    Unregistering here would instead drop the parent's entry and make its unlink() fail.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
@@ -0,0 +1,195 @@
+"""
+Season Bundle
+
+In-memory form of everything a SimulatedLeague reads from a season folder to build its
+managers: the construction-snapshot player records (week_18, with the draft-time
+player_rating substituted from week_01), the season schedule, the per-team weekly data,
+the D/ST weekly points and the parsed game conditions.
+
+Without a bundle, every SimulatedLeague copies those files into a temp directory,
+rewrites the six position files, and then has its ConfigManager, TeamDataManager,
+SeasonScheduleManager and 20 PlayerManagers (each with its own GameDataManager)
+re-read and re-parse them. A bundle is read ONCE per season (SimDataLoader.load_season_bundle,
+or once per worker process in ParallelLeagueRunner) and every league built from it
+constructs its managers with zero filesystem I/O.
+
+Everything in a bundle is shared, read-only source data. The managers copy what they
+mutate (FantasyPlayer.from_json builds fresh point arrays, SeasonScheduleManager copies
+its schedule dict, GameDataManager copies a week's games on set_current_week), so one
+bundle can back any number of leagues, sequentially or concurrently. The one thing that
+grows is rank_tables: the TeamDataManager week rankings, computed by the first league
+to reach a (week, window) pair and reused by every later one.
+
+Author: Kai Mizuno
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from league_helper.util.GameDataManager import GameDataManager
+from league_helper.util.SeasonScheduleManager import SeasonScheduleManager
+from league_helper.util.TeamDataManager import RankTableCache, TeamDataManager
+from league_helper.util.upcoming_game_model import UpcomingGame
+from utils.LoggingManager import get_logger
+from utils.TeamData import load_team_weekly_data
+
+
+POSITION_FILES: Tuple[str, ...] = (
+    'qb_data.json', 'rb_data.json', 'wr_data.json',
+    'te_data.json', 'k_data.json', 'dst_data.json',
+)
+
+
+def apply_draft_time_ratings(
+    records: List[Dict[str, Any]],
+    week_one_records: List[Dict[str, Any]]
+) -> Tuple[int, int]:
+    """
+    Replace each record's player_rating with its week_01 value, in place.
+
+    The single implementation of the draft-time rating substitution, shared by
+    SimulatedLeague._apply_draft_time_ratings (temp-directory path) and
+    SeasonBundle.from_season_folder (in-memory path). See
+    SimulatedLeague._apply_draft_time_ratings for why the substitution exists.
+
+    Args:
+        records (List[Dict[str, Any]]): One position's construction-snapshot records.
+        week_one_records (List[Dict[str, Any]]): The same position's week_01 records.
+
+    Returns:
+        Tuple[int, int]: (substituted, unmatched) record counts.
+    """
+    draft_time = {rec["id"]: rec.get("player_rating") for rec in week_one_records}
+    substituted = 0
+    unmatched = 0
+    for rec in records:
+        if rec["id"] in draft_time:
+            rec["player_rating"] = draft_time[rec["id"]]
+            substituted += 1
+        else:
+            unmatched += 1
+    return substituted, unmatched
+
+
+@dataclass(frozen=True)
+class SeasonBundle:
+    """
+    Read-only, in-memory season data a SimulatedLeague builds its managers from.
+
+    Attributes:
+        season_folder (Path): The season directory the bundle was read from.
+        player_records (Dict[str, List[Dict[str, Any]]]): Construction-snapshot player
+            records keyed by position file stem ('qb_data', ...), draft-time ratings
+            applied. A position whose file is missing is absent.
+        schedule (Dict[Tuple[str, int], Optional[str]]): SeasonScheduleManager's
+            (team, week) -> opponent cache; None marks a bye.
+        team_weekly_data (Dict[str, List[Dict[str, Any]]]): load_team_weekly_data output.
+        dst_player_data (Dict[str, List[Optional[float]]]): D/ST weekly actual points by team.
+        games (Dict[int, Dict[str, UpcomingGame]]): GameDataManager.all_games.
+        rank_tables (RankTableCache): TeamDataManager week rank tables shared by every
+            league built from this bundle; filled on first use (derived data, excluded
+            from equality).
+    """
+
+    season_folder: Path
+    player_records: Dict[str, List[Dict[str, Any]]]
+    schedule: Dict[Tuple[str, int], Optional[str]]
+    team_weekly_data: Dict[str, List[Dict[str, Any]]]
+    dst_player_data: Dict[str, List[Optional[float]]]
+    games: Dict[int, Dict[str, UpcomingGame]]
+    rank_tables: RankTableCache = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_season_folder(cls, season_folder: Path, construction_week: int) -> 'SeasonBundle':
+        """
+        Read one season folder into a bundle.
+
+        Reads exactly what SimulatedLeague._create_shared_data_dir copies, with the same
+        dispositions: a missing position file, schedule, game data or team_data folder
+        is warned about and left empty; a missing construction-snapshot or week_01
+        folder raises.
+
+        Args:
+            season_folder (Path): The season directory (e.g. simulation/sim_data/2025).
+            construction_week (int): The week folder supplying the player snapshot
+                (SimulatedLeague builds from week WEEKS_PER_SEASON + 1).
+
+        Returns:
+            SeasonBundle: The season's in-memory data.
+
+        Raises:
+            FileNotFoundError: If the construction-snapshot or week_01 folder is absent.
+        """
+        logger = get_logger()
+        weeks_folder = season_folder / "weeks"
+
+        week_folder = weeks_folder / f"week_{construction_week:02d}"
+        if not week_folder.is_dir():
+            raise FileNotFoundError(
+                f"Expected construction-snapshot week folder not found: "
+                f"{week_folder} (week_{construction_week:02d} is the required "
+                f"construction snapshot)"
+            )
+        week_one = weeks_folder / "week_01"
+        if not week_one.is_dir():
+            raise FileNotFoundError(
+                f"Draft-time ratings unavailable: {week_one} not found. week_01 supplies "
+                f"the pre-season player_rating; without it the draft would read week_18's "
+                f"full-season ranking, which is lookahead."
+            )
+
+        player_records: Dict[str, List[Dict[str, Any]]] = {}
+        substituted = 0
+        unmatched = 0
+        for position_file in POSITION_FILES:
+            src = week_folder / position_file
+            if not src.exists():
+                logger.warning(f"Missing {position_file} in {week_folder}")
+                continue
+            data = json.loads(src.read_text())
+            source = week_one / position_file
+            if source.exists():
+                week_one_data = json.loads(source.read_text())
+                counts = apply_draft_time_ratings(
+                    data[next(iter(data))], week_one_data[next(iter(week_one_data))]
+                )
+                substituted += counts[0]
+                unmatched += counts[1]
+            else:
+                logger.warning(f"Draft-time ratings: {source} missing; leaving {position_file} as-is")
+            position_key = position_file.removesuffix('.json')
+            player_records[position_key] = data.get(position_key, [])
+
+        logger.debug(
+            f"Draft-time ratings applied from week_01: {substituted} substituted, "
+            f"{unmatched} not present in week_01 (left at the construction value)"
+        )
+
+        team_data_folder = season_folder / "team_data"
+        team_weekly_data: Dict[str, List[Dict[str, Any]]] = {}
+        if not team_data_folder.exists():
+            logger.warning(f"team_data folder not found: {team_data_folder}")
+        else:
+            try:
+                team_weekly_data = load_team_weekly_data(str(team_data_folder))
+            except Exception as e:
+                logger.warning(f"Error loading team data from {team_data_folder}: {e}. Team rankings will not be available.")
+
+        bundle = cls(
+            season_folder=season_folder,
+            player_records=player_records,
+            schedule=SeasonScheduleManager(season_folder).schedule_cache,
+            team_weekly_data=team_weekly_data,
+            dst_player_data=TeamDataManager.dst_player_data_from_records(
+                player_records.get('dst_data', [])
+            ),
+            games=GameDataManager(season_folder).all_games,
+        )
+        logger.debug(
+            f"Season bundle for {season_folder.name}: "
+            f"{sum(len(r) for r in player_records.values())} players, "
+            f"{len(bundle.schedule)} schedule entries, {len(team_weekly_data)} teams"
+        )
+        return bundle
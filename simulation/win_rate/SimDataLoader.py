@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+from simulation.win_rate.SeasonBundle import SeasonBundle
 from simulation.win_rate.SimulatedLeague import (
     SimulatedLeague,
     DRAFT_ROUNDS,
@@ -35,6 +36,10 @@ class SimDataLoader:
         logger: Logger instance
     """
 
+    # Loaded on first load_season_bundle() call; class-level so test doubles built
+    # without __init__ behave as "not loaded yet".
+    _season_bundle: Optional[SeasonBundle] = None
+
     def __init__(self, season_folder: Path) -> None:
         """
         Initialize SimDataLoader for a single season folder.
@@ -53,6 +58,27 @@ class SimDataLoader:
         if self.is_valid:
             self._preload_all_weeks()
 
+    def load_season_bundle(self) -> SeasonBundle:
+        """
+        Return this season's SeasonBundle, reading it from disk on the first call only.
+
+        The bundle is everything a SimulatedLeague builds its managers from (see
+        SeasonBundle); passing it as SimulatedLeague(season_bundle=...) builds a league
+        with no temp directory and no file reads. Loaded lazily, so callers that only
+        need week_data_cache pay nothing for it.
+
+        Returns:
+            SeasonBundle: The season's construction data, shared by every caller.
+
+        Raises:
+            FileNotFoundError: If the construction-snapshot or week_01 folder is missing.
+        """
+        if self._season_bundle is None:
+            self._season_bundle = SeasonBundle.from_season_folder(
+                self.season_folder, WEEKS_PER_SEASON + 1
+            )
+        return self._season_bundle
+
     def _validate_season_data(self) -> None:
         """
         Validate that season_folder contains sufficient player data.
@@ -27,7 +27,10 @@ from league_helper.util.ConfigManager import ConfigManager
 from league_helper.util.TeamDataManager import TeamDataManager
 from league_helper.util.SeasonScheduleManager import SeasonScheduleManager
 from simulation.win_rate.DraftHelperTeam import DraftHelperTeam
+from simulation.win_rate.PlayerTable import PlayerTable
+from simulation.win_rate.SeasonBundle import SeasonBundle, apply_draft_time_ratings
 from simulation.win_rate.SimulatedOpponent import SimulatedOpponent
+from simulation.win_rate.draft_log_cache import DraftLogCache, DraftLogKey, draft_log_key
 from simulation.win_rate.Week import Week
 from simulation.utils.scheduler import generate_schedule_for_nfl_season
 from utils.LoggingManager import get_logger
@@ -176,7 +179,7 @@ class SimulatedLeague:
     }
     """Legacy naive-opponent composition (selected when naive_opponents=True): 1 DraftHelperTeam + 9 SimulatedOpponents. dict values sum to 9 opponents + 1 DraftHelperTeam = 10 total teams per league. The 1/2/2/2/3 distribution reflects the relative prevalence of each strategy among typical human fantasy drafters. Retained verbatim so the prior ~0.84 baseline regime stays reproducible (T24)."""
 
-    def __init__(self, config_dict: dict, data_folder: Path = Path("./simulation/sim_data"), preloaded_week_data: Optional[Dict[int, Dict]] = None, measured_config_dict: Optional[dict] = None, naive_opponents: bool = False, seed: Optional[int] = None) -> None:
+    def __init__(self, config_dict: dict, data_folder: Path = Path("./simulation/sim_data"), preloaded_week_data: Optional[Dict[int, Dict]] = None, measured_config_dict: Optional[dict] = None, naive_opponents: bool = False, seed: Optional[int] = None, player_table: Optional[PlayerTable] = None, season_bundle: Optional[SeasonBundle] = None, draft_log_cache: Optional[DraftLogCache] = None) -> None:
         """
         Initialize SimulatedLeague with configuration.
 
@@ -202,6 +205,21 @@ class SimulatedLeague:
                 opponent human-error picks) is deterministic and isolated from other leagues and
                 from the process-global random module. Default None seeds from OS entropy,
                 preserving today's stochastic behavior (D3/T29).
+            player_table (Optional[PlayerTable]): Read-only columnar view of the season's
+                week data (typically attached from shared memory inside a worker process).
+                When provided it is the weekly data source for _load_week_data and
+                _preload_all_weeks() is skipped; preloaded_week_data is then ignored.
+                Default None keeps the dict-backed week_data_cache path unchanged.
+            season_bundle (Optional[SeasonBundle]): The season's construction data already
+                in memory (SimDataLoader.load_season_bundle). When provided, every manager
+                is built from it and from config_dict directly: no temp directory is
+                created and nothing is read from or written to disk. Must have been read
+                from data_folder. Default None keeps the temp-directory construction path.
+            draft_log_cache (Optional[DraftLogCache]): Pick logs of earlier drafts. When
+                provided and the league is seeded self-play, run_draft replays a logged
+                draft with the same season, seed and configs, or resumes one that shares
+                the reference config until the measured team's first divergent pick, and
+                logs its own draft. Default None drafts every pick live.
 
         Raises:
             FileNotFoundError: If data files are missing.
@@ -220,12 +238,21 @@ class SimulatedLeague:
         # every draw is isolated from the process-global random module and from other leagues.
         # seed=None falls back to OS entropy, preserving the original stochastic behavior (D3).
         self._rng = random.Random(seed)
+        self._seed = seed
+        self.draft_log_cache = draft_log_cache
 
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="sim_league_"))
+        self.season_bundle = season_bundle
 
-        self.config_path = self.temp_dir / "league_config.json"
-        with open(self.config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        # The bundle path never touches disk; temp_dir/config_path stay None and cleanup()
+        # has nothing to remove.
+        self.temp_dir: Optional[Path] = None
+        self.config_path: Optional[Path] = None
+        if season_bundle is None:
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="sim_league_"))
+
+            self.config_path = self.temp_dir / "league_config.json"
+            with open(self.config_path, 'w') as f:
+                json.dump(config_dict, f, indent=2)
 
         self.teams: List = []
         self.draft_helper_team: Optional[DraftHelperTeam] = None
@@ -238,6 +265,8 @@ class SimulatedLeague:
         if preloaded_week_data is not None:
             self.week_data_cache = preloaded_week_data
 
+        self.player_table = player_table
+
         # D1.2/UD6: the caller never receives `self` if any of the following three raise, so
         # `cleanup()` (which releases `self.temp_dir`) is unreachable on that path. This guard
         # releases temp_dir on unwind only -- the success path below is untouched and
@@ -255,7 +284,7 @@ class SimulatedLeague:
             # missing week folder is this guard's entire diagnostic value -- do not "tidy" this
             # back to a bare rmtree call, which would let a cleanup-path exception mask it.
             try:
-                if self.temp_dir.exists():
+                if self.temp_dir is not None and self.temp_dir.exists():
                     shutil.rmtree(self.temp_dir)
             except Exception:
                 pass
@@ -271,7 +300,8 @@ class SimulatedLeague:
 
         OPTIMIZATION: Uses shared read-only directories instead of per-team copies.
         Each team gets its own PlayerManager instance (with independent in-memory state)
-        but all teams share the same underlying data files.
+        but all teams share the same underlying data files -- or, when the league was
+        given a SeasonBundle, the same in-memory records, with no directory at all.
 
         Note:
             Each team needs independent PlayerManager instances to track
@@ -288,35 +318,20 @@ class SimulatedLeague:
 
         self._rng.shuffle(strategies)  # site #1 (T29): team-slot assignment via per-league RNG
 
-        weeks_folder = self.data_folder / "weeks"
-
-        # D1.3: the exact-path guard is now unconditional — the legacy sorted-last selector
-        # and its opt-in rollback flag are retired (contract; see Week.py and
-        # load_week_player_data's docstring for the full T74 reconciliation). Derived locally
-        # from WEEKS_PER_SEASON (no import of SimDataLoader.WEEKS_REQUIRED back into this
-        # module — that would be a circular dependency and would put SimDataLoader.py in this
-        # unit's diff, violating an explicit success criterion).
-        construction_week = WEEKS_PER_SEASON + 1
-        expected_week_folder = weeks_folder / f"week_{construction_week:02d}"
-        if not expected_week_folder.is_dir():
-            raise FileNotFoundError(
-                f"Expected construction-snapshot week folder not found: "
-                f"{expected_week_folder} (week_{construction_week:02d} is the required "
-                f"construction snapshot)"
+        if self.season_bundle is not None:
+            bundle = self.season_bundle
+            shared_dir = self.data_folder
+            shared_config = ConfigManager(shared_dir, config_data=self.config_dict)
+            shared_schedule_mgr = SeasonScheduleManager(shared_dir, schedule=bundle.schedule)
+            shared_team_data_mgr = TeamDataManager(
+                shared_dir, shared_config, shared_schedule_mgr, shared_config.current_nfl_week,
+                team_weekly_data=bundle.team_weekly_data, dst_player_data=bundle.dst_player_data,
+                rank_table_cache=bundle.rank_tables
             )
-        week_folder = expected_week_folder
-
-        self.logger.debug(f"Using {week_folder.name} JSON files for team setup (has complete actual_points data)")
-
-        shared_dir = self._create_shared_data_dir("shared_data", week_folder)
-
-        shared_config = ConfigManager(shared_dir)
-
-        shared_schedule_mgr = SeasonScheduleManager(shared_dir)
-
-        shared_team_data_mgr = TeamDataManager(
-            shared_dir, shared_config, shared_schedule_mgr, shared_config.current_nfl_week
-        )
+            player_source = {'player_records': bundle.player_records, 'game_data': bundle.games}
+        else:
+            shared_dir, shared_config, shared_schedule_mgr, shared_team_data_mgr = self._load_shared_managers()
+            player_source = {}
 
         measured_config = None
         if self.measured_config_dict is not None:
@@ -336,33 +351,82 @@ class SimulatedLeague:
                 )
                 raise
 
+        # Every simulation PlayerManager scores with fast_scoring: nothing in the
+        # simulation reads ScoredPlayer.reason, so it is never built.
         measured_assigned = False
         for idx, strategy in enumerate(strategies):
             if strategy == 'draft_helper' and measured_config is not None and not measured_assigned:
                 # The single measured DraftHelperTeam scores with its own config: its
                 # PlayerManagers (whose scoring_calculator carries the draft-side params) are
                 # built from measured_config, not shared_config.
-                projected_pm = PlayerManager(shared_dir, measured_config, shared_team_data_mgr, shared_schedule_mgr)
-                actual_pm = PlayerManager(shared_dir, measured_config, shared_team_data_mgr, shared_schedule_mgr)
+                projected_pm = PlayerManager(shared_dir, measured_config, shared_team_data_mgr, shared_schedule_mgr, fast_scoring=True, **player_source)
+                actual_pm = PlayerManager(shared_dir, measured_config, shared_team_data_mgr, shared_schedule_mgr, fast_scoring=True, **player_source)
                 team = DraftHelperTeam(projected_pm, actual_pm, measured_config, shared_team_data_mgr)
                 self.draft_helper_team = team
                 measured_assigned = True
             elif strategy == 'draft_helper':
-                projected_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr)
-                actual_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr)
+                projected_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr, fast_scoring=True, **player_source)
+                actual_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr, fast_scoring=True, **player_source)
                 team = DraftHelperTeam(projected_pm, actual_pm, shared_config, shared_team_data_mgr)
                 if measured_config is None:
                     # Legacy single-config path: the last draft_helper is the measured team.
                     self.draft_helper_team = team
             else:
-                projected_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr)
-                actual_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr)
+                projected_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr, fast_scoring=True, **player_source)
+                actual_pm = PlayerManager(shared_dir, shared_config, shared_team_data_mgr, shared_schedule_mgr, fast_scoring=True, **player_source)
                 team = SimulatedOpponent(projected_pm, actual_pm, shared_config, shared_team_data_mgr, strategy, rng=self._rng)
 
             self.teams.append(team)
 
         self.logger.debug(f"Initialized {len(self.teams)} teams (using shared data directory)")
 
+    def _load_shared_managers(self) -> Tuple[Path, ConfigManager, SeasonScheduleManager, TeamDataManager]:
+        """
+        Build the league-wide managers through the temp-directory round-trip.
+
+        Copies the season's construction snapshot into temp_dir (_create_shared_data_dir)
+        and loads the shared ConfigManager, SeasonScheduleManager and TeamDataManager from
+        it. Used when the league was not given a SeasonBundle.
+
+        Returns:
+            Tuple[Path, ConfigManager, SeasonScheduleManager, TeamDataManager]: The shared
+                directory every PlayerManager reads, and the three shared managers.
+
+        Raises:
+            FileNotFoundError: If the construction-snapshot week folder is missing.
+        """
+        weeks_folder = self.data_folder / "weeks"
+
+        # D1.3: the exact-path guard is now unconditional — the legacy sorted-last selector
+        # and its opt-in rollback flag are retired (contract; see Week.py and
+        # load_week_player_data's docstring for the full T74 reconciliation). Derived locally
+        # from WEEKS_PER_SEASON (no import of SimDataLoader.WEEKS_REQUIRED back into this
+        # module — that would be a circular dependency and would put SimDataLoader.py in this
+        # unit's diff, violating an explicit success criterion).
+        construction_week = WEEKS_PER_SEASON + 1
+        expected_week_folder = weeks_folder / f"week_{construction_week:02d}"
+        if not expected_week_folder.is_dir():
+            raise FileNotFoundError(
+                f"Expected construction-snapshot week folder not found: "
+                f"{expected_week_folder} (week_{construction_week:02d} is the required "
+                f"construction snapshot)"
+            )
+        week_folder = expected_week_folder
+
+        self.logger.debug(f"Using {week_folder.name} JSON files for team setup (has complete actual_points data)")
+
+        shared_dir = self._create_shared_data_dir("shared_data", week_folder)
+
+        shared_config = ConfigManager(shared_dir)
+
+        shared_schedule_mgr = SeasonScheduleManager(shared_dir)
+
+        shared_team_data_mgr = TeamDataManager(
+            shared_dir, shared_config, shared_schedule_mgr, shared_config.current_nfl_week
+        )
+
+        return shared_dir, shared_config, shared_schedule_mgr, shared_team_data_mgr
+
     def _build_measured_config(self, config_dict: dict) -> ConfigManager:
         """
         Build a standalone ConfigManager for the measured team from config_dict.
@@ -370,6 +434,7 @@ class SimulatedLeague:
         Writes config_dict as league_config.json into a dedicated temp subdir and loads it via
         ConfigManager (legacy single-file layout, same as the shared config). Only the config is
         needed here — player data, schedule, and team data are shared with the rest of the league.
+        A league built from a SeasonBundle loads config_dict in memory instead.
 
         Args:
             config_dict (dict): The measured team's configuration dictionary.
@@ -377,6 +442,8 @@ class SimulatedLeague:
         Returns:
             ConfigManager: Config manager scoped to the measured team.
         """
+        if self.season_bundle is not None:
+            return ConfigManager(self.data_folder, config_data=config_dict)
         measured_dir = self.temp_dir / "measured_config_data"
         measured_dir.mkdir(exist_ok=True)
         with open(measured_dir / "league_config.json", 'w') as f:
@@ -482,19 +549,13 @@ class SimulatedLeague:
             if not source.exists():
                 self.logger.warning(f"Draft-time ratings: {source} missing; leaving {json_path.name} as-is")
                 continue
-            src_key = next(iter(json.loads(source.read_text())))
-            draft_time = {
-                rec["id"]: rec.get("player_rating")
-                for rec in json.loads(source.read_text())[src_key]
-            }
+            week_one_data = json.loads(source.read_text())
             data = json.loads(json_path.read_text())
-            key = next(iter(data))
-            for rec in data[key]:
-                if rec["id"] in draft_time:
-                    rec["player_rating"] = draft_time[rec["id"]]
-                    substituted += 1
-                else:
-                    unmatched += 1
+            counts = apply_draft_time_ratings(
+                data[next(iter(data))], week_one_data[next(iter(week_one_data))]
+            )
+            substituted += counts[0]
+            unmatched += counts[1]
             json_path.write_text(json.dumps(data, indent=2))
 
         self.logger.debug(
@@ -532,7 +593,7 @@ class SimulatedLeague:
         Only loads data if historical structure (weeks/week_XX/) exists.
         Falls back gracefully if using legacy flat structure.
         """
-        if self.week_data_cache:
+        if self.week_data_cache or self.player_table is not None:
             return
 
         weeks_folder = self.data_folder / "weeks"
@@ -649,19 +710,27 @@ class SimulatedLeague:
             week_num (int): Week number (1-17)
 
         Note:
-            Does nothing if week data was not pre-loaded (legacy mode).
-        """
-        if week_num not in self.week_data_cache:
-            return
+            Does nothing if week data was not pre-loaded (legacy mode). When a
+            player_table was supplied, the same two datasets are read from it instead
+            of week_data_cache.
+        """
+        if self.player_table is not None:
+            if not self.player_table.has_week(week_num):
+                return
+            projected_data = self.player_table.week_view(week_num, 'projected')
+            actual_data = self.player_table.week_view(week_num, 'actual')
+        else:
+            if week_num not in self.week_data_cache:
+                return
 
-        week_data = self.week_data_cache[week_num]
+            week_data = self.week_data_cache[week_num]
 
-        if isinstance(week_data, dict) and 'projected' in week_data and 'actual' in week_data:
-            projected_data = week_data['projected']
-            actual_data = week_data['actual']
-        else:
-            projected_data = week_data
-            actual_data = week_data
+            if isinstance(week_data, dict) and 'projected' in week_data and 'actual' in week_data:
+                projected_data = week_data['projected']
+                actual_data = week_data['actual']
+            else:
+                projected_data = week_data
+                actual_data = week_data
 
         for team in self.teams:
             if hasattr(team, 'projected_pm') and hasattr(team.projected_pm, 'set_player_data'):
@@ -699,23 +768,61 @@ class SimulatedLeague:
         self.draft_order = self.teams.copy()
         self._rng.shuffle(self.draft_order)  # site #2 (T29): snake-draft order via per-league RNG
 
-        for round_num in range(15):
+        pick_sequence = []
+        for round_num in range(DRAFT_ROUNDS):
             if round_num % 2 == 0:
-                pick_order = self.draft_order
+                pick_sequence.extend(self.draft_order)
             else:
-                pick_order = list(reversed(self.draft_order))
-
-            for team in pick_order:
+                pick_sequence.extend(reversed(self.draft_order))
+
+        cache_key = self._draft_log_key()
+        found = self.draft_log_cache.lookup(cache_key) if cache_key is not None else None
+        log = found[1] if found is not None else None
+        exact = found is not None and found[0] == cache_key
+        replaying = log is not None
+        picks_replayed = 0
+        picks = []
+
+        for pick_idx, team in enumerate(pick_sequence):
+            player = None
+            if replaying and pick_idx < len(log):
+                if exact or team is not self.draft_helper_team:
+                    player = team.projected_pm.get_player_by_id(log[pick_idx])
+                    picks_replayed += player is not None
+                else:
+                    # The measured team decides whether the logged draft still holds.
+                    player = team.get_draft_recommendation()
+                    if player.id != log[pick_idx]:
+                        replaying = False
+            if player is None:
+                replaying = False
                 player = team.get_draft_recommendation()
 
-                team.draft_player(player)
+            team.draft_player(player)
+            picks.append(player.id)
 
-                for other_team in self.teams:
-                    if other_team != team:
-                        other_team.mark_player_drafted(player.id)
+            for other_team in self.teams:
+                if other_team != team:
+                    other_team.mark_player_drafted(player.id)
+
+        if cache_key is not None:
+            if not exact:
+                self.draft_log_cache.store(cache_key, tuple(picks))
+            self.draft_log_cache.record('hit' if exact else 'resume' if log is not None else 'miss', picks_replayed)
 
         self.logger.debug("Draft complete: All teams have 15 players")
 
+    def _draft_log_key(self) -> Optional[DraftLogKey]:
+        """
+        Key of this league's draft in draft_log_cache, or None when the cache does not apply.
+
+        The cache applies to seeded self-play leagues only: an unseeded draft order is
+        not reproducible, and naive opponents draw from the league RNG while picking.
+        """
+        if self.draft_log_cache is None or self._seed is None or self.naive_opponents:
+            return None
+        return draft_log_key(self.data_folder.name, self._seed, self.config_dict, self.measured_config_dict)
+
     def run_season(self) -> None:
         """
         Simulate 17-week regular season.
@@ -752,8 +859,10 @@ class SimulatedLeague:
         """
         Update team rankings for all teams for the given week.
 
-        Uses TeamDataManager's set_current_week method to recalculate rankings
-        based on the rolling window of historical data up to this week.
+        Uses TeamDataManager's set_current_week method to switch to the rankings
+        for the rolling window of historical data up to this week. Each week's rank
+        tables are computed once (once per season when built from a SeasonBundle),
+        so every call after the first is a table swap.
 
         Args:
             week_num (int): Week number (1-17)
@@ -882,7 +991,7 @@ class SimulatedLeague:
         Should be called after simulation is complete to free disk space
         and memory. Clears all large objects to help garbage collector.
         """
-        if self.temp_dir.exists():
+        if self.temp_dir is not None and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
 
         self.teams = None
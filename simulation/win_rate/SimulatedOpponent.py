@@ -113,15 +113,8 @@ class SimulatedOpponent:
         """
         self.roster.append(player)
 
-        for p in self.projected_pm.players:
-            if p.id == player.id:
-                p.drafted_by = "OPPONENT"
-                break
-
-        for p in self.actual_pm.players:
-            if p.id == player.id:
-                p.drafted_by = "OPPONENT"
-                break
+        self.projected_pm.mark_player_drafted(player.id, "OPPONENT")
+        self.actual_pm.mark_player_drafted(player.id, "OPPONENT")
 
 
     def get_draft_recommendation(self) -> FantasyPlayer:
@@ -147,16 +140,14 @@ class SimulatedOpponent:
             (free-agent) candidates with zero/negative projections rather than raising, so
             the draft can still complete this opponent's roster.
         """
-        available_players = [
-            p for p in self.projected_pm.players
-            if p.is_free_agent() and p.fantasy_points and p.fantasy_points > 0
-        ]
+        free_agents = self.projected_pm.get_available_players()
+        available_players = [p for p in free_agents if p.fantasy_points and p.fantasy_points > 0]
 
         if not available_players:
             # T42 fallback: no positive-value candidates remain. Relax the positive-points
             # requirement so the roster can still be completed with the best roster-legal
             # (free-agent) player available.
-            available_players = [p for p in self.projected_pm.players if p.is_free_agent()]
+            available_players = free_agents
             if available_players:
                 self.logger.warning(
                     f"SimulatedOpponent ({self.strategy}): no positive-value draftable "
@@ -321,9 +312,8 @@ class SimulatedOpponent:
         total_actual_points = 0.0
         # D2: score from actual_pm (<- week_N+1) by id, not the projected_pm roster object
         # (which reads 0.0 for the current week after the D1 in-place swap).
-        actual_pm_by_id = {p.id: p for p in self.actual_pm.players}
         for starter in starters:
-            actual_player = actual_pm_by_id.get(starter.id)
+            actual_player = self.actual_pm.get_player_by_id(starter.id)
             if actual_player is not None and 1 <= week <= 17 and len(actual_player.actual_points) >= week:
                 actual_points = actual_player.actual_points[week - 1]
                 if actual_points is not None:
@@ -342,15 +332,8 @@ class SimulatedOpponent:
         Args:
             player_id (int): ID of the player drafted by another team
         """
-        for p in self.projected_pm.players:
-            if p.id == player_id:
-                p.drafted_by = "OPPONENT"
-                break
-
-        for p in self.actual_pm.players:
-            if p.id == player_id:
-                p.drafted_by = "OPPONENT"
-                break
+        self.projected_pm.mark_player_drafted(player_id, "OPPONENT")
+        self.actual_pm.mark_player_drafted(player_id, "OPPONENT")
 
     def get_roster_size(self) -> int:
         """Get current roster size."""
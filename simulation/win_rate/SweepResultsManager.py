@@ -321,6 +321,7 @@ class SweepResultsManager:
         wins: int,
         games: int,
         incumbent_param_values: Optional[Dict[str, float]] = None,
+        games_budgeted: Optional[int] = None,
     ) -> None:
         """
         Record the result of one combination evaluation.
@@ -341,6 +342,11 @@ class SweepResultsManager:
                 self-play baseline / carry-over anchor (T68/D1). The wins/games accumulate into
                 by_reference[make_reference_key(incumbent_param_values)] so evaluations against
                 different references are NEVER pooled into one rate.
+            games_budgeted (Optional[int]): For a sequentially tested evaluation, the games
+                the full fixed-size evaluation would have played; `games` is then what was
+                actually spent before the decision. Accumulates the entry's
+                sequential_games / games_budgeted / early_stops counters. None (default) for a
+                fixed-size evaluation, which leaves those counters untouched.
         """
         key = self.make_combo_key(strategy_id, param_values)
         if key not in self._data["combinations"]:
@@ -370,6 +376,10 @@ class SweepResultsManager:
         entry["total_wins"] = sum(b["wins"] for b in by_reference.values())
         entry["total_games"] = sum(b["games"] for b in by_reference.values())
         entry["last_run"] = datetime.date.today().isoformat()
+        if games_budgeted is not None:
+            entry["sequential_games"] = entry.get("sequential_games", 0) + games
+            entry["games_budgeted"] = entry.get("games_budgeted", 0) + games_budgeted
+            entry["early_stops"] = entry.get("early_stops", 0) + (1 if games < games_budgeted else 0)
         # D4: read-fallback (new key, else legacy ``best_win_rate``) so an old-schema entry
         # loaded from the live store never KeyErrors; then write the new key and pop the legacy
         # key (migrate-on-write) — ``_save`` json.dumps the full entry, so a set-only write would
@@ -519,10 +529,29 @@ class SweepResultsManager:
                 'param_values', 'best_single_run_win_rate', 'by_reference'
                 (per-reference {wins, games} buckets, incl. the 'self_play' bucket — T68/D1),
                 'total_wins', 'total_games' (a DERIVED cross-bucket sum, NON-ranking),
-                'total_runs', 'last_run'.
+                'total_runs', 'last_run'; sequentially tested combinations also carry
+                'sequential_games', 'games_budgeted', 'early_stops'.
         """
         return self._data["combinations"]
 
+    def sequential_summary(self) -> Dict[str, int]:
+        """Return the store-wide totals of its sequentially tested evaluations.
+
+        Sums the per-combination counters written by update(games_budgeted=...); combinations
+        only ever evaluated at a fixed size contribute nothing.
+
+        Returns:
+            Dict[str, int]: 'games_spent' (games actually played), 'games_budgeted' (games the
+                fixed-size evaluations would have played) and 'early_stops' (evaluations
+                decided before their full budget).
+        """
+        entries = self._data["combinations"].values()
+        return {
+            "games_spent": sum(entry.get("sequential_games", 0) for entry in entries),
+            "games_budgeted": sum(entry.get("games_budgeted", 0) for entry in entries),
+            "early_stops": sum(entry.get("early_stops", 0) for entry in entries),
+        }
+
     def get_combination(self, strategy_id: str, param_values: Dict[str, float]) -> Optional[Dict]:
         """Return the stored entry for one combination, or None if not recorded.
 
@@ -12,7 +12,14 @@ convergence is the sole stopping rule. The candidate grid is computed once per c
 its baseline and reused across passes (a fixed, finite search space).
 
 Each combination is scored via an injected CombinationEvaluator (called sequentially) and
-recorded into an injected SweepResultsManager. The store is the durable record, the
+recorded into an injected SweepResultsManager. With batch_candidates, all of one parameter's
+candidates are scored as one flat batch of leagues (CombinationEvaluator.evaluate_batch)
+against the same incumbent, and the strongest candidate that clears the gate is adopted
+once the batch completes. With sequential_block, each evaluation is played in blocks of
+leagues and a candidate stops as soon as a repeated confidence bound puts its win rate
+clearly above or clearly below the adoption gate's 0.50 + min_effect_size (see
+_sequential_decision), so obvious losers and winners cost a fraction of the full budget
+while the adoption rates stay those of the fixed-size gate. The store is the durable record, the
 reporting source, and the `--promote` input — it is NOT read by the adoption gate (T58/D2).
 The returned per-config map carries each config's converged params and the fresh win rate
 of the evaluation that won it.
@@ -21,7 +28,7 @@ Author: Kai Mizuno
 """
 
 # Standard library
-from math import sqrt
+from math import ceil, sqrt
 from statistics import NormalDist
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -88,6 +95,49 @@ def _adopt_by_significance(
     return z > z_crit and effect > min_effect_size  # D3: AND-gate, both boundaries strict
 
 
+def _sequential_decision(
+    wins: int,
+    games: int,
+    confidence: float,
+    min_effect_size: float,
+    looks: int,
+) -> Optional[bool]:
+    """Decide a trial early when its interim evidence clearly settles the adoption gate.
+
+    Builds a two-sided repeated confidence interval around the interim win rate, at the
+    Bonferroni-adjusted level 1 - (1 - confidence) / looks so that, over all `looks` interim
+    checks of one evaluation, the chance of ever stopping on the wrong side of
+    0.5 + min_effect_size stays below 1 - confidence. The standard error is the 0.50 null's
+    sqrt(0.25 / games), the largest binomial one, so the bounds are conservative. A trial
+    stops for futility only when the UPPER bound falls below 0.5 + min_effect_size — the
+    effect _adopt_by_significance requires — so a real improvement near that floor plays on
+    and keeps the fixed-size gate's power. Stdlib-only (``math.sqrt`` +
+    ``statistics.NormalDist``).
+
+    Args:
+        wins (int): Wins accumulated so far.
+        games (int): Games accumulated so far.
+        confidence (float): The adoption gate's one-sided confidence level, in (0, 1).
+        min_effect_size (float): The adoption gate's minimum effect (p - 0.5).
+        looks (int): Interim checks the evaluation makes before its full budget.
+
+    Returns:
+        Optional[bool]: True when the lower bound clears 0.5 + min_effect_size (the trial is
+            clearly stronger), False when the upper bound falls below it (stop, the trial will
+            not be adopted), None when undecided.
+    """
+    if games == 0 or looks < 1:
+        return None
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / looks)
+    margin = z * sqrt(0.25 / games)
+    rate = wins / games
+    if rate - margin > 0.5 + min_effect_size:
+        return True
+    if rate + margin < 0.5 + min_effect_size:
+        return False
+    return None
+
+
 def _read_convergence_best_rate(conv: dict) -> float:
     """Read a convergence entry's accumulated best-combo rate, tolerating the legacy key.
 
@@ -144,6 +194,10 @@ class SweepTournament:
             None when unknown. When it is below _min_games the adoption gate can never fire
             for any trial, so every config reaches its terminal mark as "starved" instead of
             "converged". None (the default) = unknown -> behave exactly as before.
+        _batch_candidates: True scores each parameter's candidates in one evaluate_batch call
+            and adopts at most one of them per parameter per pass.
+        _sequential_block: simulations per season per block in sequential mode, or None for
+            fixed-size evaluations.
     """
 
     def __init__(
@@ -155,6 +209,8 @@ class SweepTournament:
         min_effect_size: float = DEFAULT_MIN_EFFECT_SIZE,
         min_games: int = DEFAULT_MIN_GAMES,
         games_per_evaluation: Optional[int] = None,
+        batch_candidates: bool = False,
+        sequential_block: Optional[int] = None,
     ) -> None:
         """
         Args:
@@ -173,11 +229,29 @@ class SweepTournament:
                 disposition is always computed against THIS tournament's own min_games rather
                 than the caller's floor. Default None = "unknown, behave as today", which
                 keeps every existing construction site byte-identical in behavior.
+            batch_candidates (bool): If True, each parameter's candidates are evaluated
+                together (evaluator.evaluate_batch), all against the incumbent the parameter
+                started with, and the candidate with the highest fresh win rate among those
+                clearing the gate is adopted (the first in grid order on a tie). The league
+                seeds are unchanged, so each candidate's evidence equals its sequential
+                evaluation against that incumbent; only the adoption order differs — a
+                sequential sweep re-tests later candidates against a newly adopted value.
+                Default False evaluates and gates one candidate at a time.
+            sequential_block (Optional[int]): If set, every trial evaluation is played in
+                blocks of this many simulations per season (evaluator.evaluate_batch over
+                consecutive sim_ids, so the leagues are those of the fixed-size evaluation).
+                After each block a trial stops once its upper confidence bound falls below
+                0.5 + min_effect_size, or once its lower bound clears it AND it already clears
+                the adoption gate (_sequential_decision). The bounds are adjusted for the
+                number of blocks, so the adoption rate stays within 1 - confidence of the
+                fixed-size gate's at any true win rate. The store records the games spent and
+                the games budgeted. Default None plays every evaluation at its full fixed size.
 
         Raises:
             ConfigurationError: If confidence is not strictly within (0, 1).
             ConfigurationError: If min_games is less than 1.
             ConfigurationError: If min_effect_size is not in [0, 1).
+            ConfigurationError: If sequential_block is set and less than 1.
         """
         if not 0 < confidence < 1:
             raise ConfigurationError(
@@ -191,6 +265,10 @@ class SweepTournament:
             raise ConfigurationError(
                 f"SweepTournament min_effect_size must be in the interval [0, 1); got {min_effect_size!r}"
             )
+        if sequential_block is not None and sequential_block < 1:
+            raise ConfigurationError(
+                f"SweepTournament sequential_block must be a positive integer (>= 1); got {sequential_block!r}"
+            )
         self._evaluator = evaluator
         self._store = store
         self._num_values = num_values
@@ -198,6 +276,92 @@ class SweepTournament:
         self._min_effect_size = min_effect_size
         self._min_games = min_games
         self._games_per_evaluation = games_per_evaluation
+        self._batch_candidates = batch_candidates
+        self._sequential_block = sequential_block
+
+    def _record_kwargs(self, games_budgeted: int) -> Dict[str, int]:
+        """Return the extra store.update kwargs for one trial evaluation.
+
+        Args:
+            games_budgeted (int): Games the full fixed-size evaluation plays (or would have).
+
+        Returns:
+            Dict[str, int]: {"games_budgeted": games_budgeted} in sequential mode, else {} so
+                fixed-size evaluations are recorded exactly as before.
+        """
+        return {"games_budgeted": games_budgeted} if self._sequential_block is not None else {}
+
+    def _evaluate_sequentially(
+        self,
+        draft_order: list,
+        trials: List[Dict[str, float]],
+        incumbent_param_values: Dict[str, float],
+    ) -> List[Tuple[int, int, float, int, bool]]:
+        """Evaluate trials against one incumbent block by block, stopping each once decided.
+
+        Plays blocks of _sequential_block simulations per season through
+        evaluator.evaluate_batch, walking sim_ids 0 .. evaluator.num_simulations - 1, with only
+        the still-undecided trials in each block. After a block a trial stops when
+        _sequential_decision rules out the adoption gate's 0.5 + min_effect_size, or when it
+        clears that effect and its evidence so far already passes _adopt_by_significance. A
+        trial that reaches the full budget is gated by _adopt_by_significance alone, as in
+        fixed mode; one stopped early for futility is one the fixed gate would almost surely
+        have rejected too (see _sequential_decision for the bound on the difference).
+
+        Args:
+            draft_order (list): The strategy's DRAFT_ORDER array.
+            trials (List[Dict[str, float]]): The measured team's 6-param sets.
+            incumbent_param_values (Dict[str, float]): The 6-param set the opponents draft with.
+
+        Returns:
+            List[Tuple[int, int, float, int, bool]]: Per trial, aligned to trials: (wins,
+                games, win_rate) over the blocks played, the games the full budget would
+                have played (games scaled by budget / simulations played), and whether the
+                trial is adopted.
+        """
+        budget = self._evaluator.num_simulations
+        # Interim checks: every block boundary before the last one.
+        looks = ceil(budget / self._sequential_block) - 1
+        totals = [[0, 0] for _ in trials]
+        sims_played = [0] * len(trials)
+        adopted = [False] * len(trials)
+        undecided = list(range(len(trials)))
+        first_sim_id = 0
+        while undecided and first_sim_id < budget:
+            block = min(self._sequential_block, budget - first_sim_id)
+            scores = self._evaluator.evaluate_batch(
+                draft_order, [trials[i] for i in undecided], incumbent_param_values,
+                first_sim_id=first_sim_id, num_simulations=block,
+            )
+            first_sim_id += block
+            still_undecided = []
+            for i, (wins, games, _) in zip(undecided, scores):
+                totals[i][0] += wins
+                totals[i][1] += games
+                sims_played[i] = first_sim_id
+                gate = _adopt_by_significance(
+                    totals[i][0], totals[i][1],
+                    self._confidence, self._min_effect_size, self._min_games,
+                )
+                if first_sim_id >= budget:
+                    adopted[i] = gate
+                    continue
+                decision = _sequential_decision(
+                    totals[i][0], totals[i][1], self._confidence, self._min_effect_size, looks
+                )
+                if decision is False:
+                    continue                       # futile: not adopted
+                if decision and gate:
+                    adopted[i] = True
+                    continue
+                still_undecided.append(i)
+            undecided = still_undecided
+
+        outcomes = []
+        for (wins, games), played, is_adopted in zip(totals, sims_played, adopted):
+            games_budgeted = games * budget // played if played else 0
+            outcomes.append((wins, games, wins / games if games else 0.0, games_budgeted, is_adopted))
+        return outcomes
 
     def _accumulated_rate(self, strategy_id: str, param_values: Dict[str, float]) -> float:
         """Return the store's accumulated win rate for one combination.
@@ -282,6 +446,7 @@ class SweepTournament:
                                          mid-pass adoption can shift the skip-the-incumbent
                                          count, so the actual total may exceed it slightly)
                     wins (int), games (int), win_rate (float)  the evaluation's own result
+                                         (in sequential mode, over the blocks played)
                     adopted (bool)       whether this trial cleared the adoption gate (always
                                          False for an anchor, which is not gated)
 
@@ -306,6 +471,8 @@ class SweepTournament:
             raise ConfigurationError("SweepTournament.run requires a non-empty strategies list")
 
         logger = get_logger()  # KDD-3: resolve at call time so --log-level governs this output
+        # The store accumulates across resumed runs; the end-of-run log reports this run's share.
+        sequential_before = self._store.sequential_summary() if self._sequential_block is not None else None
 
         candidates = generate_candidate_values(baseline_params, self._num_values)  # KDD-3: fixed grid
         results: Dict[str, Dict] = {}
@@ -434,17 +601,80 @@ class SweepTournament:
                 evals_in_pass = planned_evals(current)
                 eval_in_pass = 0
                 for param_index, param in enumerate(DRAFT_SWEEP_PARAMS, start=1):  # all 6 swept every pass
+                    if self._batch_candidates:
+                        values = [value for value in candidates[param] if value != current[param]]
+                        if not values:
+                            continue
+                        incumbent = dict(current)
+                        trials = []
+                        for value in values:
+                            trial = dict(incumbent)
+                            trial[param] = value
+                            trials.append(trial)
+                        if self._sequential_block is not None:
+                            outcomes = self._evaluate_sequentially(draft_order, trials, incumbent)
+                        else:
+                            outcomes = [
+                                (wins, games, win_rate, games, _adopt_by_significance(
+                                    wins, games,
+                                    self._confidence, self._min_effect_size, self._min_games,
+                                ))
+                                for wins, games, win_rate in self._evaluator.evaluate_batch(draft_order, trials, incumbent)
+                            ]
+                        cleared = []
+                        for value, trial, (wins, games, win_rate, games_budgeted, passed) in zip(values, trials, outcomes):
+                            # T71/D1: observed shortfall (drop-induced); a sequential early stop
+                            # is judged on the games its full budget would have played.
+                            if games_budgeted < self._min_games:
+                                config_observed_starved = True
+                            self._store.update(
+                                strategy_id, trial, win_rate, wins, games, incumbent_param_values=incumbent,
+                                **self._record_kwargs(games_budgeted)
+                            )
+                            if passed:
+                                cleared.append((win_rate, value))
+                        # Same gate as the sequential path, applied to every candidate against
+                        # the same incumbent; max() keeps the first of equal rates (grid order).
+                        adopted_value = None
+                        if cleared:
+                            best_rate, adopted_value = max(cleared, key=lambda rate_value: rate_value[0])
+                            current[param] = adopted_value
+                            moved = True
+                            self._store.mark_config_progress(
+                                strategy_id, "in_progress", current, best_rate
+                            )
+                        for value, (wins, games, win_rate, _, _) in zip(values, outcomes):
+                            eval_in_pass += 1
+                            emit_evaluation(
+                                strategy_id=strategy_id, kind="trial", ascent_pass=ascent_pass,
+                                param=param, value=value,
+                                param_index=param_index, param_total=len(DRAFT_SWEEP_PARAMS),
+                                eval_in_pass=eval_in_pass, evals_in_pass=evals_in_pass,
+                                wins=wins, games=games, win_rate=win_rate,
+                                adopted=value == adopted_value,
+                            )
+                        continue
                     for value in candidates[param]:
                         if value == current[param]:
                             continue                       # current best already recorded
                         trial = dict(current)
                         trial[param] = value
                         eval_in_pass += 1
-                        wins, games, win_rate = self._evaluator.evaluate(draft_order, trial, incumbent_param_values=current)
-                        if games < self._min_games:      # T71/D1: observed shortfall (drop-induced)
+                        if self._sequential_block is not None:
+                            # Decided block by block; the verdict comes back with the evidence.
+                            (wins, games, win_rate, games_budgeted, adopted), = self._evaluate_sequentially(
+                                draft_order, [trial], current
+                            )
+                        else:
+                            wins, games, win_rate = self._evaluator.evaluate(draft_order, trial, incumbent_param_values=current)
+                            games_budgeted, adopted = games, None
+                        if games_budgeted < self._min_games:      # T71/D1: observed shortfall (drop-induced)
                             config_observed_starved = True
                         # T68/D1: the trial was measured against `current` -> the matching reference bucket.
-                        self._store.update(strategy_id, trial, win_rate, wins, games, incumbent_param_values=current)
+                        self._store.update(
+                            strategy_id, trial, win_rate, wins, games, incumbent_param_values=current,
+                            **self._record_kwargs(games_budgeted)
+                        )
                         # T58/D2: decide adoption on the trial's FRESH head-to-head evidence
                         # (the `wins, games` bound from the evaluate() above), tested against the
                         # 0.50 null. The store is deliberately NOT read here: the running-best's
@@ -454,10 +684,11 @@ class SweepTournament:
                         # passes against a different incumbent. The fresh pair is same-reference
                         # by construction, so the old None-entry hold-guard has no failure mode
                         # left to defend (the PR #18 resume path can no longer reach the gate).
-                        adopted = _adopt_by_significance(
-                            wins, games,
-                            self._confidence, self._min_effect_size, self._min_games,
-                        )
+                        if adopted is None:
+                            adopted = _adopt_by_significance(
+                                wins, games,
+                                self._confidence, self._min_effect_size, self._min_games,
+                            )
                         if adopted:
                             current[param] = value
                             # After adoption current == trial, so the new running-best's rate is
@@ -533,4 +764,11 @@ class SweepTournament:
             if progress_callback is not None:  # KDD-2: fire on the converged path
                 progress_callback(strategy_id)
 
+        if sequential_before is not None:
+            after = self._store.sequential_summary()
+            totals = {key: after[key] - sequential_before[key] for key in after}
+            logger.info(
+                f"Sequential testing: {totals['games_spent']} of {totals['games_budgeted']} budgeted games "
+                f"spent ({totals['early_stops']} trial evaluations stopped early)"
+            )
         return results
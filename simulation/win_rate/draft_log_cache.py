@@ -0,0 +1,210 @@
+"""
+Draft-Log Cache
+
+A self-play draft is a pure function of the season, the league seed (team slots and
+draft order) and the configs the teams draft with. The sweep re-simulates the same
+seeds for every candidate (common random numbers), and paired_comparison runs both
+arms of an A/B on the same seed, so many leagues repeat a draft that was already
+played, or share its opening picks:
+
+- the same (season, seed, reference config, measured config) -> the identical draft;
+  its pick log is replayed without asking any team for a recommendation
+- the same (season, seed, reference config) with a different measured config -> the
+  nine reference teams pick exactly as before until the measured team's recommendation
+  first differs from the logged pick; the log is replayed up to that pick and the draft
+  continues live from there
+
+DraftLogCache holds those pick logs (player ids in pick order) in memory, bounded by
+least-recently-used eviction, and is shared by every league given it. Only seeded
+self-play leagues use it: an unseeded draft order is not reproducible, and naive
+SimulatedOpponents draw from the league RNG while picking, so skipping their picks
+would shift every later draw.
+
+A process worker cannot share the parent's cache, so ParallelLeagueRunner ships each
+task the one log its draft can use (lookup) in a small worker-local cache, and merges
+that cache back (merge) when the task returns.
+
+Config fingerprints cover the whole 'parameters' block (config_name and description do
+not affect a draft), which is conservative: two configs that differ only in season-time
+parameters get separate logs.
+
+Author: Kai Mizuno
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+DEFAULT_MAX_DRAFT_LOGS = 10000
+
+
+def config_fingerprint(config_dict: dict) -> str:
+    """
+    Return the sha256 of a config's canonical 'parameters' block.
+
+    Args:
+        config_dict (dict): League config with a 'parameters' block.
+
+    Returns:
+        str: sha256 hex digest.
+    """
+    canonical = json.dumps(config_dict.get('parameters', {}), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DraftLogKey(NamedTuple):
+    """
+    Identifies one draft.
+
+    Attributes:
+        season (str): Season folder name.
+        seed (int): The league's seed.
+        reference (str): Fingerprint of the config every other team drafts with.
+        measured (str): Fingerprint of the measured team's config.
+    """
+
+    season: str
+    seed: int
+    reference: str
+    measured: str
+
+
+def draft_log_key(season: str, seed: int, config_dict: dict, measured_config_dict: Optional[dict]) -> DraftLogKey:
+    """
+    Build the key of a league's draft.
+
+    Args:
+        season (str): Season folder name.
+        seed (int): The league's seed.
+        config_dict (dict): The config every non-measured team drafts with.
+        measured_config_dict (Optional[dict]): The measured team's config; None when it
+            shares config_dict.
+
+    Returns:
+        DraftLogKey: The draft's key.
+    """
+    reference = config_fingerprint(config_dict)
+    measured = reference if measured_config_dict is None else config_fingerprint(measured_config_dict)
+    return DraftLogKey(season, seed, reference, measured)
+
+
+class DraftLogCache:
+    """
+    Thread-safe, bounded in-memory store of draft pick logs.
+
+    Attributes:
+        max_entries (int): Logs kept before the least recently used is evicted.
+        hits (int): Drafts replayed whole.
+        resumes (int): Drafts replayed up to their first divergent pick.
+        misses (int): Drafts run live from the first pick.
+        picks_replayed (int): Picks taken from a log instead of a recommendation.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_DRAFT_LOGS) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries (int): Logs kept before eviction (default DEFAULT_MAX_DRAFT_LOGS).
+        """
+        self.max_entries = max_entries
+        self._logs: 'OrderedDict[DraftLogKey, Tuple[int, ...]]' = OrderedDict()
+        # (season, seed, reference) -> the most recently stored key sharing it.
+        self._latest: Dict[Tuple[str, int, str], DraftLogKey] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.resumes = 0
+        self.misses = 0
+        self.picks_replayed = 0
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def lookup(self, key: DraftLogKey) -> Optional[Tuple[DraftLogKey, Tuple[int, ...]]]:
+        """
+        Find the log to start a draft from.
+
+        Args:
+            key (DraftLogKey): The draft about to run.
+
+        Returns:
+            Optional[Tuple[DraftLogKey, Tuple[int, ...]]]: (log key, pick log), or None.
+                The log key equals key when the log is this very draft; otherwise the log
+                is another measured config's draft with the same season, seed and
+                reference config, to be replayed only while the measured team agrees.
+        """
+        with self._lock:
+            found = key if key in self._logs else self._latest.get(key[:3])
+            if found is None:
+                return None
+            self._logs.move_to_end(found)
+            return found, self._logs[found]
+
+    def store(self, key: DraftLogKey, picks: Tuple[int, ...]) -> None:
+        """
+        Record a finished draft's pick log, evicting the least recently used beyond max_entries.
+
+        Args:
+            key (DraftLogKey): The draft that ran.
+            picks (Tuple[int, ...]): Player ids in pick order.
+        """
+        with self._lock:
+            self._logs[key] = picks
+            self._logs.move_to_end(key)
+            self._latest[key[:3]] = key
+            while len(self._logs) > self.max_entries:
+                evicted, _ = self._logs.popitem(last=False)
+                if self._latest.get(evicted[:3]) == evicted:
+                    del self._latest[evicted[:3]]
+
+    def record(self, outcome: str, picks_replayed: int) -> None:
+        """
+        Count one draft's use of the cache.
+
+        Args:
+            outcome (str): 'hit', 'resume' or 'miss'.
+            picks_replayed (int): Picks taken from a log.
+        """
+        with self._lock:
+            if outcome == 'hit':
+                self.hits += 1
+            elif outcome == 'resume':
+                self.resumes += 1
+            else:
+                self.misses += 1
+            self.picks_replayed += picks_replayed
+
+    def merge(self, other: 'DraftLogCache') -> None:
+        """
+        Take over another cache's logs and counts (a process worker's, returned with its task).
+
+        Args:
+            other (DraftLogCache): The cache to merge in; left unchanged.
+        """
+        for key, picks in other._logs.items():
+            self.store(key, picks)
+        with self._lock:
+            self.hits += other.hits
+            self.resumes += other.resumes
+            self.misses += other.misses
+            self.picks_replayed += other.picks_replayed
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def summary(self) -> str:
+        """One-line usage summary, e.g. for a run's closing log."""
+        drafts = self.hits + self.resumes + self.misses
+        return (
+            f"{drafts} drafts: {self.hits} replayed, {self.resumes} resumed, {self.misses} live; "
+            f"{self.picks_replayed} picks replayed; {len(self)} logs held"
+        )
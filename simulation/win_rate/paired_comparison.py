@@ -35,6 +35,8 @@ from typing import Dict, Optional, Tuple
 
 # Local
 from utils.LoggingManager import get_logger
+from simulation.win_rate.SeasonBundle import SeasonBundle
+from simulation.win_rate.draft_log_cache import DraftLogCache
 from simulation.win_rate.SimDataLoader import SimDataLoader
 from simulation.win_rate.SimulatedLeague import SimulatedLeague
 from simulation.win_rate.ParallelLeagueRunner import _derive_task_seed
@@ -100,6 +102,8 @@ def _run_arm(
     season_folder: Path,
     week_data_cache: Dict[int, Dict],
     seed: int,
+    season_bundle: Optional[SeasonBundle] = None,
+    draft_log_cache: Optional[DraftLogCache] = None,
 ) -> Tuple[int, int]:
     """Run one asymmetric measured-vs-reference league and return (wins, games).
 
@@ -114,6 +118,10 @@ def _run_arm(
         season_folder (Path): The committed season directory (data_folder for the league).
         week_data_cache (Dict[int, Dict]): Preloaded week data from SimDataLoader.
         seed (int): The shared per-(season, sim_id) task seed.
+        season_bundle (Optional[SeasonBundle]): The season's SeasonBundle; when provided the
+            league is built in memory rather than through a temp directory.
+        draft_log_cache (Optional[DraftLogCache]): Shared pick logs; when provided the league
+            replays or resumes a logged draft on the same seed.
 
     Returns:
         Tuple[int, int]: (wins, games) for the measured DraftHelperTeam; games = wins + losses.
@@ -126,6 +134,8 @@ def _run_arm(
             week_data_cache,
             measured_config_dict=measured_config,
             seed=seed,
+            **({'season_bundle': season_bundle} if season_bundle is not None else {}),
+            **({'draft_log_cache': draft_log_cache} if draft_log_cache is not None else {}),
         )
         league.run_draft()
         league.run_season()
@@ -145,6 +155,7 @@ def run_paired_ab_comparison(
     reference_config: Optional[dict] = None,
     num_simulations: int = 1,
     max_workers: int = 8,
+    draft_log_cache: Optional[DraftLogCache] = None,
 ) -> PairedComparisonResult:
     """Measure the CRN-paired before/after win-rate delta of two configs.
 
@@ -168,6 +179,10 @@ def run_paired_ab_comparison(
             sequentially per season here — this helper is called once per bounded operational
             run, not in a hot loop — so it is accepted for API/signature stability and not
             yet threaded into an executor.
+        draft_log_cache (Optional[DraftLogCache]): Shared pick logs. Both arms draft on the
+            same seed against the same reference, so the second arm resumes the first arm's
+            draft up to its measured team's first different pick. Results are unchanged.
+            Default None drafts every league live.
 
     Returns:
         PairedComparisonResult: (current_rate, recommended_rate, delta, z, games, seed).
@@ -198,10 +213,13 @@ def run_paired_ab_comparison(
             )
             continue
         week_data_cache = loader.week_data_cache
+        season_bundle = loader.load_season_bundle()
         for sim_id in range(num_simulations):
             task_seed = _derive_task_seed(seed, season_folder, sim_id)
-            cw, cg = _run_arm(reference, current_config, season_folder, week_data_cache, task_seed)
-            rw, rg = _run_arm(reference, recommended_config, season_folder, week_data_cache, task_seed)
+            cw, cg = _run_arm(reference, current_config, season_folder, week_data_cache, task_seed, season_bundle,
+                              draft_log_cache)
+            rw, rg = _run_arm(reference, recommended_config, season_folder, week_data_cache, task_seed, season_bundle,
+                              draft_log_cache)
             wins_current += cw
             games_current += cg
             wins_recommended += rw
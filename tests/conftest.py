@@ -1,12 +1,47 @@
 """
 Pytest configuration for Fantasy Football Helper Scripts tests.
 
-Adds the project root to sys.path so pytest can import all project modules.
+Adds the project root to sys.path so pytest can import all project modules, and
+provides fixtures shared across test packages.
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 project_root = Path(__file__).parent.parent
 
 sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture
+def index_mock_pm():
+    """
+    Return a function that backs PlayerManager's index API on a Mock with its .players list.
+
+    get_player_by_id, mark_player_drafted and get_available_players read pm.players at call
+    time, so a test may assign or append to it after wrapping.
+    """
+    def wrap(pm):
+        def get_player_by_id(player_id):
+            return next((p for p in pm.players if p.id == player_id), None)
+
+        def mark_player_drafted(player_id, drafted_by):
+            player = get_player_by_id(player_id)
+            if player is not None:
+                player.drafted_by = drafted_by
+            return player
+
+        def get_available_players(positions=None):
+            return [
+                p for p in pm.players
+                if p.is_free_agent() and (positions is None or p.position in positions)
+            ]
+
+        pm.get_player_by_id.side_effect = get_player_by_id
+        pm.mark_player_drafted.side_effect = mark_player_drafted
+        pm.get_available_players.side_effect = get_available_players
+        return pm
+
+    return wrap
@@ -0,0 +1,153 @@
+"""
+Parity tests for IncrementalDraftRecommender against the full-rescore DraftModeManager.
+
+Drives a real seeded win-rate league draft (committed simulation/sim_data/2025 data) and,
+before every pick, asks BOTH a fresh DraftModeManager and the long-lived incremental
+recommender of each drafting team for recommendations. They must agree exactly: same
+players, same scores, same reasons, same projected_points, and the same p.score left on
+every player (get_player_list's score floor reads it on the next pick).
+
+Author: Kai Mizuno
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from league_helper.draft_mode.DraftModeManager import DraftModeManager
+from league_helper.draft_mode.IncrementalDraftRecommender import IncrementalDraftRecommender
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.draft_geometry import DraftGeometry
+from simulation.win_rate.DraftHelperTeam import DraftHelperTeam
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+
+@pytest.fixture(scope="module")
+def base_config_dict():
+    cm = ConfigManager(Path("data"))
+    return {
+        "config_name": cm.config_name,
+        "description": cm.description,
+        "parameters": dict(cm.parameters),
+    }
+
+
+def _as_tuples(recommendations):
+    return [
+        (r.player.id, r.score, tuple(r.reason), r.projected_points)
+        for r in recommendations
+    ]
+
+
+def _run_parity_draft(config_dict, seed, geometry_for=None):
+    """Run a full seeded draft, checking both recommenders before every DraftHelperTeam pick."""
+    league = SimulatedLeague(config_dict, REAL_DATA_FOLDER, seed=seed)
+    try:
+        for team in league.teams:
+            team.config.current_nfl_week = 1
+        league._load_week_data(1)
+
+        recommenders = {
+            id(team): IncrementalDraftRecommender(team.config, team.projected_pm, team.team_data_mgr)
+            for team in league.teams if isinstance(team, DraftHelperTeam)
+        }
+        assert recommenders, "self-play composition must contain DraftHelperTeams"
+
+        order = list(league.teams)
+        checked = 0
+        for round_num in range(15):
+            for team in (order if round_num % 2 == 0 else list(reversed(order))):
+                if isinstance(team, DraftHelperTeam):
+                    geometry = geometry_for(round_num) if geometry_for else None
+                    players = team.projected_pm.players
+
+                    # Both paths start from the same p.score state (the score floor reads it).
+                    scores_before = [p.score for p in players]
+
+                    full = DraftModeManager(team.config, team.projected_pm, team.team_data_mgr)
+                    expected = _as_tuples(full.get_recommendations(geometry))
+                    expected_scores = [p.score for p in players]
+
+                    for p, score in zip(players, scores_before):
+                        p.score = score
+                    actual = _as_tuples(recommenders[id(team)].get_recommendations(geometry))
+
+                    assert actual == expected
+                    assert [p.score for p in players] == expected_scores
+                    checked += 1
+
+                    player = next(p for p in team.projected_pm.players if p.id == expected[0][0])
+                else:
+                    player = team.get_draft_recommendation()
+
+                team.draft_player(player)
+                for other in league.teams:
+                    if other is not team:
+                        other.mark_player_drafted(player.id)
+        return checked
+    finally:
+        league.cleanup()
+
+
+class TestParityWithFullRescore:
+    def test_matches_full_rescore_every_pick(self, base_config_dict):
+        assert _run_parity_draft(base_config_dict, seed=11) == 150
+
+    def test_matches_full_rescore_with_survival_estimate(self, base_config_dict):
+        def geometry_for(round_num):
+            return DraftGeometry(
+                our_slot=0,
+                current_round=round_num + 1,
+                overall_pick_number=round_num * 10 + 1,
+                snake_direction="forward",
+                picks_until_our_next_turn=7 + round_num % 5,
+            )
+
+        assert _run_parity_draft(base_config_dict, seed=23, geometry_for=geometry_for) == 150
+
+
+class TestCacheInvalidation:
+    def _recommender(self, base_score=10.0):
+        player = Mock()
+        player.id = 1
+        calculator = Mock()
+        calculator.max_projection = 100.0
+        calculator._get_normalized_fantasy_points.return_value = (base_score, "")
+        calculator._apply_adp_multiplier.side_effect = lambda p, s: (s, "")
+        calculator._apply_player_rating_multiplier.side_effect = lambda p, s: (s, "")
+        calculator._apply_injury_penalty.return_value = (0.0, "")
+        pm = Mock()
+        pm.players = [player]
+        pm.player_data_version = 1
+        pm.scoring_calculator = calculator
+        config = Mock()
+        config.current_nfl_week = 1
+        config.nfl_team_penalty = []
+        return IncrementalDraftRecommender(config, pm, Mock()), pm, player
+
+    def test_partial_score_cached_until_data_version_changes(self):
+        recommender, pm, player = self._recommender()
+        recommender._sync_cache()
+        assert recommender._get_partial_score(player)[0] == 10.0
+
+        pm.scoring_calculator._get_normalized_fantasy_points.return_value = (20.0, "")
+        recommender._sync_cache()
+        assert recommender._get_partial_score(player)[0] == 10.0
+
+        pm.player_data_version = 2
+        recommender._sync_cache()
+        assert recommender._get_partial_score(player)[0] == 20.0
+
+    def test_week_change_invalidates(self):
+        recommender, pm, player = self._recommender()
+        recommender._sync_cache()
+        recommender._get_partial_score(player)
+
+        pm.scoring_calculator._get_normalized_fantasy_points.return_value = (30.0, "")
+        recommender.config.current_nfl_week = 2
+        recommender._sync_cache()
+        assert recommender._get_partial_score(player)[0] == 30.0
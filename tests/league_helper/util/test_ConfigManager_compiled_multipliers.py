@@ -0,0 +1,189 @@
+"""
+Tests for ConfigManager's precompiled multiplier lookups.
+
+Verifies:
+- every registered ladder, and survival, is compiled at config load
+- a compiled lookup returns exactly what the interpretive _get_multiplier path does
+  (multiplier bits, float type AND label), in both SCALING modes, both threshold
+  directions, with and without the 1-32 integer table, at anchors, between them,
+  outside them, and for None and NaN inputs
+- a ladder edited after load and invalidated is scored from its current contents
+- an integer-domain factor (team rank) carries a full table; real-valued ones do not
+- a malformed survival block is left uncompiled and still raises lazily
+
+Author: Kai Mizuno
+"""
+
+import copy
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.multiplier_lookup import LinearMultiplierLookup
+
+
+@pytest.fixture(scope="module")
+def config():
+    return ConfigManager(Path("data"))
+
+
+def _interpretive(config, scoring_dict, val, rising):
+    """Score val with the block's compiled entry temporarily removed."""
+    entry = config._compiled_multipliers.pop(id(scoring_dict), None)
+    try:
+        return config._get_multiplier(scoring_dict, val, rising)
+    finally:
+        if entry is not None:
+            config._compiled_multipliers[id(scoring_dict)] = entry
+
+
+def _same(expected, actual):
+    expected_multiplier, expected_label = expected
+    actual_multiplier, actual_label = actual
+    return (expected_label == actual_label
+            and type(expected_multiplier) is type(actual_multiplier)
+            and (expected_multiplier == actual_multiplier
+                 or (math.isnan(expected_multiplier) and math.isnan(actual_multiplier))))
+
+
+class TestCompiledAtLoad:
+    def test_every_registered_ladder_and_survival_is_compiled(self, config):
+        ladders = [scoring_dict for _, scoring_dict, _ in config._multiplier_factors()]
+        ladders.append(config.survival_scoring)
+        for scoring_dict in ladders:
+            assert id(scoring_dict) in config._compiled_multipliers
+
+    def test_integer_domain_factors_carry_a_full_rank_table(self, config):
+        for scoring_dict in (config.team_quality_scoring, config.matchup_scoring):
+            lookups = config._compiled_multipliers[id(scoring_dict)][1]
+            for lookup in lookups.values():
+                assert lookup.int_table_start == 1
+                assert len(lookup.int_table) == 32
+
+    def test_real_valued_factors_have_no_table(self, config):
+        for scoring_dict in (config.adp_scoring, config.performance_scoring,
+                             config.temperature_scoring):
+            lookups = config._compiled_multipliers[id(scoring_dict)][1]
+            assert all(lookup.int_table is None for lookup in lookups.values())
+
+
+class TestParityWithInterpretivePath:
+    @pytest.mark.parametrize("scaling", ["BUCKETED", "LINEAR"])
+    @pytest.mark.parametrize("domain", [None, (1, 32)], ids=["no_table", "rank_table"])
+    def test_matches_interpretive_multiplier(self, config, scaling, domain):
+        keys = config.keys
+        rng = random.Random(11)
+        ladders = [scoring_dict for _, scoring_dict, _ in config._multiplier_factors()]
+        ladders.append(config.survival_scoring)
+        for ladder in ladders:
+            scoring_dict = copy.deepcopy(ladder)
+            scoring_dict[keys.SCALING] = scaling
+            config._compile_multiplier(scoring_dict, domain)
+            try:
+                thresholds = [scoring_dict[keys.THRESHOLDS][tier]
+                              for tier in (keys.EXCELLENT, keys.GOOD, keys.POOR, keys.VERY_POOR)]
+                low, high = min(thresholds), max(thresholds)
+                values = (thresholds
+                          + [t + offset for t in thresholds for offset in (-1e-9, 1e-9, -0.5, 0.5)]
+                          + [rng.uniform(low - 10, high + 10) for _ in range(200)]
+                          + list(range(-2, 36)) + [True, float("nan"), None])
+
+                for rising in (True, False):
+                    for val in values:
+                        compiled = config._get_multiplier(scoring_dict, val, rising)
+                        expected = _interpretive(config, scoring_dict, val, rising)
+                        assert _same(expected, compiled), (scaling, rising, val)
+            finally:
+                config._compiled_multipliers.pop(id(scoring_dict), None)
+
+    def test_missing_value_tier_is_precompiled(self, config):
+        keys = config.keys
+        scoring_dict = copy.deepcopy(config.player_rating_scoring)
+        scoring_dict[keys.MISSING_VALUE_TIER] = keys.VERY_POOR
+        config._compile_multiplier(scoring_dict, None)
+        try:
+            compiled = config._get_multiplier(scoring_dict, None)
+            assert compiled == _interpretive(config, scoring_dict, None, True)
+            assert compiled[1] == keys.VERY_POOR
+        finally:
+            config._compiled_multipliers.pop(id(scoring_dict), None)
+
+
+class TestPostLoadMutation:
+    def test_edited_weight_is_honored(self, config):
+        keys = config.keys
+        scoring_dict = copy.deepcopy(config.wind_scoring)
+        config._compile_multiplier(scoring_dict, None)
+        try:
+            before = config._get_multiplier(scoring_dict, 0.0, rising_thresholds=False)
+            scoring_dict[keys.WEIGHT] = scoring_dict[keys.WEIGHT] * 2
+            config.invalidate_compiled_multipliers(scoring_dict)
+            assert id(scoring_dict) not in config._compiled_multipliers
+            after = config._get_multiplier(scoring_dict, 0.0, rising_thresholds=False)
+            assert after == _interpretive(config, scoring_dict, 0.0, False)
+            assert after[0] != before[0]
+        finally:
+            config._compiled_multipliers.pop(id(scoring_dict), None)
+
+    def test_edited_threshold_is_honored(self, config):
+        keys = config.keys
+        scoring_dict = copy.deepcopy(config.team_quality_scoring)
+        config._compile_multiplier(scoring_dict, (1, 32))
+        try:
+            scoring_dict[keys.THRESHOLDS][keys.EXCELLENT] = 31
+            config.invalidate_compiled_multipliers(scoring_dict)
+            result = config._get_multiplier(scoring_dict, 30, rising_thresholds=False)
+            assert result[1] == keys.EXCELLENT
+            assert result == _interpretive(config, scoring_dict, 30, False)
+        finally:
+            config._compiled_multipliers.pop(id(scoring_dict), None)
+
+    def test_invalidating_everything_leaves_no_compiled_ladder(self):
+        config = ConfigManager(Path("data"))
+        config.invalidate_compiled_multipliers()
+        assert not config._compiled_multipliers
+        assert config.get_adp_multiplier(12.5) == _interpretive(config, config.adp_scoring, 12.5, False)
+
+    def test_invalidating_one_block_keeps_the_others(self, config):
+        scoring_dict = copy.deepcopy(config.adp_scoring)
+        config._compile_multiplier(scoring_dict, None)
+        size = len(config._compiled_multipliers)
+        config.invalidate_compiled_multipliers(scoring_dict)
+        assert len(config._compiled_multipliers) == size - 1
+        assert id(config.adp_scoring) in config._compiled_multipliers
+
+    def test_unknown_block_is_not_cached(self, config):
+        scoring_dict = copy.deepcopy(config.adp_scoring)
+        size = len(config._compiled_multipliers)
+        config._get_multiplier(scoring_dict, 12.5, rising_thresholds=False)
+        assert len(config._compiled_multipliers) == size
+
+
+class TestLinearLookup:
+    def test_nan_and_interior_values(self):
+        lookup = LinearMultiplierLookup(
+            weight=2.0,
+            neutral=(1.0, "NEUTRAL"),
+            missing=(1.0, "NEUTRAL"),
+            thresholds=(0.0, 10.0),
+            anchor_results=((0.5 ** 2.0, "VERY_POOR"), (1.5 ** 2.0, "EXCELLENT")),
+            segments=((0.0, 0.5, 1.0, 10.0, "EXCELLENT"),),
+        )
+        assert lookup.evaluate(float("nan")) == (1.0, "NEUTRAL")
+        assert lookup.evaluate(-1) == (0.25, "VERY_POOR")
+        assert lookup.evaluate(11) == (2.25, "EXCELLENT")
+        assert lookup.evaluate(5.0) == (1.0, "EXCELLENT")
+
+
+class TestMalformedSurvival:
+    def test_block_without_weight_stays_uncompiled_and_raises_lazily(self, config):
+        keys = config.keys
+        scoring_dict = copy.deepcopy(config.survival_scoring)
+        del scoring_dict[keys.WEIGHT]
+        config._compile_multiplier(scoring_dict, None)
+        assert id(scoring_dict) not in config._compiled_multipliers
+        with pytest.raises(KeyError):
+            config._get_multiplier(scoring_dict, 3.0, rising_thresholds=False)
@@ -455,6 +455,23 @@ class TestCanDraft:
 
         assert empty_team.can_draft(invalid_player) is False
 
+    def test_draftable_positions_agree_with_can_draft(self, empty_team, sample_players):
+        """draftable_positions lists exactly the positions can_draft accepts a fresh player at"""
+        def fresh(position):
+            return FantasyPlayer(id=99, name="New", team="KC", position=position, bye_week=7,
+                                 fantasy_points=100.0, injury_status="ACTIVE", drafted_by="", locked=0)
+
+        for player in sample_players[:2] + sample_players[12:14]:   # both QBs, the K and the DST
+            empty_team.draft_player(player)
+
+        draftable = empty_team.draftable_positions()
+        assert "QB" not in draftable and "RB" in draftable
+        for position in ["QB", "RB", "WR", "TE", "K", "DST"]:
+            assert (position in draftable) == empty_team.can_draft(fresh(position))
+
+    def test_full_roster_has_no_draftable_positions(self, full_roster_team):
+        assert full_roster_team.draftable_positions() == []
+
 
 
 class TestDraftPlayer:
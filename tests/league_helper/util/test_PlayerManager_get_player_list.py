@@ -22,6 +22,7 @@ import inspect
 import pytest
 from unittest.mock import Mock
 
+import league_helper.constants as Constants
 from league_helper.util.PlayerManager import PlayerManager
 from utils.FantasyPlayer import FantasyPlayer
 
@@ -45,12 +46,15 @@ def _make_player(player_id, position="QB", score=0.0, fantasy_points=10.0, locke
 def _make_bare_pm(players, can_draft_result=True):
     """
     Construct a minimal PlayerManager exposing only what get_player_list touches,
-    bypassing the heavy __init__ (file loading, config, schedule scaffolding).
+    bypassing the heavy __init__ (file loading, config, schedule scaffolding). The team
+    leaves every position open to the draft pool.
     """
     pm = PlayerManager.__new__(PlayerManager)
     pm.logger = Mock()
     pm.players = players
     pm.can_draft = Mock(return_value=can_draft_result)
+    pm.team = Mock()
+    pm.team.draftable_positions.return_value = list(Constants.ALL_POSITIONS)
     return pm
 
 
@@ -0,0 +1,121 @@
+"""
+Unit tests for PlayerManager's id / position player index.
+
+Verifies:
+- get_player_by_id resolves ids without scanning and returns None for unknown ids
+- the index follows self.players when the list is replaced or grows
+- get_available_players buckets by position, keeps self.players order across positions
+  and reads drafted_by at call time (so direct drafted_by writes are always reflected)
+- the draft candidate pool (get_player_list with can_draft) reads only the positions
+  the team can still draft
+- mark_player_drafted sets drafted_by and leaves the roster alone
+
+Author: Kai Mizuno
+"""
+
+from unittest.mock import Mock
+
+from league_helper.util.PlayerManager import PlayerManager
+from utils.FantasyPlayer import FantasyPlayer
+
+
+def _make_player(player_id, position="RB", drafted_by=""):
+    return FantasyPlayer(
+        id=player_id,
+        name=f"Player {player_id}",
+        team="KC",
+        position=position,
+        drafted_by=drafted_by,
+    )
+
+
+def _make_bare_pm(players):
+    """Minimal PlayerManager bypassing the heavy __init__; the index builds lazily."""
+    pm = PlayerManager.__new__(PlayerManager)
+    pm.logger = Mock()
+    pm.players = players
+    return pm
+
+
+class TestGetPlayerById:
+    def test_returns_matching_player(self):
+        players = [_make_player(1), _make_player(2, "WR")]
+        pm = _make_bare_pm(players)
+        assert pm.get_player_by_id(2) is players[1]
+
+    def test_unknown_id_returns_none(self):
+        pm = _make_bare_pm([_make_player(1)])
+        assert pm.get_player_by_id(99) is None
+
+    def test_follows_replaced_players_list(self):
+        pm = _make_bare_pm([_make_player(1)])
+        assert pm.get_player_by_id(1) is not None
+        replacement = _make_player(2)
+        pm.players = [replacement]
+        assert pm.get_player_by_id(1) is None
+        assert pm.get_player_by_id(2) is replacement
+
+    def test_follows_appended_player(self):
+        pm = _make_bare_pm([_make_player(1)])
+        pm.get_player_by_id(1)
+        added = _make_player(3)
+        pm.players.append(added)
+        assert pm.get_player_by_id(3) is added
+
+    def test_duplicate_id_resolves_to_first_like_a_scan(self):
+        first, second = _make_player(1), _make_player(1, "WR")
+        pm = _make_bare_pm([first, second])
+        assert pm.get_player_by_id(1) is first
+
+
+class TestPositionBuckets:
+    def test_available_players_reflects_direct_drafted_by_writes(self):
+        players = [_make_player(1, "QB"), _make_player(2, "QB"), _make_player(3, "RB")]
+        pm = _make_bare_pm(players)
+        assert pm.get_available_players(["QB"]) == [players[0], players[1]]
+
+        players[0].drafted_by = "Team A"
+        assert pm.get_available_players(["QB"]) == [players[1]]
+
+        players[0].drafted_by = ""
+        assert pm.get_available_players(["QB"]) == [players[0], players[1]]
+        assert pm.get_available_players() == players
+
+    def test_several_positions_merge_in_players_order(self):
+        players = [_make_player(1, "WR"), _make_player(2, "QB"), _make_player(3, "K"),
+                   _make_player(4, "QB"), _make_player(5, "WR")]
+        pm = _make_bare_pm(players)
+        assert pm.get_available_players(["QB", "WR", "QB"]) == [players[0], players[1], players[3], players[4]]
+        assert pm.get_available_players([]) == []
+
+
+class TestDraftCandidatePool:
+    def test_get_player_list_reads_only_draftable_positions(self):
+        players = [_make_player(1, "QB"), _make_player(2, "RB"), _make_player(3, "RB", drafted_by="Team A"),
+                   _make_player(4, "K")]
+        for player in players:
+            player.fantasy_points = 10.0
+        pm = _make_bare_pm(players)
+        pm.team = Mock()
+        pm.team.draftable_positions.return_value = ["RB", "K"]
+        pm.can_draft = Mock(return_value=True)
+
+        assert pm.get_player_list(drafted_vals=[0], can_draft=True) == [players[1], players[3]]
+        assert [p.id for p in pm.can_draft.call_args_list[0].args] == [2]
+        # Other status filters still scan every player.
+        assert pm.get_player_list(drafted_vals=[0]) == [players[0], players[1], players[3]]
+
+
+class TestMarkPlayerDrafted:
+    def test_sets_drafted_by(self):
+        player = _make_player(1)
+        pm = _make_bare_pm([player])
+        assert pm.mark_player_drafted(1, "OPPONENT") is player
+        assert player.drafted_by == "OPPONENT"
+        assert pm.get_available_players(["RB"]) == []
+
+    def test_unknown_id_is_noop(self):
+        player = _make_player(1)
+        pm = _make_bare_pm([player])
+        assert pm.mark_player_drafted(42, "OPPONENT") is None
+        assert player.drafted_by == ""
@@ -0,0 +1,152 @@
+"""
+Tests for TeamDataManager's cached per-week rank tables and memoized team context.
+
+Verifies:
+- advancing with set_current_week yields exactly the rankings a manager built fresh at
+  that week calculates, for every week
+- a week's tables are computed once per (week, window) and then only swapped in, also
+  across managers sharing one cache; a different rolling window gets its own tables
+- cached tables are never modified by later weeks
+- get_team_context and PlayerManager.refresh_team_context match the individual getters
+- replacing the rank dicts or reloading the data is never served stale tables
+
+Author: Kai Mizuno
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from league_helper.constants import DEFENSE_POSITIONS
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.PlayerManager import PlayerManager
+from league_helper.util.SeasonScheduleManager import SeasonScheduleManager
+from league_helper.util.TeamDataManager import TeamDataManager
+from simulation.win_rate.SeasonBundle import SeasonBundle
+from utils.TeamData import NFL_TEAMS
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
+
+
+@pytest.fixture(scope="module")
+def bundle():
+    return SeasonBundle.from_season_folder(REAL_DATA_FOLDER, 18)
+
+
+@pytest.fixture(scope="module")
+def config():
+    return ConfigManager(Path("data"))
+
+
+def _manager(bundle, config, week=1, cache=None):
+    return TeamDataManager(
+        REAL_DATA_FOLDER, config, SeasonScheduleManager(REAL_DATA_FOLDER, schedule=bundle.schedule),
+        week, team_weekly_data=bundle.team_weekly_data, dst_player_data=bundle.dst_player_data,
+        rank_table_cache=cache,
+    )
+
+
+def _ranks(manager):
+    return (manager.offensive_ranks, manager.defensive_ranks, manager.position_ranks,
+            manager.dst_fantasy_ranks, manager.team_data_cache)
+
+
+def _live_context(manager, team, position):
+    defensive = (manager.get_team_dst_fantasy_rank(team) if position in DEFENSE_POSITIONS
+                 else manager.get_team_defensive_rank(team))
+    return (manager.get_team_offensive_rank(team), defensive,
+            manager.get_rank_difference(team, position))
+
+
+class TestWeekTables:
+    def test_advanced_manager_matches_fresh_manager_every_week(self, bundle, config):
+        advanced = _manager(bundle, config)
+        for week in range(1, 18):
+            advanced.set_current_week(week)
+            assert _ranks(advanced) == _ranks(_manager(bundle, config, week))
+
+    def test_each_week_computed_once_across_managers_sharing_a_cache(self, bundle, config):
+        cache = {}
+        first = _manager(bundle, config, cache=cache)
+        with patch.object(TeamDataManager, "_compute_rank_tables",
+                          wraps=first._compute_rank_tables) as compute:
+            for week in range(1, 18):
+                first.set_current_week(week)
+            computed_by_first = compute.call_count
+
+            second = _manager(bundle, config, cache=cache)
+            for week in (1, 9, 17, 9):
+                second.set_current_week(week)
+        assert computed_by_first == 16
+        assert compute.call_count == computed_by_first
+        assert second.offensive_ranks is cache[(9, config.get_team_quality_min_weeks(),
+                                                config.get_matchup_min_weeks())].offensive_ranks
+
+    def test_window_is_part_of_the_key(self, bundle, config):
+        cache = {}
+        _manager(bundle, config, 10, cache)
+        narrow = ConfigManager(Path("data"))
+        narrow.team_quality_scoring[narrow.keys.MIN_WEEKS] = 2
+        manager = _manager(bundle, narrow, 10, cache)
+        assert len(cache) == 2
+        assert _ranks(manager) == _ranks(_manager(bundle, narrow, 10))
+
+    def test_cached_tables_are_not_modified_by_later_weeks(self, bundle, config):
+        cache = {}
+        manager = _manager(bundle, config, 1, cache)
+        manager.set_current_week(8)
+        key = next(k for k in cache if k[0] == 8)
+        snapshot = {team: dict(ranks) for team, ranks in cache[key].position_ranks.items()}
+        offensive = dict(cache[key].offensive_ranks)
+        for week in range(9, 18):
+            manager.set_current_week(week)
+        assert cache[key].offensive_ranks == offensive
+        assert cache[key].position_ranks == snapshot
+
+    def test_early_weeks_are_neutral_for_every_team(self, bundle, config):
+        manager = _manager(bundle, config, 1)
+        assert set(manager.offensive_ranks) == set(NFL_TEAMS)
+        assert set(manager.dst_fantasy_ranks.values()) == {16}
+
+
+class TestTeamContext:
+    @pytest.mark.parametrize("week", [1, 7, 15])
+    def test_matches_individual_getters(self, bundle, config, week):
+        manager = _manager(bundle, config, week)
+        for team in NFL_TEAMS:
+            for position in POSITIONS:
+                expected = _live_context(manager, team, position)
+                assert manager.get_team_context(team, position) == expected
+                assert manager.get_team_context(team, position) == expected
+
+    def test_refresh_team_context_matches_getters_as_weeks_advance(self, bundle, config):
+        manager = _manager(bundle, config)
+        pm = PlayerManager(REAL_DATA_FOLDER, config, manager, manager.season_schedule_manager,
+                           fast_scoring=True, player_records=bundle.player_records,
+                           game_data=bundle.games)
+        for week in (3, 8, 16):
+            manager.set_current_week(week)
+            pm.refresh_team_context()
+            for player in pm.players:
+                assert (player.team_offensive_rank, player.team_defensive_rank,
+                        player.matchup_score) == _live_context(manager, player.team, player.position)
+
+    def test_replaced_rank_dicts_are_read_live(self, bundle, config):
+        manager = _manager(bundle, config, 10)
+        team = NFL_TEAMS[0]
+        manager.get_team_context(team, "QB")
+        manager.offensive_ranks = {t: 1 for t in NFL_TEAMS}
+        assert manager.get_team_context(team, "QB")[0] == 1
+
+    def test_reload_is_not_served_stale_tables(self, bundle, config, tmp_path):
+        cache = {}
+        manager = _manager(bundle, config, 10, cache)
+        manager.data_folder = tmp_path
+        manager.team_data_folder = tmp_path / "team_data"
+        manager.reload_team_data()
+        assert manager.offensive_ranks == {}
+        assert manager.get_team_context(NFL_TEAMS[0], "QB") == (None, None, None)
+        assert len(cache) == 1
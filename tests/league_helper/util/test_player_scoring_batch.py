@@ -0,0 +1,175 @@
+"""
+Parity tests for the vectorized batch scoring API.
+
+Verifies:
+- ConfigManager.get_multipliers_batch equals _get_multiplier element for element
+  (multiplier bits AND label) for every ladder, in both SCALING modes and both
+  threshold directions, including at-anchor, clamped, None and NaN inputs
+- PlayerScoringCalculator.score_players_batch equals score_player for every player of
+  a real season's pool (scores, projected_points, reasons, and p.score) under the
+  draft, draft + survival, weekly-lineup and default flag sets
+- PlayerColumns keeps a None input distinct from a NaN one
+
+Author: Kai Mizuno
+"""
+
+import copy
+import math
+import random
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.batch_scoring import PlayerColumns
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+from utils.FantasyPlayer import FantasyPlayer
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+DRAFT_FLAGS = dict(
+    adp=True, player_rating=True, team_quality=False, performance=False, matchup=False,
+    schedule=False, draft_round=3, bye=True, injury=True, use_draft_normalization=True,
+    nfl_team_penalty=True,
+)
+WEEKLY_FLAGS = dict(
+    use_weekly_projection=True, adp=False, player_rating=True, team_quality=True,
+    performance=True, matchup=True, schedule=True, bye=False, injury=False,
+    temperature=True, wind=True, location=True,
+)
+
+
+@pytest.fixture(scope="module")
+def config():
+    return ConfigManager(Path("data"))
+
+
+@pytest.fixture(scope="module")
+def base_config_dict(config):
+    return {
+        "config_name": config.config_name,
+        "description": config.description,
+        "parameters": dict(config.parameters),
+    }
+
+
+@pytest.fixture(scope="module")
+def league(base_config_dict):
+    league = SimulatedLeague(base_config_dict, REAL_DATA_FOLDER, seed=3)
+    yield league
+    league.cleanup()
+
+
+def _same(expected, actual):
+    return expected == actual or (math.isnan(expected) and math.isnan(actual))
+
+
+class TestGetMultipliersBatch:
+    @pytest.mark.parametrize("scaling", ["BUCKETED", "LINEAR"])
+    @pytest.mark.parametrize("rising", [True, False])
+    def test_matches_scalar_multiplier(self, config, scaling, rising):
+        keys = config.keys
+        rng = random.Random(7)
+        ladders = [scoring_dict for _, scoring_dict, _ in config._multiplier_factors()]
+        ladders.append(config.survival_scoring)
+        for ladder in ladders:
+            scoring_dict = copy.deepcopy(ladder)
+            scoring_dict[keys.SCALING] = scaling
+            thresholds = [scoring_dict[keys.THRESHOLDS][tier]
+                          for tier in (keys.EXCELLENT, keys.GOOD, keys.POOR, keys.VERY_POOR)]
+            low, high = min(thresholds), max(thresholds)
+            values = (thresholds
+                      + [t + offset for t in thresholds for offset in (-1e-9, 1e-9, -0.5, 0.5)]
+                      + [rng.uniform(low - 10, high + 10) for _ in range(200)]
+                      + [float("nan"), None, 0, 1, 32])
+
+            multipliers, labels = config.get_multipliers_batch(
+                scoring_dict,
+                [np.nan if v is None else v for v in values],
+                rising_thresholds=rising,
+                missing=[v is None for v in values],
+            )
+
+            for i, value in enumerate(values):
+                expected_multiplier, expected_label = config._get_multiplier(scoring_dict, value, rising)
+                assert _same(expected_multiplier, multipliers[i]), (scaling, rising, value)
+                assert labels[i] == expected_label, (scaling, rising, value)
+
+    def test_missing_value_tier_applies_to_missing_mask_only(self, config):
+        keys = config.keys
+        scoring_dict = copy.deepcopy(config.player_rating_scoring)
+        scoring_dict[keys.MISSING_VALUE_TIER] = keys.VERY_POOR
+
+        multipliers, labels = config.get_multipliers_batch(
+            scoring_dict, [np.nan, np.nan], missing=[True, False])
+
+        assert (multipliers[0], labels[0]) == config._get_multiplier(scoring_dict, None)
+        assert (multipliers[1], labels[1]) == (1.0, keys.NEUTRAL)
+
+
+class TestScorePlayersBatch:
+    @pytest.mark.parametrize("week", [1, 6])
+    @pytest.mark.parametrize("flags", [
+        DRAFT_FLAGS,
+        dict(DRAFT_FLAGS, picks_until_next_turn=9),
+        WEEKLY_FLAGS,
+        {},
+    ], ids=["draft", "draft_survival", "weekly", "defaults"])
+    def test_matches_score_player(self, league, week, flags):
+        for team in league.teams:
+            team.config.current_nfl_week = week
+        league._load_week_data(week)
+        pm = league.teams[0].projected_pm
+        calculator = pm.scoring_calculator
+        calculator.fast_scoring = False  # reasons are compared too
+        players = pm.players
+        roster = players[:7]
+
+        scores_before = [p.score for p in players]
+        expected = [calculator.score_player(p, roster, **flags) for p in players]
+        expected_p_scores = [p.score for p in players]
+
+        for p, score in zip(players, scores_before):
+            p.score = score
+        result = calculator.score_players_batch(players, roster, include_reasons=True, **flags)
+
+        assert result.scores.tolist() == [scored.score for scored in expected]
+        assert result.projected_points.tolist() == [scored.projected_points for scored in expected]
+        assert result.reasons == [scored.reason for scored in expected]
+        assert [p.score for p in players] == expected_p_scores
+
+    def test_reasons_skipped_by_default_and_columns_reusable(self, league):
+        for team in league.teams:
+            team.config.current_nfl_week = 1
+        league._load_week_data(1)
+        pm = league.teams[0].projected_pm
+        columns = PlayerColumns.from_players(pm.players)
+
+        first = pm.scoring_calculator.score_players_batch(columns, [], **DRAFT_FLAGS)
+        second = pm.scoring_calculator.score_players_batch(columns, [], **DRAFT_FLAGS)
+
+        assert first.reasons is None
+        np.testing.assert_array_equal(first.scores, second.scores)
+
+
+class TestPlayerColumns:
+    def test_none_and_nan_are_distinct(self):
+        players = [
+            FantasyPlayer(id=1, name="A", team="KC", position="QB", average_draft_position=None),
+            FantasyPlayer(id=2, name="B", team="KC", position="QB", average_draft_position=float("nan")),
+            FantasyPlayer(id=3, name="C", team="KC", position="QB", average_draft_position=12.5),
+        ]
+        columns = PlayerColumns.from_players(players)
+        assert columns.adp_missing.tolist() == [True, False, False]
+        assert np.isnan(columns.adp[:2]).all()
+        assert columns.adp[2] == 12.5
+
+    def test_hybrid_points_switch_at_current_week(self):
+        player = FantasyPlayer(id=1, name="A", team="KC", position="QB",
+                               projected_points=[1.0] * 17, actual_points=[2.0] * 17)
+        hybrid = PlayerColumns.from_players([player]).hybrid_points(4)
+        assert hybrid[0].tolist() == [2.0] * 3 + [1.0] * 14
+        assert hybrid[0].tolist() == player.get_weekly_projections(Mock(current_nfl_week=4))
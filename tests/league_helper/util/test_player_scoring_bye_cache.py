@@ -0,0 +1,184 @@
+"""
+Tests for the Step 9 bye-week median cache and per-roster conflict aggregate.
+
+Verifies:
+- the cached penalty equals ConfigManager.get_bye_week_penalty over freshly computed
+  medians, bit for bit, for candidates off and on the roster, across weeks
+- a roster's medians are computed once and shared by every candidate scored against it
+- PlayerManager.set_player_data (a data-version bump) and a week change invalidate the cache
+- arrays edited in place are never served a stale median, and a roster grown or
+  swapped in place is re-aggregated
+- get_bye_week_penalty_from_totals matches get_bye_week_penalty
+
+Author: Kai Mizuno
+"""
+
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+from utils.FantasyPlayer import FantasyPlayer
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+
+@pytest.fixture(scope="module")
+def league():
+    cm = ConfigManager(Path("data"))
+    config_dict = {
+        "config_name": cm.config_name,
+        "description": cm.description,
+        "parameters": dict(cm.parameters),
+    }
+    league = SimulatedLeague(config_dict, REAL_DATA_FOLDER, seed=4)
+    yield league
+    league.cleanup()
+
+
+def _load_week(league, week):
+    for team in league.teams:
+        team.config.current_nfl_week = week
+    league._load_week_data(week)
+    return league.teams[0].projected_pm
+
+
+def _uncached_penalty(config, p, roster):
+    """The pre-cache Step 9: walk the roster and compute every median fresh."""
+    week = config.current_nfl_week
+    conflicts = [r for r in roster
+                 if r.id != p.id and r.bye_week is not None and r.bye_week >= week
+                 and r.bye_week == p.bye_week]
+    same = [r for r in conflicts if r.position == p.position]
+    diff = [r for r in conflicts if r.position != p.position]
+    return config.get_bye_week_penalty(same, diff), len(same), len(diff)
+
+
+class TestParity:
+    @pytest.mark.parametrize("week", [1, 6, 12])
+    def test_matches_uncached_penalty(self, league, week):
+        pm = _load_week(league, week)
+        calculator = pm.scoring_calculator
+        config = calculator.config
+        rng = random.Random(week)
+        for _ in range(10):
+            roster = rng.sample(pm.players, 15)
+            for p in rng.sample(pm.players, 60) + roster[:3]:
+                if p.bye_week is None or p.bye_week < week:
+                    continue
+                penalty = _uncached_penalty(config, p, roster)[0]
+                score, _ = calculator._apply_bye_week_penalty(p, 50.0, roster)
+                assert score == 50.0 - penalty
+
+    def test_reason_counts_unchanged(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        roster = pm.players[:15]
+        candidate = next(p for p in pm.players[15:]
+                         if any(r.bye_week == p.bye_week for r in roster))
+        penalty, same_count, diff_count = _uncached_penalty(calculator.config, candidate, roster)
+        calculator.fast_scoring = False
+        try:
+            _, reason = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+        finally:
+            calculator.fast_scoring = True
+        assert reason == (f"Bye Overlaps: {same_count} same-position, "
+                          f"{diff_count} different-position ({-penalty:.1f} pts)")
+
+
+class TestCaching:
+    def test_roster_medians_computed_once_for_all_candidates(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        roster = pm.players[:15]
+        config = calculator.config
+        with patch.object(config, "calculate_player_median",
+                          wraps=config.calculate_player_median) as median:
+            for p in pm.players[15:200]:
+                calculator._apply_bye_week_penalty(p, 0.0, roster)
+        assert median.call_count <= len(roster)
+
+    def test_set_player_data_invalidates(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        roster = pm.players[:15]
+        target = roster[0]
+        candidate = FantasyPlayer(id=-1, name="Candidate", team="KC", position=target.position,
+                                  bye_week=target.bye_week)
+        before, _ = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+
+        pm.set_player_data({target.id: {"projected_points": [40.0] * 17,
+                                        "actual_points": [40.0] * 17}})
+        after, _ = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+
+        assert after == -_uncached_penalty(calculator.config, candidate, roster)[0]
+        assert after != before
+        _load_week(league, 1)
+
+    def test_week_change_invalidates(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        roster = pm.players[:15]
+        candidate = FantasyPlayer(id=-1, name="Candidate", team="KC", position=roster[0].position,
+                                  bye_week=14)
+        calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+
+        calculator.config.current_nfl_week = 9
+        try:
+            score, _ = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+            assert score == -_uncached_penalty(calculator.config, candidate, roster)[0]
+        finally:
+            calculator.config.current_nfl_week = 1
+
+    def test_grown_roster_is_rebuilt(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        roster = pm.players[:14]
+        added = pm.players[14]
+        candidate = FantasyPlayer(id=-1, name="Candidate", team="KC", position=added.position,
+                                  bye_week=added.bye_week)
+        calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+
+        roster.append(added)
+        score, _ = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+        assert score == -_uncached_penalty(calculator.config, candidate, roster)[0]
+
+    def test_same_length_swap_is_rebuilt(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        roster = pm.players[:15]
+        incoming = next(p for p in pm.players[15:]
+                        if p.bye_week is not None and p.bye_week != roster[0].bye_week
+                        and calculator.config.calculate_player_median(p) > 0)
+        candidate = FantasyPlayer(id=-1, name="Candidate", team="KC", position=incoming.position,
+                                  bye_week=incoming.bye_week)
+        before, _ = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+
+        roster[0] = incoming
+        score, _ = calculator._apply_bye_week_penalty(candidate, 0.0, roster)
+        assert score == -_uncached_penalty(calculator.config, candidate, roster)[0]
+        assert score != before
+
+    def test_in_place_edit_is_not_served_stale(self, league):
+        pm = _load_week(league, 1)
+        calculator = pm.scoring_calculator
+        player = FantasyPlayer(id=-2, name="Edited", team="KC", position="RB",
+                               projected_points=[10.0] * 17, actual_points=[10.0] * 17)
+        assert calculator._bye_week_median(player) == 10.0
+        player.projected_points[:] = [20.0] * 17
+        assert calculator._bye_week_median(player) == 20.0
+
+
+class TestPenaltyFromTotals:
+    def test_matches_list_form(self, league):
+        pm = _load_week(league, 1)
+        config = pm.scoring_calculator.config
+        same, diff = pm.players[:3], pm.players[3:5]
+        same_total = sum(config.calculate_player_median(p) for p in same)
+        diff_total = sum(config.calculate_player_median(p) for p in diff)
+        assert (config.get_bye_week_penalty_from_totals(same_total, diff_total)
+                == config.get_bye_week_penalty(same, diff))
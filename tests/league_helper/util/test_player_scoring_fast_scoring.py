@@ -0,0 +1,94 @@
+"""
+Tests for PlayerScoringCalculator's fast_scoring (simulation) mode.
+
+Verifies:
+- fast_scoring leaves every score and projected_points unchanged and returns no reasons
+- no debug message is formatted in fast_scoring mode, even with a DEBUG logger
+- the interactive default still builds reasons
+- PlayerManager threads the flag through, and the simulation leagues enable it
+
+Author: Kai Mizuno
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+FLAG_SETS = [
+    dict(adp=True, player_rating=True, team_quality=False, performance=False, matchup=False,
+         schedule=False, draft_round=3, bye=True, injury=True, use_draft_normalization=True,
+         nfl_team_penalty=True, picks_until_next_turn=9),
+    dict(use_weekly_projection=True, adp=False, player_rating=True, team_quality=True,
+         performance=True, matchup=True, schedule=True, bye=False, injury=False,
+         temperature=True, wind=True, location=True),
+]
+
+
+@pytest.fixture(scope="module")
+def league():
+    cm = ConfigManager(Path("data"))
+    config_dict = {
+        "config_name": cm.config_name,
+        "description": cm.description,
+        "parameters": dict(cm.parameters),
+    }
+    league = SimulatedLeague(config_dict, REAL_DATA_FOLDER, seed=5)
+    for team in league.teams:
+        team.config.current_nfl_week = 6
+    league._load_week_data(6)
+    yield league
+    league.cleanup()
+
+
+class TestFastScoring:
+    @pytest.mark.parametrize("flags", FLAG_SETS, ids=["draft", "weekly"])
+    def test_scores_unchanged_and_reasons_empty(self, league, flags):
+        pm = league.teams[0].projected_pm
+        calculator = pm.scoring_calculator
+        roster = pm.players[:7]
+        try:
+            calculator.fast_scoring = False
+            interactive = [calculator.score_player(p, roster, **flags) for p in pm.players]
+            calculator.fast_scoring = True
+            fast = [calculator.score_player(p, roster, **flags) for p in pm.players]
+        finally:
+            calculator.fast_scoring = True
+
+        assert [s.score for s in fast] == [s.score for s in interactive]
+        assert [s.projected_points for s in fast] == [s.projected_points for s in interactive]
+        assert all(s.reason == [] for s in fast)
+        assert any(s.reason for s in interactive)
+
+    @pytest.mark.parametrize("flags", FLAG_SETS, ids=["draft", "weekly"])
+    def test_no_debug_messages_formatted(self, league, flags):
+        pm = league.teams[0].projected_pm
+        calculator = pm.scoring_calculator
+        original_logger = calculator.logger
+        calculator.logger = Mock()
+        calculator.logger.isEnabledFor.return_value = True
+        try:
+            calculator.fast_scoring = True
+            for p in pm.players[:50]:
+                calculator.score_player(p, pm.players[:7], **flags)
+            assert not calculator.logger.debug.called
+
+            calculator.fast_scoring = False
+            calculator.score_player(pm.players[0], pm.players[:7], **flags)
+            assert calculator.logger.debug.called
+        finally:
+            calculator.logger = original_logger
+            calculator.fast_scoring = True
+
+
+class TestWiring:
+    def test_simulation_player_managers_use_fast_scoring(self, league):
+        for team in league.teams:
+            assert team.projected_pm.scoring_calculator.fast_scoring is True
+            assert team.actual_pm.scoring_calculator.fast_scoring is True
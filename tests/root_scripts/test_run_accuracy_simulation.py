@@ -1087,3 +1087,35 @@ class TestD84ExcludeLowCoverageWeeksFlag:
         kwargs = self._manager_kwargs(tmp_path, ['--exclude-low-coverage-weeks'])
 
         assert kwargs['exclude_low_coverage_weeks'] is True
+
+    def test_the_eval_memo_is_on_by_default(self, tmp_path):
+        assert self._manager_kwargs(tmp_path, [])['use_eval_memo'] is True
+
+    def test_no_eval_memo_reaches_the_manager_as_false(self, tmp_path):
+        assert self._manager_kwargs(tmp_path, ['--no-eval-memo'])['use_eval_memo'] is False
+
+    def test_season_shards_are_on_by_default(self, tmp_path):
+        assert self._manager_kwargs(tmp_path, [])['shard_seasons'] is True
+
+    def test_no_season_shards_reaches_the_manager_as_false(self, tmp_path):
+        assert self._manager_kwargs(tmp_path, ['--no-season-shards'])['shard_seasons'] is False
+
+    def test_racing_is_off_by_default(self, tmp_path):
+        kwargs = self._manager_kwargs(tmp_path, [])
+        assert kwargs['racing'] is False
+        assert kwargs['racing_fraction'] == 0.25
+        assert kwargs['racing_confidence'] == 0.95
+
+    def test_racing_flags_reach_the_manager(self, tmp_path):
+        kwargs = self._manager_kwargs(
+            tmp_path, ['--racing', '--racing-fraction', '0.5', '--racing-confidence', '0.99']
+        )
+        assert kwargs['racing'] is True
+        assert kwargs['racing_fraction'] == 0.5
+        assert kwargs['racing_confidence'] == 0.99
+
+    def test_horizon_restricted_is_off_by_default(self, tmp_path):
+        assert self._manager_kwargs(tmp_path, [])['horizon_restricted'] is False
+
+    def test_horizon_restricted_reaches_the_manager(self, tmp_path):
+        assert self._manager_kwargs(tmp_path, ['--horizon-restricted'])['horizon_restricted'] is True
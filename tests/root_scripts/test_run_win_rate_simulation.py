@@ -224,6 +224,8 @@ class TestMainFlow:
                 strategy_filter=None,
                 naive_opponents=False,
                 seed=None,
+                use_processes=True,
+                draft_log_cache=False,
             )
 
     def test_keyboard_interrupt_exits_zero(self, tmp_path):
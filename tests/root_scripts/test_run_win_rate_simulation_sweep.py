@@ -24,7 +24,8 @@ def _sweep_args(tmp_path):
         sims=10, workers=2, endless=False, strategy=None,
         log_level="INFO", enable_log_file=False, sweep=True,
         num_values=5, promote=False, fresh=False, naive_opponents=False,
-        seed=None,
+        seed=None, threads=False, draft_log_cache=False, batch_candidates=False,
+        sequential_block=None,
     )
 
 
@@ -201,7 +202,8 @@ class TestSweepDispatch:
         # T61/D3: the pre-flight count (17 weeks x 10 sims x 1 season = 170) is plumbed through.
         MockTour.assert_called_once_with(
             MockEval.return_value, MockStore.return_value,
-            num_values=args.num_values, games_per_evaluation=170,
+            num_values=args.num_values, games_per_evaluation=170, batch_candidates=False,
+            sequential_block=None,
         )
         run_args, run_kwargs = MockTour.return_value.run.call_args
         assert run_args == ([("1_a.json", [{"QB": "P"}])], {"PRIMARY_BONUS": 67})
@@ -642,6 +644,46 @@ class TestSweepStarvationPreflight:
         )
 
 
+class TestBatchCandidatesFlag:
+    """--batch-candidates parses as a store_true flag and reaches the SweepTournament."""
+
+    def test_default_is_off(self):
+        assert rws._build_parser().parse_args([]).batch_candidates is False
+        assert rws._build_parser().parse_args(["--batch-candidates"]).batch_candidates is True
+
+    def test_flag_reaches_the_tournament(self, tmp_path):
+        from contextlib import ExitStack
+        from pathlib import Path
+        args = _sweep_args(tmp_path)
+        args.batch_candidates = True
+        with ExitStack() as stack:
+            for p in TestSweepDispatch._patches_for_run(self):
+                stack.enter_context(p)
+            MockTour = stack.enter_context(patch(f"{MODULE}.SweepTournament"))
+            rws._run_sweep_mode(args, Path(args.data), Mock())
+        assert MockTour.call_args.kwargs["batch_candidates"] is True
+
+
+class TestSequentialBlockFlag:
+    """--sequential-block parses as an optional int and reaches the SweepTournament."""
+
+    def test_default_is_off(self):
+        assert rws._build_parser().parse_args([]).sequential_block is None
+        assert rws._build_parser().parse_args(["--sequential-block", "4"]).sequential_block == 4
+
+    def test_flag_reaches_the_tournament(self, tmp_path):
+        from contextlib import ExitStack
+        from pathlib import Path
+        args = _sweep_args(tmp_path)
+        args.sequential_block = 2
+        with ExitStack() as stack:
+            for p in TestSweepDispatch._patches_for_run(self):
+                stack.enter_context(p)
+            MockTour = stack.enter_context(patch(f"{MODULE}.SweepTournament"))
+            rws._run_sweep_mode(args, Path(args.data), Mock())
+        assert MockTour.call_args.kwargs["sequential_block"] == 2
+
+
 class TestSweepHonorsStrategyFilter:
     """--strategy restricts the sweep's strategy set, not just strategy-only mode.
 
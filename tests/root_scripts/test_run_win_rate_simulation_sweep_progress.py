@@ -26,7 +26,8 @@ def _sweep_args(tmp_path):
         sims=10, workers=2, endless=False, strategy=None,
         log_level="INFO", enable_log_file=False, sweep=True,
         num_values=5, promote=False, fresh=False, naive_opponents=False,
-        seed=None,
+        seed=None, threads=False, draft_log_cache=False, batch_candidates=False,
+        sequential_block=None,
     )
 
 
@@ -0,0 +1,122 @@
+"""
+Unit tests for the --threads CLI flag and the worker-kind wiring of both run modes.
+
+Covers the CLI surface: --threads parses to args.threads (store_true; absent -> False), and
+main() / _run_sweep_mode() pass use_processes=not args.threads to DraftStrategyOrchestrator and
+CombinationEvaluator, and close them (stopping the persistent worker pool) when the run ends.
+--draft-log-cache is wired the same way (draft_log_cache=args.draft_log_cache).
+The runner-side defaults are covered in test_CombinationEvaluator.py,
+test_ParallelLeagueRunner_throughput.py and test_draft_log_cache.py.
+
+Author: Kai Mizuno
+"""
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+import run_win_rate_simulation as rws
+from run_win_rate_simulation import _build_parser, main
+from tests.root_scripts.test_run_win_rate_simulation_sweep import _sweep_args
+
+
+MODULE = "run_win_rate_simulation"
+
+
+class TestThreadsFlagParsing:
+    """--threads is a store_true flag defaulting to False (worker processes)."""
+
+    def test_threads_default_is_false(self):
+        args = _build_parser().parse_args([])
+        assert args.threads is False
+
+    def test_threads_store_true(self):
+        args = _build_parser().parse_args(["--threads"])
+        assert args.threads is True
+
+    def test_draft_log_cache_flag(self):
+        assert _build_parser().parse_args([]).draft_log_cache is False
+        assert _build_parser().parse_args(["--draft-log-cache"]).draft_log_cache is True
+
+
+class TestStrategyModeWorkers:
+    """main() chooses the orchestrator's worker kind from --threads and always closes it."""
+
+    def _run_main(self, tmp_path, extra_argv, run_side_effect=None):
+        with (
+            patch("sys.argv", ["prog", "--data", str(tmp_path), *extra_argv]),
+            patch(f"{MODULE}.setup_logger"),
+            patch(f"{MODULE}.get_logger") as mock_get_logger,
+            patch(f"{MODULE}.WinRateMetaDataManager") as mock_mdm_cls,
+            patch(f"{MODULE}.DraftStrategyOrchestrator") as mock_orch_cls,
+        ):
+            mock_get_logger.return_value = MagicMock()
+            mock_mdm_cls.return_value.get_all_strategies.return_value = {}
+            mock_orch_cls.return_value.run.side_effect = run_side_effect
+            try:
+                main()
+            except SystemExit:
+                pass
+        return mock_orch_cls
+
+    def test_processes_by_default(self, tmp_path):
+        mock_orch_cls = self._run_main(tmp_path, [])
+        assert mock_orch_cls.call_args.kwargs["use_processes"] is True
+        mock_orch_cls.return_value.close.assert_called_once()
+
+    def test_threads_flag_selects_threads(self, tmp_path):
+        mock_orch_cls = self._run_main(tmp_path, ["--threads"])
+        assert mock_orch_cls.call_args.kwargs["use_processes"] is False
+
+    def test_draft_log_cache_flag_reaches_orchestrator(self, tmp_path):
+        assert self._run_main(tmp_path, []).call_args.kwargs["draft_log_cache"] is False
+        assert self._run_main(tmp_path, ["--draft-log-cache"]).call_args.kwargs["draft_log_cache"] is True
+
+    @pytest.mark.parametrize("error", [KeyboardInterrupt(), FileNotFoundError("missing")])
+    def test_orchestrator_closed_on_early_exit(self, tmp_path, error):
+        mock_orch_cls = self._run_main(tmp_path, [], run_side_effect=error)
+        mock_orch_cls.return_value.close.assert_called_once()
+
+
+class TestSweepModeWorkers:
+    """_run_sweep_mode() chooses the evaluator's worker kind from --threads and always closes it."""
+
+    def _run_sweep(self, tmp_path, threads, run_side_effect=None, draft_log_cache=False):
+        args = _sweep_args(tmp_path)
+        args.threads = threads
+        args.draft_log_cache = draft_log_cache
+        triples = [("1_a.json", [{"QB": "P"}], "A")]
+        with patch(f"{MODULE}.load_valid_strategies", return_value=(triples, 0)), \
+             patch(f"{MODULE}.CombinationEvaluator") as MockEval, \
+             patch(f"{MODULE}.extract_draft_param_values", return_value={"PRIMARY_BONUS": 67}), \
+             patch(f"{MODULE}.SweepResultsManager") as MockStore, \
+             patch(f"{MODULE}.SweepTournament") as MockTour, \
+             patch(f"{MODULE}.rank_combinations", return_value=[]), \
+             patch(f"{MODULE}.format_summary", return_value="summary"), \
+             patch(f"{MODULE}.write_sweep_report"):
+            MockEval.return_value.base_config = {"parameters": {}}
+            MockEval.return_value.season_count = 1
+            MockStore.return_value.get_all_combinations.return_value = {}
+            MockTour.return_value.run.side_effect = run_side_effect
+            try:
+                rws._run_sweep_mode(args, Path(args.data), Mock())
+            except SystemExit:
+                pass
+        return MockEval
+
+    def test_processes_by_default(self, tmp_path):
+        MockEval = self._run_sweep(tmp_path, threads=False)
+        assert MockEval.call_args.kwargs["use_processes"] is True
+        MockEval.return_value.close.assert_called_once()
+
+    def test_threads_flag_selects_threads(self, tmp_path):
+        MockEval = self._run_sweep(tmp_path, threads=True)
+        assert MockEval.call_args.kwargs["use_processes"] is False
+
+    def test_draft_log_cache_flag_reaches_evaluator(self, tmp_path):
+        MockEval = self._run_sweep(tmp_path, threads=False, draft_log_cache=True)
+        assert MockEval.call_args.kwargs["draft_log_cache"] is True
+
+    def test_evaluator_closed_on_interrupt(self, tmp_path):
+        MockEval = self._run_sweep(tmp_path, threads=False, run_side_effect=KeyboardInterrupt())
+        MockEval.return_value.close.assert_called_once()
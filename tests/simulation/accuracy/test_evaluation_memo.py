@@ -0,0 +1,165 @@
+"""
+Unit Tests for the Persistent Config-Evaluation Memo
+
+Covers simulation/accuracy/evaluation_memo and its use by ParallelAccuracyRunner:
+- results round-trip the payload exactly and come back as fresh objects
+- the key depends on the parameters only (not name, description or _eval_metadata),
+  the horizons of a horizon-restricted evaluation, and the evaluation context:
+  season files, excluded weeks and code
+- a runner with a memo evaluates each distinct config once, serves stored configs
+  without dispatching (also from a new memo on the same file, as after a resume), and
+  returns the same results a runner without a memo does
+
+Author: Kai Mizuno
+"""
+
+import copy
+import os
+from unittest.mock import patch
+
+import pytest
+
+from simulation.accuracy import ParallelAccuracyRunner as runner_module
+from simulation.accuracy import evaluation_memo as memo_module
+from simulation.accuracy.AccuracyCalculator import AccuracyResult
+from simulation.accuracy.ParallelAccuracyRunner import ParallelAccuracyRunner
+from simulation.accuracy.accuracy_types import RankingMetrics
+from simulation.accuracy.evaluation_memo import (
+    MEMO_FILENAME, EvaluationMemo, results_from_payload, results_to_payload,
+)
+from tests.simulation.test_ParallelAccuracyRunner import (
+    build_f05_config_dict, create_mock_historical_season_f05,
+)
+
+
+@pytest.fixture
+def season(tmp_path):
+    create_mock_historical_season_f05(tmp_path / "sim_data", "2024")
+    return tmp_path / "sim_data" / "2024"
+
+
+@pytest.fixture(autouse=True)
+def empty_worker_cache():
+    with patch.dict(runner_module._WORKER_SEASONS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FOLDERS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_ACTUALS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FACTORS, clear=True):
+        yield
+
+
+def _memo(tmp_path, season, excluded=None):
+    return EvaluationMemo(tmp_path / MEMO_FILENAME, [season], excluded)
+
+
+def _summary(results):
+    return {horizon: results_to_payload({horizon: result}) for horizon, result in results.items()}
+
+
+class TestPayload:
+    def test_round_trip_is_exact(self):
+        metrics = RankingMetrics(0.1 + 0.2, None, 1 / 3, 0.7, -0.123456789012345)
+        results = {
+            'week_1_5': AccuracyResult(
+                mae=4.123456789, player_count=10, total_error=41.23456789,
+                overall_metrics=metrics, by_position={'QB': metrics},
+                weeks_evaluated=4, weeks_requested=5, per_season_pairwise={'2024': 0.6},
+            ),
+            'week_6_9': AccuracyResult(mae=0.0, player_count=0, total_error=0.0),
+        }
+        restored = results_from_payload(results_to_payload(results))
+        for horizon, result in results.items():
+            assert vars(restored[horizon]) == vars(result)
+        assert restored['week_1_5'].overall_metrics == metrics
+        assert restored['week_6_9'].overall_metrics is None
+
+    def test_each_rebuild_is_a_new_object(self):
+        payload = results_to_payload({'week_1_5': AccuracyResult(mae=1.0, player_count=1, total_error=1.0)})
+        assert results_from_payload(payload)['week_1_5'] is not results_from_payload(payload)['week_1_5']
+
+
+class TestKey:
+    def test_bookkeeping_fields_do_not_change_the_key(self, tmp_path, season):
+        memo = _memo(tmp_path, season)
+        config = build_f05_config_dict()
+        renamed = copy.deepcopy(config)
+        renamed['config_name'] = 'other'
+        renamed['description'] = 'other'
+        renamed['_eval_metadata'] = {'param_name': 'X', 'horizon': 'week_6_9', 'test_idx': 3}
+        assert memo.key(renamed) == memo.key(config)
+
+    def test_a_parameter_changes_the_key(self, tmp_path, season):
+        memo = _memo(tmp_path, season)
+        config = build_f05_config_dict()
+        changed = copy.deepcopy(config)
+        changed['parameters']['NORMALIZATION_MAX_SCALE'] = 999
+        assert memo.key(changed) != memo.key(config)
+
+    def test_restricted_horizons_are_part_of_the_key(self, tmp_path, season):
+        memo = _memo(tmp_path, season)
+        config = build_f05_config_dict()
+        assert memo.key(config, None) == memo.key(config)
+        assert memo.key(config, ('week_6_9',)) != memo.key(config)
+        assert memo.key(config, ('week_6_9',)) != memo.key(config, ('week_1_5',))
+
+    def test_exclusions_change_the_context(self, tmp_path, season):
+        assert _memo(tmp_path, season).context_fingerprint != \
+            _memo(tmp_path, season, {'2024': frozenset({3})}).context_fingerprint
+        assert _memo(tmp_path, season, {'2024': frozenset()}).context_fingerprint == \
+            _memo(tmp_path, season).context_fingerprint
+
+    def test_season_files_change_the_context(self, tmp_path, season):
+        before = _memo(tmp_path, season).context_fingerprint
+        data_file = season / "season_schedule.csv"
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _memo(tmp_path, season).context_fingerprint != before
+
+    def test_code_changes_the_context(self, tmp_path, season):
+        before = _memo(tmp_path, season).context_fingerprint
+        with patch.object(memo_module, "_code_fingerprint", return_value="edited"):
+            assert _memo(tmp_path, season).context_fingerprint != before
+
+
+class TestRunnerWithMemo:
+    def _configs(self):
+        base = build_f05_config_dict()
+        duplicate = copy.deepcopy(base)
+        duplicate['_eval_metadata'] = dict(duplicate.get('_eval_metadata', {}), horizon='week_6_9')
+        other = copy.deepcopy(base)
+        other['parameters']['NORMALIZATION_MAX_SCALE'] = base['parameters']['NORMALIZATION_MAX_SCALE'] * 2
+        return [base, duplicate, other]
+
+    def _evaluate(self, season, configs, memo):
+        progress = []
+        with patch.object(runner_module, "_evaluate_config_tournament_process",
+                          wraps=runner_module._evaluate_config_tournament_process) as worker, \
+             ParallelAccuracyRunner(season.parent, [season], max_workers=2,
+                                    use_processes=False, memo=memo) as runner:
+            evaluated = runner.evaluate_configs_parallel(configs, progress_callback=progress.append)
+        return evaluated, worker.call_count, progress
+
+    def test_distinct_configs_are_evaluated_once_and_then_served(self, tmp_path, season):
+        configs = self._configs()
+        expected, calls, _ = self._evaluate(season, configs, None)
+        assert calls == 3
+
+        evaluated, calls, progress = self._evaluate(season, configs, _memo(tmp_path, season))
+        assert calls == 2
+        assert progress == [1, 2, 3]
+        assert [cfg for cfg, _ in evaluated] == configs
+        assert [_summary(r) for _, r in evaluated] == [_summary(r) for _, r in expected]
+        assert evaluated[0][1]['week_1_5'] is not evaluated[1][1]['week_1_5']
+
+        # A new memo on the same file (a resumed run) serves everything.
+        resumed = _memo(tmp_path, season)
+        evaluated, calls, progress = self._evaluate(season, configs, resumed)
+        assert calls == 0
+        assert progress == [1, 2, 3]
+        assert resumed.hits == 2
+        assert [_summary(r) for _, r in evaluated] == [_summary(r) for _, r in expected]
+
+    def test_a_changed_context_is_not_served(self, tmp_path, season):
+        configs = self._configs()[:1]
+        self._evaluate(season, configs, _memo(tmp_path, season))
+        _, calls, _ = self._evaluate(season, configs, _memo(tmp_path, season, {'2024': frozenset({2})}))
+        assert calls == 1
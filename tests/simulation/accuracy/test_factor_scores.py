@@ -0,0 +1,209 @@
+"""
+Unit Tests for Factor-Decomposed Accuracy Scoring
+
+Covers simulation/accuracy/factor_scores and its use by ParallelAccuracyRunner's
+_WeekFactors:
+- recombined factor values equal score_player's projected_points bit for bit
+- each swept section changes exactly its own factor's key (both MIN_WEEKS feed both
+  rank-window factors; an unowned parameter changes every key)
+- a candidate differing from the cached baseline in one section recomputes only that
+  factor, and its projections still equal a full rescore
+- the per-factor cache stays bounded
+- grouped factors run their step once per distinct feature and still equal a
+  per-player loop bit for bit; the week's game-feature tables are built once
+
+Author: Kai Mizuno
+"""
+
+import copy
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.accuracy import ParallelAccuracyRunner as runner_module
+from simulation.accuracy import factor_scores
+from simulation.accuracy.ParallelAccuracyRunner import (
+    FACTOR_CACHE_SIZE, _create_player_manager, _load_season_data, _WeekFactors,
+)
+from simulation.accuracy.factor_scores import (
+    _FACTOR_STEPS, ACCURACY_FACTORS, FACTOR_FEATURES, FACTOR_SECTIONS, STATIC_FEATURE_FACTORS,
+    compose_projections, factor_keys, factor_values, feature_table,
+)
+
+
+REAL_SEASON = Path("simulation/sim_data/2025")
+
+# One edit per swept section: (path into parameters, new value, factors it must change).
+SECTION_EDITS = [
+    (("NORMALIZATION_MAX_SCALE",), 120, {"weight"}),
+    (("TEAM_QUALITY_SCORING", "MIN_WEEKS"), 3, {"team_quality", "matchup"}),
+    (("PERFORMANCE_SCORING", "MIN_WEEKS"), 3, {"performance"}),
+    (("MATCHUP_SCORING", "IMPACT_SCALE"), 90, {"matchup"}),
+    (("MATCHUP_SCORING", "MIN_WEEKS"), 5, {"team_quality", "matchup"}),
+    (("TEMPERATURE_SCORING", "IMPACT_SCALE"), 80, {"temperature"}),
+    (("WIND_SCORING", "IMPACT_SCALE"), 30, {"wind"}),
+    (("LOCATION_MODIFIERS", "HOME"), 4.0, {"location"}),
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_worker_cache():
+    with patch.dict(runner_module._WORKER_SEASONS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FOLDERS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FACTORS, clear=True):
+        yield
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    cm = ConfigManager(Path("data"))
+    return {"config_name": cm.config_name, "description": cm.description,
+            "parameters": json.loads(json.dumps(cm.parameters))}
+
+
+def _edited(config, path, value):
+    config = copy.deepcopy(config)
+    target = config["parameters"]
+    for name in path[:-1]:
+        target = target[name]
+    target[path[-1]] = value
+    return config
+
+
+def _scored_projections(config, week_num):
+    """Full score_player rescoring, as the worker did before decomposition."""
+    projected_path, _ = _load_season_data(REAL_SEASON, week_num)
+    player_mgr = _create_player_manager(config, projected_path, REAL_SEASON, week_num)
+    player_mgr.scoring_calculator.max_weekly_projection = player_mgr.calculate_max_weekly_projection(week_num)
+    return {
+        p.id: player_mgr.score_player(
+            p, use_weekly_projection=True, adp=False, player_rating=False, team_quality=True,
+            performance=True, matchup=True, schedule=False, bye=False, injury=False,
+            temperature=True, wind=True, location=True,
+        ).projected_points
+        for p in player_mgr.players
+    }
+
+
+class TestComposeProjections:
+    @pytest.mark.parametrize("week_num", [1, 6, 12, 17])
+    def test_matches_score_player_exactly(self, base_config, week_num):
+        projected_path, _ = _load_season_data(REAL_SEASON, week_num)
+        player_mgr = _create_player_manager(base_config, projected_path, REAL_SEASON, week_num)
+        calculator = player_mgr.scoring_calculator
+        calculator.max_weekly_projection = player_mgr.calculate_max_weekly_projection(week_num)
+
+        factors = {f: factor_values(calculator, player_mgr.players, f) for f in ACCURACY_FACTORS}
+        projected = compose_projections(
+            factors, player_mgr.config.normalization_max_scale, calculator.max_weekly_projection
+        )
+        ids = [p.id for p in player_mgr.players]
+        assert dict(zip(ids, projected.tolist())) == _scored_projections(base_config, week_num)
+
+    def test_zero_weekly_max_projects_zero(self):
+        factors = {f: np.ones(3) for f in ACCURACY_FACTORS}
+        assert compose_projections(factors, 100, 0.0).tolist() == [0.0, 0.0, 0.0]
+
+
+class TestFactorKeys:
+    @pytest.mark.parametrize("path,value,changed", SECTION_EDITS)
+    def test_a_section_edit_changes_only_its_factors(self, base_config, path, value, changed):
+        before = factor_keys(base_config["parameters"])
+        after = factor_keys(_edited(base_config, path, value)["parameters"])
+        assert {f for f in ACCURACY_FACTORS if before[f] != after[f]} == changed
+
+    def test_an_unowned_parameter_changes_every_key(self, base_config):
+        before = factor_keys(base_config["parameters"])
+        after = factor_keys(_edited(base_config, ("ADP_SCORING", "WEIGHT"), 9.0)["parameters"])
+        assert all(before[f] != after[f] for f in ACCURACY_FACTORS)
+
+    def test_every_factor_owns_a_section(self):
+        assert set(FACTOR_SECTIONS) == set(ACCURACY_FACTORS)
+
+
+class TestWeekFactors:
+    WEEK = 11
+
+    def _week_factors(self, config):
+        projected_path, _ = _load_season_data(REAL_SEASON, self.WEEK)
+        return _WeekFactors(config, projected_path, REAL_SEASON, self.WEEK)
+
+    def test_baseline_projections_match_full_rescore(self, base_config):
+        week = self._week_factors(base_config)
+        projections = week.projections(base_config, factor_keys(base_config["parameters"]))
+        assert projections == _scored_projections(base_config, self.WEEK)
+
+    @pytest.mark.parametrize("path,value,changed", SECTION_EDITS)
+    def test_a_candidate_recomputes_only_its_factors(self, base_config, path, value, changed):
+        week = self._week_factors(base_config)
+        week.projections(base_config, factor_keys(base_config["parameters"]))
+
+        candidate = _edited(base_config, path, value)
+        with patch.object(runner_module, "factor_values", wraps=factor_values) as computed:
+            projections = week.projections(candidate, factor_keys(candidate["parameters"]))
+        assert {call.args[2] for call in computed.call_args_list} == changed
+        assert projections == _scored_projections(candidate, self.WEEK)
+
+        # The baseline is still served entirely from the cache.
+        with patch.object(runner_module, "factor_values", wraps=factor_values) as computed:
+            assert week.projections(base_config, factor_keys(base_config["parameters"])) == \
+                _scored_projections(base_config, self.WEEK)
+        assert computed.call_count == 0
+
+    def test_cache_is_bounded(self, base_config):
+        week = self._week_factors(base_config)
+        for scale in range(100, 100 + FACTOR_CACHE_SIZE + 3):
+            config = _edited(base_config, ("NORMALIZATION_MAX_SCALE",), scale)
+            week.projections(config, factor_keys(config["parameters"]))
+        assert len(week.factors["weight"]) == FACTOR_CACHE_SIZE
+        assert set(week.normalization_scales) == set(week.factors["weight"])
+        assert len(week.factors["location"]) == 1
+
+
+class TestFeatureTables:
+    @pytest.mark.parametrize("week_num", [2, 9, 16])
+    def test_grouped_values_equal_per_player_steps(self, base_config, week_num):
+        projected_path, _ = _load_season_data(REAL_SEASON, week_num)
+        player_mgr = _create_player_manager(base_config, projected_path, REAL_SEASON, week_num)
+        calculator = player_mgr.scoring_calculator
+        calculator.max_weekly_projection = player_mgr.calculate_max_weekly_projection(week_num)
+
+        for factor in ACCURACY_FACTORS:
+            step = _FACTOR_STEPS[factor]
+            expected = [step(calculator, p) for p in player_mgr.players]
+            assert factor_values(calculator, player_mgr.players, factor).tolist() == expected
+
+    def test_players_are_grouped_by_feature(self, base_config):
+        projected_path, _ = _load_season_data(REAL_SEASON, 4)
+        players = _create_player_manager(base_config, projected_path, REAL_SEASON, 4).players
+        for factor, feature_of in FACTOR_FEATURES.items():
+            table = feature_table(players, factor)
+            features = [feature_of(players[row]) for row in table.rows]
+            assert len(set(features)) == len(table.rows) < len(players)
+            assert all(features[code] == feature_of(p) for p, code in zip(players, table.codes.tolist()))
+
+    def test_steps_run_once_per_feature(self, base_config):
+        projected_path, _ = _load_season_data(REAL_SEASON, 4)
+        player_mgr = _create_player_manager(base_config, projected_path, REAL_SEASON, 4)
+        calculator = player_mgr.scoring_calculator
+        teams = {p.team for p in player_mgr.players}
+        with patch.object(calculator, "_apply_location_modifier",
+                          wraps=calculator._apply_location_modifier) as step:
+            factor_values(calculator, player_mgr.players, "location")
+        assert step.call_count == len(teams)
+
+    def test_week_builds_static_tables_once(self, base_config):
+        projected_path, _ = _load_season_data(REAL_SEASON, 7)
+        week = _WeekFactors(base_config, projected_path, REAL_SEASON, 7)
+        assert set(week.feature_tables) == STATIC_FEATURE_FACTORS
+
+        candidate = _edited(base_config, ("WIND_SCORING", "IMPACT_SCALE"), 30)
+        with patch.object(factor_scores, "feature_table", wraps=feature_table) as built:
+            week.projections(base_config, factor_keys(base_config["parameters"]))
+            week.projections(candidate, factor_keys(candidate["parameters"]))
+        # Only the rank features, which move with the team context, are regrouped.
+        assert sorted(call.args[1] for call in built.call_args_list) == ["matchup", "team_quality"]
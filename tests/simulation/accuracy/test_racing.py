@@ -0,0 +1,96 @@
+"""
+Unit Tests for Racing Mode (simulation/accuracy/racing)
+
+Covers:
+- screening_exclusions keeps a seeded share of every season's horizon weeks, at least
+  one, only among weeks with data that the run does not already exclude
+- is_clearly_worse discards only on a consistent per-season pairwise deficit
+
+Author: Kai Mizuno
+"""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from simulation.accuracy.AccuracyCalculator import AccuracyResult
+from simulation.accuracy.horizon_labels import WEEK_RANGES
+from simulation.accuracy.racing import is_clearly_worse, screening_exclusions
+
+
+ALL_WEEKS = set(range(1, 18))
+
+
+def _season(root: Path, name: str, last_week: int = 18) -> Path:
+    season = root / name
+    for week in range(1, last_week + 1):
+        (season / "weeks" / f"week_{week:02d}").mkdir(parents=True)
+    return season
+
+
+def _result(per_season):
+    return AccuracyResult(mae=1.0, player_count=10, total_error=10.0, per_season_pairwise=per_season)
+
+
+def _kept(exclusions, season):
+    return ALL_WEEKS - exclusions[season]
+
+
+class TestScreeningExclusions:
+    @pytest.mark.parametrize("fraction", [0.25, 0.5, 1.0])
+    def test_every_horizon_keeps_its_share(self, tmp_path, fraction):
+        seasons = [_season(tmp_path, "2023"), _season(tmp_path, "2024")]
+        exclusions = screening_exclusions(seasons, {}, fraction, seed=7)
+        for season in ("2023", "2024"):
+            kept = _kept(exclusions, season)
+            for start, end in WEEK_RANGES.values():
+                horizon_weeks = set(range(start, end + 1))
+                assert len(kept & horizon_weeks) == max(1, math.ceil(fraction * len(horizon_weeks)))
+
+    def test_run_exclusions_and_missing_weeks_are_never_screened(self, tmp_path):
+        # Week 17's actuals (week 18) are missing, so 17 has no data.
+        seasons = [_season(tmp_path, "2024", last_week=17)]
+        exclusions = screening_exclusions(seasons, {"2024": frozenset({1, 2, 3, 4})}, 1.0, seed=0)
+        kept = _kept(exclusions, "2024")
+        assert 5 in kept
+        assert not kept & {1, 2, 3, 4, 17}
+        assert {14, 15, 16} <= kept
+
+    def test_choice_is_seeded(self, tmp_path):
+        seasons = [_season(tmp_path, "2024")]
+        first = screening_exclusions(seasons, None, 0.25, seed=3)
+        assert screening_exclusions(seasons, None, 0.25, seed=3) == first
+        assert any(screening_exclusions(seasons, None, 0.25, seed=s) != first for s in range(4, 12))
+
+
+class TestIsClearlyWorse:
+    def test_consistent_deficit_is_worse(self):
+        incumbent = _result({"2022": 0.70, "2023": 0.72, "2024": 0.71, "2025": 0.69})
+        candidate = _result({"2022": 0.65, "2023": 0.66, "2024": 0.67, "2025": 0.64})
+        assert is_clearly_worse(candidate, incumbent, 0.95)
+
+    def test_noisy_deficit_is_kept(self):
+        incumbent = _result({"2022": 0.70, "2023": 0.72, "2024": 0.71, "2025": 0.69})
+        candidate = _result({"2022": 0.60, "2023": 0.75, "2024": 0.72, "2025": 0.68})
+        assert not is_clearly_worse(candidate, incumbent, 0.95)
+
+    def test_confidence_controls_the_decision(self):
+        incumbent = _result({"2022": 0.70, "2023": 0.70, "2024": 0.70})
+        candidate = _result({"2022": 0.69, "2023": 0.67, "2024": 0.695})
+        assert is_clearly_worse(candidate, incumbent, 0.90)
+        assert not is_clearly_worse(candidate, incumbent, 0.99)
+
+    def test_better_or_equal_is_kept(self):
+        incumbent = _result({"2023": 0.70, "2024": 0.70})
+        assert not is_clearly_worse(_result({"2023": 0.71, "2024": 0.72}), incumbent, 0.95)
+        assert not is_clearly_worse(_result({"2023": 0.70, "2024": 0.70}), incumbent, 0.95)
+
+    def test_identical_deficits_are_worse(self):
+        incumbent = _result({"2023": 0.70, "2024": 0.72})
+        assert is_clearly_worse(_result({"2023": 0.68, "2024": 0.70}), incumbent, 0.99)
+
+    def test_fewer_than_two_shared_seasons_is_kept(self):
+        incumbent = _result({"2024": 0.70, "2025": 0.70})
+        assert not is_clearly_worse(_result({"2024": 0.10, "2023": 0.10}), incumbent, 0.95)
+        assert not is_clearly_worse(_result({}), incumbent, 0.95)
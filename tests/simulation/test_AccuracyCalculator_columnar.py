@@ -0,0 +1,185 @@
+"""
+Tests for AccuracyCalculator's columnar (PLAYER_WEEK_DTYPE) metrics.
+
+Verifies:
+- calculate_ranking_metrics_columnar matches the per-position, per-week loop over the
+  dict-based methods: pairwise and top-N exactly, Spearman to rounding, on randomized
+  seasons with heavy ties, duplicate and missing names, off-list positions and NaN
+  projections
+- calculate_season_accuracy matches calculate_weekly_mae (MAE, player count, coverage)
+- the worker's per-week rows pair each projection with its actual like the dicts did
+
+Author: Kai Mizuno
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.accuracy import ParallelAccuracyRunner as runner_module
+from simulation.accuracy.AccuracyCalculator import (
+    PLAYER_WEEK_DTYPE, RANKING_POSITIONS, AccuracyCalculator, player_week_rows,
+)
+from simulation.accuracy.ParallelAccuracyRunner import _WeekFactors, _load_season_data, _week_actuals
+from simulation.accuracy.factor_scores import factor_keys
+
+
+REAL_SEASON = Path("simulation/sim_data/2025")
+METRICS = ('pairwise_accuracy', 'top_5_accuracy', 'top_10_accuracy', 'top_20_accuracy')
+
+
+def reference_ranking_metrics(calculator, player_data_by_week):
+    """The dict-based per-week loop the columnar pass replaced, as the oracle."""
+    values = {pos: {'pairwise': [], 'top_5': [], 'top_10': [], 'top_20': [], 'spearman_z': []}
+              for pos in RANKING_POSITIONS}
+    for player_list in player_data_by_week.values():
+        for pos in RANKING_POSITIONS:
+            pairwise = calculator.calculate_pairwise_accuracy(player_list, pos)
+            if not np.isnan(pairwise):
+                values[pos]['pairwise'].append(pairwise)
+            for n in (5, 10, 20):
+                top_n = calculator.calculate_top_n_accuracy(player_list, n, pos)
+                if not np.isnan(top_n):
+                    values[pos][f'top_{n}'].append(top_n)
+            corr = calculator.calculate_spearman_correlation(player_list, pos)
+            if not np.isnan(corr):
+                values[pos]['spearman_z'].append(np.arctanh(np.clip(corr, -1 + 1e-6, 1 - 1e-6)))
+    return calculator._assemble_ranking_metrics(values)
+
+
+def _random_season(rng, weeks, nan_rate=0.0):
+    grid = np.linspace(0.0, 30.0, int(rng.integers(3, 40)))
+    season = {}
+    for week in range(1, weeks + 1):
+        players = []
+        for i in range(int(rng.integers(0, 150))):
+            projected = float(rng.choice(grid))
+            if rng.random() < nan_rate:
+                projected = float('nan')
+            player = {
+                'position': str(rng.choice(RANKING_POSITIONS + ('FB',))),
+                'projected': projected,
+                'actual': float(rng.choice(grid)),
+            }
+            if rng.random() < 0.9:
+                player['name'] = f"P{int(rng.integers(0, 200))}"   # duplicates are common
+            players.append(player)
+        season[week] = players
+    return season
+
+
+def _assert_same_metrics(actual, expected):
+    if expected is None:
+        assert actual is None
+        return
+    for field in METRICS:
+        assert getattr(actual, field) == getattr(expected, field), field
+    if expected.spearman_correlation is None:
+        assert actual.spearman_correlation is None
+    else:
+        assert actual.spearman_correlation == pytest.approx(expected.spearman_correlation, abs=1e-12)
+
+
+@pytest.fixture
+def calculator():
+    return AccuracyCalculator()
+
+
+@pytest.mark.filterwarnings("ignore::scipy.stats.ConstantInputWarning")
+class TestRankingMetricsColumnar:
+    @pytest.mark.parametrize("seed", range(40))
+    def test_matches_dict_based_loop(self, calculator, seed):
+        rng = np.random.default_rng(seed)
+        season = _random_season(rng, int(rng.integers(1, 6)))
+        overall, by_position = calculator.calculate_ranking_metrics_columnar(player_week_rows(season))
+        expected_overall, expected_by_position = reference_ranking_metrics(calculator, season)
+
+        _assert_same_metrics(overall, expected_overall)
+        assert set(by_position) == set(expected_by_position)
+        for pos, metrics in expected_by_position.items():
+            _assert_same_metrics(by_position[pos], metrics)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_nan_projections_match_dict_based_loop(self, calculator, seed):
+        rng = np.random.default_rng(500 + seed)
+        season = _random_season(rng, 3, nan_rate=0.1)
+        overall, by_position = calculator.calculate_ranking_metrics_columnar(player_week_rows(season))
+        expected_overall, expected_by_position = reference_ranking_metrics(calculator, season)
+
+        _assert_same_metrics(overall, expected_overall)
+        for pos, metrics in expected_by_position.items():
+            _assert_same_metrics(by_position[pos], metrics)
+
+    def test_duplicate_names_count_once_in_top_n(self, calculator):
+        week = [{'position': 'WR', 'name': 'Same', 'projected': 20.0 - i, 'actual': 20.0 - i}
+                for i in range(5)]
+        _, by_position = calculator.calculate_ranking_metrics_columnar(player_week_rows({1: week}))
+        assert by_position['WR'].top_5_accuracy == 0.2
+
+    def test_no_rows(self, calculator):
+        assert calculator.calculate_ranking_metrics_columnar(
+            np.empty(0, dtype=PLAYER_WEEK_DTYPE)) == (None, {})
+
+
+class TestSeasonAccuracy:
+    def test_matches_weekly_mae(self, calculator):
+        rng = np.random.default_rng(3)
+        projections, actuals, season = {}, {}, {}
+        for week in (1, 2, 4):
+            ids = [f"id{i}" for i in range(80)]
+            projections[week] = {pid: float(rng.normal(10, 4)) for pid in ids}
+            actuals[week] = {pid: float(abs(rng.normal(10, 6))) + 0.1 for pid in ids[:60]}
+            season[week] = [{'name': pid, 'position': 'RB', 'projected': projections[week][pid],
+                             'actual': actuals[week][pid]} for pid in actuals[week]]
+
+        result = calculator.calculate_season_accuracy(player_week_rows(season), (1, 5), 3)
+        expected = calculator.calculate_weekly_mae(projections, actuals, (1, 5))
+        assert result.mae == pytest.approx(expected.mae, rel=1e-12)
+        assert result.total_error == pytest.approx(expected.total_error, rel=1e-12)
+        assert (result.player_count, result.weeks_evaluated, result.weeks_requested) == \
+            (expected.player_count, expected.weeks_evaluated, expected.weeks_requested)
+        _assert_same_metrics(result.overall_metrics, reference_ranking_metrics(calculator, season)[0])
+
+    def test_empty_season(self, calculator):
+        result = calculator.calculate_season_accuracy(np.empty(0, dtype=PLAYER_WEEK_DTYPE), (6, 9), 0)
+        assert (result.mae, result.player_count, result.overall_metrics, result.by_position) == \
+            (0.0, 0, None, {})
+        assert (result.weeks_evaluated, result.weeks_requested) == (0, 4)
+
+
+class TestWorkerRows:
+    @pytest.fixture(autouse=True)
+    def empty_worker_cache(self):
+        with patch.dict(runner_module._WORKER_SEASONS, clear=True), \
+             patch.dict(runner_module._WORKER_WEEK_FOLDERS, clear=True), \
+             patch.dict(runner_module._WORKER_WEEK_ACTUALS, clear=True), \
+             patch.dict(runner_module._WORKER_WEEK_FACTORS, clear=True):
+            yield
+
+    def test_rows_pair_projections_with_actuals(self):
+        cm = ConfigManager(Path("data"))
+        config = {"config_name": cm.config_name, "description": cm.description,
+                  "parameters": json.loads(json.dumps(cm.parameters))}
+        week_num = 7
+        projected_path, actual_path = _load_season_data(REAL_SEASON, week_num)
+        factors = _WeekFactors(config, projected_path, REAL_SEASON, week_num)
+        keys = factor_keys(config["parameters"])
+
+        projections = factors.projections(config, keys)
+        expected = [(RANKING_POSITIONS.index(pos), projections[pid], actual)
+                    for pid, _, pos, actual in _week_actuals(actual_path, week_num) if pid in projections]
+        rows = factors.rows(config, keys, actual_path)
+        assert list(zip(rows['position'].tolist(), rows['projected'].tolist(),
+                        rows['actual'].tolist())) == expected
+        assert set(rows['week'].tolist()) == {week_num}
+
+        # The config-independent columns are built once; only projections are refilled.
+        scaled = json.loads(json.dumps(config))
+        scaled["parameters"]["NORMALIZATION_MAX_SCALE"] *= 2
+        again = factors.rows(scaled, factor_keys(scaled["parameters"]), actual_path)
+        assert np.array_equal(again['actual'], rows['actual'])
+        assert not np.array_equal(again['projected'], rows['projected'])
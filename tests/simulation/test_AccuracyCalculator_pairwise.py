@@ -0,0 +1,131 @@
+"""
+Tests for AccuracyCalculator's O(n log n) pairwise accuracy.
+
+Verifies:
+- the merge-sort inversion count matches a brute-force count, ties never counted
+- calculate_pairwise_accuracy equals the original O(n^2) pair loop on randomized
+  slates with heavy projected and actual ties, mixed positions, sub-3-point actuals
+  and NaN projections
+- all-ties and tiny slates still return the np.nan sentinel
+
+Author: Kai Mizuno
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from simulation.accuracy.AccuracyCalculator import AccuracyCalculator, _count_strict_inversions
+
+
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'K', 'DST']
+
+
+def reference_pairwise_accuracy(player_data, position):
+    """The original O(n^2) implementation, kept verbatim as the oracle."""
+    players = []
+    for player in player_data:
+        if player.get('position') == position and player.get('actual', 0) >= 3.0:
+            players.append((player.get('projected', 0), player.get('actual', 0)))
+
+    if len(players) < 2:
+        return np.nan
+
+    correct = 0
+    total = 0
+    for i in range(len(players)):
+        for j in range(i + 1, len(players)):
+            proj_i, actual_i = players[i]
+            proj_j, actual_j = players[j]
+            if actual_i == actual_j:
+                continue
+            predicted_order = proj_i > proj_j
+            actual_order = actual_i > actual_j
+            if predicted_order == actual_order:
+                correct += 1
+            total += 1
+
+    if total == 0:
+        return np.nan
+    return correct / total
+
+
+def _random_slate(rng, size, distinct_values, nan_rate=0.0):
+    """Players drawn from a small value grid so projected and actual ties are common."""
+    grid = np.linspace(0.0, 30.0, distinct_values)
+    slate = []
+    for _ in range(size):
+        projected = float(rng.choice(grid))
+        if rng.random() < nan_rate:
+            projected = float('nan')
+        slate.append({
+            'position': str(rng.choice(POSITIONS)),
+            'projected': projected,
+            'actual': float(rng.choice(grid)),
+        })
+    return slate
+
+
+def _same(a, b):
+    return (np.isnan(a) and np.isnan(b)) or a == b
+
+
+class TestCountStrictInversions:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_brute_force(self, seed):
+        rng = np.random.default_rng(seed)
+        values = rng.integers(0, 6, size=int(rng.integers(0, 40))).tolist()
+        expected = sum(1 for a, b in itertools.combinations(values, 2) if a > b)
+        assert _count_strict_inversions(values) == expected
+
+    def test_ties_are_not_inversions(self):
+        assert _count_strict_inversions([3, 3, 3]) == 0
+        assert _count_strict_inversions([3, 2, 2, 1]) == 5
+
+    def test_input_is_not_modified(self):
+        values = [5, 1, 4]
+        _count_strict_inversions(values)
+        assert values == [5, 1, 4]
+
+
+class TestMatchesQuadraticReference:
+    @pytest.fixture
+    def calculator(self):
+        return AccuracyCalculator()
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_random_slates(self, calculator, seed):
+        rng = np.random.default_rng(seed)
+        slate = _random_slate(rng, int(rng.integers(0, 120)), int(rng.integers(2, 25)))
+        for position in POSITIONS:
+            assert _same(calculator.calculate_pairwise_accuracy(slate, position),
+                         reference_pairwise_accuracy(slate, position))
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_slates_with_nan_projections(self, calculator, seed):
+        rng = np.random.default_rng(1000 + seed)
+        slate = _random_slate(rng, 60, 8, nan_rate=0.2)
+        for position in POSITIONS:
+            assert _same(calculator.calculate_pairwise_accuracy(slate, position),
+                         reference_pairwise_accuracy(slate, position))
+
+    def test_projected_ties_follow_input_order(self, calculator):
+        # Equal projections predict "first is not higher": correct only when the later
+        # player outscored the earlier one.
+        forward = [{'position': 'WR', 'projected': 10.0, 'actual': a} for a in (5.0, 9.0)]
+        assert calculator.calculate_pairwise_accuracy(forward, 'WR') == 1.0
+        assert calculator.calculate_pairwise_accuracy(forward[::-1], 'WR') == 0.0
+
+    def test_large_real_sized_pool(self, calculator):
+        rng = np.random.default_rng(7)
+        slate = [{'position': 'WR', 'projected': float(p), 'actual': float(a)}
+                 for p, a in zip(rng.normal(10, 5, 150).round(1), rng.normal(10, 6, 150).round(1))]
+        assert calculator.calculate_pairwise_accuracy(slate, 'WR') == \
+            reference_pairwise_accuracy(slate, 'WR')
+
+    def test_all_ties_and_tiny_slates_are_nan(self, calculator):
+        ties = [{'position': 'QB', 'projected': p, 'actual': 12.0} for p in (1.0, 2.0, 3.0)]
+        assert np.isnan(calculator.calculate_pairwise_accuracy(ties, 'QB'))
+        assert np.isnan(calculator.calculate_pairwise_accuracy(ties[:1], 'QB'))
+        assert np.isnan(calculator.calculate_pairwise_accuracy([], 'QB'))
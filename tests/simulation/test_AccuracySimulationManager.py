@@ -17,6 +17,7 @@ from unittest.mock import Mock, patch, MagicMock
 
 project_root = Path(__file__).parent.parent.parent
 
+from simulation.accuracy.AccuracyCalculator import AccuracyResult
 from simulation.accuracy.AccuracyResultsManager import WEEK_RANGES
 from simulation.accuracy.AccuracySimulationManager import (
     AccuracySimulationManager,
@@ -1428,3 +1429,204 @@ class TestD84ExcludeLowCoverageWeeksPrePass:
         assert passed == {'2023': frozenset({1})}, (
             f"the workers must see the excluded season-weeks, got {passed}"
         )
+
+
+class TestStreamedResults:
+    """Results are recorded as the runner releases them, one config at a time."""
+
+    def test_each_released_result_is_recorded_with_its_own_metadata(self, tmp_path):
+        mgr = AccuracySimulationManager.__new__(AccuracySimulationManager)
+        mgr.logger = Mock()
+        mgr.output_dir = tmp_path
+        mgr.parameter_order = ['P1']
+        mgr.config_generator = Mock()
+        mgr.config_generator.generate_horizon_test_values = Mock(
+            return_value={h: [10, 20] for h in WEEK_RANGES}
+        )
+        mgr.config_generator.get_config_for_horizon = Mock(side_effect=lambda *a, **k: {})
+        mgr.results_manager = Mock()
+        # Only the 6-9 horizon's second candidate improves anything.
+        mgr.results_manager.add_result = Mock(
+            side_effect=lambda week_key, config, result, **kw: (
+                kw['base_horizon'] == 'week_6_9' and kw['test_idx'] == 1 and week_key == 'week_6_9'
+            )
+        )
+        mgr._log_parameter_summary = Mock()
+
+        recorded_before_release = []
+
+        def stream(configs, progress_callback=None, result_callback=None, horizons=None):
+            for index, config in enumerate(configs):
+                recorded_before_release.append(mgr.results_manager.add_result.call_count)
+                result_callback(index, config, {h: Mock(mae=1.0) for h in WEEK_RANGES})
+            return []
+
+        mgr.parallel_runner = Mock()
+        mgr.parallel_runner.evaluate_configs_parallel = Mock(side_effect=stream)
+
+        with patch('simulation.accuracy.AccuracySimulationManager.ProgressTracker'):
+            adopted = mgr._run_ascent_pass(0, {'week_14_17'}, should_resume=False, resume_param_idx=0)
+
+        # 3 active horizons x 2 candidates, each recorded for the 3 unfrozen week keys.
+        assert recorded_before_release == [0, 3, 6, 9, 12, 15]
+        recorded = [
+            (c.args[1]['_eval_metadata']['horizon'], c.kwargs['test_idx'], c.kwargs['base_horizon'], c.args[0])
+            for c in mgr.results_manager.add_result.call_args_list
+        ]
+        assert [r[:3] for r in recorded[::3]] == [
+            ('week_1_5', 0, 'week_1_5'), ('week_1_5', 1, 'week_1_5'),
+            ('week_6_9', 0, 'week_6_9'), ('week_6_9', 1, 'week_6_9'),
+            ('week_10_13', 0, 'week_10_13'), ('week_10_13', 1, 'week_10_13'),
+        ]
+        assert 'week_14_17' not in {r[3] for r in recorded}
+        assert adopted == {'week_6_9'}
+        mgr.results_manager.save_intermediate_results.assert_called_once()
+
+
+class TestRacing:
+    """Racing screens candidates against the horizon incumbents before the full run."""
+
+    SCREEN = {'2023': frozenset({2, 3})}
+
+    def _mgr(self, tmp_path):
+        mgr = AccuracySimulationManager.__new__(AccuracySimulationManager)
+        mgr.logger = Mock()
+        mgr.output_dir = tmp_path
+        mgr.parameter_order = ['P1']
+        mgr.racing_exclusions = self.SCREEN
+        mgr.config_generator = Mock()
+        mgr.config_generator.generate_horizon_test_values = Mock(
+            return_value={h: [10, 20] for h in WEEK_RANGES}
+        )
+        mgr.config_generator.get_config_for_horizon = Mock(side_effect=lambda *a, **k: {})
+        mgr.results_manager = Mock()
+        mgr.results_manager.add_result = Mock(return_value=False)
+        mgr.results_manager.best_configs = {
+            h: Mock(config_dict={'incumbent': h}) for h in WEEK_RANGES
+        }
+        mgr._log_parameter_summary = Mock()
+        return mgr
+
+    @staticmethod
+    def _screened(worse):
+        """Screening result: 'worse' seasons trail the incumbent's 0.70 consistently."""
+        per_season = {'2022': 0.70, '2023': 0.71, '2024': 0.72}
+        if worse:
+            per_season = {season: value - 0.10 for season, value in per_season.items()}
+        return {h: AccuracyResult(mae=1.0, player_count=10, total_error=10.0, per_season_pairwise=per_season)
+                for h in WEEK_RANGES}
+
+    def test_only_survivors_get_the_full_evaluation(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        full_batches = []
+
+        def evaluate(configs, progress_callback=None, result_callback=None, excluded_season_weeks=None,
+                     horizons=None):
+            if excluded_season_weeks is not None:
+                # Screening: the second candidate of every horizon is clearly worse.
+                assert excluded_season_weeks is self.SCREEN
+                return [
+                    (c, self._screened(worse='incumbent' not in c and c['_eval_metadata']['test_idx'] == 1))
+                    for c in configs
+                ]
+            full_batches.append(configs)
+            for index, config in enumerate(configs):
+                result_callback(index, config, self._screened(worse=False))
+            return []
+
+        mgr.parallel_runner = Mock()
+        mgr.parallel_runner.evaluate_configs_parallel = Mock(side_effect=evaluate)
+
+        with patch('simulation.accuracy.AccuracySimulationManager.ProgressTracker') as tracker:
+            mgr._run_ascent_pass(0, set(), should_resume=False, resume_param_idx=0)
+
+        screening = mgr.parallel_runner.evaluate_configs_parallel.call_args_list[0].args[0]
+        assert [c.get('incumbent') for c in screening[:4]] == list(WEEK_RANGES)
+        assert len(full_batches) == 1
+        assert [c['_eval_metadata']['test_idx'] for c in full_batches[0]] == [0] * len(WEEK_RANGES)
+        assert {c.kwargs['test_idx'] for c in mgr.results_manager.add_result.call_args_list} == {0}
+        assert tracker.call_args.kwargs['total'] == len(WEEK_RANGES)
+        assert tracker.call_args.kwargs['description'] == (
+            f"Configs (each tests 4 horizons; {len(WEEK_RANGES)} of {2 * len(WEEK_RANGES)} survived racing)"
+        )
+
+    def test_a_missing_incumbent_skips_screening(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        del mgr.results_manager.best_configs['week_6_9']
+        mgr.parallel_runner = Mock()
+        mgr.parallel_runner.evaluate_configs_parallel = Mock(return_value=[])
+
+        with patch('simulation.accuracy.AccuracySimulationManager.ProgressTracker'):
+            mgr._run_ascent_pass(0, set(), should_resume=False, resume_param_idx=0)
+
+        (call,) = mgr.parallel_runner.evaluate_configs_parallel.call_args_list
+        assert 'excluded_season_weeks' not in call.kwargs
+        assert len(call.args[0]) == 2 * len(WEEK_RANGES)
+
+    def test_racing_is_off_by_default(self):
+        assert AccuracySimulationManager.racing_exclusions is None
+
+
+class TestHorizonRestricted:
+    """Horizon-restricted mode scores horizon-specific candidates on their own range only."""
+
+    def _mgr(self, tmp_path, test_values):
+        mgr = AccuracySimulationManager.__new__(AccuracySimulationManager)
+        mgr.logger = Mock()
+        mgr.output_dir = tmp_path
+        mgr.parameter_order = ['P1']
+        mgr.horizon_restricted = True
+        mgr.config_generator = Mock()
+        mgr.config_generator.generate_horizon_test_values = Mock(return_value=test_values)
+        mgr.config_generator.get_config_for_horizon = Mock(side_effect=lambda *a, **k: {})
+        mgr.results_manager = Mock()
+        mgr.results_manager.add_result = Mock(return_value=False)
+        mgr._log_parameter_summary = Mock()
+
+        def evaluate(configs, progress_callback=None, result_callback=None, horizons=None):
+            for index, (config, scored) in enumerate(zip(configs, horizons)):
+                result_callback(index, config, {
+                    week_key: AccuracyResult(mae=1.0, player_count=10, total_error=10.0)
+                    for week_key in (scored or WEEK_RANGES)
+                })
+            return []
+
+        mgr.parallel_runner = Mock()
+        mgr.parallel_runner.evaluate_configs_parallel = Mock(side_effect=evaluate)
+        return mgr
+
+    def _run(self, mgr, frozen):
+        with patch('simulation.accuracy.AccuracySimulationManager.ProgressTracker') as tracker:
+            mgr._run_ascent_pass(0, frozen, should_resume=False, resume_param_idx=0)
+        self.description = tracker.call_args.kwargs['description']
+        return mgr.parallel_runner.evaluate_configs_parallel.call_args.kwargs['horizons']
+
+    def test_horizon_candidates_cover_only_their_own_range(self, tmp_path):
+        mgr = self._mgr(tmp_path, {'1-5': [1, 2], '6-9': [1, 2], '10-13': [1, 2], '14-17': [1, 2]})
+
+        horizons = self._run(mgr, {'week_14_17'})
+
+        # The frozen horizon's candidates could only ever be recorded there: none are built.
+        assert horizons == [('week_1_5',)] * 2 + [('week_6_9',)] * 2 + [('week_10_13',)] * 2
+        assert self.description == "Configs (each tests 1 horizon)"
+        recorded = [(c.args[0], c.kwargs['base_horizon']) for c in mgr.results_manager.add_result.call_args_list]
+        assert recorded == [('week_1_5', '1-5')] * 2 + [('week_6_9', '6-9')] * 2 + [('week_10_13', '10-13')] * 2
+
+    def test_shared_candidates_still_cover_every_horizon(self, tmp_path):
+        mgr = self._mgr(tmp_path, {'shared': [1, 2]})
+
+        assert self._run(mgr, {'week_14_17'}) == [None, None]
+        assert self.description == "Configs (each tests 4 horizons)"
+        recorded = [c.args[0] for c in mgr.results_manager.add_result.call_args_list]
+        assert recorded == [week_key for week_key in WEEK_RANGES if week_key != 'week_14_17'] * 2
+
+    def test_mixed_batches_report_the_horizon_range(self):
+        metadata = [('shared', 0, None), ('1-5', 0, ('week_1_5',))]
+        assert AccuracySimulationManager._progress_description(metadata, 2) == "Configs (1-4 horizons each)"
+
+    def test_off_by_default(self, tmp_path):
+        mgr = self._mgr(tmp_path, {'1-5': [1], '6-9': [1], '10-13': [1], '14-17': [1]})
+        mgr.horizon_restricted = AccuracySimulationManager.horizon_restricted
+
+        assert self._run(mgr, set()) == [None] * 4
+        assert mgr.results_manager.add_result.call_count == 4 * len(WEEK_RANGES)
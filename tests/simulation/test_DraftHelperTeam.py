@@ -36,23 +36,23 @@ def mock_player2():
 
 
 @pytest.fixture
-def mock_projected_pm():
+def mock_projected_pm(index_mock_pm):
     """Create mock PlayerManager for projected data"""
     pm = Mock()
     pm.players = []
     pm.team = Mock()
     pm.team.roster = []
-    return pm
+    return index_mock_pm(pm)
 
 
 @pytest.fixture
-def mock_actual_pm():
+def mock_actual_pm(index_mock_pm):
     """Create mock PlayerManager for actual data"""
     pm = Mock()
     pm.players = []
     pm.team = Mock()
     pm.team.roster = []
-    return pm
+    return index_mock_pm(pm)
 
 
 @pytest.fixture
@@ -241,7 +241,7 @@ class TestDraftPlayer:
         assert draft_helper_team.get_roster_size() == 1
 
 
-@patch('simulation.win_rate.DraftHelperTeam.DraftModeManager')
+@patch('simulation.win_rate.DraftHelperTeam.IncrementalDraftRecommender')
 class TestGetDraftRecommendation:
     """Test get_draft_recommendation method"""
 
@@ -259,8 +259,8 @@ class TestGetDraftRecommendation:
 
         assert result == mock_player
 
-    def test_get_draft_recommendation_creates_fresh_manager(self, mock_draft_class, draft_helper_team, mock_player, mock_config, mock_projected_pm, mock_team_data_mgr):
-        """Test get_draft_recommendation creates fresh DraftModeManager"""
+    def test_get_draft_recommendation_creates_manager_once(self, mock_draft_class, draft_helper_team, mock_player, mock_config, mock_projected_pm, mock_team_data_mgr):
+        """Test get_draft_recommendation builds the recommender on first use and reuses it"""
         mock_rec = Mock()
         mock_rec.player = mock_player
         mock_rec.score = 95.5
@@ -269,6 +269,7 @@ class TestGetDraftRecommendation:
         mock_draft_mgr.get_recommendations.return_value = [mock_rec]
         mock_draft_class.return_value = mock_draft_mgr
 
+        draft_helper_team.get_draft_recommendation()
         draft_helper_team.get_draft_recommendation()
 
         mock_draft_class.assert_called_once_with(
@@ -276,6 +277,7 @@ class TestGetDraftRecommendation:
             mock_projected_pm,
             mock_team_data_mgr
         )
+        assert mock_draft_mgr.get_recommendations.call_count == 2
 
     def test_get_draft_recommendation_raises_when_no_recommendations(self, mock_draft_class, draft_helper_team):
         """Test get_draft_recommendation raises ValueError when no recommendations"""
@@ -708,7 +710,7 @@ class TestGetRosterPlayers:
 class TestDraftHelperTeamIntegration:
     """Test realistic integration scenarios"""
 
-    @patch('simulation.win_rate.DraftHelperTeam.DraftModeManager')
+    @patch('simulation.win_rate.DraftHelperTeam.IncrementalDraftRecommender')
     @patch('simulation.win_rate.DraftHelperTeam.StarterHelperModeManager')
     def test_full_draft_and_week_cycle(self, mock_starter_helper_class, mock_draft_class, draft_helper_team, mock_player, mock_projected_pm, mock_actual_pm):
         """Test complete draft and weekly lineup cycle"""
@@ -389,5 +389,26 @@ class TestExcludedSeasonWeeks:
         assert empty['week_1_5'].mae == baseline['week_1_5'].mae
 
 
+
+class TestHorizonRestricted:
+    """Horizon-restricted mode: only the requested horizons are scored."""
+
+    def test_only_requested_horizons_are_returned_unchanged(self, tmp_path):
+        data_path = tmp_path / "sim_data"
+        data_path.mkdir(parents=True)
+        create_mock_historical_season_f05(data_path, "2024")
+        seasons = [data_path / "2024"]
+
+        _config, full = _evaluate_config_tournament_process(build_f05_config_dict(), data_path, seasons)
+        _config, restricted = _evaluate_config_tournament_process(
+            build_f05_config_dict(), data_path, seasons, None, ('week_6_9',)
+        )
+
+        assert list(restricted) == ['week_6_9']
+        assert restricted['week_6_9'].mae == full['week_6_9'].mae
+        assert restricted['week_6_9'].player_count == full['week_6_9'].player_count
+        assert restricted['week_6_9'].overall_metrics == full['week_6_9'].overall_metrics
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,163 @@
+"""
+Tests for ParallelAccuracyRunner's worker-resident season cache.
+
+Verifies:
+- a PlayerManager built from the cache scores every player exactly like one built from a
+  temp-directory copy of the same files (the pre-cache path)
+- the cached actuals match what a PlayerManager loaded from the actuals folder yields
+- evaluating a config copies no files, and each season and week folder is read once no
+  matter how many configs are evaluated
+- the config is never cached: a different config still scores differently
+- the runner's executor persists across evaluate_configs_parallel calls until close()
+
+Author: Kai Mizuno
+"""
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from league_helper.util.PlayerManager import PlayerManager
+from league_helper.util.SeasonScheduleManager import SeasonScheduleManager
+from league_helper.util.TeamDataManager import TeamDataManager
+from simulation.accuracy import ParallelAccuracyRunner as runner_module
+from simulation.accuracy.ParallelAccuracyRunner import (
+    POSITION_FILES, ParallelAccuracyRunner, _create_player_manager, _evaluate_config_tournament_process,
+    _load_season_data, _week_actuals,
+)
+from tests.simulation.test_ParallelAccuracyRunner import (
+    build_f05_config_dict, create_mock_historical_season_f05,
+)
+
+
+REAL_SEASON = Path("simulation/sim_data/2025")
+SCORING_FLAGS = dict(
+    use_weekly_projection=True, adp=False, player_rating=False, team_quality=True,
+    performance=True, matchup=True, schedule=False, bye=False, injury=False,
+    temperature=True, wind=True, location=True,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_worker_cache():
+    with patch.dict(runner_module._WORKER_SEASONS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FOLDERS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_ACTUALS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FACTORS, clear=True):
+        yield
+
+
+@pytest.fixture(scope="module")
+def config_dict():
+    cm = ConfigManager(Path("data"))
+    return {"config_name": cm.config_name, "description": cm.description,
+            "parameters": json.loads(json.dumps(cm.parameters))}
+
+
+def _disk_player_manager(tmp_path, config_dict, week_data_path, season_path, week_num):
+    """The pre-cache construction: copy the week's files to a temp folder and load them."""
+    (tmp_path / "player_data").mkdir(parents=True)
+    for filename in POSITION_FILES:
+        shutil.copy(week_data_path / filename, tmp_path / "player_data" / filename)
+    shutil.copy(season_path / "season_schedule.csv", tmp_path / "season_schedule.csv")
+    shutil.copy(season_path / "game_data.csv", tmp_path / "game_data.csv")
+    shutil.copytree(season_path / "team_data", tmp_path / "team_data")
+    config = dict(config_dict, parameters=dict(config_dict["parameters"], CURRENT_NFL_WEEK=week_num))
+    (tmp_path / "league_config.json").write_text(json.dumps(config))
+
+    config_mgr = ConfigManager(tmp_path)
+    schedule_mgr = SeasonScheduleManager(tmp_path)
+    team_data_mgr = TeamDataManager(tmp_path, config_mgr, schedule_mgr, config_mgr.current_nfl_week)
+    return PlayerManager(tmp_path, config_mgr, team_data_mgr, schedule_mgr, fast_scoring=True)
+
+
+def _projections(player_mgr, week_num):
+    player_mgr.scoring_calculator.max_weekly_projection = player_mgr.calculate_max_weekly_projection(week_num)
+    return {p.id: player_mgr.score_player(p, **SCORING_FLAGS).projected_points for p in player_mgr.players}
+
+
+class TestParity:
+    @pytest.mark.parametrize("week_num", [1, 6, 14])
+    def test_cached_manager_scores_like_disk_manager(self, tmp_path, config_dict, week_num):
+        projected_path, _ = _load_season_data(REAL_SEASON, week_num)
+        expected = _projections(
+            _disk_player_manager(tmp_path, config_dict, projected_path, REAL_SEASON, week_num), week_num
+        )
+        cached = _create_player_manager(config_dict, projected_path, REAL_SEASON, week_num)
+        assert _projections(cached, week_num) == expected
+        # A second config-week build reuses the cache and still matches.
+        again = _create_player_manager(config_dict, projected_path, REAL_SEASON, week_num)
+        assert _projections(again, week_num) == expected
+
+    def test_cached_actuals_match_disk_manager(self, tmp_path, config_dict):
+        week_num = 9
+        _, actual_path = _load_season_data(REAL_SEASON, week_num)
+        disk = _disk_player_manager(tmp_path, config_dict, actual_path, REAL_SEASON, week_num)
+        expected = [(p.id, p.name, p.position, p.actual_points[week_num - 1]) for p in disk.players
+                    if p.actual_points[week_num - 1] is not None and p.actual_points[week_num - 1] > 0]
+        assert _week_actuals(actual_path, week_num) == expected
+
+
+class TestFileAccess:
+    @pytest.fixture
+    def season(self, tmp_path):
+        create_mock_historical_season_f05(tmp_path, "2024")
+        return tmp_path / "2024"
+
+    def test_no_files_are_copied(self, season):
+        with patch("shutil.copy", side_effect=AssertionError("copied")), \
+             patch("shutil.copytree", side_effect=AssertionError("copied")), \
+             patch("tempfile.mkdtemp", side_effect=AssertionError("temp dir")):
+            _evaluate_config_tournament_process(build_f05_config_dict(), season.parent, [season])
+
+    def test_each_folder_is_read_once_across_configs(self, season):
+        configs = [build_f05_config_dict(), build_f05_config_dict()]
+        configs[1]["parameters"]["NORMALIZATION_MAX_SCALE"] = 120
+        with patch.object(runner_module, "load_team_weekly_data",
+                          wraps=runner_module.load_team_weekly_data) as team_reads, \
+             patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as file_reads:
+            for config in configs:
+                _evaluate_config_tournament_process(config, season.parent, [season])
+
+        week_folders = {call.args[0].parent for call in file_reads.call_args_list}
+        assert team_reads.call_count == 1
+        assert file_reads.call_count == len(week_folders) * len(POSITION_FILES)
+        assert week_folders == {season / "weeks" / f"week_{week:02d}" for week in range(1, 19)}
+
+
+class TestConfigIsNotCached:
+    def test_a_different_config_scores_differently(self, config_dict):
+        projected_path, _ = _load_season_data(REAL_SEASON, 5)
+        base = _projections(_create_player_manager(config_dict, projected_path, REAL_SEASON, 5), 5)
+
+        changed = json.loads(json.dumps(config_dict))
+        changed["parameters"]["NORMALIZATION_MAX_SCALE"] *= 2
+        scaled = _projections(_create_player_manager(changed, projected_path, REAL_SEASON, 5), 5)
+        assert scaled != base
+        assert _projections(_create_player_manager(config_dict, projected_path, REAL_SEASON, 5), 5) == base
+
+
+class TestPersistentExecutor:
+    def test_executor_is_reused_until_closed(self, tmp_path):
+        create_mock_historical_season_f05(tmp_path, "2024")
+        season = tmp_path / "2024"
+        with ParallelAccuracyRunner(tmp_path, [season], max_workers=2, use_processes=False) as runner:
+            runner.evaluate_configs_parallel([build_f05_config_dict()])
+            executor = runner._executor
+            assert executor is not None
+            runner.evaluate_configs_parallel([build_f05_config_dict()])
+            assert runner._executor is executor
+
+            runner.close()
+            runner.close()
+            assert runner._executor is None
+            assert executor._shutdown
+
+            # A closed runner stays usable with a fresh executor.
+            runner.evaluate_configs_parallel([build_f05_config_dict()])
+            assert runner._executor not in (None, executor)
+        assert runner._executor is None
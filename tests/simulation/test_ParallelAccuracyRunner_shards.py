@@ -0,0 +1,196 @@
+"""
+Tests for ParallelAccuracyRunner's (config, season, horizon) sharding.
+
+Verifies:
+- sharded results equal per-config results exactly, with and without season-week
+  exclusions and horizon restrictions, and are released in input order
+- every season-horizon has a home lane, home loads are balanced, a single config is
+  spread over every lane, and an idle lane steals queued shards (so a batch with fewer
+  season-horizons than workers still uses every worker)
+- close() stops the lanes and a later batch starts fresh ones
+
+Author: Kai Mizuno
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from simulation.accuracy import ParallelAccuracyRunner as runner_module
+from simulation.accuracy.ParallelAccuracyRunner import IN_FLIGHT_PER_WORKER, ParallelAccuracyRunner, _LaneQueues
+from simulation.accuracy.evaluation_memo import results_to_payload
+from simulation.accuracy.horizon_labels import WEEK_RANGES
+from tests.simulation.test_ParallelAccuracyRunner import (
+    build_f05_config_dict, create_mock_historical_season_f05,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_worker_cache():
+    with patch.dict(runner_module._WORKER_SEASONS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FOLDERS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_ACTUALS, clear=True), \
+         patch.dict(runner_module._WORKER_WEEK_FACTORS, clear=True):
+        yield
+
+
+@pytest.fixture
+def seasons(tmp_path):
+    for year in ("2023", "2024"):
+        create_mock_historical_season_f05(tmp_path, year)
+    return [tmp_path / "2023", tmp_path / "2024"]
+
+
+def _configs():
+    configs = [build_f05_config_dict() for _ in range(3)]
+    configs[1]["parameters"]["NORMALIZATION_MAX_SCALE"] = 120
+    configs[2]["parameters"]["NORMALIZATION_MAX_SCALE"] = 80
+    return configs
+
+
+def _evaluate(seasons, shard_seasons, max_workers=3, **kwargs):
+    with ParallelAccuracyRunner(seasons[0].parent, seasons, max_workers=max_workers, use_processes=False,
+                                shard_seasons=shard_seasons) as runner:
+        return runner.evaluate_configs_parallel(_configs(), **kwargs)
+
+
+def _payloads(evaluated):
+    return [results_to_payload(results) for _, results in evaluated]
+
+
+class TestShardedResults:
+    def test_sharded_results_equal_per_config_results(self, seasons):
+        expected = _evaluate(seasons, shard_seasons=False)
+        sharded = _evaluate(seasons, shard_seasons=True)
+        assert [config for config, _ in sharded] == [config for config, _ in expected]
+        assert _payloads(sharded) == _payloads(expected)
+        assert all(list(results) == list(WEEK_RANGES) for _, results in sharded)
+
+    def test_exclusions_and_restricted_horizons(self, seasons):
+        kwargs = dict(
+            excluded_season_weeks={"2024": frozenset({2, 7})},
+            horizons=[None, ("week_6_9",), ("week_1_5", "week_14_17")],
+        )
+        expected = _evaluate(seasons, shard_seasons=False, **kwargs)
+        sharded = _evaluate(seasons, shard_seasons=True, **kwargs)
+        assert _payloads(sharded) == _payloads(expected)
+        assert [list(results) for _, results in sharded] == [
+            list(WEEK_RANGES), ["week_6_9"], ["week_1_5", "week_14_17"],
+        ]
+
+    def test_results_are_released_in_input_order(self, seasons):
+        released = []
+        _evaluate(seasons, shard_seasons=True,
+                  result_callback=lambda index, config, results: released.append(index))
+        assert released == [0, 1, 2]
+
+
+class TestLanes:
+    def _shard_threads(self, seasons, max_workers, batches=2):
+        threads = {}
+        lock = threading.Lock()
+        real_task = runner_module._evaluate_shard_task
+
+        def recording_task(index, config_dict, season_pos, season_path, week_key, excluded_weeks):
+            with lock:
+                threads.setdefault((season_pos, week_key), set()).add(threading.get_ident())
+            return real_task(index, config_dict, season_pos, season_path, week_key, excluded_weeks)
+
+        with patch.object(runner_module, "_evaluate_shard_task", side_effect=recording_task), \
+             ParallelAccuracyRunner(seasons[0].parent, seasons, max_workers=max_workers, use_processes=False,
+                                    shard_seasons=True) as runner:
+            for _ in range(batches):
+                runner.evaluate_configs_parallel(_configs()[:1])
+            lane_of = dict(runner._lane_of)
+        return threads, lane_of
+
+    def test_every_season_horizon_has_a_home_lane(self, seasons):
+        threads, lane_of = self._shard_threads(seasons, max_workers=3)
+        assert set(threads) == set(lane_of) == {(pos, key) for pos in range(2) for key in WEEK_RANGES}
+        assert set(lane_of.values()) == {0, 1, 2}
+
+    def test_idle_lanes_steal_a_lone_season_horizon(self, seasons):
+        threads = set()
+        lock = threading.Lock()
+        real_task = runner_module._evaluate_shard_task
+
+        def recording_task(*args):
+            with lock:
+                threads.add(threading.get_ident())
+            return real_task(*args)
+
+        with patch.object(runner_module, "_evaluate_shard_task", side_effect=recording_task):
+            evaluated = _evaluate(seasons[:1], shard_seasons=True, max_workers=4,
+                                  horizons=[("week_6_9",)] * 3)
+        # One season x one horizon is a single home lane, yet its three shards run on more.
+        assert len(threads) > 1
+        expected = _evaluate(seasons[:1], shard_seasons=False, horizons=[("week_6_9",)] * 3)
+        assert _payloads(evaluated) == _payloads(expected)
+
+    def test_one_config_is_spread_over_every_lane(self, seasons):
+        threads, lane_of = self._shard_threads(seasons, max_workers=4, batches=1)
+        assert len(set.union(*threads.values())) == 4
+        assert set(lane_of.values()) == {0, 1, 2, 3}
+
+    def test_lane_loads_are_balanced(self, seasons):
+        runner = ParallelAccuracyRunner(seasons[0].parent, seasons, max_workers=3, use_processes=False,
+                                        shard_seasons=True)
+        runner._start_lanes()
+        loads = [0] * len(runner._lanes)
+        for (_, week_key), lane in runner._lane_of.items():
+            start_week, end_week = WEEK_RANGES[week_key]
+            loads[lane] += end_week - start_week + 1
+        runner.close()
+        assert sum(loads) == 2 * 17
+        # Greedy placement keeps the spread within one season-horizon's weeks.
+        assert max(loads) - min(loads) <= max(end - start + 1 for start, end in WEEK_RANGES.values())
+
+    def test_fewer_season_horizons_than_workers_still_start_every_lane(self, seasons):
+        runner = ParallelAccuracyRunner(seasons[0].parent, seasons[:1], max_workers=8, use_processes=False,
+                                        shard_seasons=True)
+        runner._start_lanes()
+        assert len(runner._lanes) == 8
+        assert len(set(runner._lane_of.values())) == 4
+        runner.close()
+
+    def test_close_stops_the_lanes(self, seasons):
+        with ParallelAccuracyRunner(seasons[0].parent, seasons, max_workers=2, use_processes=False,
+                                    shard_seasons=True) as runner:
+            runner.evaluate_configs_parallel(_configs()[:1])
+            lanes = list(runner._lanes)
+            assert len(lanes) == 2 and runner._executor is None
+
+            runner.close()
+            assert runner._lanes == [] and runner._lane_of == {}
+            assert all(lane._shutdown for lane in lanes)
+
+            runner.evaluate_configs_parallel(_configs()[:1])
+            assert runner._lanes and not set(runner._lanes) & set(lanes)
+
+
+class TestLaneQueues:
+    def test_home_shards_first_up_to_the_in_flight_limit(self):
+        queues = _LaneQueues(2)
+        for index in range(IN_FLIGHT_PER_WORKER + 1):
+            queues.push(0, (index, 0, "week_1_5"))
+        queues.push(1, (0, 1, "week_1_5"))
+
+        assert [queues.take(0) for _ in range(IN_FLIGHT_PER_WORKER + 1)] == (
+            [(index, 0, "week_1_5") for index in range(IN_FLIGHT_PER_WORKER)] + [None]
+        )
+        assert queues.take(1) == (0, 1, "week_1_5")
+        assert len(queues) == 1
+
+    def test_only_an_idle_lane_steals_and_from_the_longest_queue(self):
+        queues = _LaneQueues(3)
+        queues.push(0, (0, 0, "week_1_5"))
+        queues.push(1, (0, 1, "week_1_5"))
+        queues.push(1, (1, 1, "week_1_5"))
+
+        assert queues.take(2) == (0, 1, "week_1_5")
+        assert queues.take(2) is None               # still running its stolen shard
+        queues.finish(2)
+        assert queues.take(1) == (1, 1, "week_1_5")   # lane 1 still runs its own shard
+        assert queues.take(2) == (0, 0, "week_1_5")
+        assert queues.take(0) is None and len(queues) == 0
@@ -0,0 +1,170 @@
+"""
+Tests for ParallelAccuracyRunner's streaming, order-preserving result delivery.
+
+Verifies:
+- results reach result_callback in input order even when configs finish out of order,
+  and are not retained in the returned list
+- without a callback the returned list is in input order
+- no more than max_workers * IN_FLIGHT_PER_WORKER tasks are outstanding at once
+- a callback returning True stops the evaluation before the rest is submitted
+- memo hits and duplicate configs are released in their input positions
+- a corpus override reaches the tasks and bypasses the memo; per-config horizon
+  restrictions reach their tasks
+
+Author: Kai Mizuno
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from simulation.accuracy import ParallelAccuracyRunner as runner_module
+from simulation.accuracy.AccuracyCalculator import AccuracyResult
+from simulation.accuracy.ParallelAccuracyRunner import IN_FLIGHT_PER_WORKER, ParallelAccuracyRunner
+from simulation.accuracy.evaluation_memo import EvaluationMemo
+
+
+def _configs(count):
+    return [{"parameters": {"VALUE": index}} for index in range(count)]
+
+
+def _fake_evaluation(delays=None, evaluated=None):
+    """Stand-in for _evaluate_config_tournament_process: the result's MAE is the config's value."""
+    lock = threading.Lock()
+
+    def evaluate(config, *args):
+        value = config["parameters"]["VALUE"]
+        if evaluated is not None:
+            with lock:
+                evaluated.append(value)
+        time.sleep((delays or {}).get(value, 0))
+        return config, {"week_1_5": AccuracyResult(mae=value, player_count=1, total_error=value)}
+
+    return evaluate
+
+
+def _runner(tmp_path, max_workers=4, memo=None):
+    return ParallelAccuracyRunner(tmp_path, [], max_workers=max_workers, use_processes=False, memo=memo)
+
+
+class TestOrderedRelease:
+    def test_callback_sees_input_order_when_completion_is_out_of_order(self, tmp_path):
+        configs = _configs(8)
+        released = []
+        # Early configs are the slowest, so later ones finish first.
+        delays = {0: 0.2, 1: 0.1, 2: 0.05}
+        with _runner(tmp_path) as runner, \
+             patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation(delays)):
+            returned = runner.evaluate_configs_parallel(
+                configs,
+                result_callback=lambda index, config, results: released.append((index, config, results))
+            )
+
+        assert [index for index, _, _ in released] == list(range(8))
+        assert all(config is configs[index] for index, config, _ in released)
+        assert [results["week_1_5"].mae for _, _, results in released] == list(range(8))
+        assert returned == []
+
+    def test_without_callback_returns_input_order(self, tmp_path):
+        configs = _configs(6)
+        with _runner(tmp_path) as runner, \
+             patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation({0: 0.1})):
+            returned = runner.evaluate_configs_parallel(configs)
+        assert [config for config, _ in returned] == configs
+        assert [results["week_1_5"].mae for _, results in returned] == list(range(6))
+
+
+class TestChunkedSubmission:
+    def test_outstanding_tasks_are_bounded(self, tmp_path):
+        max_workers = 2
+        limit = max_workers * IN_FLIGHT_PER_WORKER
+        submitted = []
+        outstanding_at_submit = []
+
+        with _runner(tmp_path, max_workers=max_workers) as runner, \
+             patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation({0: 0.1, 3: 0.05})):
+            executor = runner._get_executor()
+            real_submit = executor.submit
+
+            def counting_submit(*args, **kwargs):
+                outstanding_at_submit.append(sum(not f.done() for f in submitted))
+                future = real_submit(*args, **kwargs)
+                submitted.append(future)
+                return future
+
+            with patch.object(executor, "submit", side_effect=counting_submit):
+                returned = runner.evaluate_configs_parallel(_configs(15))
+
+        assert len(submitted) == 15
+        assert max(outstanding_at_submit) < limit
+        assert len(returned) == 15
+
+
+class TestEarlyStop:
+    def test_callback_returning_true_stops_submission(self, tmp_path):
+        evaluated = []
+        released = []
+
+        def stop_after_third(index, config, results):
+            released.append(index)
+            return index == 2
+
+        with _runner(tmp_path, max_workers=1) as runner, \
+             patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation(evaluated=evaluated)):
+            runner.evaluate_configs_parallel(_configs(20), result_callback=stop_after_third)
+
+        assert released == [0, 1, 2]
+        # Only the released configs plus at most one window of queued tasks ever ran.
+        assert len(evaluated) <= 3 + IN_FLIGHT_PER_WORKER
+
+
+class TestMemoAndDuplicates:
+    def test_hits_and_duplicates_are_released_in_position(self, tmp_path):
+        memo = EvaluationMemo(tmp_path / "memo.sqlite", [])
+        configs = _configs(4)
+        configs += [{"parameters": {"VALUE": 1}}, {"parameters": {"VALUE": 5}}]
+
+        # Configs 2 and 3 are stored by an earlier batch.
+        with patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation()), \
+             _runner(tmp_path, memo=memo) as runner:
+            runner.evaluate_configs_parallel(configs[2:4])
+
+        evaluated = []
+        released = []
+        with patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation({0: 0.1}, evaluated)), \
+             _runner(tmp_path, memo=memo) as runner:
+            runner.evaluate_configs_parallel(
+                configs,
+                result_callback=lambda index, config, results: released.append((index, results["week_1_5"].mae))
+            )
+
+        assert released == [(0, 0), (1, 1), (2, 2), (3, 3), (4, 1), (5, 5)]
+        assert sorted(evaluated) == [0, 1, 5]
+
+
+class TestPerBatchOverrides:
+    def test_override_reaches_tasks_and_bypasses_the_memo(self, tmp_path):
+        memo = EvaluationMemo(tmp_path / "memo.sqlite", [])
+        screen = {"2024": frozenset({1, 2})}
+        with patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation()) as evaluate, \
+             _runner(tmp_path, memo=memo) as runner:
+            runner.evaluate_configs_parallel(_configs(2))
+            runner.evaluate_configs_parallel(_configs(2), excluded_season_weeks=screen)
+
+        assert [call.args[3] for call in evaluate.call_args_list] == [{}, {}, screen, screen]
+        assert memo.hits == 0
+
+    def test_restricted_horizons_reach_their_tasks(self, tmp_path):
+        with patch.object(runner_module, "_evaluate_config_tournament_process",
+                          side_effect=_fake_evaluation()) as evaluate, \
+             _runner(tmp_path, max_workers=1) as runner:
+            runner.evaluate_configs_parallel(_configs(3), horizons=[None, ("week_6_9",), None])
+
+        assert [call.args[4] for call in evaluate.call_args_list] == [None, ("week_6_9",), None]
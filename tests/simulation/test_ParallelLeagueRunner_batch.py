@@ -0,0 +1,133 @@
+"""
+Tests for ParallelLeagueRunner.run_simulations_for_batch.
+
+Verifies:
+- with a persistent pool, every group's leagues go out as one flat batch; results come
+  back grouped and aligned to the items, each league on its own season with the seed
+  run_simulations_for_config would give it
+- the last_* counters describe the whole batch
+- without a persistent pool the groups run one after another, each on its own season,
+  and the runner's data folder is restored
+- first_sim_id shifts a group onto the seeds of later sim_ids, in both modes
+- real leagues from a batch match thread-mode leagues under the same seed
+
+Author: Kai Mizuno
+"""
+
+import copy
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.ParallelLeagueRunner import LeagueBatchItem, ParallelLeagueRunner, _derive_task_seed
+from tests.simulation.test_ParallelLeagueRunner_persistent_pool import CONFIG, _FakeLeague, _week_data
+
+
+MODULE = "simulation.win_rate.ParallelLeagueRunner"
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+
+@pytest.fixture
+def fake_pool():
+    with patch(f"{MODULE}.SimulatedLeague", _FakeLeague), \
+         patch(f"{MODULE}.SeasonBundle.from_season_folder", side_effect=lambda folder, week: object()):
+        runner = ParallelLeagueRunner(max_workers=2, data_folder=Path("sim/2024"),
+                                      use_processes=True, persistent_pool=True, seed=5)
+        yield runner
+        runner.close()
+
+
+class TestPersistentBatch:
+    def test_groups_are_aligned_and_seeded_per_season(self, fake_pool):
+        week_2024, week_2025 = _week_data(), _week_data()
+        trial = dict(CONFIG, config_name="trial")
+        items = [
+            LeagueBatchItem(CONFIG, 3, Path("sim/2024"), week_2024),
+            LeagueBatchItem(CONFIG, 2, Path("sim/2025"), week_2025, measured_config_dict=trial),
+            LeagueBatchItem(CONFIG, 1, Path("sim/2024"), week_2024, measured_config_dict=trial),
+        ]
+
+        groups = fake_pool.run_simulations_for_batch(items)
+
+        assert [len(group) for group in groups] == [3, 2, 1]
+        for item, group in zip(items, groups):
+            expected_seeds = {_derive_task_seed(5, item.data_folder, sim_id) for sim_id in range(item.num_simulations)}
+            assert {r[2] for r in group} == {item.data_folder.name}
+            assert {r[3] for r in group} == expected_seeds
+            assert {r[4] for r in group} == {(item.measured_config_dict or {}).get("config_name")}
+        assert (fake_pool.last_requested_count, fake_pool.last_completed_count, fake_pool.last_dropped_count) == (6, 6, 0)
+        assert fake_pool.leagues_completed == 6
+        # The runner's own season is untouched.
+        assert fake_pool.data_folder == Path("sim/2024")
+
+    def test_first_sim_id_offsets_the_seeds(self, fake_pool):
+        item = LeagueBatchItem(CONFIG, 2, Path("sim/2024"), _week_data(), first_sim_id=3)
+
+        (group,) = fake_pool.run_simulations_for_batch([item])
+
+        assert {r[3] for r in group} == {_derive_task_seed(5, Path("sim/2024"), sim_id) for sim_id in (3, 4)}
+
+    def test_empty_batch(self, fake_pool):
+        assert fake_pool.run_simulations_for_batch([]) == []
+        assert fake_pool.last_requested_count == 0
+
+
+class TestSequentialFallback:
+    def test_thread_mode_runs_each_group_on_its_season(self):
+        seen_folders = []
+
+        def league_factory(config_dict, data_folder, *args, **kwargs):
+            seen_folders.append(data_folder)
+            league = Mock()
+            league.get_draft_helper_results.return_value = (10, 7, 1.0)
+            return league
+
+        with patch(f"{MODULE}.SimulatedLeague", side_effect=league_factory):
+            runner = ParallelLeagueRunner(max_workers=2, data_folder=Path("sim/2023"), seed=5)
+            groups = runner.run_simulations_for_batch([
+                LeagueBatchItem(CONFIG, 2, Path("sim/2024")),
+                LeagueBatchItem(CONFIG, 1, Path("sim/2025")),
+            ])
+
+        assert groups == [[(10, 7, 1.0)] * 2, [(10, 7, 1.0)]]
+        assert sorted(folder.name for folder in seen_folders) == ["2024", "2024", "2025"]
+        assert runner.data_folder == Path("sim/2023")
+        assert (runner.last_requested_count, runner.last_completed_count, runner.last_dropped_count) == (3, 3, 0)
+
+    def test_first_sim_id_reaches_the_league_seeds(self):
+        seen_seeds = []
+
+        def league_factory(config_dict, data_folder, *args, seed=None, **kwargs):
+            seen_seeds.append(seed)
+            league = Mock()
+            league.get_draft_helper_results.return_value = (10, 7, 1.0)
+            return league
+
+        with patch(f"{MODULE}.SimulatedLeague", side_effect=league_factory):
+            runner = ParallelLeagueRunner(max_workers=1, data_folder=Path("sim/2023"), seed=5)
+            runner.run_simulations_for_batch([LeagueBatchItem(CONFIG, 2, Path("sim/2024"), first_sim_id=6)])
+
+        assert sorted(seen_seeds) == sorted(_derive_task_seed(5, Path("sim/2024"), sim_id) for sim_id in (6, 7))
+
+
+class TestRealLeagueParity:
+    def test_batch_matches_thread_mode(self):
+        cm = ConfigManager(Path("data"))
+        config_dict = {"config_name": cm.config_name, "description": cm.description,
+                       "parameters": dict(cm.parameters)}
+        measured = copy.deepcopy(config_dict)
+        measured["parameters"]["ADP_SCORING"]["WEIGHT"] *= 1.2
+
+        threads = ParallelLeagueRunner(max_workers=1, data_folder=REAL_DATA_FOLDER, seed=13)
+        expected = [threads.run_simulations_for_config(config_dict, 1),
+                    threads.run_simulations_for_config(config_dict, 1, measured_config_dict=measured)]
+
+        with ParallelLeagueRunner(max_workers=2, data_folder=REAL_DATA_FOLDER, seed=13,
+                                  use_processes=True, persistent_pool=True) as persistent:
+            actual = persistent.run_simulations_for_batch([
+                LeagueBatchItem(config_dict, 1, REAL_DATA_FOLDER),
+                LeagueBatchItem(config_dict, 1, REAL_DATA_FOLDER, measured_config_dict=measured),
+            ])
+        assert actual == expected
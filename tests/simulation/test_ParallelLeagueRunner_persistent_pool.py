@@ -0,0 +1,157 @@
+"""
+Tests for ParallelLeagueRunner's persistent process pool.
+
+Verifies:
+- one pool serves every call until close(), across configs and seasons
+- each worker builds a season's warm context (bundle, attached table) once and reuses it
+  for every later league of that season; a new season gets its own context
+- a week-data dict is published to shared memory once per pool and released by close()
+- per-task seeds and the measured config still reach every league; by-week results work
+- real leagues from the persistent pool match thread-mode leagues under the same seed
+
+The unit tests replace SimulatedLeague and SeasonBundle.from_season_folder with fakes
+before the pool starts; worker processes are forked and inherit them. Each fake league
+reports back what it was built from.
+
+Author: Kai Mizuno
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.ParallelLeagueRunner import ParallelLeagueRunner, _derive_task_seed
+from simulation.win_rate.PlayerTable import PlayerTable
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+CONFIG = {"config_name": "incumbent", "description": "", "parameters": {}}
+
+
+class _FakeLeague:
+    """Reports (pid, bundle id, season, seed, measured config name, table-backed)."""
+
+    def __init__(self, config_dict, data_folder, week_data, measured_config_dict=None,
+                 naive_opponents=False, seed=None, player_table=None, season_bundle=None):
+        self.report = (
+            os.getpid(), id(season_bundle), data_folder.name, seed,
+            (measured_config_dict or {}).get("config_name"), player_table is not None,
+        )
+
+    def run_draft(self):
+        pass
+
+    def run_season(self):
+        pass
+
+    def get_draft_helper_results(self):
+        return self.report
+
+    def get_draft_helper_results_by_week(self):
+        return [(1, True, float(self.report[3] or 0))]
+
+    def cleanup(self):
+        pass
+
+
+def _week_data():
+    points = [1.0] * 17
+    record = {'id': '1', 'name': 'P1', 'position': 'QB', 'drafted_by': '', 'locked': '0',
+              'projected_points': points, 'actual_points': points}
+    return {1: {'projected': {1: record}, 'actual': {1: record}}}
+
+
+@pytest.fixture
+def fake_pool():
+    with patch("simulation.win_rate.ParallelLeagueRunner.SimulatedLeague", _FakeLeague), \
+         patch("simulation.win_rate.ParallelLeagueRunner.SeasonBundle.from_season_folder",
+               side_effect=lambda folder, week: object()):
+        runner = ParallelLeagueRunner(max_workers=2, data_folder=Path("sim/2024"),
+                                      use_processes=True, persistent_pool=True, seed=5)
+        yield runner
+        runner.close()
+
+
+class TestPoolLifetime:
+    def test_one_pool_serves_every_call_until_close(self, fake_pool):
+        week_data = _week_data()
+        first = fake_pool.run_simulations_for_config(CONFIG, 6, week_data)
+        pool = fake_pool._pool
+        second = fake_pool.run_simulations_for_config(dict(CONFIG, config_name="other"), 6, week_data)
+
+        assert fake_pool._pool is pool
+        pids = {r[0] for r in first + second}
+        assert os.getpid() not in pids
+        assert len(pids) <= 2
+
+        fake_pool.close()
+        assert fake_pool._pool is None
+        fake_pool.run_simulations_for_config(CONFIG, 1, week_data)
+        assert fake_pool._pool is not None and fake_pool._pool is not pool
+
+    def test_close_is_idempotent_without_a_pool(self):
+        runner = ParallelLeagueRunner(use_processes=True, persistent_pool=True)
+        runner.close()
+        runner.close()
+
+
+class TestWarmSeasons:
+    def test_each_worker_reuses_its_season_context(self, fake_pool):
+        week_data_2024, week_data_2025 = _week_data(), _week_data()
+        results_2024 = (fake_pool.run_simulations_for_config(CONFIG, 8, week_data_2024)
+                        + fake_pool.run_simulations_for_config(CONFIG, 8, week_data_2024))
+        fake_pool.set_data_folder(Path("sim/2025"))
+        results_2025 = fake_pool.run_simulations_for_config(CONFIG, 8, week_data_2025)
+
+        bundles_2024 = {}
+        for pid, bundle_id, season, _, _, table_backed in results_2024:
+            assert season == "2024" and table_backed
+            assert bundles_2024.setdefault(pid, bundle_id) == bundle_id
+        for pid, bundle_id, season, _, _, _ in results_2025:
+            assert season == "2025"
+            assert bundle_id != bundles_2024.get(pid)
+
+    def test_week_data_published_once_and_released_on_close(self, fake_pool):
+        week_data = _week_data()
+        with patch("simulation.win_rate.ParallelLeagueRunner.PlayerTable.from_week_data",
+                   wraps=PlayerTable.from_week_data) as build:
+            fake_pool.run_simulations_for_config(CONFIG, 2, week_data)
+            fake_pool.run_simulations_for_config_with_weeks(CONFIG, 2, week_data)
+        assert build.call_count == 1
+        (_, table), = fake_pool._persistent_tables
+
+        fake_pool.close()
+        assert fake_pool._persistent_tables == []
+        with pytest.raises(FileNotFoundError):
+            PlayerTable.attach(table.handle)
+
+
+class TestTaskInputs:
+    def test_seeds_and_measured_config_reach_every_league(self, fake_pool):
+        measured = dict(CONFIG, config_name="trial")
+        results = fake_pool.run_simulations_for_config(CONFIG, 4, _week_data(), measured_config_dict=measured)
+        expected = {_derive_task_seed(5, Path("sim/2024"), sim_id) for sim_id in range(4)}
+        assert {r[3] for r in results} == expected
+        assert {r[4] for r in results} == {"trial"}
+
+    def test_with_weeks(self, fake_pool):
+        results = fake_pool.run_simulations_for_config_with_weeks(CONFIG, 3, _week_data())
+        expected = {float(_derive_task_seed(5, Path("sim/2024"), sim_id)) for sim_id in range(3)}
+        assert {weeks[0][2] for weeks in results} == expected
+
+
+class TestRealLeagueParity:
+    def test_matches_thread_mode(self):
+        cm = ConfigManager(Path("data"))
+        config_dict = {"config_name": cm.config_name, "description": cm.description,
+                       "parameters": dict(cm.parameters)}
+        threads = ParallelLeagueRunner(max_workers=2, data_folder=REAL_DATA_FOLDER, seed=11)
+        expected = sorted(threads.run_simulations_for_config(config_dict, 2))
+
+        with ParallelLeagueRunner(max_workers=2, data_folder=REAL_DATA_FOLDER, seed=11,
+                                  use_processes=True, persistent_pool=True) as persistent:
+            actual = sorted(persistent.run_simulations_for_config(config_dict, 2))
+        assert actual == expected
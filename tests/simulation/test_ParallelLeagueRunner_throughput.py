@@ -0,0 +1,90 @@
+"""
+Tests for ParallelLeagueRunner's throughput accounting.
+
+Verifies:
+- completed leagues and elapsed time accumulate across calls of both run methods;
+  dropped leagues are not counted
+- leagues_per_second() is 0.0 before any call
+- cores_in_use is 1 in thread mode (one GIL) and min(max_workers, CPU count) in
+  process mode
+- throughput_summary() reports totals, overall and per-core rates, and the pool shape
+
+Author: Kai Mizuno
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from simulation.win_rate.ParallelLeagueRunner import ParallelLeagueRunner
+
+
+MODULE = "simulation.win_rate.ParallelLeagueRunner"
+
+
+@pytest.fixture
+def mock_league_class():
+    with patch(f"{MODULE}.SimulatedLeague") as mock_league_class:
+        league = Mock()
+        league.get_draft_helper_results.return_value = (10, 7, 1234.5)
+        league.get_draft_helper_results_by_week.return_value = [(1, True, 100.0)]
+        mock_league_class.return_value = league
+        yield mock_league_class
+
+
+class TestThroughputAccounting:
+    def test_leagues_accumulate_across_both_run_methods(self, mock_league_class):
+        runner = ParallelLeagueRunner(max_workers=2)
+        runner.run_simulations_for_config({}, num_simulations=3)
+        runner.run_simulations_for_config_with_weeks({}, num_simulations=2)
+
+        assert runner.leagues_completed == 5
+        assert runner.simulation_seconds > 0
+        assert runner.leagues_per_second() == pytest.approx(5 / runner.simulation_seconds)
+
+    def test_dropped_leagues_are_not_counted(self, mock_league_class):
+        failing = Mock()
+        failing.run_draft.side_effect = RuntimeError("draft failed")
+        mock_league_class.side_effect = [mock_league_class.return_value, failing, mock_league_class.return_value]
+
+        runner = ParallelLeagueRunner(max_workers=1)
+        runner.run_simulations_for_config({}, num_simulations=3)
+
+        assert runner.last_dropped_count == 1
+        assert runner.leagues_completed == 2
+
+    def test_rate_is_zero_before_any_call(self):
+        runner = ParallelLeagueRunner()
+        assert runner.leagues_completed == 0
+        assert runner.leagues_per_second() == 0.0
+
+
+class TestCoresInUse:
+    def test_thread_mode_counts_one_core(self):
+        assert ParallelLeagueRunner(max_workers=8).cores_in_use == 1
+
+    @pytest.mark.parametrize("max_workers, cpu_count, expected", [(8, 4, 4), (2, 16, 2), (4, None, 1)])
+    def test_process_mode_is_bounded_by_workers_and_cpus(self, max_workers, cpu_count, expected):
+        runner = ParallelLeagueRunner(max_workers=max_workers, use_processes=True)
+        with patch(f"{MODULE}.os.cpu_count", return_value=cpu_count):
+            assert runner.cores_in_use == expected
+
+
+class TestThroughputSummary:
+    def test_summary_reports_rates_and_pool_shape(self):
+        runner = ParallelLeagueRunner(max_workers=8, use_processes=True)
+        runner.leagues_completed = 1200
+        runner.simulation_seconds = 300.0
+        with patch(f"{MODULE}.os.cpu_count", return_value=4):
+            summary = runner.throughput_summary()
+        assert summary == (
+            "1200 leagues in 300.0s: 4.00 leagues/s, 1.00 leagues/s per core (8 processes on 4 cores)"
+        )
+
+    def test_thread_summary_names_threads_on_one_core(self):
+        runner = ParallelLeagueRunner(max_workers=2)
+        runner.leagues_completed = 10
+        runner.simulation_seconds = 5.0
+        assert runner.throughput_summary() == (
+            "10 leagues in 5.0s: 2.00 leagues/s, 2.00 leagues/s per core (2 threads on 1 core)"
+        )
@@ -81,13 +81,16 @@ def _make_bare_pm(players, can_draft_result=True):
     """
     Construct a minimal PlayerManager exposing only what get_player_list touches,
     bypassing the heavy __init__ (file loading, config, schedule scaffolding).
-    can_draft is stubbed directly (FantasyTeam.can_draft's own position-limit logic
-    is covered elsewhere) so this isolates get_player_list's own filtering.
+    can_draft and the team's draftable_positions are stubbed directly (FantasyTeam's own
+    position-limit logic is covered elsewhere) so this isolates get_player_list's own
+    filtering.
     """
     pm = PlayerManager.__new__(PlayerManager)
     pm.logger = Mock()
     pm.players = players
     pm.can_draft = Mock(return_value=can_draft_result)
+    pm.team = Mock()
+    pm.team.draftable_positions.return_value = list(Constants.ALL_POSITIONS)
     return pm
 
 
@@ -342,12 +345,12 @@ class TestSimulatedOpponentPositiveValuePoolExhaustionFallback:
     ValueError and crashing the whole league to a 0.000 win rate.
     """
 
-    def test_get_draft_recommendation_falls_back_when_positive_pool_empty(self):
+    def test_get_draft_recommendation_falls_back_when_positive_pool_empty(self, index_mock_pm):
         """Only zero-value free agents remain -> no ValueError, the zero-value candidate is
         still returned, and the fallback logs a warning (matching the DraftHelperTeam shape)."""
         zero_value_qb = _make_player(1, position="QB", fantasy_points=0.0)
 
-        projected_pm = Mock(spec=PlayerManager)
+        projected_pm = index_mock_pm(Mock(spec=PlayerManager))
         projected_pm.players = [zero_value_qb]
         actual_pm = Mock(spec=PlayerManager)
         team_data_manager = Mock(spec=TeamDataManager)
@@ -368,10 +371,10 @@ class TestSimulatedOpponentPositiveValuePoolExhaustionFallback:
         assert recommendation is zero_value_qb
         opponent.logger.warning.assert_called_once()
 
-    def test_get_draft_recommendation_raises_when_truly_no_candidates(self):
+    def test_get_draft_recommendation_raises_when_truly_no_candidates(self, index_mock_pm):
         """When even the fallback finds nothing (no free agents at all), the method still
         raises ValueError rather than crashing on something unexpected downstream."""
-        projected_pm = Mock(spec=PlayerManager)
+        projected_pm = index_mock_pm(Mock(spec=PlayerManager))
         projected_pm.players = []
         actual_pm = Mock(spec=PlayerManager)
         team_data_manager = Mock(spec=TeamDataManager)
@@ -388,7 +391,7 @@ class TestSimulatedOpponentPositiveValuePoolExhaustionFallback:
         with pytest.raises(ValueError, match="No available players to draft"):
             opponent.get_draft_recommendation()
 
-    def test_naive_draft_completes_when_positive_pool_exhausted_mid_draft(self):
+    def test_naive_draft_completes_when_positive_pool_exhausted_mid_draft(self, index_mock_pm):
         """Multi-round, SimulatedOpponent-only snake-draft-style loop (mirroring the per-pick
         sequence in SimulatedLeague.run_draft()) against a deliberately sparse (mostly
         zero-value) shared player pool: every roster must still reach 15 players without
@@ -411,7 +414,7 @@ class TestSimulatedOpponentPositiveValuePoolExhaustionFallback:
         config = Mock()
         config.get_draft_order_bonus = Mock(return_value=(0.0, ""))
 
-        pm = Mock(spec=PlayerManager)
+        pm = index_mock_pm(Mock(spec=PlayerManager))
         pm.players = players
 
         team_data_manager = Mock(spec=TeamDataManager)
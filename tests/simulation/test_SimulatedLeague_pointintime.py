@@ -176,7 +176,7 @@ class TestWinTallyingSourcesActualPm:
     """Assertion 3 — win-tallying reads real actuals via actual_pm, both team types."""
 
     @patch('simulation.win_rate.DraftHelperTeam.StarterHelperModeManager')
-    def test_draft_helper_team_scores_from_actual_pm(self, mock_shm):
+    def test_draft_helper_team_scores_from_actual_pm(self, mock_shm, index_mock_pm):
         # projected_pm lineup player holds the POST-SWAP current-week value (0.0);
         # the real result must come from actual_pm, proving the D2 redirect.
         proj_player = Mock(spec=FantasyPlayer)
@@ -198,9 +198,9 @@ class TestWinTallyingSourcesActualPm:
         actual_player.id = 1
         actual_player.actual_points = [WEEK1_ACTUAL] + [0.0] * 16
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = [proj_player]
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = [actual_player]
         actual_pm.calculate_max_weekly_projection.return_value = 100.0
 
@@ -212,7 +212,7 @@ class TestWinTallyingSourcesActualPm:
 
         assert total == WEEK1_ACTUAL  # 12.0 from actual_pm, NOT 0.0 from projected_pm
 
-    def test_simulated_opponent_scores_from_actual_pm(self):
+    def test_simulated_opponent_scores_from_actual_pm(self, index_mock_pm):
         def make_roster_player(pid, position):
             p = Mock(spec=FantasyPlayer)
             p.id = pid
@@ -237,11 +237,11 @@ class TestWinTallyingSourcesActualPm:
             ap.actual_points = [WEEK1_ACTUAL] + [0.0] * 16  # real week-1 result from week_02
             actual_players.append(ap)
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = roster
         projected_pm.calculate_max_weekly_projection.return_value = 100.0
         projected_pm.get_weekly_projection.return_value = (10.0, 0.0)
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = actual_players
         actual_pm.calculate_max_weekly_projection.return_value = 100.0
 
@@ -107,11 +107,11 @@ class TestSimulatedOpponentInitialization:
 class TestDraftPlayer:
     """Test draft_player functionality"""
 
-    def test_draft_player_adds_to_roster(self):
+    def test_draft_player_adds_to_roster(self, index_mock_pm):
         """Test that drafting a player adds them to roster"""
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = []
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = []
         config = Mock()
         team_data_mgr = Mock()
@@ -131,16 +131,16 @@ class TestDraftPlayer:
         assert len(opponent.roster) == 1
         assert opponent.roster[0] == player
 
-    def test_draft_player_marks_drafted_in_projected_pm(self):
+    def test_draft_player_marks_drafted_in_projected_pm(self, index_mock_pm):
         """Test that drafting marks player as drafted=1 in projected PlayerManager"""
         projected_player = Mock(spec=FantasyPlayer)
         projected_player.id = 1
         projected_player.drafted_by = ""
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = [projected_player]
 
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = []
 
         config = Mock()
@@ -160,16 +160,16 @@ class TestDraftPlayer:
 
         assert projected_player.drafted_by == "OPPONENT"
 
-    def test_draft_player_marks_drafted_in_actual_pm(self):
+    def test_draft_player_marks_drafted_in_actual_pm(self, index_mock_pm):
         """Test that drafting marks player as drafted=1 in actual PlayerManager"""
         actual_player = Mock(spec=FantasyPlayer)
         actual_player.id = 1
         actual_player.drafted_by = ""
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = []
 
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = [actual_player]
 
         config = Mock()
@@ -189,11 +189,11 @@ class TestDraftPlayer:
 
         assert actual_player.drafted_by == "OPPONENT"
 
-    def test_draft_multiple_players(self):
+    def test_draft_multiple_players(self, index_mock_pm):
         """Test drafting multiple players"""
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = []
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = []
         config = Mock()
         team_data_mgr = Mock()
@@ -231,16 +231,16 @@ class TestDraftPlayer:
 class TestMarkPlayerDrafted:
     """Test mark_player_drafted functionality"""
 
-    def test_mark_player_drafted_in_projected_pm(self):
+    def test_mark_player_drafted_in_projected_pm(self, index_mock_pm):
         """Test marking player as drafted by another team"""
         player = Mock(spec=FantasyPlayer)
         player.id = 5
         player.drafted_by = ""
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = [player]
 
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = []
 
         config = Mock()
@@ -255,16 +255,16 @@ class TestMarkPlayerDrafted:
 
         assert player.drafted_by == "OPPONENT"
 
-    def test_mark_player_drafted_in_actual_pm(self):
+    def test_mark_player_drafted_in_actual_pm(self, index_mock_pm):
         """Test marking player as drafted in actual PM"""
         player = Mock(spec=FantasyPlayer)
         player.id = 10
         player.drafted_by = ""
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = []
 
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = [player]
 
         config = Mock()
@@ -279,12 +279,12 @@ class TestMarkPlayerDrafted:
 
         assert player.drafted_by == "OPPONENT"
 
-    def test_mark_player_drafted_nonexistent_player(self):
+    def test_mark_player_drafted_nonexistent_player(self, index_mock_pm):
         """Test marking nonexistent player does nothing"""
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = []
 
-        actual_pm = Mock()
+        actual_pm = index_mock_pm(Mock())
         actual_pm.players = []
 
         config = Mock()
@@ -301,9 +301,9 @@ class TestMarkPlayerDrafted:
 class TestGetDraftRecommendation:
     """Test get_draft_recommendation functionality"""
 
-    def test_get_draft_recommendation_no_available_players(self):
+    def test_get_draft_recommendation_no_available_players(self, index_mock_pm):
         """Test getting recommendation with no available players raises error"""
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = []
 
         actual_pm = Mock()
@@ -319,7 +319,7 @@ class TestGetDraftRecommendation:
             opponent.get_draft_recommendation()
 
     @patch('simulation.win_rate.SimulatedOpponent.random.random')
-    def test_adp_aggressive_strategy_picks_lowest_adp(self, mock_random):
+    def test_adp_aggressive_strategy_picks_lowest_adp(self, mock_random, index_mock_pm):
         """Test ADP aggressive strategy picks player with lowest ADP"""
         mock_random.return_value = 1.0
 
@@ -347,7 +347,7 @@ class TestGetDraftRecommendation:
         player3.drafted_by = ""
         player3.drafted = 0
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = [player1, player2, player3]
 
         actual_pm = Mock()
@@ -364,7 +364,7 @@ class TestGetDraftRecommendation:
         assert recommendation == player2
 
     @patch('simulation.win_rate.SimulatedOpponent.random.random')
-    def test_projected_points_aggressive_picks_highest_points(self, mock_random):
+    def test_projected_points_aggressive_picks_highest_points(self, mock_random, index_mock_pm):
         """Test projected points aggressive strategy picks highest points"""
         mock_random.return_value = 1.0
 
@@ -389,7 +389,7 @@ class TestGetDraftRecommendation:
         player3.drafted_by = ""
         player3.drafted = 0
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = [player1, player2, player3]
 
         actual_pm = Mock()
@@ -407,7 +407,7 @@ class TestGetDraftRecommendation:
 
     @patch('simulation.win_rate.SimulatedOpponent.random.random')
     @patch('simulation.win_rate.SimulatedOpponent.random.choice')
-    def test_human_error_picks_from_top_5(self, mock_choice, mock_random):
+    def test_human_error_picks_from_top_5(self, mock_choice, mock_random, index_mock_pm):
         """Test human error causes pick from top 5 instead of #1"""
         mock_random.return_value = 0.1
 
@@ -424,7 +424,7 @@ class TestGetDraftRecommendation:
 
         mock_choice.return_value = players[2]
 
-        projected_pm = Mock()
+        projected_pm = index_mock_pm(Mock())
         projected_pm.players = players
 
         actual_pm = Mock()
@@ -94,6 +94,75 @@ class TestCombinationEvaluator:
 
         assert MockRunner.call_args.kwargs["naive_opponents"] is True
 
+    @pytest.mark.parametrize("use_processes", [True, False])
+    def test_worker_kind_reaches_runner(self, tmp_path, use_processes):
+        """Processes (with a persistent pool) are the default; use_processes=False selects threads."""
+        (tmp_path / "2021").mkdir()
+        kwargs = {} if use_processes else {"use_processes": False}
+        with patch(f"{MODULE}.ConfigManager") as MockCM, \
+             patch(f"{MODULE}.SimDataLoader") as MockLoader, \
+             patch(f"{MODULE}.ParallelLeagueRunner") as MockRunner:
+            MockCM.return_value.config_name = "test"
+            MockCM.return_value.description = "test"
+            MockCM.return_value.parameters = _fake_params()
+            MockLoader.return_value.is_valid = True
+            MockLoader.return_value.week_data_cache = {1: {}}
+            CombinationEvaluator(tmp_path, num_simulations=10, **kwargs)
+
+        assert MockRunner.call_args.kwargs["use_processes"] is use_processes
+        assert MockRunner.call_args.kwargs["persistent_pool"] is use_processes
+
+    def test_close_logs_throughput_and_closes_runner(self, tmp_path, caplog):
+        ev, mock_runner = _make_evaluator(tmp_path, [(10, 7, 1.0)])
+        mock_runner.leagues_completed = 20
+        mock_runner.throughput_summary.return_value = "20 leagues in 2.0s"
+        with caplog.at_level(logging.INFO):
+            with ev:
+                pass
+        mock_runner.close.assert_called_once()
+        assert any("League throughput: 20 leagues in 2.0s" in r.getMessage() for r in caplog.records)
+
+    def test_close_without_leagues_logs_nothing(self, tmp_path, caplog):
+        ev, mock_runner = _make_evaluator(tmp_path, [(10, 7, 1.0)])
+        mock_runner.leagues_completed = 0
+        with caplog.at_level(logging.INFO):
+            ev.close()
+        mock_runner.close.assert_called_once()
+        assert not any("League throughput" in r.getMessage() for r in caplog.records)
+
+    @pytest.mark.parametrize("draft_log_cache", [True, False])
+    def test_draft_log_cache_reaches_runner(self, tmp_path, draft_log_cache):
+        (tmp_path / "2021").mkdir()
+        with patch(f"{MODULE}.ConfigManager") as MockCM, \
+             patch(f"{MODULE}.SimDataLoader") as MockLoader, \
+             patch(f"{MODULE}.ParallelLeagueRunner") as MockRunner:
+            MockCM.return_value.config_name = "test"
+            MockCM.return_value.description = "test"
+            MockCM.return_value.parameters = _fake_params()
+            MockLoader.return_value.is_valid = True
+            MockLoader.return_value.week_data_cache = {1: {}}
+            CombinationEvaluator(tmp_path, num_simulations=10, draft_log_cache=draft_log_cache)
+
+        assert MockRunner.call_args.kwargs["draft_log_cache"] is draft_log_cache
+
+    def test_close_logs_draft_log_summary_when_enabled(self, tmp_path, caplog):
+        ev, mock_runner = _make_evaluator(tmp_path, [(10, 7, 1.0)])
+        mock_runner.leagues_completed = 20
+        mock_runner.throughput_summary.return_value = "20 leagues in 2.0s"
+        mock_runner.draft_logs.summary.return_value = "20 drafts: 12 replayed"
+        with caplog.at_level(logging.INFO):
+            ev.close()
+        assert any("Draft-log cache: 20 drafts: 12 replayed" in r.getMessage() for r in caplog.records)
+
+    def test_close_without_draft_log_cache_logs_no_summary(self, tmp_path, caplog):
+        ev, mock_runner = _make_evaluator(tmp_path, [(10, 7, 1.0)])
+        mock_runner.leagues_completed = 20
+        mock_runner.throughput_summary.return_value = "20 leagues in 2.0s"
+        mock_runner.draft_logs = None
+        with caplog.at_level(logging.INFO):
+            ev.close()
+        assert not any("Draft-log cache" in r.getMessage() for r in caplog.records)
+
     def test_evaluate_aggregates_wins_and_games_across_seasons(self, tmp_path):
         ev, _ = _make_evaluator(tmp_path, [(10, 7, 1.0), (12, 5, 2.0)], num_seasons=2)
         wins, games, win_rate = ev.evaluate([{"RB": "P"}], _valid_param_values())
@@ -133,6 +202,52 @@ class TestCombinationEvaluator:
         assert mock_runner.set_data_folder.call_count == 3
         assert mock_runner.run_simulations_for_config.call_count == 3
 
+    def test_evaluate_batch_sends_one_flat_batch_and_aggregates_per_trial(self, tmp_path):
+        ev, mock_runner = _make_evaluator(tmp_path, [], num_seasons=2, num_sims=2)
+        incumbent = _valid_param_values()
+        trials = [dict(incumbent, PRIMARY_BONUS=70), dict(incumbent, PRIMARY_BONUS=90)]
+        # Trial-major, season-minor: (trial 1, 2021), (trial 1, 2022), (trial 2, 2021), (trial 2, 2022).
+        mock_runner.run_simulations_for_batch.return_value = [
+            [(10, 7, 1.0), (9, 8, 1.0)], [(12, 5, 1.0), (8, 9, 1.0)],
+            [(7, 10, 1.0), (6, 11, 1.0)], [(5, 12, 1.0), (4, 13, 1.0)],
+        ]
+
+        scores = ev.evaluate_batch([{"RB": "P"}], trials, incumbent)
+
+        assert scores == [(39, 68, pytest.approx(39 / 68)), (22, 68, pytest.approx(22 / 68))]
+        mock_runner.run_simulations_for_batch.assert_called_once()
+        mock_runner.run_simulations_for_config.assert_not_called()
+        items = mock_runner.run_simulations_for_batch.call_args.args[0]
+        assert [item.data_folder.name for item in items] == ["2021", "2022", "2021", "2022"]
+        assert [item.measured_config_dict["parameters"]["DRAFT_ORDER_BONUSES"]["PRIMARY"] for item in items] == [70, 70, 90, 90]
+        assert {item.config_dict["parameters"]["DRAFT_ORDER_BONUSES"]["PRIMARY"] for item in items} == {80}
+        assert {item.num_simulations for item in items} == {2}
+
+    def test_evaluate_batch_runs_a_block_of_sim_ids(self, tmp_path):
+        ev, mock_runner = _make_evaluator(tmp_path, [], num_seasons=2, num_sims=10)
+        incumbent = _valid_param_values()
+        mock_runner.run_simulations_for_batch.return_value = [[(10, 7, 1.0)] * 3, [(9, 8, 1.0)] * 3]
+
+        scores = ev.evaluate_batch([{"RB": "P"}], [dict(incumbent, PRIMARY_BONUS=70)], incumbent,
+                                   first_sim_id=4, num_simulations=3)
+
+        assert ev.num_simulations == 10
+        assert scores == [(57, 102, pytest.approx(57 / 102))]
+        items = mock_runner.run_simulations_for_batch.call_args.args[0]
+        assert {(item.first_sim_id, item.num_simulations) for item in items} == {(4, 3)}
+
+    def test_evaluate_batch_logs_a_trials_dropped_leagues(self, tmp_path, caplog):
+        ev, mock_runner = _make_evaluator(tmp_path, [], num_seasons=1, num_sims=2)
+        incumbent = _valid_param_values()
+        mock_runner.run_simulations_for_batch.return_value = [[(10, 7, 1.0), (9, 8, 1.0)], [(7, 10, 1.0)]]
+
+        with caplog.at_level(logging.ERROR):
+            scores = ev.evaluate_batch([{"RB": "P"}], [dict(incumbent, PRIMARY_BONUS=70), dict(incumbent, PRIMARY_BONUS=90)], incumbent)
+
+        assert scores[1] == (7, 17, pytest.approx(7 / 17))
+        messages = [r.getMessage() for r in caplog.records if "evaluate_batch dropped" in r.getMessage()]
+        assert len(messages) == 1 and "1/2 leagues of trial 2/2" in messages[0]
+
     def test_evaluate_does_not_mutate_base_config(self, tmp_path):
         ev, _ = _make_evaluator(tmp_path, [(1, 1, 0.0)], num_seasons=1)
         before = copy.deepcopy(ev._base_config)
@@ -70,3 +70,13 @@ class TestOrchestratorRouting:
             DraftStrategyOrchestrator(tmp_path, num_simulations=10, max_workers=2,
                                       meta_data_manager=Mock(), naive_opponents=True)
             assert MockEval.call_args.kwargs["naive_opponents"] is True
+
+    def test_use_processes_threads_to_evaluator_and_close_reaches_it(self, tmp_path):
+        """Processes are the default worker kind; close() stops the evaluator's pool."""
+        with patch(f"{MODULE}.CombinationEvaluator") as MockEval:
+            MockEval.return_value.base_config = _fake_base_config()
+            orch = DraftStrategyOrchestrator(tmp_path, num_simulations=10, max_workers=2,
+                                             meta_data_manager=Mock())
+            assert MockEval.call_args.kwargs["use_processes"] is True
+            orch.close()
+            MockEval.return_value.close.assert_called_once()
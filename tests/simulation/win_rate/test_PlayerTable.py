@@ -0,0 +1,164 @@
+"""
+Unit tests for PlayerTable (columnar, shared-memory week data for the win-rate sim).
+
+Covers:
+- week_view() is a drop-in for the week_data_cache dict set_player_data consumes.
+- to_shared_memory() / attach() round-trip yields identical, read-only arrays.
+- A seeded league run from the table matches the same league run from the dicts.
+- ParallelLeagueRunner process mode publishes the table and releases it afterwards.
+
+Author: Kai Mizuno
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.ParallelLeagueRunner import ParallelLeagueRunner
+from simulation.win_rate.PlayerTable import PlayerTable, POSITION_CODES
+from simulation.win_rate.SimDataLoader import SimDataLoader
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+
+def _record(pid, position, projected, actual):
+    return {
+        'id': str(pid), 'name': f"P{pid}", 'position': position, 'drafted_by': '', 'locked': '0',
+        'projected_points': projected, 'actual_points': actual,
+    }
+
+
+@pytest.fixture
+def week_data():
+    """Two weeks; player 3 only appears in week 2's actual dataset."""
+    p1 = [float(i) for i in range(17)]
+    p2 = [2.5] * 17
+    return {
+        1: {
+            'projected': {1: _record(1, 'QB', p1, [0.0] * 17), 2: _record(2, 'DST', p2, p2)},
+            'actual': {1: _record(1, 'QB', p1, p2), 2: _record(2, 'DST', p2, p1)},
+        },
+        2: {
+            'projected': {1: _record(1, 'QB', p2, p1)},
+            'actual': {1: _record(1, 'QB', p2, p2), 3: _record(3, 'FLEX', p1, p1)},
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def real_week_data():
+    return SimDataLoader(REAL_DATA_FOLDER).week_data_cache
+
+
+@pytest.fixture(scope="module")
+def base_config_dict():
+    cm = ConfigManager(Path("data"))
+    return {
+        "config_name": cm.config_name,
+        "description": cm.description,
+        "parameters": dict(cm.parameters),
+    }
+
+
+def _as_dict(view):
+    return {pid: view[pid] for pid in view}
+
+
+class TestWeekView:
+    def test_matches_week_data_cache(self, week_data):
+        table = PlayerTable.from_week_data(week_data)
+        for week, datasets in week_data.items():
+            for dataset, players in datasets.items():
+                expected = {
+                    pid: {'projected_points': r['projected_points'], 'actual_points': r['actual_points']}
+                    for pid, r in players.items()
+                }
+                assert _as_dict(table.week_view(week, dataset)) == expected
+
+    def test_absent_players_are_not_members(self, week_data):
+        table = PlayerTable.from_week_data(week_data)
+        view = table.week_view(2, 'projected')
+        assert 1 in view
+        assert 2 not in view
+        assert 3 not in view
+        assert 999 not in view
+        assert len(view) == 1
+        with pytest.raises(KeyError):
+            view[2]
+
+    def test_positions_and_weeks(self, week_data):
+        table = PlayerTable.from_week_data(week_data)
+        assert table.ids.tolist() == [1, 2, 3]
+        assert table.positions.tolist() == [POSITION_CODES.index('QB'), POSITION_CODES.index('DST'), -1]
+        assert table.weeks == (1, 2)
+        assert table.has_week(2) and not table.has_week(3)
+
+    def test_arrays_are_read_only(self, week_data):
+        table = PlayerTable.from_week_data(week_data)
+        with pytest.raises(ValueError):
+            table.points[0, 0, 0, 0, 0] = 1.0
+        row = table.week_view(1, 'projected')[1]['projected_points']
+        row[0] = 99.0
+        assert table.week_view(1, 'projected')[1]['projected_points'][0] == 0.0
+
+
+class TestSharedMemory:
+    def test_attach_round_trip(self, week_data):
+        table = PlayerTable.from_week_data(week_data)
+        shared = table.to_shared_memory()
+        try:
+            attached = PlayerTable.attach(shared.handle)
+            np.testing.assert_array_equal(attached.points, table.points)
+            np.testing.assert_array_equal(attached.present, table.present)
+            np.testing.assert_array_equal(attached.ids, table.ids)
+            assert attached.weeks == table.weeks
+            assert not attached.points.flags.writeable
+            assert _as_dict(attached.week_view(1, 'actual')) == _as_dict(table.week_view(1, 'actual'))
+        finally:
+            shared.release()
+
+    def test_release_is_idempotent(self, week_data):
+        shared = PlayerTable.from_week_data(week_data).to_shared_memory()
+        shared.release()
+        shared.release()
+
+
+class TestLeagueParity:
+    def test_table_backed_league_matches_dict_backed_league(self, real_week_data, base_config_dict):
+        """Same seed, same data, two sources -> identical per-team season results."""
+        table = PlayerTable.from_week_data(real_week_data)
+        results = []
+        for kwargs in ({'preloaded_week_data': real_week_data}, {'player_table': table}):
+            league = SimulatedLeague(base_config_dict, REAL_DATA_FOLDER, seed=1234, **kwargs)
+            try:
+                league.run_draft()
+                league.run_season()
+                results.append(league.get_all_team_results())
+            finally:
+                league.cleanup()
+        assert results[0] == results[1]
+
+
+class TestRunnerProcessMode:
+    def test_process_mode_publishes_table_once_and_releases(self, week_data):
+        runner = ParallelLeagueRunner(use_processes=True)
+        with patch('simulation.win_rate.ParallelLeagueRunner.PlayerTable.from_week_data',
+                   wraps=PlayerTable.from_week_data) as build:
+            first = runner._publish_player_table(week_data)
+            second = runner._publish_player_table(week_data)
+        try:
+            assert build.call_count == 1
+            assert first.handle.points_name != second.handle.points_name
+        finally:
+            first.release()
+            second.release()
+
+    def test_no_week_data_publishes_nothing(self):
+        runner = ParallelLeagueRunner(use_processes=True)
+        assert runner._publish_player_table(None) is None
+        assert runner._publish_player_table({}) is None
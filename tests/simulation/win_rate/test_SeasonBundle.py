@@ -0,0 +1,163 @@
+"""
+Tests for building a SimulatedLeague from an in-memory SeasonBundle.
+
+Verifies:
+- a bundle-built league drafts the same rosters and produces the same results as a
+  temp-directory-built league under the same seed, with and without a measured config
+- bundle construction creates no temp directory and opens no file
+- the bundle carries the week_01 draft-time ratings and fails loudly without week_01
+- SimDataLoader loads the bundle once; ConfigManager(config_data=...) loads exactly
+  what the written file would have, without aliasing the caller's dict
+- ParallelLeagueRunner forwards the bundle in thread mode
+
+Author: Kai Mizuno
+"""
+
+import copy
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.ParallelLeagueRunner import ParallelLeagueRunner
+from simulation.win_rate.SeasonBundle import SeasonBundle
+from simulation.win_rate.SimDataLoader import SimDataLoader
+from simulation.win_rate.SimulatedLeague import SimulatedLeague, WEEKS_PER_SEASON
+from tests.simulation.win_rate.test_draft_time_ratings import CONFIG, _write_week
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+
+
+@pytest.fixture(scope="module")
+def config_dict():
+    cm = ConfigManager(Path("data"))
+    return {
+        "config_name": cm.config_name,
+        "description": cm.description,
+        "parameters": dict(cm.parameters),
+    }
+
+
+@pytest.fixture(scope="module")
+def loader():
+    return SimDataLoader(REAL_DATA_FOLDER)
+
+
+def _play(config_dict, loader, seed, **kwargs):
+    league = SimulatedLeague(config_dict, REAL_DATA_FOLDER, loader.week_data_cache, seed=seed, **kwargs)
+    try:
+        league.run_draft()
+        rosters = [[p.id for p in team.projected_pm.team.roster] for team in league.teams]
+        league.run_season()
+        return rosters, league.get_all_team_results(), league.get_draft_helper_results()
+    finally:
+        league.cleanup()
+
+
+class TestParityWithTempDirectoryLeague:
+    def test_same_draft_and_results(self, config_dict, loader):
+        expected = _play(config_dict, loader, seed=8)
+        actual = _play(config_dict, loader, seed=8, season_bundle=loader.load_season_bundle())
+        assert actual == expected
+
+    def test_same_results_with_measured_config(self, config_dict, loader):
+        measured = copy.deepcopy(config_dict)
+        measured["parameters"]["ADP_SCORING"]["WEIGHT"] *= 2
+        expected = _play(config_dict, loader, seed=9, measured_config_dict=measured)
+        actual = _play(config_dict, loader, seed=9, measured_config_dict=measured,
+                       season_bundle=loader.load_season_bundle())
+        assert actual == expected
+
+
+class TestNoFilesystemIO:
+    def test_construction_creates_no_temp_dir_and_opens_no_file(self, config_dict, loader):
+        bundle = loader.load_season_bundle()
+
+        def _no_open(*args, **kwargs):
+            raise AssertionError(f"unexpected file open: {args[:1]}")
+
+        with patch("tempfile.mkdtemp", side_effect=AssertionError("temp dir created")), \
+             patch("builtins.open", side_effect=_no_open), \
+             patch("io.open", side_effect=_no_open):
+            league = SimulatedLeague(config_dict, REAL_DATA_FOLDER, loader.week_data_cache,
+                                     seed=1, season_bundle=bundle)
+        assert league.temp_dir is None
+        league.cleanup()
+
+    def test_bundle_is_not_mutated_by_a_league(self, config_dict, loader):
+        bundle = loader.load_season_bundle()
+        before = copy.deepcopy(bundle)
+        _play(config_dict, loader, seed=3, season_bundle=bundle)
+        assert bundle == before
+
+
+class TestBundleContents:
+    @pytest.fixture
+    def season(self, tmp_path):
+        root = tmp_path / "2099"
+        weeks = root / "weeks"
+        for w in range(1, 19):
+            _write_week(weeks / f"week_{w:02d}", {"1": 3.0, "2": 95.0})
+        _write_week(weeks / "week_01", {"1": 99.0, "2": 10.0})
+        (root / "season_schedule.csv").write_text("week,team,opponent\n1,SEA,KC\n")
+        return root
+
+    def test_carries_draft_time_ratings(self, season):
+        bundle = SeasonBundle.from_season_folder(season, WEEKS_PER_SEASON + 1)
+        for records in bundle.player_records.values():
+            assert {rec["id"]: rec["player_rating"] for rec in records} == {"1": 99.0, "2": 10.0}
+
+    def test_matches_the_shared_data_dir(self, season):
+        bundle = SeasonBundle.from_season_folder(season, WEEKS_PER_SEASON + 1)
+        with patch.object(SimulatedLeague, "_initialize_teams"), \
+             patch.object(SimulatedLeague, "_generate_schedule"):
+            league = SimulatedLeague(CONFIG, season)
+        shared = league._create_shared_data_dir("probe", season / "weeks" / "week_18")
+        try:
+            for f in (shared / "player_data").glob("*_data.json"):
+                stem = f.name.removesuffix(".json")
+                assert bundle.player_records[stem] == json.loads(f.read_text())[stem]
+            assert bundle.schedule == {("SEA", 1): "KC"}
+            assert set(bundle.dst_player_data) == {"SEA"}
+        finally:
+            league.cleanup()
+
+    def test_absent_week_01_raises(self, season):
+        shutil.rmtree(season / "weeks" / "week_01")
+        with pytest.raises(FileNotFoundError, match="week_01"):
+            SeasonBundle.from_season_folder(season, WEEKS_PER_SEASON + 1)
+
+
+class TestLoaders:
+    def test_sim_data_loader_reads_the_bundle_once(self, loader):
+        with patch.object(SeasonBundle, "from_season_folder") as build:
+            fresh = SimDataLoader.__new__(SimDataLoader)
+            fresh.season_folder = REAL_DATA_FOLDER
+            assert fresh.load_season_bundle() is fresh.load_season_bundle()
+        build.assert_called_once_with(REAL_DATA_FOLDER, WEEKS_PER_SEASON + 1)
+
+    def test_config_data_matches_file_and_is_not_aliased(self, config_dict, tmp_path):
+        (tmp_path / "league_config.json").write_text(json.dumps(config_dict, indent=2))
+        from_file = ConfigManager(tmp_path)
+        in_memory = ConfigManager(tmp_path / "unused", config_data=config_dict)
+
+        assert in_memory.parameters == from_file.parameters
+        assert in_memory.adp_scoring == from_file.adp_scoring
+        assert in_memory.config_path is None
+        in_memory.adp_scoring["WEIGHT"] = -1.0
+        assert config_dict["parameters"]["ADP_SCORING"]["WEIGHT"] != -1.0
+
+
+class TestRunnerWiring:
+    def test_thread_mode_forwards_the_bundle(self, config_dict, loader):
+        bundle = loader.load_season_bundle()
+        runner = ParallelLeagueRunner(max_workers=1, data_folder=REAL_DATA_FOLDER)
+        with patch("simulation.win_rate.ParallelLeagueRunner.SimulatedLeague") as league_class:
+            league_class.return_value.get_draft_helper_results.return_value = (1, 0, 0.0)
+            runner.run_simulations_for_config(config_dict, 2, loader.week_data_cache,
+                                              season_bundle=bundle)
+        assert all(call.kwargs["season_bundle"] is bundle for call in league_class.call_args_list)
@@ -257,6 +257,29 @@ class TestReferenceBucketing:
         assert "self_play" not in by_ref
 
 
+class TestSequentialGames:
+    """Sequentially tested evaluations record the games spent against the games budgeted."""
+
+    def test_games_budgeted_accumulates_and_counts_early_stops(self, results_path):
+        mgr = SweepResultsManager(results_path)
+        trial = _param_values()
+        incumbent = _param_values(PRIMARY_BONUS=80)
+        mgr.update("1_zero_rb.json", trial, 0.3, 30, 100, incumbent_param_values=incumbent, games_budgeted=400)
+        mgr.update("1_zero_rb.json", trial, 0.55, 220, 400, incumbent_param_values=incumbent, games_budgeted=400)
+
+        entry = mgr.get_combination("1_zero_rb.json", trial)
+        assert (entry["sequential_games"], entry["games_budgeted"], entry["early_stops"]) == (500, 800, 1)
+        assert entry["by_reference"][SweepResultsManager.make_reference_key(incumbent)] == {"wins": 250, "games": 500}
+        reloaded = SweepResultsManager(results_path)
+        assert reloaded.sequential_summary() == {"games_spent": 500, "games_budgeted": 800, "early_stops": 1}
+
+    def test_fixed_size_evaluations_leave_no_sequential_counters(self, results_path):
+        mgr = SweepResultsManager(results_path)
+        mgr.update("1_zero_rb.json", _param_values(), 0.5, 50, 100)
+        assert "games_budgeted" not in mgr.get_combination("1_zero_rb.json", _param_values())
+        assert mgr.sequential_summary() == {"games_spent": 0, "games_budgeted": 0, "early_stops": 0}
+
+
 class TestQuarantineAndRestart:
     """T68/D3 + AC5: a pre-fix store is quarantined (renamed, never destroyed) and restarts empty;
     an empty/fresh store is never quarantined."""
@@ -0,0 +1,144 @@
+"""
+Tests for SweepTournament's batch_candidates mode.
+
+Unit-only, like test_SweepTournament.py: a mocked CombinationEvaluator answers
+evaluate_batch with canned (wins, games, win_rate) per trial, keyed on the trial and its
+incumbent; a real SweepResultsManager on tmp_path exercises the store.
+
+Verifies:
+- each parameter's candidates go to ONE evaluate_batch call, all against the incumbent
+  the parameter started with; evaluate() is used only for the anchor
+- the strongest candidate clearing the gate is adopted (grid order breaks ties)
+- a landscape with one clear winner converges where the sequential sweep does
+- every trial is recorded against its incumbent, and one payload per trial is emitted
+  with adopted set only on the chosen value
+- an observed sub-floor evaluation still starves the config
+
+Author: Kai Mizuno
+"""
+
+# Standard library
+from unittest.mock import Mock
+
+# Local
+from simulation.win_rate.SweepTournament import SweepTournament
+from simulation.win_rate.SweepResultsManager import SweepResultsManager
+from simulation.win_rate.param_value_generation import generate_candidate_values, DRAFT_SWEEP_PARAMS
+from tests.simulation.win_rate.test_SweepTournament import _baseline, _wg_evaluator
+
+
+def _batch_evaluator(wg_fn):
+    """Mock evaluator: wg_fn(param_values, incumbent_param_values) -> (wins, games), for both calls."""
+    ev = _wg_evaluator(lambda do, pv: wg_fn(pv, None))
+
+    def batch_side_effect(draft_order, trials, incumbent_param_values):
+        scores = []
+        for trial in trials:
+            wins, games = wg_fn(trial, incumbent_param_values)
+            scores.append((wins, games, wins / games if games else 0.0))
+        return scores
+
+    ev.evaluate_batch = Mock(side_effect=batch_side_effect)
+    return ev
+
+
+def _store(tmp_path, name="win_rate_sweep_results.json"):
+    return SweepResultsManager(tmp_path / name)
+
+
+def _pb_candidates(baseline):
+    return sorted(generate_candidate_values(baseline, 5)["PRIMARY_BONUS"])
+
+
+def _with(baseline, **overrides):
+    values = dict(baseline)
+    values.update(overrides)
+    return values
+
+
+class TestBatchCandidates:
+    def test_one_batch_per_parameter_against_the_starting_incumbent(self, tmp_path):
+        baseline = _baseline()
+        ev = _batch_evaluator(lambda pv, inc: (500, 1000))
+        SweepTournament(ev, _store(tmp_path), batch_candidates=True).run([("s1", [{"s": "1"}])], baseline)
+
+        assert ev.evaluate.call_count == 1          # the baseline anchor only
+        assert ev.evaluate_batch.call_count == len(DRAFT_SWEEP_PARAMS)
+        candidates = generate_candidate_values(baseline, 5)
+        for call, param in zip(ev.evaluate_batch.call_args_list, DRAFT_SWEEP_PARAMS):
+            _, trials, incumbent = call.args
+            assert incumbent == baseline
+            assert [trial[param] for trial in trials] == [v for v in candidates[param] if v != baseline[param]]
+
+    def test_adopts_the_strongest_cleared_candidate(self, tmp_path):
+        baseline = _baseline()
+        *_, second, best = [v for v in _pb_candidates(baseline) if v != baseline["PRIMARY_BONUS"]]
+        rates = {second: 650, best: 700}
+
+        def wg(pv, inc):
+            if inc == baseline and pv["PRIMARY_BONUS"] in rates and pv == _with(baseline, PRIMARY_BONUS=pv["PRIMARY_BONUS"]):
+                return rates[pv["PRIMARY_BONUS"]], 1000
+            return 500, 1000
+
+        result = SweepTournament(_batch_evaluator(wg), _store(tmp_path), batch_candidates=True).run(
+            [("s1", [{"s": "1"}])], baseline
+        )
+        assert result["s1"]["param_values"] == _with(baseline, PRIMARY_BONUS=best)
+        assert result["s1"]["win_rate"] == 0.7
+
+    def test_tie_keeps_grid_order(self, tmp_path):
+        baseline = _baseline()
+        first, second = [v for v in _pb_candidates(baseline) if v != baseline["PRIMARY_BONUS"]][:2]
+
+        def wg(pv, inc):
+            if inc == baseline and pv in (_with(baseline, PRIMARY_BONUS=first), _with(baseline, PRIMARY_BONUS=second)):
+                return 700, 1000
+            return 500, 1000
+
+        result = SweepTournament(_batch_evaluator(wg), _store(tmp_path), batch_candidates=True).run(
+            [("s1", [{"s": "1"}])], baseline
+        )
+        grid = generate_candidate_values(baseline, 5)["PRIMARY_BONUS"]
+        assert result["s1"]["param_values"]["PRIMARY_BONUS"] == min((first, second), key=grid.index)
+
+    def test_single_winner_matches_sequential_sweep(self, tmp_path):
+        baseline = _baseline()
+        winner = _with(baseline, PRIMARY_BONUS=max(_pb_candidates(baseline)))
+
+        def wg(pv, inc):
+            return (700, 1000) if pv == winner else (500, 1000)
+
+        sequential = SweepTournament(_wg_evaluator(lambda do, pv: wg(pv, None)), _store(tmp_path, "a.json")).run(
+            [("s1", [{"s": "1"}])], baseline
+        )
+        batched = SweepTournament(_batch_evaluator(wg), _store(tmp_path, "b.json"), batch_candidates=True).run(
+            [("s1", [{"s": "1"}])], baseline
+        )
+        assert batched == sequential
+
+    def test_records_every_trial_and_emits_one_payload_each(self, tmp_path):
+        baseline = _baseline()
+        winner = _with(baseline, PRIMARY_BONUS=max(_pb_candidates(baseline)))
+        store = _store(tmp_path)
+        seen = []
+
+        def wg(pv, inc):
+            return (700, 1000) if pv == winner and inc == baseline else (500, 1000)
+
+        SweepTournament(_batch_evaluator(wg), store, batch_candidates=True).run(
+            [("s1", [{"s": "1"}])], baseline, evaluation_callback=seen.append
+        )
+
+        trials = [p for p in seen if p["kind"] == "trial"]
+        first_pass = [p for p in trials if p["ascent_pass"] == 1]
+        assert [p["eval_in_pass"] for p in first_pass] == list(range(1, len(first_pass) + 1))
+        assert first_pass[-1]["eval_in_pass"] == first_pass[0]["evals_in_pass"]
+        assert [p["value"] for p in trials if p["adopted"]] == [winner["PRIMARY_BONUS"]]
+        entry = store.get_combination("s1", winner)
+        assert entry is not None and entry["total_runs"] >= 1
+
+    def test_observed_shortfall_still_starves(self, tmp_path):
+        store = _store(tmp_path)
+        ev = _batch_evaluator(lambda pv, inc: (9, 17))
+        SweepTournament(ev, store, games_per_evaluation=34, batch_candidates=True).run([("s1", [{"s": "1"}])], _baseline())
+        assert store.get_config_convergence("s1")["status"] == "starved"
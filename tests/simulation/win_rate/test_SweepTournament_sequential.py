@@ -0,0 +1,236 @@
+"""
+Tests for SweepTournament's sequential-testing mode (sequential_block).
+
+Unit-only, like test_SweepTournament.py: a mocked CombinationEvaluator answers
+evaluate_batch blocks with a fixed win rate per (trial, incumbent); a real
+SweepResultsManager on tmp_path exercises the store.
+
+Verifies:
+- _sequential_decision stops only once its adjusted bounds clear 0.5 + min_effect_size
+- an obvious loser stops after the first decisive block and is not adopted
+- an obvious winner is adopted as soon as the bounds and the adoption gate both agree
+- over seeded binomial evaluations, the adoption rates match the fixed-size gate's
+- an undecided candidate plays the whole budget, in consecutive sim_id blocks, and the
+  sweep matches the fixed-size sweep
+- batch_candidates drops decided candidates from later blocks
+- the store records the games spent and budgeted, and the end-of-run log reports this
+  run's share of the store's sequential_summary; bad settings raise ConfigurationError
+
+Author: Kai Mizuno
+"""
+
+# Standard library
+import random
+from unittest.mock import Mock, patch
+
+# Third-party
+import pytest
+
+# Local
+from simulation.win_rate.SweepTournament import SweepTournament, _adopt_by_significance, _sequential_decision
+from simulation.win_rate.SweepResultsManager import SweepResultsManager
+from simulation.win_rate.param_value_generation import generate_candidate_values
+from tests.simulation.win_rate.test_SweepTournament import _baseline, _wg_evaluator
+from utils.error_handler import ConfigurationError
+
+
+NUM_SIMULATIONS = 10
+GAMES_PER_SIM = 20
+
+
+def _seq_evaluator(rate_fn):
+    """Mock evaluator: rate_fn(param_values, incumbent_param_values) -> win rate of every block."""
+    budget_games = NUM_SIMULATIONS * GAMES_PER_SIM
+    ev = _wg_evaluator(lambda do, pv: (budget_games // 2, budget_games))
+    ev.num_simulations = NUM_SIMULATIONS
+
+    def batch_side_effect(draft_order, trials, incumbent_param_values, first_sim_id=0, num_simulations=None):
+        games = GAMES_PER_SIM * num_simulations
+        scores = []
+        for trial in trials:
+            wins = round(rate_fn(trial, incumbent_param_values) * games)
+            scores.append((wins, games, wins / games))
+        return scores
+
+    ev.evaluate_batch = Mock(side_effect=batch_side_effect)
+    return ev
+
+
+def _store(tmp_path, name="win_rate_sweep_results.json"):
+    return SweepResultsManager(tmp_path / name)
+
+
+def _winner(baseline):
+    values = dict(baseline)
+    values["PRIMARY_BONUS"] = max(generate_candidate_values(baseline, 5)["PRIMARY_BONUS"])
+    return values
+
+
+def _blocks(ev, trial):
+    """(first_sim_id, num_simulations) of every block that played `trial`."""
+    return [
+        (call.kwargs["first_sim_id"], call.kwargs["num_simulations"])
+        for call in ev.evaluate_batch.call_args_list if trial in call.args[1]
+    ]
+
+
+class TestSequentialDecision:
+    def test_bounds_around_the_minimum_effect(self):
+        # One look: z = 1.645, so at 100 games the interval is the rate +- 0.082.
+        assert _sequential_decision(43, 100, 0.95, 0.01, 1) is None
+        assert _sequential_decision(42, 100, 0.95, 0.01, 1) is False
+        assert _sequential_decision(42, 100, 0.95, 0.0, 1) is None
+        assert _sequential_decision(59, 100, 0.95, 0.01, 1) is None
+        assert _sequential_decision(60, 100, 0.95, 0.01, 1) is True
+        # A rate at 0.52 is never futile against the 0.51 floor, however many games it took.
+        assert _sequential_decision(520, 1000, 0.95, 0.01, 1) is None
+        assert _sequential_decision(0, 0, 0.95, 0.01, 1) is None
+        assert _sequential_decision(0, 100, 0.95, 0.01, 0) is None
+
+    def test_more_looks_widen_the_bounds(self):
+        # Nine looks: z = 2.54, so at 100 games the interval is the rate +- 0.127.
+        assert _sequential_decision(39, 100, 0.95, 0.01, 9) is None
+        assert _sequential_decision(38, 100, 0.95, 0.01, 9) is False
+        assert _sequential_decision(63, 100, 0.95, 0.01, 9) is None
+        assert _sequential_decision(64, 100, 0.95, 0.01, 9) is True
+
+
+class TestEarlyStopping:
+    def test_obvious_loser_stops_early(self, tmp_path):
+        baseline = _baseline()
+        store = _store(tmp_path)
+        ev = _seq_evaluator(lambda pv, inc: 0.3)
+        with patch("simulation.win_rate.SweepTournament.get_logger") as mock_get_logger:
+            result = SweepTournament(ev, store, sequential_block=1).run([("s1", [{"s": "1"}])], baseline)
+
+        assert result["s1"]["param_values"] == baseline
+        trial = dict(baseline, PRIMARY_BONUS=max(generate_candidate_values(baseline, 5)["PRIMARY_BONUS"]))
+        # 6 wins / 14 losses per block: 12/40 puts the upper bound (0.30 + 0.20) below 0.51.
+        assert _blocks(ev, trial) == [(0, 1), (1, 1)]
+        entry = store.get_combination("s1", trial)
+        assert (entry["total_games"], entry["games_budgeted"], entry["early_stops"]) == (40, 200, 1)
+        summary = store.sequential_summary()
+        assert summary["games_spent"] * 2 < summary["games_budgeted"]
+        messages = [str(c.args[0]) for c in mock_get_logger.return_value.info.call_args_list if c.args]
+        assert any(m.startswith(f"Sequential testing: {summary['games_spent']} of {summary['games_budgeted']}")
+                   for m in messages)
+
+    def test_end_of_run_log_reports_this_runs_share_of_the_store(self, tmp_path):
+        baseline = _baseline()
+        store = _store(tmp_path)
+        store.update("earlier", baseline, 0.25, 10, 40, games_budgeted=200)
+        before = store.sequential_summary()
+        with patch("simulation.win_rate.SweepTournament.get_logger") as mock_get_logger:
+            SweepTournament(_seq_evaluator(lambda pv, inc: 0.3), store, sequential_block=1).run(
+                [("s1", [{"s": "1"}])], baseline
+            )
+
+        after = store.sequential_summary()
+        spent = after["games_spent"] - before["games_spent"]
+        budgeted = after["games_budgeted"] - before["games_budgeted"]
+        messages = [str(c.args[0]) for c in mock_get_logger.return_value.info.call_args_list if c.args]
+        assert any(m.startswith(f"Sequential testing: {spent} of {budgeted} budgeted") for m in messages)
+
+    def test_obvious_winner_is_adopted_early(self, tmp_path):
+        baseline = _baseline()
+        winner = _winner(baseline)
+        store = _store(tmp_path)
+        seen = []
+        ev = _seq_evaluator(lambda pv, inc: 0.8 if pv == winner and inc == baseline else 0.5)
+
+        result = SweepTournament(ev, store, sequential_block=1).run(
+            [("s1", [{"s": "1"}])], baseline, evaluation_callback=seen.append
+        )
+
+        assert result["s1"] == {"param_values": winner, "win_rate": 0.8}
+        # 16/4 per block: block 1 already clears 0.51 but is under min_games; 32/40 clears both.
+        assert _blocks(ev, winner) == [(0, 1), (1, 1)]
+        adopted = [p for p in seen if p["kind"] == "trial" and p["adopted"]]
+        assert [(p["value"], p["wins"], p["games"]) for p in adopted] == [(winner["PRIMARY_BONUS"], 32, 40)]
+        entry = store.get_combination("s1", winner)
+        assert (entry["games_budgeted"], entry["early_stops"]) == (200, 1)
+
+    def test_undecided_candidates_play_the_full_budget(self, tmp_path):
+        baseline = _baseline()
+        ev = _seq_evaluator(lambda pv, inc: 0.5)
+        store = _store(tmp_path, "sequential.json")
+
+        sequential = SweepTournament(ev, store, sequential_block=4).run([("s1", [{"s": "1"}])], baseline)
+
+        trial = dict(baseline, PRIMARY_BONUS=max(generate_candidate_values(baseline, 5)["PRIMARY_BONUS"]))
+        assert _blocks(ev, trial) == [(0, 4), (4, 4), (8, 2)]
+        summary = store.sequential_summary()
+        assert summary["games_spent"] == summary["games_budgeted"] > 0
+        assert summary["early_stops"] == 0
+        fixed = SweepTournament(
+            _wg_evaluator(lambda do, pv: (100, 200)), _store(tmp_path, "fixed.json")
+        ).run([("s1", [{"s": "1"}])], baseline)
+        assert sequential == fixed
+
+    def test_batch_candidates_drop_decided_trials_from_later_blocks(self, tmp_path):
+        baseline = _baseline()
+        winner = _winner(baseline)
+        ev = _seq_evaluator(lambda pv, inc: 0.8 if pv == winner and inc == baseline else 0.5)
+
+        result = SweepTournament(ev, _store(tmp_path), batch_candidates=True, sequential_block=1).run(
+            [("s1", [{"s": "1"}])], baseline
+        )
+
+        assert result["s1"]["param_values"] == winner
+        pb_blocks = [
+            call.args[1] for call in ev.evaluate_batch.call_args_list
+            if call.args[2] == baseline
+            and all(trial == dict(baseline, PRIMARY_BONUS=trial["PRIMARY_BONUS"]) for trial in call.args[1])
+        ]
+        # The winner is decided in block 2; the undecided rest play on to the full budget.
+        sizes = [len(trials) for trials in pb_blocks]
+        assert len(sizes) == NUM_SIMULATIONS
+        assert sizes[:2] == [sizes[0]] * 2
+        assert sizes[2:] == [sizes[0] - 1] * (NUM_SIMULATIONS - 2)
+        assert all(winner not in trials for trials in pb_blocks[2:])
+
+
+class TestAdoptionRates:
+    """Sequential vs fixed-size adoption over the same seeded game streams.
+
+    3400 games per evaluation in 10 blocks: enough that the fixed gate adopts a true 0.52
+    about three times in four, which is where an over-eager futility stop loses power.
+    """
+
+    SIMS = 10
+    GAMES_PER_BLOCK = 340
+    REPS = 400
+
+    def _rates(self, p):
+        rng = random.Random(f"sequential-{p}")
+        baseline = _baseline()
+        trial = _winner(baseline)
+        fixed = sequential = spent = 0
+        for _ in range(self.REPS):
+            block_wins = [sum(rng.random() < p for _ in range(self.GAMES_PER_BLOCK)) for _ in range(self.SIMS)]
+            ev = Mock()
+            ev.num_simulations = self.SIMS
+            ev.evaluate_batch = Mock(side_effect=lambda do, trials, inc, first_sim_id=0, num_simulations=None: [
+                (block_wins[first_sim_id], self.GAMES_PER_BLOCK, block_wins[first_sim_id] / self.GAMES_PER_BLOCK)
+            ])
+            tour = SweepTournament(ev, Mock(), sequential_block=1)
+            (_, games, _, _, adopted), = tour._evaluate_sequentially([], [trial], baseline)
+            fixed += _adopt_by_significance(sum(block_wins), self.SIMS * self.GAMES_PER_BLOCK, 0.95, 0.01, 30)
+            sequential += adopted
+            spent += games
+        return fixed / self.REPS, sequential / self.REPS, spent / (self.REPS * self.SIMS * self.GAMES_PER_BLOCK)
+
+    @pytest.mark.parametrize("p", [0.5, 0.52, 0.53])
+    def test_adoption_matches_the_fixed_gate(self, p):
+        fixed, sequential, _ = self._rates(p)
+        assert abs(sequential - fixed) <= 0.03
+
+    def test_clear_losers_and_winners_stop_early(self):
+        assert self._rates(0.46)[2] < 0.5
+        assert self._rates(0.56)[2] < 0.5
+
+
+class TestValidation:
+    def test_bad_block_raises(self):
+        with pytest.raises(ConfigurationError):
+            SweepTournament(Mock(), Mock(), sequential_block=0)
@@ -0,0 +1,229 @@
+"""
+Tests for simulation.win_rate.draft_log_cache and its use by SimulatedLeague and
+ParallelLeagueRunner.
+
+Verifies:
+- config fingerprints ignore config_name/description and follow the parameters block
+- lookup returns the exact draft, else the latest draft sharing season, seed and
+  reference config; least-recently-used logs are evicted
+- merge takes over logs and counts; the cache survives pickling (its lock is recreated)
+- a replayed draft, and a draft resumed from another measured config's log, give the
+  same rosters, season scores and results as a live draft
+- unseeded and naive-opponent leagues neither read nor write the cache
+- ParallelLeagueRunner shares one cache across calls in thread mode and ships each
+  persistent-pool task the log it can use, merging the task's log back
+
+Author: Kai Mizuno
+"""
+
+import copy
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from league_helper.util.ConfigManager import ConfigManager
+from simulation.win_rate.ParallelLeagueRunner import ParallelLeagueRunner, _derive_task_seed
+from simulation.win_rate.SimDataLoader import SimDataLoader
+from simulation.win_rate.SimulatedLeague import SimulatedLeague
+from simulation.win_rate.draft_log_cache import (
+    DraftLogCache, DraftLogKey, config_fingerprint, draft_log_key,
+)
+
+
+REAL_DATA_FOLDER = Path("simulation/sim_data/2025")
+CONFIG = {"config_name": "incumbent", "description": "", "parameters": {"A": 1}}
+TRIAL = {"config_name": "trial", "description": "", "parameters": {"A": 2}}
+
+
+class TestKeys:
+    def test_fingerprint_covers_parameters_only(self):
+        renamed = dict(CONFIG, config_name="renamed", description="other")
+        assert config_fingerprint(renamed) == config_fingerprint(CONFIG)
+        assert config_fingerprint(TRIAL) != config_fingerprint(CONFIG)
+
+    def test_no_measured_config_measures_the_reference(self):
+        key = draft_log_key("2025", 3, CONFIG, None)
+        assert key == draft_log_key("2025", 3, CONFIG, copy.deepcopy(CONFIG))
+        assert key.measured == key.reference
+
+
+class TestLookup:
+    def test_exact_draft_wins_over_a_shared_reference(self):
+        cache = DraftLogCache()
+        incumbent = draft_log_key("2025", 3, CONFIG, None)
+        trial = draft_log_key("2025", 3, CONFIG, TRIAL)
+        cache.store(incumbent, (1, 2))
+        cache.store(trial, (1, 3))
+
+        assert cache.lookup(incumbent) == (incumbent, (1, 2))
+        other = draft_log_key("2025", 3, CONFIG, dict(TRIAL, parameters={"A": 5}))
+        assert cache.lookup(other) == (trial, (1, 3))
+
+    def test_different_seed_season_or_reference_misses(self):
+        cache = DraftLogCache()
+        cache.store(draft_log_key("2025", 3, CONFIG, None), (1,))
+        assert cache.lookup(draft_log_key("2025", 4, CONFIG, None)) is None
+        assert cache.lookup(draft_log_key("2024", 3, CONFIG, None)) is None
+        assert cache.lookup(draft_log_key("2025", 3, TRIAL, None)) is None
+
+    def test_least_recently_used_log_is_evicted(self):
+        cache = DraftLogCache(max_entries=2)
+        keys = [DraftLogKey("2025", seed, "r", "m") for seed in range(3)]
+        cache.store(keys[0], (0,))
+        cache.store(keys[1], (1,))
+        cache.lookup(keys[0])
+        cache.store(keys[2], (2,))
+
+        assert len(cache) == 2
+        assert cache.lookup(keys[1]) is None
+        assert cache.lookup(keys[0]) == (keys[0], (0,))
+
+    def test_eviction_keeps_a_newer_log_for_the_same_reference(self):
+        cache = DraftLogCache(max_entries=1)
+        first, second = DraftLogKey("2025", 1, "r", "a"), DraftLogKey("2025", 1, "r", "b")
+        cache.store(first, (1,))
+        cache.store(second, (2,))
+        assert cache.lookup(first) == (second, (2,))
+
+
+class TestMergeAndPickle:
+    def test_merge_takes_logs_and_counts(self):
+        parent, worker = DraftLogCache(), DraftLogCache()
+        parent.record('miss', 0)
+        worker.store(DraftLogKey("2025", 1, "r", "m"), (7,))
+        worker.record('hit', 150)
+        worker.record('resume', 40)
+
+        parent.merge(worker)
+
+        assert parent.lookup(DraftLogKey("2025", 1, "r", "m")) == (DraftLogKey("2025", 1, "r", "m"), (7,))
+        assert (parent.hits, parent.resumes, parent.misses, parent.picks_replayed) == (1, 1, 1, 190)
+        assert parent.summary() == "3 drafts: 1 replayed, 1 resumed, 1 live; 190 picks replayed; 1 logs held"
+
+    def test_pickle_round_trip(self):
+        cache = DraftLogCache(max_entries=5)
+        cache.store(DraftLogKey("2025", 1, "r", "m"), (7, 8))
+        restored = pickle.loads(pickle.dumps(cache))
+        assert restored.max_entries == 5
+        assert restored.lookup(DraftLogKey("2025", 1, "r", "m")) == (DraftLogKey("2025", 1, "r", "m"), (7, 8))
+        restored.store(DraftLogKey("2025", 2, "r", "m"), (9,))
+
+
+@pytest.fixture(scope="module")
+def season():
+    loader = SimDataLoader(REAL_DATA_FOLDER)
+    return loader.week_data_cache, loader.load_season_bundle()
+
+
+@pytest.fixture(scope="module")
+def real_config():
+    cm = ConfigManager(Path("data"))
+    return {"config_name": cm.config_name, "description": cm.description, "parameters": dict(cm.parameters)}
+
+
+def _play(config_dict, season, seed, **kwargs):
+    week_data, bundle = season
+    league = SimulatedLeague(config_dict, REAL_DATA_FOLDER, week_data, seed=seed, season_bundle=bundle, **kwargs)
+    try:
+        league.run_draft()
+        rosters = [[p.id for p in team.roster] for team in league.teams]
+        league.run_season()
+        return rosters, league.get_all_team_results(), league.get_draft_helper_results()
+    finally:
+        league.cleanup()
+
+
+class TestLeagueReplay:
+    def test_replay_and_resume_match_live_drafts(self, real_config, season):
+        measured = copy.deepcopy(real_config)
+        measured["parameters"]["ADP_SCORING"]["WEIGHT"] *= 1.2
+        cache = DraftLogCache()
+
+        live = _play(real_config, season, seed=3)
+        assert _play(real_config, season, seed=3, draft_log_cache=cache) == live
+        assert _play(real_config, season, seed=3, draft_log_cache=cache) == live
+        assert (cache.misses, cache.hits) == (1, 1)
+
+        live_measured = _play(real_config, season, seed=3, measured_config_dict=measured)
+        assert _play(real_config, season, seed=3, measured_config_dict=measured, draft_log_cache=cache) == live_measured
+        assert cache.resumes == 1
+        assert len(cache) == 2
+
+    def test_unseeded_and_naive_leagues_skip_the_cache(self, real_config, season):
+        cache = DraftLogCache()
+        _play(real_config, season, seed=None, draft_log_cache=cache)
+        _play(real_config, season, seed=4, naive_opponents=True, draft_log_cache=cache)
+        assert len(cache) == 0
+        assert cache.hits + cache.resumes + cache.misses == 0
+
+
+class _LoggingLeague:
+    """Drafts a one-pick log per seed and reports whether the cache already held it."""
+
+    def __init__(self, config_dict, data_folder, week_data, measured_config_dict=None,
+                 naive_opponents=False, seed=None, player_table=None, season_bundle=None,
+                 draft_log_cache=None):
+        self.key = draft_log_key(data_folder.name, seed, config_dict, measured_config_dict)
+        self.cache = draft_log_cache
+        self.found = None
+
+    def run_draft(self):
+        self.found = self.cache.lookup(self.key)
+        self.cache.store(self.key, (self.key.seed,))
+        self.cache.record('miss' if self.found is None else 'hit', 0 if self.found is None else 1)
+
+    def run_season(self):
+        pass
+
+    def get_draft_helper_results(self):
+        return self.key.seed, self.found is not None, 0.0
+
+    def cleanup(self):
+        pass
+
+
+def _week_data():
+    points = [1.0] * 17
+    record = {'id': '1', 'name': 'P1', 'position': 'QB', 'drafted_by': '', 'locked': '0',
+              'projected_points': points, 'actual_points': points}
+    return {1: {'projected': {1: record}, 'actual': {1: record}}}
+
+
+class TestRunnerSharing:
+    def test_disabled_by_default(self):
+        assert ParallelLeagueRunner().draft_logs is None
+
+    def test_thread_mode_shares_one_cache_across_calls(self):
+        with patch("simulation.win_rate.ParallelLeagueRunner.SimulatedLeague", _LoggingLeague):
+            runner = ParallelLeagueRunner(max_workers=2, data_folder=Path("sim/2024"), seed=5, draft_log_cache=True)
+            first = runner.run_simulations_for_config(CONFIG, 3)
+            second = runner.run_simulations_for_config(CONFIG, 3)
+
+        assert not any(found for _, found, _ in first)
+        assert all(found for _, found, _ in second)
+        assert (runner.draft_logs.misses, runner.draft_logs.hits, len(runner.draft_logs)) == (3, 3, 3)
+
+    def test_persistent_pool_ships_and_merges_logs(self):
+        with patch("simulation.win_rate.ParallelLeagueRunner.SimulatedLeague", _LoggingLeague), \
+             patch("simulation.win_rate.ParallelLeagueRunner.SeasonBundle.from_season_folder",
+                   side_effect=lambda folder, week: object()):
+            with ParallelLeagueRunner(max_workers=2, data_folder=Path("sim/2024"), seed=5, use_processes=True,
+                                      persistent_pool=True, draft_log_cache=True) as runner:
+                week_data = _week_data()
+                first = runner.run_simulations_for_config(CONFIG, 4, week_data)
+                second = runner.run_simulations_for_config(CONFIG, 4, week_data, measured_config_dict=TRIAL)
+
+        assert not any(found for _, found, _ in first)
+        # Each trial draft is handed the incumbent's log for its own seed.
+        assert all(found for _, found, _ in second)
+        expected_seeds = {_derive_task_seed(5, Path("sim/2024"), sim_id) for sim_id in range(4)}
+        assert {seed for seed, _, _ in second} == expected_seeds
+        assert (runner.draft_logs.misses, runner.draft_logs.hits, len(runner.draft_logs)) == (4, 4, 8)
+
+    def test_unseeded_runner_ships_no_cache(self):
+        runner = ParallelLeagueRunner(draft_log_cache=True)
+        assert runner._task_draft_logs(CONFIG, None, None) is None
+        naive = ParallelLeagueRunner(naive_opponents=True, draft_log_cache=True)
+        assert naive._task_draft_logs(CONFIG, None, 3) is None
@@ -53,6 +53,9 @@ class _FakeLoader:
         self.is_valid = True
         self.week_data_cache = {}
 
+    def load_season_bundle(self):
+        return None
+
 
 class _FakeLeague:
     """Fast Bernoulli-kernel stand-in for SimulatedLeague (no draft/season replay, no I/O)."""
@@ -55,7 +55,7 @@ class FakeRunner:
         """Stub method for compatibility with ParallelLeagueRunner interface."""
         pass
 
-    def run_simulations_for_config(self, config_dict, num_simulations, preloaded_week_data=None, measured_config_dict=None):
+    def run_simulations_for_config(self, config_dict, num_simulations, preloaded_week_data=None, measured_config_dict=None, season_bundle=None):
         """
         Return deterministic (wins, losses, points) tuples based on config strength.
 